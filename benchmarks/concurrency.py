@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+""" Concurrency benchmark of the backend service serving modes.
+
+Starts the services in each serving mode (`wsgi`, with a pool of threads per worker process, and
+`async`, with cooperative Gevent workers) with the same number of worker processes, and sends
+authenticated backend API requests (`GET /discussions/{id}`) from an increasing number of
+concurrent clients. Every request is validated against the auth service (`token_revocation_check`
+without token cache), so it waits for the network as well as for the database, which is where the
+cooperative workers can overlap requests. The requests per second and the latencies of every mode
+and number of clients are printed and written as JSON.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from typing import Dict, List
+from e2e import Services, git_revision, print_table
+from tokens import run_load
+
+
+def main() -> int:
+    """ Runs the benchmark.
+
+    Returns:
+        - int: The process exit status: 0 on success, 2 on error.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0].strip())
+    parser.add_argument('--server-modes', default='wsgi,async',
+                        help='Comma-separated serving modes to compare (default: wsgi,async).')
+    parser.add_argument('--clients', default='8,64,256',
+                        help='Comma-separated numbers of concurrent clients (default: 8,64,256).')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes of the auth and backend services (default: 1).')
+    parser.add_argument('--threads', type=int, default=4,
+                        help='Threads per worker in wsgi mode (default: 4).')
+    parser.add_argument('--local-tokens', action='store_true',
+                        help='Verify the tokens locally instead of against the auth service.')
+    parser.add_argument('--discussions', type=int, default=100,
+                        help='Discussions generated in the backend database (default: 100).')
+    parser.add_argument('--warmup', type=float, default=2, help='Seconds before recording (default: 2).')
+    parser.add_argument('--duration', type=float, default=10,
+                        help='Seconds recorded per mode and number of clients (default: 10).')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the data and the requests (default: 0).')
+    parser.add_argument('--output', default='concurrency-benchmark-results.json',
+                        help='Where to write the results (default: concurrency-benchmark-results.json).')
+    args = parser.parse_args()
+
+    modes: List[str] = [mode for mode in args.server_modes.split(',') if mode]
+    clients: List[int] = [int(count) for count in args.clients.split(',') if count]
+    results: Dict[str, Dict] = {}
+    for mode in modes:
+        server: Dict = {
+            'mode': mode, 'workers': args.workers, 'threads': args.threads,
+            'worker_connections': max(1000, max(clients))
+        }
+        backend: Dict = {'server': server}
+        if not args.local_tokens:
+            backend.update({'token_revocation_check': True, 'token_cache': {'size': 0}})
+        work_dir: str = tempfile.mkdtemp(prefix='dms2223-benchmark-')
+        services: Services = Services(
+            work_dir, f'sqlite:///{os.path.join(work_dir, "backend.db")}', mode,
+            overrides={'dms2223auth': {'server': server}, 'dms2223backend': backend}
+        )
+        try:
+            services.run_script('dms2223auth', 'dms2223auth-create-admin')
+            services.run_script(
+                'dms2223backend', 'dms2223backend-generate-data',
+                '--discussions', str(args.discussions), '--seed', str(args.seed)
+            )
+            services.start()
+            services.create_users([('benchconcurrency', ['DISCUSSION'])])
+            token: str = services.login('benchconcurrency')
+            for count in clients:
+                print(f'Running the {mode} mode with {count} clients for '
+                      f'{args.warmup} + {args.duration} s...', file=sys.stderr)
+                results[f'{mode} x{count}'] = dict(run_load(
+                    services, token, args.discussions, count, args.warmup, args.duration,
+                    args.seed
+                ), mode=mode, clients=count)
+        except (RuntimeError, subprocess.CalledProcessError, ValueError) as ex:
+            print(f'Benchmark error: {ex}', file=sys.stderr)
+            return 2
+        finally:
+            services.stop()
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    with open(args.output, 'w', encoding='UTF-8') as stream:
+        json.dump({
+            'meta': {
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'revision': git_revision(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpus': os.cpu_count(),
+                'options': {key: value for key, value in vars(args).items() if key != 'output'}
+            },
+            'runs': results
+        }, stream, indent=2)
+    print_table(results)
+    print(f'Results written to {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+""" Reader/writer concurrency benchmark of the backend SQLite database.
+
+Generates a backend database per SQLite journal mode and, for a while, reads discussion threads
+(`DiscussionsServices.get_thread`) from concurrent reader threads while writer threads keep
+answering discussions (`AnswersServices.answer`), with the rest of the `db_pragmas` and
+`db_engine` options at their defaults. In rollback journal modes every write locks the readers
+out; in WAL mode they are not blocked. The operations per second, the failures (e.g. `database is
+locked`) and the latencies of the readers and writers are printed and written as JSON.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+ROOT_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENTS_DIR: str = os.path.join(ROOT_DIR, 'components')
+for _component in ('dms2223common', 'dms2223backend'):
+    sys.path.insert(0, os.path.join(COMPONENTS_DIR, _component))
+
+# pylint: disable=wrong-import-position
+from e2e import git_revision
+from login import latency_stats
+
+
+def run_mode(journal_mode: str, discussions: int, readers: int, writers: int, duration: float,
+             seed: int) -> Dict[str, Dict]:
+    """ Runs the readers and writers against a new database in a journal mode.
+
+    The result classes can only be mapped once per process, so each mode is run by a separate
+    worker process.
+
+    Args:
+        - journal_mode (str): The SQLite `journal_mode` pragma.
+        - discussions (int): The number of discussions generated.
+        - readers (int): The number of reader threads.
+        - writers (int): The number of writer threads.
+        - duration (float): Seconds recorded.
+        - seed (int): Seed of the data and of the discussions read and answered.
+
+    Returns:
+        - Dict[str, Dict]: The latency statistics (see `login.latency_stats`), plus the number of
+          failures, of the reads and of the writes.
+    """
+    # pylint: disable=import-outside-toplevel,too-many-locals
+    from dms2223backend.data.config import BackendConfiguration
+    from dms2223backend.data.db import DataGenerator, Schema
+    from dms2223backend.service import AnswersServices, DiscussionsServices
+
+    work_dir: str = tempfile.mkdtemp(prefix='dms2223-database-benchmark-')
+    try:
+        cfg: BackendConfiguration = BackendConfiguration()
+        cfg.set_db_connection_string(f'sqlite:///{os.path.join(work_dir, "backend.db")}')
+        cfg.set_db_pragmas({'journal_mode': journal_mode})
+        schema: Schema = Schema(cfg)
+        DataGenerator(discussions=discussions, seed=seed).generate(schema.new_session())
+        schema.remove_session()
+
+        stop: threading.Event = threading.Event()
+        lock: threading.Lock = threading.Lock()
+        latencies: Dict[str, List[float]] = {'read': [], 'write': []}
+        failures: Dict[str, int] = {'read': 0, 'write': 0}
+
+        def loop(name: str, operation: Callable[[int], None], rnd: random.Random) -> None:
+            while not stop.is_set():
+                start: float = time.perf_counter()
+                try:
+                    operation(rnd.randint(1, discussions))
+                    failed: bool = False
+                except Exception:  # pylint: disable=broad-except
+                    failed = True
+                elapsed: float = time.perf_counter() - start
+                with lock:
+                    if failed:
+                        failures[name] += 1
+                    else:
+                        latencies[name].append(elapsed)
+
+        def read(discussionid: int) -> None:
+            DiscussionsServices.get_thread(discussionid, schema)
+
+        def write(discussionid: int) -> None:
+            AnswersServices.answer(discussionid, 'Benchmark answer', schema)
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=loop, args=('read', read, random.Random(seed * 1000 + index)),
+                             daemon=True)
+            for index in range(readers)
+        ] + [
+            threading.Thread(target=loop, args=('write', write, random.Random(seed * 1000 - index)),
+                             daemon=True)
+            for index in range(1, writers + 1)
+        ]
+        start: float = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        for thread in threads:
+            thread.join(timeout=60)
+        measured: float = time.perf_counter() - start
+        schema.get_engine().dispose()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return {
+        name: dict(latency_stats(samples, measured), failures=failures[name])
+        for name, samples in latencies.items()
+    }
+
+
+def main() -> int:
+    """ Runs the benchmark.
+
+    Returns:
+        - int: The process exit status: 0 on success, 2 on error.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0].strip())
+    parser.add_argument('--journal-modes', default='DELETE,WAL',
+                        help='Comma-separated SQLite journal modes to compare (default: DELETE,WAL).')
+    parser.add_argument('--readers', type=int, default=4, help='Reader threads (default: 4).')
+    parser.add_argument('--writers', type=int, default=2, help='Writer threads (default: 2).')
+    parser.add_argument('--discussions', type=int, default=1000,
+                        help='Discussions generated in the database (default: 1000).')
+    parser.add_argument('--duration', type=float, default=10,
+                        help='Seconds recorded per journal mode (default: 10).')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the data and the operations (default: 0).')
+    parser.add_argument('--output', default='database-benchmark-results.json',
+                        help='Where to write the results (default: database-benchmark-results.json).')
+    parser.add_argument('--worker-journal-mode', default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker_journal_mode is not None:
+        json.dump(run_mode(args.worker_journal_mode, args.discussions, args.readers, args.writers,
+                           args.duration, args.seed), sys.stdout)
+        return 0
+
+    results: Dict[str, Dict] = {}
+    for mode in [mode for mode in args.journal_modes.split(',') if mode]:
+        print(f'Running the {mode} journal mode for {args.duration} s...', file=sys.stderr)
+        worker = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--worker-journal-mode', mode,
+             '--readers', str(args.readers), '--writers', str(args.writers),
+             '--discussions', str(args.discussions), '--duration', str(args.duration),
+             '--seed', str(args.seed)],
+            stdout=subprocess.PIPE, text=True, check=False
+        )
+        if worker.returncode != 0:
+            print(f'Benchmark error: the {mode} journal mode failed', file=sys.stderr)
+            return 2
+        for name, stats in json.loads(worker.stdout).items():
+            results[f'{mode} {name}'] = stats
+
+    with open(args.output, 'w', encoding='UTF-8') as stream:
+        json.dump({
+            'meta': {
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'revision': git_revision(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpus': os.cpu_count(),
+                'options': {key: value for key, value in vars(args).items()
+                            if key not in ('output', 'worker_journal_mode')}
+            },
+            'operations': results
+        }, stream, indent=2)
+    print(f'{"operation":<16}{"count":>8}{"ops/s":>10}{"failed":>8}{"p50 ms":>10}{"p95 ms":>10}'
+          f'{"p99 ms":>10}')
+    for name, stats in results.items():
+        print(f'{name:<16}{stats["count"]:>8}{stats["ops"]:>10.1f}{stats["failures"]:>8}'
+              f'{stats["p50_ms"]:>10.1f}{stats["p95_ms"]:>10.1f}{stats["p99_ms"]:>10.1f}')
+    print(f'Results written to {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
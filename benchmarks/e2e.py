@@ -0,0 +1,783 @@
+#!/usr/bin/env python3
+""" End-to-end HTTP benchmark of the auth, backend and frontend services.
+
+Starts the three services locally against a freshly generated database, drives the user
+scenarios through the frontend with a number of concurrent virtual users, and records the
+throughput, latency percentiles and error rate of every endpoint. The results are written as
+JSON and, if a baseline is given, compared against it; any regression beyond the tolerance makes
+the process exit with a non-zero status.
+"""
+
+import argparse
+import base64
+import json
+import math
+import os
+import platform
+import random
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+import requests
+import yaml
+
+
+ROOT_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENTS_DIR: str = os.path.join(ROOT_DIR, 'components')
+COMPONENTS: List[str] = ['dms2223common', 'dms2223auth', 'dms2223backend', 'dms2223frontend']
+PASSWORD: str = 'benchmark'
+JWS_SECRET: str = 'Benchmark JWS secret'
+API_KEYS: Dict[str, str] = {
+    'backend_to_auth': 'Benchmark backend key for auth',
+    'frontend_to_auth': 'Benchmark frontend key for auth',
+    'frontend_to_backend': 'Benchmark frontend key for backend',
+    'auth_to_backend': 'Benchmark auth key for backend',
+    'auth_to_frontend': 'Benchmark auth key for frontend'
+}
+
+
+class Services():
+    """ The three services, running as local subprocesses.
+    """
+
+    def __init__(self, work_dir: str, database_url: str, server_mode: str,
+                 backend_cache: str = 'none', overrides: Optional[Dict[str, Dict]] = None):
+        """ Constructor method.
+
+        Args:
+            - work_dir (str): Directory for the configurations, databases and logs.
+            - database_url (str): The connection string of the backend database.
+            - server_mode (str): The serving mode of the services (`server.mode` option).
+            - backend_cache (str): The backend cache backend (`cache.backend` option).
+            - overrides (Optional[Dict[str, Dict]]): Other configuration options of each
+              component (e.g. `{'dms2223backend': {'token_revocation_check': True}}`), if any.
+        """
+        self.__work_dir: str = work_dir
+        self.__processes: List[subprocess.Popen] = []
+        self.ports: Dict[str, int] = {
+            name: Services.__free_port() for name in ('auth', 'backend', 'frontend')
+        }
+        server: Dict = {'mode': server_mode}
+        self.__configs: Dict[str, Dict] = {
+            'dms2223auth': {
+                'db_connection_string': f'sqlite:///{os.path.join(work_dir, "auth.db")}',
+                'service_host': '127.0.0.1',
+                'service_port': self.ports['auth'],
+                'debug': False,
+                'jws_secret': JWS_SECRET,
+                'jws_ttl': 3600,
+                'server': server,
+                # Every virtual user logs in from the same address, over and over
+                'login_throttling': {'backend': 'none'},
+                'authorized_api_keys': [API_KEYS['backend_to_auth'], API_KEYS['frontend_to_auth']],
+                'token_invalidation_hooks': [
+                    {
+                        'url': f'http://127.0.0.1:{self.ports["frontend"]}/tokens/invalidations',
+                        'apikey_header': 'X-ApiKey-Frontend',
+                        'apikey_secret': API_KEYS['auth_to_frontend']
+                    },
+                    {
+                        'url': f'http://127.0.0.1:{self.ports["backend"]}/api/v1/tokens/invalidations',
+                        'apikey_header': 'X-ApiKey-Backend',
+                        'apikey_secret': API_KEYS['auth_to_backend']
+                    }
+                ]
+            },
+            'dms2223backend': {
+                'db_connection_string': database_url,
+                'service_host': '127.0.0.1',
+                'service_port': self.ports['backend'],
+                'debug': False,
+                'jws_secret': JWS_SECRET,
+                'server': server,
+                'cache': {'backend': backend_cache},
+                'authorized_api_keys': [API_KEYS['frontend_to_backend'], API_KEYS['auth_to_backend']],
+                'auth_service': {
+                    'host': '127.0.0.1',
+                    'port': self.ports['auth'],
+                    'apikey_secret': API_KEYS['backend_to_auth']
+                }
+            },
+            'dms2223frontend': {
+                'service_host': '127.0.0.1',
+                'service_port': self.ports['frontend'],
+                'debug': False,
+                'app_secret_key': 'Benchmark session key',
+                'server': server,
+                'authorized_api_keys': [API_KEYS['auth_to_frontend']],
+                'auth_service': {
+                    'host': '127.0.0.1',
+                    'port': self.ports['auth'],
+                    'apikey_secret': API_KEYS['frontend_to_auth']
+                },
+                'backend_service': {
+                    'host': '127.0.0.1',
+                    'port': self.ports['backend'],
+                    'apikey_secret': API_KEYS['frontend_to_backend']
+                }
+            }
+        }
+        for component, options in (overrides or {}).items():
+            self.__configs[component].update(options)
+        for component, config in self.__configs.items():
+            config_dir: str = os.path.join(work_dir, component, component)
+            os.makedirs(config_dir, exist_ok=True)
+            with open(os.path.join(config_dir, 'config.yml'), 'w', encoding='UTF-8') as stream:
+                yaml.safe_dump(config, stream)
+
+    @staticmethod
+    def __free_port() -> int:
+        """ Finds a free local TCP port.
+
+        Returns:
+            - int: The port number.
+        """
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+
+    def __environment(self, component: str) -> Dict[str, str]:
+        """ Builds the environment of a component process.
+
+        The configuration is read from the work directory (through `XDG_CONFIG_HOME`), and the
+        components are imported from the source tree unless they are installed.
+
+        Args:
+            - component (str): The component name.
+
+        Returns:
+            - Dict[str, str]: The environment variables.
+        """
+        environment: Dict[str, str] = dict(os.environ)
+        environment['XDG_CONFIG_HOME'] = os.path.join(self.__work_dir, component)
+        environment['PYTHONPATH'] = os.pathsep.join(
+            [os.path.join(COMPONENTS_DIR, name) for name in COMPONENTS]
+            + ([environment['PYTHONPATH']] if environment.get('PYTHONPATH') else [])
+        )
+        return environment
+
+    def run_script(self, component: str, script: str, *args: str) -> None:
+        """ Runs a component script to completion.
+
+        Args:
+            - component (str): The component name.
+            - script (str): The script name, in the component `bin` directory.
+            - *args (str): The script arguments.
+
+        Raises:
+            - subprocess.CalledProcessError: If the script fails.
+        """
+        subprocess.run(
+            [sys.executable, os.path.join(COMPONENTS_DIR, component, 'bin', script), *args],
+            env=self.__environment(component), check=True, stdout=subprocess.DEVNULL
+        )
+
+    def start(self, timeout: float = 60) -> None:
+        """ Starts the services and waits until all of them answer.
+
+        Args:
+            - timeout (float): Seconds to wait for the services to be ready.
+
+        Raises:
+            - RuntimeError: If a service exits or does not answer in time.
+        """
+        checks: Dict[str, str] = {
+            'dms2223auth': f'http://127.0.0.1:{self.ports["auth"]}/api/v1/',
+            'dms2223backend': f'http://127.0.0.1:{self.ports["backend"]}/api/v1/',
+            'dms2223frontend': f'http://127.0.0.1:{self.ports["frontend"]}/login'
+        }
+        for component in checks:
+            log = open(os.path.join(self.__work_dir, f'{component}.log'), 'w', encoding='UTF-8')
+            self.__processes.append(subprocess.Popen(
+                [sys.executable, os.path.join(COMPONENTS_DIR, component, 'bin', component)],
+                env=self.__environment(component), stdout=log, stderr=subprocess.STDOUT
+            ))
+        deadline: float = time.monotonic() + timeout
+        for process, (component, url) in zip(self.__processes, checks.items()):
+            while True:
+                if process.poll() is not None:
+                    raise RuntimeError(
+                        f'{component} exited with status {process.returncode}; see its log at '
+                        f'{os.path.join(self.__work_dir, component + ".log")}'
+                    )
+                try:
+                    requests.get(url, timeout=1)
+                    break
+                except requests.RequestException:
+                    if time.monotonic() > deadline:
+                        raise RuntimeError(f'{component} did not start in {timeout} s.') from None
+                    time.sleep(0.2)
+
+    def stop(self) -> None:
+        """ Stops the services.
+        """
+        for process in self.__processes:
+            process.terminate()
+        for process in self.__processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self.__processes = []
+
+    def backend_cache_stats(self) -> Dict[str, Dict[str, float]]:
+        """ Reads the backend cache lookups from its metrics.
+
+        Returns:
+            - Dict[str, Dict[str, float]]: The hits, misses and hit ratio of every kind of entry
+              (empty if the cache is disabled or the metrics cannot be read).
+        """
+        try:
+            response = requests.get(f'http://127.0.0.1:{self.ports["backend"]}/metrics', timeout=10)
+        except requests.RequestException:
+            return {}
+        stats: Dict[str, Dict[str, float]] = {}
+        for kind, result, value in re.findall(
+            r'^cache_requests_total\{kind="(\w+)",result="(hit|miss)"\} (\S+)$',
+            response.text if response.ok else '', re.MULTILINE
+        ):
+            stats.setdefault(kind, {'hits': 0, 'misses': 0})[
+                'hits' if result == 'hit' else 'misses'
+            ] = float(value)
+        for kind_stats in stats.values():
+            lookups: float = kind_stats['hits'] + kind_stats['misses']
+            kind_stats['hit_ratio'] = kind_stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+    def auth_token_stats(self) -> Dict[str, float]:
+        """ Reads the session tokens signed by the auth service, per frontend page view.
+
+        Returns:
+            - Dict[str, float]: The tokens signed and reused by the auth service, the page views
+              (`GET` requests) served by the frontend, and the tokens signed per page view (empty
+              if the metrics cannot be read).
+        """
+        stats: Dict[str, float] = {
+            'signed': self.__metric_total('auth', 'auth_tokens_signed_total'),
+            'reused': self.__metric_total('auth', 'auth_tokens_reused_total'),
+            'page_views': self.__metric_total('frontend', 'http_requests_total', 'method="GET"')
+        }
+        if any(math.isnan(value) for value in stats.values()):
+            return {}
+        stats['signed_per_page_view'] = (
+            stats['signed'] / stats['page_views'] if stats['page_views'] else 0.0
+        )
+        return stats
+
+    def __metric_total(self, service: str, name: str, label: str = '') -> float:
+        """ Adds up the series of a metric of a service.
+
+        Args:
+            - service (str): The service (`auth`, `backend` or `frontend`).
+            - name (str): The metric name.
+            - label (str): A label the series must have (e.g., `method="GET"`), if any.
+
+        Returns:
+            - float: The total, or NaN if the metrics cannot be read.
+        """
+        try:
+            response = requests.get(f'http://127.0.0.1:{self.ports[service]}/metrics', timeout=10)
+        except requests.RequestException:
+            return math.nan
+        if not response.ok:
+            return math.nan
+        return sum(
+            float(value) for labels, value in re.findall(
+                rf'^{name}(?:\{{([^}}]*)\}})? (\S+)$', response.text, re.MULTILINE
+            ) if label in labels
+        )
+
+    def login(self, username: str, password: str = PASSWORD) -> str:
+        """ Logs a user in through the auth service REST API.
+
+        Args:
+            - username (str): The user name.
+            - password (str): The user password.
+
+        Raises:
+            - RuntimeError: If the credentials are rejected.
+
+        Returns:
+            - str: The session token.
+        """
+        credentials: str = base64.b64encode(f'{username}:{password}'.encode('UTF-8')).decode('ascii')
+        response = requests.post(
+            f'http://127.0.0.1:{self.ports["auth"]}/api/v1/auth', timeout=30, headers={
+                'X-ApiKey-Auth': API_KEYS['frontend_to_auth'],
+                'Authorization': f'Basic {credentials}'
+            }
+        )
+        if not response.ok:
+            raise RuntimeError(f'Cannot log in as {username}: {response.status_code} {response.text}')
+        return response.text
+
+    def create_users(self, users: List[Tuple[str, List[str]]]) -> None:
+        """ Creates users through the auth service REST API, logged in as `admin`.
+
+        Args:
+            - users (List[Tuple[str, List[str]]]): The user names and the role names to grant
+              to each one. Their password is `PASSWORD`.
+
+        Raises:
+            - RuntimeError: If any request fails.
+        """
+        base_url: str = f'http://127.0.0.1:{self.ports["auth"]}/api/v1'
+        headers: Dict[str, str] = {
+            'X-ApiKey-Auth': API_KEYS['frontend_to_auth'],
+            'Authorization': f'Bearer {self.login("admin", "admin")}'
+        }
+        for username, roles in users:
+            response = requests.post(
+                f'{base_url}/users', json={'username': username, 'password': PASSWORD},
+                headers=headers, timeout=30
+            )
+            if not response.ok:
+                raise RuntimeError(f'Cannot create {username}: {response.status_code} {response.text}')
+            for role in roles:
+                response = requests.post(
+                    f'{base_url}/users/{username}/roles/{role}', headers=headers, timeout=30
+                )
+                if not response.ok:
+                    raise RuntimeError(
+                        f'Cannot grant {role} to {username}: {response.status_code} {response.text}'
+                    )
+
+
+class Recorder():
+    """ Thread-safe accounting of the requests latencies and errors, by endpoint.
+    """
+
+    def __init__(self):
+        """ Constructor method.
+        """
+        self.__lock: threading.Lock = threading.Lock()
+        self.__samples: Dict[str, List[float]] = {}
+        self.__errors: Dict[str, int] = {}
+        self.recording: bool = False
+
+    def record(self, endpoint: str, elapsed: float, failed: bool) -> None:
+        """ Accounts a finished request, unless recording is paused (e.g., while warming up).
+
+        Args:
+            - endpoint (str): The method and path of the request.
+            - elapsed (float): The request latency, in seconds.
+            - failed (bool): Whether the request failed.
+        """
+        if not self.recording:
+            return
+        with self.__lock:
+            self.__samples.setdefault(endpoint, []).append(elapsed)
+            self.__errors[endpoint] = self.__errors.get(endpoint, 0) + int(failed)
+
+    @staticmethod
+    def __percentile(samples: List[float], percentile: float) -> float:
+        """ Computes a percentile of sorted samples (nearest-rank method).
+
+        Args:
+            - samples (List[float]): The sorted samples.
+            - percentile (float): The percentile, from 0 to 100.
+
+        Returns:
+            - float: The percentile value.
+        """
+        rank: int = max(1, -(-len(samples) * percentile // 100))
+        return samples[int(rank) - 1]
+
+    def summary(self, duration: float) -> Dict[str, Dict]:
+        """ Summarizes the recorded requests.
+
+        Args:
+            - duration (float): The measured period, in seconds.
+
+        Returns:
+            - Dict[str, Dict]: For every endpoint (and `TOTAL` for all of them), the number of
+              requests and errors, the error rate, the throughput in requests per second, and the
+              mean, p50, p95, p99 and maximum latencies in milliseconds.
+        """
+        with self.__lock:
+            # The requests still running may record more samples meanwhile
+            groups: Dict[str, List[float]] = {
+                endpoint: list(samples) for endpoint, samples in self.__samples.items()
+            }
+            errors: Dict[str, int] = dict(self.__errors)
+        groups['TOTAL'] = [sample for samples in groups.values() for sample in samples]
+        errors['TOTAL'] = sum(errors.values())
+        out: Dict[str, Dict] = {}
+        for endpoint, samples in sorted(groups.items()):
+            if not samples:
+                continue
+            samples = sorted(samples)
+            out[endpoint] = {
+                'requests': len(samples),
+                'errors': errors[endpoint],
+                'error_rate': errors[endpoint] / len(samples),
+                'throughput': len(samples) / duration,
+                'mean_ms': 1000 * sum(samples) / len(samples),
+                'p50_ms': 1000 * Recorder.__percentile(samples, 50),
+                'p95_ms': 1000 * Recorder.__percentile(samples, 95),
+                'p99_ms': 1000 * Recorder.__percentile(samples, 99),
+                'max_ms': 1000 * samples[-1]
+            }
+        return out
+
+
+class VirtualUser():
+    """ A browser-like frontend client that runs the benchmark scenarios.
+    """
+
+    __DISCUSSION_ID = re.compile(r'discussionid=(\d+)')
+    __ANSWER_ID = re.compile(r'name="answerid" value="(\d+)"')
+    __REPORT_ID = re.compile(r'name\s*=\s*"idreport"\s+value="(\d+)"')
+
+    def __init__(self, base_url: str, username: str, recorder: Recorder, rnd: random.Random):
+        """ Constructor method.
+
+        Args:
+            - base_url (str): The frontend URL.
+            - username (str): The user to log in as.
+            - recorder (Recorder): Where the requests are accounted.
+            - rnd (random.Random): The random generator of this user.
+        """
+        self.__base_url: str = base_url
+        self.__username: str = username
+        self.__recorder: Recorder = recorder
+        self.__random: random.Random = rnd
+        self.__session: requests.Session = requests.Session()
+        self.__logged_in: bool = False
+
+    def __request(self, method: str, path: str, endpoint: Optional[str] = None, **kwargs) -> str:
+        """ Sends a request, without following redirects, and accounts it.
+
+        A request fails if it raises, gets an error status, or is redirected to the login page
+        (i.e., the session was lost).
+
+        Args:
+            - method (str): The HTTP method.
+            - path (str): The path and query string.
+            - endpoint (Optional[str]): The path to account the request under; the path without
+              the query string if `None`.
+            - **kwargs: Any other `requests` keyword arguments.
+
+        Returns:
+            - str: The response body, or an empty string on failure.
+        """
+        name: str = f'{method} {endpoint or path.split("?")[0]}'
+        start: float = time.perf_counter()
+        try:
+            response = self.__session.request(
+                method, self.__base_url + path, allow_redirects=False, timeout=60, **kwargs
+            )
+        except requests.RequestException:
+            self.__recorder.record(name, time.perf_counter() - start, True)
+            return ''
+        failed: bool = response.status_code >= 400 or (
+            path != '/logout' and response.headers.get('Location', '').endswith('/login')
+        )
+        self.__recorder.record(name, time.perf_counter() - start, failed)
+        return '' if failed else response.text
+
+    def __login(self) -> None:
+        """ Logs in through the frontend.
+        """
+        self.__request('POST', '/login', data={'user': self.__username, 'pass': PASSWORD})
+
+    def discuss(self) -> None:
+        """ Runs the discussion scenario: log in, list the discussions, open a thread, answer it,
+        vote an answer, report the discussion, and log out.
+        """
+        self.__login()
+        listing: str = self.__request('GET', '/discussion/discussions')
+        discussions: List[str] = VirtualUser.__DISCUSSION_ID.findall(listing)
+        if discussions:
+            discussionid: str = self.__random.choice(discussions)
+            thread: str = self.__request(
+                'GET', f'/discussion/discussions/view?discussionid={discussionid}'
+            )
+            self.__request('POST', '/discussion/discussions/answer', data={
+                'discussionid': discussionid,
+                'content': f'Respuesta de prueba de {self.__username}',
+                'redirect_to': f'/discussion/discussions/view?discussionid={discussionid}'
+            })
+            answers: List[str] = VirtualUser.__ANSWER_ID.findall(thread)
+            if answers:
+                self.__request('POST', '/discussion/discussions/vote_answer', data={
+                    'answerid': self.__random.choice(answers)
+                })
+            if self.__random.random() < 0.2:
+                self.__request('POST', '/discussion/discussions/report', data={
+                    'discussionid': discussionid,
+                    'reason': f'Reporte de prueba de {self.__username}',
+                    'redirect_to': f'/discussion/discussions/view?discussionid={discussionid}'
+                })
+        self.__request('GET', '/logout')
+
+    def read(self) -> None:
+        """ Runs the reading scenario: list the discussions and open some of their threads, logged
+        in once for all the iterations (a read-heavy workload, where the same threads are read
+        over and over).
+        """
+        if not self.__logged_in:
+            self.__login()
+            self.__logged_in = True
+        listing: str = self.__request('GET', '/discussion/discussions')
+        discussions: List[str] = VirtualUser.__DISCUSSION_ID.findall(listing)
+        for discussionid in self.__random.sample(discussions, min(4, len(discussions))):
+            self.__request('GET', f'/discussion/discussions/view?discussionid={discussionid}')
+
+    def moderate(self) -> None:
+        """ Runs the moderation scenario: log in, list the report queue, accept a discussion report
+        (from the queue, like its inline form does), and log out.
+        """
+        self.__login()
+        queue: str = self.__request('GET', '/moderator/reports')
+        # Only the discussion reports (listed first) can be opened and accepted
+        reports: List[str] = VirtualUser.__REPORT_ID.findall(queue.split('Reportes de respuestas')[0])
+        if reports:
+            self.__request('POST', '/accept_report', data={
+                'idreport': self.__random.choice(reports), 'redirect_to': '/moderator/reports'
+            })
+        self.__request('GET', '/logout')
+
+
+def run_load(base_url: str, users: int, moderators: int, readers: int, warmup: float,
+             duration: float, seed: int) -> Tuple[Dict[str, Dict], Dict[str, int]]:
+    """ Runs the scenarios with concurrent virtual users.
+
+    Args:
+        - base_url (str): The frontend URL.
+        - users (int): Number of virtual users running the discussion scenario.
+        - moderators (int): Number of virtual users running the moderation scenario.
+        - readers (int): Number of virtual users running the reading scenario.
+        - warmup (float): Seconds run before recording.
+        - duration (float): Seconds recorded.
+        - seed (int): Seed of the virtual users' random choices.
+
+    Returns:
+        - Tuple[Dict[str, Dict], Dict[str, int]]: The endpoint summaries (see
+          `Recorder.summary`) and the number of completed iterations of each scenario.
+    """
+    recorder: Recorder = Recorder()
+    stop: threading.Event = threading.Event()
+    iterations: Dict[str, int] = {'discuss': 0, 'moderate': 0, 'read': 0}
+    lock: threading.Lock = threading.Lock()
+
+    def loop(user: VirtualUser, scenario: str) -> None:
+        action: Callable[[], None] = getattr(user, scenario)
+        while not stop.is_set():
+            action()
+            if recorder.recording:
+                with lock:
+                    iterations[scenario] += 1
+
+    threads: List[threading.Thread] = []
+    for index in range(users + moderators + readers):
+        username: str
+        scenario: str
+        if index < users:
+            username, scenario = f'bench{index}', 'discuss'
+        elif index < users + moderators:
+            username, scenario = f'benchmod{index - users}', 'moderate'
+        else:
+            username, scenario = f'benchreader{index - users - moderators}', 'read'
+        user = VirtualUser(base_url, username, recorder, random.Random(seed * 1000 + index))
+        threads.append(threading.Thread(target=loop, args=(user, scenario), daemon=True))
+    for thread in threads:
+        thread.start()
+    time.sleep(warmup)
+    recorder.recording = True
+    start: float = time.perf_counter()
+    time.sleep(duration)
+    recorder.recording = False
+    measured: float = time.perf_counter() - start
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=60)
+    return (recorder.summary(measured), iterations)
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """ Compares the results of a run against a baseline.
+
+    An endpoint regresses if its p95 latency grows, or its throughput drops, by more than the
+    tolerance, or if its error rate grows by more than one percentage point. Endpoints missing
+    from the results also count as regressions.
+
+    Args:
+        - results (Dict): The results of the run.
+        - baseline (Dict): The baseline results.
+        - tolerance (float): The allowed relative change (e.g., 0.25 for 25%).
+
+    Returns:
+        - List[str]: A description of every regression (empty if there are none).
+    """
+    regressions: List[str] = []
+    for endpoint, expected in baseline['endpoints'].items():
+        actual: Optional[Dict] = results['endpoints'].get(endpoint)
+        if actual is None:
+            regressions.append(f'{endpoint}: not requested')
+            continue
+        if actual['p95_ms'] > expected['p95_ms'] * (1 + tolerance):
+            regressions.append(
+                f'{endpoint}: p95 {actual["p95_ms"]:.1f} ms > {expected["p95_ms"]:.1f} ms'
+            )
+        if actual['throughput'] < expected['throughput'] * (1 - tolerance):
+            regressions.append(
+                f'{endpoint}: throughput {actual["throughput"]:.2f}/s < {expected["throughput"]:.2f}/s'
+            )
+        if actual['error_rate'] > expected['error_rate'] + 0.01:
+            regressions.append(
+                f'{endpoint}: error rate {actual["error_rate"]:.2%} > {expected["error_rate"]:.2%}'
+            )
+    return regressions
+
+
+def print_table(endpoints: Dict[str, Dict]) -> None:
+    """ Prints the endpoint summaries as a table.
+
+    Args:
+        - endpoints (Dict[str, Dict]): The endpoint summaries.
+    """
+    print(f'{"endpoint":<48} {"req":>7} {"err%":>6} {"req/s":>8} {"p50":>8} {"p95":>8} {"p99":>8}')
+    for endpoint, stats in endpoints.items():
+        print(
+            f'{endpoint:<48} {stats["requests"]:>7} {100 * stats["error_rate"]:>6.2f} '
+            f'{stats["throughput"]:>8.2f} {stats["p50_ms"]:>8.1f} {stats["p95_ms"]:>8.1f} '
+            f'{stats["p99_ms"]:>8.1f}'
+        )
+
+
+def git_revision() -> Optional[str]:
+    """ Gets the current commit of the source tree.
+
+    Returns:
+        - Optional[str]: The commit hash, or `None` if it cannot be determined.
+    """
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=ROOT_DIR, check=True, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> int:
+    """ Runs the benchmark.
+
+    Returns:
+        - int: The process exit status: 0 on success, 1 on regression, 2 on error.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0].strip())
+    parser.add_argument('--discussions', type=int, default=2000,
+                        help='Discussions generated in the backend database (default: 2000).')
+    parser.add_argument('--database-url', default=None,
+                        help='Backend database connection string (default: a new SQLite file). '
+                             'It is populated with the generated data.')
+    parser.add_argument('--users', type=int, default=8,
+                        help='Virtual users running the discussion scenario (default: 8).')
+    parser.add_argument('--moderators', type=int, default=1,
+                        help='Virtual users running the moderation scenario (default: 1).')
+    parser.add_argument('--readers', type=int, default=0,
+                        help='Virtual users running the read-only scenario (default: 0).')
+    parser.add_argument('--backend-cache', choices=['none', 'memory', 'redis'], default='none',
+                        help='Backend cache of the discussion listings and threads (default: none). '
+                             'The redis one expects a server at 127.0.0.1:6379.')
+    parser.add_argument('--warmup', type=float, default=5, help='Seconds before recording (default: 5).')
+    parser.add_argument('--duration', type=float, default=30, help='Seconds recorded (default: 30).')
+    parser.add_argument('--server-mode', choices=['development', 'wsgi', 'async'], default='development',
+                        help='Serving mode of the services (default: development).')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the data and the scenarios (default: 0).')
+    parser.add_argument('--output', default='benchmark-results.json',
+                        help='Where to write the results (default: benchmark-results.json).')
+    parser.add_argument('--baseline', default=None, help='Baseline results to compare against.')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed relative regression against the baseline (default: 0.25).')
+    parser.add_argument('--keep', action='store_true',
+                        help='Keep the work directory (configurations, databases and logs).')
+    args = parser.parse_args()
+
+    work_dir: str = tempfile.mkdtemp(prefix='dms2223-benchmark-')
+    database_url: str = args.database_url or f'sqlite:///{os.path.join(work_dir, "backend.db")}'
+    services: Services = Services(work_dir, database_url, args.server_mode, args.backend_cache)
+    cache_stats: Dict[str, Dict[str, float]] = {}
+    token_stats: Dict[str, float] = {}
+    try:
+        print(f'Generating the data ({args.discussions} discussions)...', file=sys.stderr)
+        services.run_script('dms2223auth', 'dms2223auth-create-admin')
+        services.run_script(
+            'dms2223backend', 'dms2223backend-generate-data',
+            '--discussions', str(args.discussions), '--seed', str(args.seed)
+        )
+        print('Starting the services...', file=sys.stderr)
+        services.start()
+        services.create_users(
+            [(f'bench{index}', ['DISCUSSION']) for index in range(args.users)]
+            + [(f'benchmod{index}', ['MODERATION']) for index in range(args.moderators)]
+            + [(f'benchreader{index}', ['DISCUSSION']) for index in range(args.readers)]
+        )
+        print(f'Running for {args.warmup} + {args.duration} s...', file=sys.stderr)
+        endpoints, iterations = run_load(
+            f'http://127.0.0.1:{services.ports["frontend"]}', args.users, args.moderators,
+            args.readers, args.warmup, args.duration, args.seed
+        )
+        cache_stats = services.backend_cache_stats()
+        token_stats = services.auth_token_stats()
+    except (RuntimeError, subprocess.CalledProcessError) as ex:
+        print(f'Benchmark error: {ex}', file=sys.stderr)
+        return 2
+    finally:
+        services.stop()
+        if args.keep:
+            print(f'Work directory kept at {work_dir}', file=sys.stderr)
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    results: Dict = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'options': {
+                key: value for key, value in vars(args).items()
+                if key not in ('output', 'baseline', 'keep')
+            },
+            'iterations': iterations,
+            'backend_cache': cache_stats,
+            'auth_tokens': token_stats
+        },
+        'endpoints': endpoints
+    }
+    with open(args.output, 'w', encoding='UTF-8') as stream:
+        json.dump(results, stream, indent=2)
+    print_table(endpoints)
+    for kind, kind_stats in cache_stats.items():
+        print(f'Backend cache {kind}: {kind_stats["hit_ratio"]:.1%} hits '
+              f'({kind_stats["hits"]:.0f} of {kind_stats["hits"] + kind_stats["misses"]:.0f} lookups)')
+    if token_stats:
+        print(f'Auth tokens: {token_stats["signed"]:.0f} signed, {token_stats["reused"]:.0f} reused, '
+              f'{token_stats["signed_per_page_view"]:.3f} signed per page view')
+    print(f'Results written to {args.output}')
+
+    if args.baseline:
+        with open(args.baseline, encoding='UTF-8') as stream:
+            baseline: Dict = json.load(stream)
+        regressions: List[str] = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+        if regressions:
+            print(f'{len(regressions)} regressions against {args.baseline}', file=sys.stderr)
+            return 1
+        print(f'No regressions against {args.baseline}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+""" Login throughput benchmark of the auth service password hashing.
+
+Checks user credentials (`UserServices.user_exists`, as the auth service does on every login)
+from concurrent threads for a while, at the given password hashing algorithm, cost parameters and
+number of hashing workers, while another thread keeps running a cheap authorization check
+(`RoleServices.has_role`) to show how much the logins delay the other requests. The logins per
+second and the latencies of both are printed and written as JSON.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+ROOT_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENTS_DIR: str = os.path.join(ROOT_DIR, 'components')
+for _component in ('dms2223common', 'dms2223auth'):
+    sys.path.insert(0, os.path.join(COMPONENTS_DIR, _component))
+
+PASSWORD: str = 'benchmark'
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """ Computes a percentile by the nearest-rank method.
+
+    Args:
+        - samples (List[float]): The samples.
+        - fraction (float): The percentile, as a fraction (e.g., 0.95).
+
+    Returns:
+        - float: The percentile, or 0 if there are no samples.
+    """
+    if not samples:
+        return 0.0
+    ordered: List[float] = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+
+def latency_stats(samples: List[float], duration: float) -> Dict[str, float]:
+    """ Summarizes the latencies of an operation.
+
+    Args:
+        - samples (List[float]): The latencies, in seconds.
+        - duration (float): The seconds they were recorded for.
+
+    Returns:
+        - Dict[str, float]: The number of operations, the operations per second, and the mean,
+          p50, p95 and p99 latencies in milliseconds.
+    """
+    return {
+        'count': len(samples),
+        'ops': len(samples) / duration,
+        'mean_ms': 1000 * statistics.mean(samples) if samples else 0.0,
+        'p50_ms': 1000 * percentile(samples, 0.50),
+        'p95_ms': 1000 * percentile(samples, 0.95),
+        'p99_ms': 1000 * percentile(samples, 0.99)
+    }
+
+
+def main() -> int:
+    """ Runs the benchmark.
+
+    Returns:
+        - int: The process exit status: 0 on success, 2 on error.
+    """
+    # pylint: disable=import-outside-toplevel,too-many-locals
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0].strip())
+    parser.add_argument('--algorithm', choices=['scrypt', 'pbkdf2_sha256'], default='scrypt',
+                        help='Password hashing algorithm (default: scrypt).')
+    parser.add_argument('--scrypt-n', type=int, default=16384, help='scrypt n (default: 16384).')
+    parser.add_argument('--scrypt-r', type=int, default=8, help='scrypt r (default: 8).')
+    parser.add_argument('--scrypt-p', type=int, default=1, help='scrypt p (default: 1).')
+    parser.add_argument('--pbkdf2-iterations', type=int, default=600000,
+                        help='PBKDF2 iterations (default: 600000).')
+    parser.add_argument('--workers', type=int, default=2,
+                        help='Hashing worker threads, 0 hashing in the calling threads (default: 2).')
+    parser.add_argument('--threads', type=int, default=8,
+                        help='Concurrent threads logging in (default: 8).')
+    parser.add_argument('--users', type=int, default=16, help='Users logging in (default: 16).')
+    parser.add_argument('--duration', type=float, default=10, help='Seconds recorded (default: 10).')
+    parser.add_argument('--output', default='login-benchmark-results.json',
+                        help='Where to write the results (default: login-benchmark-results.json).')
+    args = parser.parse_args()
+
+    from dms2223common.data import Role
+    from dms2223auth.data.config import AuthConfiguration
+    from dms2223auth.data.db import Schema
+    from dms2223auth.data.hashing import PasswordHasher
+    from dms2223auth.service import RoleServices, UserServices
+
+    work_dir: str = tempfile.mkdtemp(prefix='dms2223-login-benchmark-')
+    try:
+        cfg: AuthConfiguration = AuthConfiguration()
+        cfg.set_db_connection_string(f'sqlite:///{os.path.join(work_dir, "auth.db")}')
+        cfg.set_password_hashing({
+            'algorithm': args.algorithm,
+            'scrypt_n': args.scrypt_n,
+            'scrypt_r': args.scrypt_r,
+            'scrypt_p': args.scrypt_p,
+            'pbkdf2_iterations': args.pbkdf2_iterations,
+            'workers': args.workers
+        })
+        schema: Schema = Schema(cfg)
+        hasher: PasswordHasher = PasswordHasher.from_config(cfg.get_password_hashing())
+        users: List[str] = [f'user{index}' for index in range(args.users)]
+        print(f'Creating {args.users} users...', file=sys.stderr)
+        for user in users:
+            UserServices.create_user(user, PASSWORD, schema, cfg, hasher)
+            RoleServices.grant_role(user, Role.DISCUSSION, schema)
+
+        stop: threading.Event = threading.Event()
+        lock: threading.Lock = threading.Lock()
+        latencies: Dict[str, List[float]] = {'login': [], 'has_role': []}
+        failures: List[str] = []
+
+        def loop(name: str, operation: Callable[[int], bool]) -> None:
+            index: int = 0
+            while not stop.is_set():
+                start: float = time.perf_counter()
+                successful: bool = operation(index)
+                elapsed: float = time.perf_counter() - start
+                with lock:
+                    if not successful:
+                        failures.append(name)
+                    latencies[name].append(elapsed)
+                index += 1
+
+        def login(index: int) -> bool:
+            return UserServices.user_exists(
+                users[index % len(users)], PASSWORD, schema, cfg, hasher
+            )
+
+        def has_role(index: int) -> bool:
+            return RoleServices.has_role(users[index % len(users)], Role.DISCUSSION, schema)
+
+        print(f'Running for {args.duration} s...', file=sys.stderr)
+        threads: List[threading.Thread] = [
+            threading.Thread(target=loop, args=('login', login), daemon=True)
+            for _ in range(args.threads)
+        ] + [threading.Thread(target=loop, args=('has_role', has_role), daemon=True)]
+        start: float = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(args.duration)
+        stop.set()
+        for thread in threads:
+            thread.join(timeout=60)
+        measured: float = time.perf_counter() - start
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    if failures:
+        print(f'Benchmark error: {len(failures)} operations failed', file=sys.stderr)
+        return 2
+
+    results: Dict = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'options': {key: value for key, value in vars(args).items() if key != 'output'}
+        },
+        'operations': {
+            name: latency_stats(samples, measured) for name, samples in latencies.items()
+        }
+    }
+    with open(args.output, 'w', encoding='UTF-8') as stream:
+        json.dump(results, stream, indent=2)
+    print(f'{"operation":<12}{"count":>8}{"ops/s":>10}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}')
+    for name, stats in results['operations'].items():
+        print(f'{name:<12}{stats["count"]:>8}{stats["ops"]:>10.1f}{stats["p50_ms"]:>10.1f}'
+              f'{stats["p95_ms"]:>10.1f}{stats["p99_ms"]:>10.1f}')
+    print(f'Results written to {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
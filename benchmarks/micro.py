@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+""" Micro-benchmarks of the data, logic and service layers.
+
+Times the hot functions that do not need a running server against fixture databases of several
+sizes, so their algorithmic scaling can be told apart from their constant costs. Each size runs
+in its own process (a schema can only be mapped once per process), and the fixture databases
+are generated once and reused. Every benchmark is calibrated to run enough iterations per round,
+and the statistics of the rounds are reported (like `pytest-benchmark` does). The results are
+written as JSON and, if a baseline is given, compared against it; any regression beyond the
+tolerance makes the process exit with a non-zero status.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENTS_DIR: str = os.path.join(ROOT_DIR, 'components')
+for _component in ('dms2223common', 'dms2223auth', 'dms2223backend'):
+    sys.path.insert(0, os.path.join(COMPONENTS_DIR, _component))
+
+# Posts (discussions, answers and comments) per generated discussion with the generator defaults
+POSTS_PER_DISCUSSION: int = 16
+PASSWORD: str = 'benchmark'
+
+
+def measure(function: Callable[[], object], rounds: int, min_round_time: float) -> Dict:
+    """ Times a function.
+
+    The number of iterations per round is doubled until a round takes `min_round_time`, then
+    the given number of rounds is timed.
+
+    Args:
+        - function (Callable[[], object]): The function to time.
+        - rounds (int): The number of timed rounds.
+        - min_round_time (float): The minimum duration of a round, in seconds.
+
+    Returns:
+        - Dict: The number of rounds and iterations per round, and the minimum, maximum, mean,
+          median and standard deviation of the time per iteration in microseconds, and the
+          operations per second (from the mean).
+    """
+    iterations: int = 1
+    while True:
+        start: float = time.perf_counter()
+        for _ in range(iterations):
+            function()
+        if time.perf_counter() - start >= min_round_time or iterations >= 1 << 20:
+            break
+        iterations *= 2
+    times: List[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            function()
+        times.append((time.perf_counter() - start) / iterations)
+    mean: float = statistics.mean(times)
+    return {
+        'rounds': rounds,
+        'iterations': iterations,
+        'min_us': 1e6 * min(times),
+        'max_us': 1e6 * max(times),
+        'mean_us': 1e6 * mean,
+        'median_us': 1e6 * statistics.median(times),
+        'stddev_us': 1e6 * (statistics.stdev(times) if len(times) > 1 else 0.0),
+        'ops': 1 / mean
+    }
+
+
+def backend_fixture(schema, path: str, size: int, seed: int) -> None:
+    """ Populates the backend fixture database, unless it is complete.
+
+    Args:
+        - schema (Schema): The backend database schema.
+        - path (str): The database file.
+        - size (int): The approximate number of posts.
+        - seed (int): The generator seed.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dms2223backend.data.db import DataGenerator
+    if os.path.exists(f'{path}.done'):
+        return
+    DataGenerator(
+        discussions=max(1, size // POSTS_PER_DISCUSSION), seed=seed
+    ).generate(schema.new_session())
+    schema.remove_session()
+    open(f'{path}.done', 'w', encoding='UTF-8').close()
+
+
+def auth_fixture(schema, path: str, size: int, salt: str) -> None:
+    """ Populates the auth fixture database (`size` users with a role each), unless it is complete.
+
+    Args:
+        - schema (Schema): The auth database schema.
+        - path (str): The database file.
+        - size (int): The number of users.
+        - salt (str): The password salt.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import delete, inspect, insert  # type: ignore
+    from dms2223common.data import Role
+    from dms2223auth.data.db.results import User, UserRole
+    from dms2223auth.data.db.resultsets import Users
+    if os.path.exists(f'{path}.done'):
+        return
+    session = schema.new_session()
+    # Discard any partial fixture left by an interrupted run
+    session.execute(delete(inspect(UserRole).local_table))
+    session.execute(delete(inspect(User).local_table))
+    roles: List[Role] = list(Role)
+    # Legacy password hashes are fast to generate; the benchmarked user is rehashed on its first
+    # login, so `UserServices.user_exists` is timed with the configured hashing
+    for start in range(0, size, 50000):
+        names: List[str] = [f'user{index}' for index in range(start, min(size, start + 50000))]
+        session.execute(insert(inspect(User).local_table), [
+            {'username': name, 'password': Users.hash_password(PASSWORD, suffix=name, salt=salt)}
+            for name in names
+        ])
+        session.execute(insert(inspect(UserRole).local_table), [
+            {'username': name, 'role': roles[index % len(roles)]} for index, name in enumerate(names)
+        ])
+        session.commit()
+    schema.remove_session()
+    open(f'{path}.done', 'w', encoding='UTF-8').close()
+
+
+def run_size(size: int, fixtures_dir: str, seed: int, rounds: int, min_round_time: float,
+             only: Optional[str]) -> Dict[str, Dict]:
+    """ Runs the benchmarks against the fixtures of a size. Meant to run in its own process.
+
+    Args:
+        - size (int): The fixture size.
+        - fixtures_dir (str): Where the fixture databases are kept.
+        - seed (int): The fixture generator seed.
+        - rounds (int): The number of timed rounds.
+        - min_round_time (float): The minimum duration of a round, in seconds.
+        - only (Optional[str]): If given, only the benchmarks whose name contains it are run.
+
+    Returns:
+        - Dict[str, Dict]: The statistics of each benchmark (see `measure`), by name.
+    """
+    # pylint: disable=import-outside-toplevel,too-many-locals
+    from authlib.jose import JsonWebSignature  # type: ignore
+    from flask import Flask, current_app
+    from sqlalchemy import text  # type: ignore
+    from dms2223common.data import Metrics, Role, TokenCache
+    from dms2223common.data.rest import ResponseData
+    from dms2223auth.data.config import AuthConfiguration
+    from dms2223auth.data.db import Schema as AuthSchema
+    from dms2223auth.service import UserServices, RoleServices
+    from dms2223auth.presentation.rest import server as auth_server
+    from dms2223backend.data.config import BackendConfiguration
+    from dms2223backend.data.db import Schema as BackendSchema
+    from dms2223backend.data.db.resultsets import Comments, Reports
+    from dms2223backend.logic import DiscussionLogic
+    from dms2223backend.service import AnswersServices
+    from dms2223backend.presentation.rest import security
+
+    backend_path: str = os.path.join(fixtures_dir, f'backend-{size}-{seed}.db')
+    auth_path: str = os.path.join(fixtures_dir, f'auth-{size}.db')
+    if not os.path.exists(f'{backend_path}.done') and os.path.exists(backend_path):
+        # A partial fixture left by an interrupted run
+        os.remove(backend_path)
+    backend_cfg: BackendConfiguration = BackendConfiguration()
+    backend_cfg.set_db_connection_string(f'sqlite:///{backend_path}')
+    backend: BackendSchema = BackendSchema(backend_cfg)
+    backend_fixture(backend, backend_path, size, seed)
+    auth_cfg: AuthConfiguration = AuthConfiguration()
+    auth_cfg.set_db_connection_string(f'sqlite:///{auth_path}')
+    auth: AuthSchema = AuthSchema(auth_cfg)
+    auth_fixture(auth, auth_path, size, auth_cfg.get_password_salt())
+
+    session = backend.new_session()
+    last_discussion: int = session.execute(text('SELECT max(id) FROM discussions')).scalar()
+    hot_discussion: int = session.execute(text(
+        'SELECT discussionid FROM answers GROUP BY discussionid ORDER BY count(*) DESC LIMIT 1'
+    )).scalar()
+    hot_answer: int = session.execute(text(
+        'SELECT answerid FROM comments GROUP BY answerid ORDER BY count(*) DESC LIMIT 1'
+    )).scalar()
+    backend.remove_session()
+    user: str = f'user{size // 2}'
+
+    jws: JsonWebSignature = JsonWebSignature()
+    auth_app: Flask = Flask('dms2223auth')
+    auth_metrics: Metrics = Metrics()
+    auth_metrics.counter('auth_tokens_signed_total', 'Session tokens signed.')
+    auth_metrics.counter('auth_tokens_reused_total', 'Session renewals answered with the same token.')
+    with auth_app.app_context():
+        current_app.cfg = auth_cfg
+        current_app.db = auth
+        current_app.jws = jws
+        current_app.metrics = auth_metrics
+        current_app.role_cache = None
+    backend_cfg.set_jws_secret(auth_cfg.get_jws_secret())
+    backend_app: Flask = Flask('dms2223backend')
+    with backend_app.app_context():
+        current_app.cfg = backend_cfg
+        current_app.jws = jws
+        current_app.token_cache = TokenCache()
+    with auth_app.app_context():
+        token: str = auth_server.login({'user_credentials': {'user': user}})[0]
+
+    def with_session(function: Callable) -> Callable[[], object]:
+        def call() -> object:
+            try:
+                return function(backend.new_session())
+            finally:
+                backend.remove_session()
+        return call
+
+    def response_data() -> ResponseData:
+        response: ResponseData = ResponseData()
+        response.set_successful(True)
+        response.set_content({'items': [], 'next_cursor': None})
+        response.add_message('OK')
+        return response
+
+    # Name, function and the application whose context is pushed while it is timed (if any)
+    benchmarks: List[Tuple[str, Callable[[], object], Optional[Flask]]] = [
+        ('DiscussionLogic.list_all (first page)',
+         with_session(lambda session: DiscussionLogic.list_all(session, 50)), None),
+        ('DiscussionLogic.list_all (last page)',
+         with_session(lambda session: DiscussionLogic.list_all(session, 50, last_discussion - 50)), None),
+        ('AnswersServices.list_all_for_discussion (hottest)',
+         lambda: AnswersServices.list_all_for_discussion(hot_discussion, backend), None),
+        ('Comments.list_all_for_answer (hottest)',
+         with_session(lambda session: Comments.list_all_for_answer(session, hot_answer)), None),
+        ('Reports.list_all', with_session(lambda session: Reports.list_all(session, 50)), None),
+        ('Reports.list_all_report_answer',
+         with_session(lambda session: Reports.list_all_report_answer(session, 50)), None),
+        ('Reports.list_all_report_comments',
+         with_session(lambda session: Reports.list_all_report_comments(session, 50)), None),
+        ('UserServices.user_exists', lambda: UserServices.user_exists(user, PASSWORD, auth, auth_cfg), None),
+        ('RoleServices.has_role', lambda: RoleServices.has_role(user, Role.DISCUSSION, auth), None),
+        ('server.login (JWS sign)',
+         lambda: auth_server.login({'user_credentials': {'user': user}}), auth_app),
+        ('security.verify_token (JWS verify)', lambda: security.verify_token(token), backend_app),
+        ('ResponseData construction', response_data, None)
+    ]
+
+    results: Dict[str, Dict] = {}
+    for name, function, app in benchmarks:
+        if only and only not in name:
+            continue
+        if app is None:
+            results[name] = measure(function, rounds, min_round_time)
+        else:
+            with app.app_context():
+                results[name] = measure(function, rounds, min_round_time)
+    return results
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """ Compares the results of a run against a baseline.
+
+    A benchmark regresses if its median time grows by more than the tolerance. Benchmarks
+    missing from the results also count as regressions.
+
+    Args:
+        - results (Dict): The results of the run.
+        - baseline (Dict): The baseline results.
+        - tolerance (float): The allowed relative change (e.g., 0.25 for 25%).
+
+    Returns:
+        - List[str]: A description of every regression (empty if there are none).
+    """
+    regressions: List[str] = []
+    for name, expected in baseline['benchmarks'].items():
+        actual: Optional[Dict] = results['benchmarks'].get(name)
+        if actual is None:
+            regressions.append(f'{name}: not run')
+        elif actual['median_us'] > expected['median_us'] * (1 + tolerance):
+            regressions.append(
+                f'{name}: median {actual["median_us"]:.1f} us > {expected["median_us"]:.1f} us'
+            )
+    return regressions
+
+
+def print_table(sizes: List[int], benchmarks: Dict[str, Dict]) -> None:
+    """ Prints the median times as a table of benchmarks by size.
+
+    Args:
+        - sizes (List[int]): The fixture sizes.
+        - benchmarks (Dict[str, Dict]): The benchmark statistics, by `name[size]`.
+    """
+    names: List[str] = list(dict.fromkeys(key.rsplit('[', 1)[0] for key in benchmarks))
+    print(f'{"median (us)":<52}' + ''.join(f'{size:>12}' for size in sizes))
+    for name in names:
+        cells: List[str] = []
+        for size in sizes:
+            stats: Optional[Dict] = benchmarks.get(f'{name}[{size}]')
+            cells.append(f'{stats["median_us"]:>12.1f}' if stats else f'{"-":>12}')
+        print(f'{name:<52}' + ''.join(cells))
+
+
+def main() -> int:
+    """ Runs the micro-benchmarks.
+
+    Returns:
+        - int: The process exit status: 0 on success, 1 on regression, 2 on error.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0].strip())
+    parser.add_argument('--sizes', default='1000,100000,1000000',
+                        help='Comma-separated fixture sizes, in posts and users '
+                             '(default: 1000,100000,1000000).')
+    parser.add_argument('--fixtures-dir', default=os.path.join(tempfile.gettempdir(), 'dms2223-benchmark-fixtures'),
+                        help='Where the fixture databases are kept and reused.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the fixture data (default: 0).')
+    parser.add_argument('--rounds', type=int, default=10, help='Timed rounds per benchmark (default: 10).')
+    parser.add_argument('--min-round-time', type=float, default=0.05,
+                        help='Minimum seconds per round (default: 0.05).')
+    parser.add_argument('-k', dest='only', default=None,
+                        help='Only run the benchmarks whose name contains this text.')
+    parser.add_argument('--output', default='micro-benchmark-results.json',
+                        help='Where to write the results (default: micro-benchmark-results.json).')
+    parser.add_argument('--baseline', default=None, help='Baseline results to compare against.')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed relative regression against the baseline (default: 0.25).')
+    parser.add_argument('--worker-size', type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker_size is not None:
+        json.dump(run_size(args.worker_size, args.fixtures_dir, args.seed, args.rounds,
+                           args.min_round_time, args.only), sys.stdout)
+        return 0
+
+    sizes: List[int] = [int(size) for size in args.sizes.split(',')]
+    os.makedirs(args.fixtures_dir, exist_ok=True)
+    benchmarks: Dict[str, Dict] = {}
+    for size in sizes:
+        print(f'Running size {size}...', file=sys.stderr)
+        worker = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--worker-size', str(size),
+             '--fixtures-dir', args.fixtures_dir, '--seed', str(args.seed),
+             '--rounds', str(args.rounds), '--min-round-time', str(args.min_round_time)]
+            + (['-k', args.only] if args.only else []),
+            stdout=subprocess.PIPE, text=True, check=False
+        )
+        if worker.returncode != 0:
+            print(f'Benchmark error: the size {size} failed', file=sys.stderr)
+            return 2
+        for name, stats in json.loads(worker.stdout).items():
+            benchmarks[f'{name}[{size}]'] = stats
+
+    results: Dict = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'options': {
+                key: value for key, value in vars(args).items()
+                if key in ('sizes', 'seed', 'rounds', 'min_round_time', 'only')
+            }
+        },
+        'benchmarks': benchmarks
+    }
+    with open(args.output, 'w', encoding='UTF-8') as stream:
+        json.dump(results, stream, indent=2)
+    print_table(sizes, benchmarks)
+    print(f'Results written to {args.output}')
+
+    if args.baseline:
+        with open(args.baseline, encoding='UTF-8') as stream:
+            baseline: Dict = json.load(stream)
+        regressions: List[str] = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+        if regressions:
+            print(f'{len(regressions)} regressions against {args.baseline}', file=sys.stderr)
+            return 1
+        print(f'No regressions against {args.baseline}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+""" Indexing and query benchmark of the backend full-text search.
+
+Generates a backend database and times building the full-text index of its posts
+(`Search.deploy`), searching words and prefixes of words drawn from the posts
+(`SearchServices.search`), and the writes the index triggers slow down (answering a discussion,
+which indexes the answer, and voting an answer, which must not reindex it), with and without the
+index. The timings are printed and written as JSON.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+ROOT_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENTS_DIR: str = os.path.join(ROOT_DIR, 'components')
+for _component in ('dms2223common', 'dms2223backend'):
+    sys.path.insert(0, os.path.join(COMPONENTS_DIR, _component))
+
+# pylint: disable=wrong-import-position
+from e2e import git_revision
+from login import latency_stats
+
+
+def time_operation(operation: Callable[[int], object], rounds: int) -> Dict[str, float]:
+    """ Times the rounds of an operation.
+
+    Args:
+        - operation (Callable[[int], object]): The operation, called with the round index.
+        - rounds (int): The number of rounds.
+
+    Returns:
+        - Dict[str, float]: The latency statistics (see `login.latency_stats`).
+    """
+    samples: List[float] = []
+    start: float = time.perf_counter()
+    for index in range(rounds):
+        round_start: float = time.perf_counter()
+        operation(index)
+        samples.append(time.perf_counter() - round_start)
+    return latency_stats(samples, time.perf_counter() - start)
+
+
+def main() -> int:
+    """ Runs the benchmark.
+
+    Returns:
+        - int: The process exit status: 0 on success, 2 on error.
+    """
+    # pylint: disable=import-outside-toplevel,too-many-locals
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0].strip())
+    parser.add_argument('--discussions', type=int, default=10000,
+                        help='Discussions generated in the database (default: 10000).')
+    parser.add_argument('--queries', type=int, default=500,
+                        help='Searches of each kind (default: 500).')
+    parser.add_argument('--writes', type=int, default=500,
+                        help='Writes of each kind, with and without the index (default: 500).')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the data and the operations (default: 0).')
+    parser.add_argument('--output', default='search-benchmark-results.json',
+                        help='Where to write the results (default: search-benchmark-results.json).')
+    args = parser.parse_args()
+
+    from sqlalchemy import text  # type: ignore
+    from dms2223backend.data.config import BackendConfiguration
+    from dms2223backend.data.db import DataGenerator, Schema
+    from dms2223backend.data.db.resultsets import Search
+    from dms2223backend.service import AnswersServices, SearchServices
+
+    rnd: random.Random = random.Random(args.seed)
+    work_dir: str = tempfile.mkdtemp(prefix='dms2223-search-benchmark-')
+    results: Dict[str, Dict] = {}
+    try:
+        cfg: BackendConfiguration = BackendConfiguration()
+        cfg.set_db_connection_string(f'sqlite:///{os.path.join(work_dir, "backend.db")}')
+        schema: Schema = Schema(cfg)
+        print(f'Generating {args.discussions} discussions...', file=sys.stderr)
+        session = schema.new_session()
+        counts: Dict[str, int] = DataGenerator(
+            discussions=args.discussions, seed=args.seed
+        ).generate(session)
+        posts: int = counts.get('discussions', 0) + counts.get('answers', 0) \
+            + counts.get('comments', 0)
+        contents: List[str] = list(session.execute(text(
+            'SELECT content FROM answers ORDER BY id LIMIT 1000'
+        )).scalars())
+        answer_ids: List[int] = list(session.execute(text(
+            'SELECT id FROM answers ORDER BY id LIMIT 1000'
+        )).scalars())
+        schema.remove_session()
+        words: List[str] = sorted({
+            word for content in contents for word in re.findall(r'\w{4,}', content)
+        })
+        if not words or not answer_ids:
+            print('Benchmark error: no posts to search', file=sys.stderr)
+            return 2
+
+        def set_index(deployed: bool) -> float:
+            session = schema.new_session()
+            try:
+                Search.undeploy(session.connection())
+                session.commit()
+                start: float = time.perf_counter()
+                if deployed:
+                    Search.deploy(session.connection())
+                    session.commit()
+                return time.perf_counter() - start
+            finally:
+                schema.remove_session()
+
+        print(f'Indexing {posts} posts...', file=sys.stderr)
+        elapsed: float = set_index(True)
+        results['index build'] = dict(latency_stats([elapsed], elapsed), posts=posts)
+
+        print(f'Running {args.queries} searches of each kind...', file=sys.stderr)
+        queries: List[str] = [rnd.choice(words) for _ in range(args.queries)]
+        results['search word'] = time_operation(
+            lambda index: SearchServices.search(queries[index], schema), args.queries
+        )
+        results['search prefix'] = time_operation(
+            lambda index: SearchServices.search(queries[index][:3], schema), args.queries
+        )
+        results['search two words'] = time_operation(
+            lambda index: SearchServices.search(
+                f'{queries[index]} {queries[-index - 1]}', schema
+            ), args.queries
+        )
+
+        print(f'Running {args.writes} writes of each kind with and without the index...',
+              file=sys.stderr)
+        for deployed in (True, False):
+            set_index(deployed)
+            suffix: str = 'indexed' if deployed else 'not indexed'
+            results[f'answer ({suffix})'] = time_operation(
+                lambda index: AnswersServices.answer(
+                    rnd.randint(1, args.discussions), f'Benchmark answer {index}', schema
+                ), args.writes
+            )
+            results[f'vote ({suffix})'] = time_operation(
+                lambda index: AnswersServices.vote_answer(rnd.choice(answer_ids), schema),
+                args.writes
+            )
+        schema.get_engine().dispose()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    with open(args.output, 'w', encoding='UTF-8') as stream:
+        json.dump({
+            'meta': {
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'revision': git_revision(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpus': os.cpu_count(),
+                'options': {key: value for key, value in vars(args).items() if key != 'output'}
+            },
+            'operations': results
+        }, stream, indent=2)
+    print(f'{"operation":<22}{"count":>8}{"ops/s":>10}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}')
+    for name, stats in results.items():
+        print(f'{name:<22}{stats["count"]:>8}{stats["ops"]:>10.1f}{stats["p50_ms"]:>10.2f}'
+              f'{stats["p95_ms"]:>10.2f}{stats["p99_ms"]:>10.2f}')
+    print(f'Results written to {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
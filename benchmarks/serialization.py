@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+""" Serialization benchmark of the large backend listings.
+
+Times how the pages of `/discussions` and `/discussions/reports` are built and serialized when
+they hold every row of a large fixture database (100K discussions and reports by default): the
+rows are converted to dictionaries from ORM objects (as the services used to) and from column
+tuples (as they do now), and each page is serialized as JSON with Connexion's encoder (indented,
+with the keys sorted) and with `FastJSONProvider` and each of its encoders. The documents of all
+the encoders are checked to be equal. The timings and document sizes are printed and written as
+JSON.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENTS_DIR: str = os.path.join(ROOT_DIR, 'components')
+for _component in ('dms2223common', 'dms2223backend'):
+    sys.path.insert(0, os.path.join(COMPONENTS_DIR, _component))
+
+
+def timings(function: Callable[[], object], rounds: int) -> Tuple[Dict[str, float], object]:
+    """ Times a function.
+
+    Args:
+        - function (Callable[[], object]): The function to time.
+        - rounds (int): The number of timed calls.
+
+    Returns:
+        - Tuple[Dict[str, float], object]: The minimum and median time per call in milliseconds,
+          and the result of the last call.
+    """
+    times: List[float] = []
+    result: object = None
+    for _ in range(rounds):
+        start: float = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return ({'min_ms': 1000 * min(times), 'median_ms': 1000 * statistics.median(times)}, result)
+
+
+def fixture(schema, path: str, rows: int, seed: int) -> None:
+    """ Populates the fixture database (`rows` discussions, each with an answer and a report),
+    unless it is complete.
+
+    Args:
+        - schema (Schema): The backend database schema.
+        - path (str): The database file.
+        - rows (int): The number of discussions.
+        - seed (int): The generator seed.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dms2223backend.data.db import DataGenerator
+    if os.path.exists(f'{path}.done'):
+        return
+    DataGenerator(
+        discussions=rows, answers_per_discussion=1, comments_per_answer=0, votes_per_post=0,
+        report_rate=1.0, seed=seed
+    ).generate(schema.new_session())
+    schema.remove_session()
+    open(f'{path}.done', 'w', encoding='UTF-8').close()
+
+
+def main() -> int:
+    """ Runs the benchmark.
+
+    Returns:
+        - int: The process exit status: 0 on success, 2 on error.
+    """
+    # pylint: disable=import-outside-toplevel,too-many-locals
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0].strip())
+    parser.add_argument('--rows', type=int, default=100000,
+                        help='Discussions and reports listed (default: 100000).')
+    parser.add_argument('--fixtures-dir', default=os.path.join(tempfile.gettempdir(), 'dms2223-benchmark-fixtures'),
+                        help='Where the fixture database is kept and reused.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the fixture data (default: 0).')
+    parser.add_argument('--rounds', type=int, default=5, help='Timed rounds per step (default: 5).')
+    parser.add_argument('--output', default='serialization-benchmark-results.json',
+                        help='Where to write the results (default: serialization-benchmark-results.json).')
+    args = parser.parse_args()
+
+    from connexion.apps.flask_app import FlaskJSONEncoder  # type: ignore
+    from flask import Flask
+    from sqlalchemy import func  # type: ignore
+    from dms2223common.presentation import FastJSONProvider
+    from dms2223backend.data.config import BackendConfiguration
+    from dms2223backend.data.db import Schema
+    from dms2223backend.data.db.results import Answer, Discussion, Report
+    from dms2223backend.data.db.resultsets import Pagination
+    from dms2223backend.service import DiscussionsServices, reportsServices
+
+    os.makedirs(args.fixtures_dir, exist_ok=True)
+    path: str = os.path.join(args.fixtures_dir, f'serialization-{args.rows}-{args.seed}.db')
+    if not os.path.exists(f'{path}.done') and os.path.exists(path):
+        # A partial fixture left by an interrupted run
+        os.remove(path)
+    cfg: BackendConfiguration = BackendConfiguration()
+    cfg.set_db_connection_string(f'sqlite:///{path}')
+    schema: Schema = Schema(cfg)
+    print(f'Preparing the fixture ({args.rows} rows)...', file=sys.stderr)
+    fixture(schema, path, args.rows, args.seed)
+
+    def discussions_from_objects() -> Dict:
+        session = schema.new_session()
+        query = session.query(Discussion, func.count(Answer.id)).outerjoin(
+            Answer, Answer.discussionid == Discussion.id
+        ).group_by(Discussion.id)
+        page, next_cursor = Pagination.split(
+            Pagination.keyset(query, Discussion.id, args.rows + 1).all(), args.rows,
+            lambda row: row[0].id
+        )
+        items: List[Dict] = [{
+            'id': discussion.id,
+            'title': discussion.title,
+            'content': discussion.content,
+            'answered': 1 if answers > 0 else 0,
+            'answers': answers
+        } for discussion, answers in page]
+        schema.remove_session()
+        return {'items': items, 'next_cursor': next_cursor}
+
+    def reports_from_objects() -> Dict:
+        session = schema.new_session()
+        page, next_cursor = Pagination.split(
+            Pagination.keyset(session.query(Report), Report.id, args.rows + 1).all(), args.rows,
+            lambda report: report.id
+        )
+        items: List[Dict] = [{
+            'id': report.id,
+            'discussionid': report.discussionid,
+            'reason': report.reason,
+            'timestamp': report.timestamp,
+            'status': report.status.name
+        } for report in page]
+        schema.remove_session()
+        return {'items': items, 'next_cursor': next_cursor}
+
+    app: Flask = Flask('serialization-benchmark')
+    encoders: Dict[str, Callable[[Dict], str]] = {
+        # What Connexion did: Flask's provider with its encoder, indented and with sorted keys
+        'connexion': lambda page: json.dumps(
+            page, cls=FlaskJSONEncoder, indent=2, sort_keys=True, ensure_ascii=True
+        ),
+        'stdlib': FastJSONProvider(app, 'stdlib').dumps
+    }
+    orjson_provider: Optional[FastJSONProvider] = None
+    try:
+        orjson_provider = FastJSONProvider(app, 'orjson')
+        encoders['orjson'] = orjson_provider.dumps
+    except RuntimeError:
+        print('orjson is not installed; skipping its encoder', file=sys.stderr)
+
+    listings: Dict[str, Tuple[Callable[[], Dict], Callable[[], Dict]]] = {
+        '/discussions': (
+            discussions_from_objects,
+            lambda: DiscussionsServices.list_discussions(schema, args.rows)
+        ),
+        '/discussions/reports': (
+            reports_from_objects,
+            lambda: reportsServices.list_reports(schema, args.rows)
+        )
+    }
+    steps: Dict[str, Dict[str, Dict]] = {}
+    failures: List[str] = []
+    warnings.simplefilter('ignore', DeprecationWarning)
+    for listing, (from_objects, from_tuples) in listings.items():
+        print(f'Timing {listing}...', file=sys.stderr)
+        steps[listing] = {}
+        steps[listing]['rows: ORM objects'], _ = timings(from_objects, args.rounds)
+        steps[listing]['rows: column tuples'], page = timings(from_tuples, args.rounds)
+        if len(page['items']) != args.rows:  # type: ignore
+            failures.append(f'{listing} listed {len(page["items"])} rows')  # type: ignore
+        expected: Optional[Dict] = None
+        for name, encoder in encoders.items():
+            stats, document = timings(lambda encoder=encoder: encoder(page), args.rounds)
+            stats['bytes'] = len(document.encode('UTF-8'))  # type: ignore
+            steps[listing][f'json: {name}'] = stats
+            decoded: Dict = json.loads(document)  # type: ignore
+            if expected is None:
+                expected = decoded
+            elif decoded != expected:
+                failures.append(f'{listing} serialized by {name} differs')
+    if failures:
+        for failure in failures:
+            print(f'Benchmark error: {failure}', file=sys.stderr)
+        return 2
+
+    results: Dict = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'options': {
+                key: value for key, value in vars(args).items() if key in ('rows', 'seed', 'rounds')
+            }
+        },
+        'listings': steps
+    }
+    with open(args.output, 'w', encoding='UTF-8') as stream:
+        json.dump(results, stream, indent=2)
+    print(f'{"listing":<22}{"step":<22}{"min ms":>10}{"median ms":>12}{"MB":>8}')
+    for listing, listing_steps in steps.items():
+        for step, stats in listing_steps.items():
+            size: str = f'{stats["bytes"] / 1e6:>8.1f}' if 'bytes' in stats else f'{"":>8}'
+            print(f'{listing:<22}{step:<22}{stats["min_ms"]:>10.1f}{stats["median_ms"]:>12.1f}'
+                  + size)
+    print(f'Results written to {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+""" Throughput benchmark of the user token verification in the backend service.
+
+Starts the services once per verification mode and sends authenticated backend API requests
+(`GET /discussions/{id}`) from concurrent threads for a while: with the tokens verified locally
+(the default), validated against the auth service on every request (as the backend used to), and
+validated against the auth service through the backend token cache. The requests per second and
+the latencies of every mode are printed and written as JSON.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List
+import requests
+from e2e import API_KEYS, Recorder, Services, git_revision, print_table
+
+# The backend configuration options of each mode
+MODES: Dict[str, Dict] = {
+    'local': {'token_revocation_check': False},
+    'auth-service': {'token_revocation_check': True, 'token_cache': {'size': 0}},
+    'auth-service-cached': {'token_revocation_check': True}
+}
+
+
+def run_load(services: Services, token: str, discussions: int, threads: int, warmup: float,
+             duration: float, seed: int) -> Dict:
+    """ Sends authenticated backend requests from concurrent threads.
+
+    Args:
+        - services (Services): The running services.
+        - token (str): The user token sent in every request.
+        - discussions (int): The number of discussions, whose ids are requested at random.
+        - threads (int): The number of concurrent threads.
+        - warmup (float): Seconds run before recording.
+        - duration (float): Seconds recorded.
+        - seed (int): Seed of the requested ids.
+
+    Returns:
+        - Dict: The summary of the requests (see `Recorder.summary`).
+    """
+    recorder: Recorder = Recorder()
+    stop: threading.Event = threading.Event()
+    base_url: str = f'http://127.0.0.1:{services.ports["backend"]}/api/v1'
+    headers: Dict[str, str] = {
+        'X-ApiKey-Backend': API_KEYS['frontend_to_backend'],
+        'Authorization': f'Bearer {token}'
+    }
+
+    def loop(rnd: random.Random) -> None:
+        session: requests.Session = requests.Session()
+        while not stop.is_set():
+            start: float = time.perf_counter()
+            try:
+                failed: bool = not session.get(
+                    f'{base_url}/discussions/{rnd.randint(1, discussions)}', headers=headers,
+                    timeout=60
+                ).ok
+            except requests.RequestException:
+                failed = True
+            recorder.record('GET /discussions/{id}', time.perf_counter() - start, failed)
+
+    workers: List[threading.Thread] = [
+        threading.Thread(target=loop, args=(random.Random(seed * 1000 + index),), daemon=True)
+        for index in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    time.sleep(warmup)
+    recorder.recording = True
+    start: float = time.perf_counter()
+    time.sleep(duration)
+    recorder.recording = False
+    measured: float = time.perf_counter() - start
+    stop.set()
+    for worker in workers:
+        worker.join(timeout=60)
+    return recorder.summary(measured).get('TOTAL', {})
+
+
+def main() -> int:
+    """ Runs the benchmark.
+
+    Returns:
+        - int: The process exit status: 0 on success, 2 on error.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0].strip())
+    parser.add_argument('--modes', default=','.join(MODES),
+                        help=f'Comma-separated verification modes (default: {",".join(MODES)}).')
+    parser.add_argument('--threads', type=int, default=4,
+                        help='Concurrent threads sending requests (default: 4).')
+    parser.add_argument('--discussions', type=int, default=100,
+                        help='Discussions generated in the backend database (default: 100).')
+    parser.add_argument('--warmup', type=float, default=2, help='Seconds before recording (default: 2).')
+    parser.add_argument('--duration', type=float, default=10,
+                        help='Seconds recorded per mode (default: 10).')
+    parser.add_argument('--server-mode', choices=['development', 'wsgi', 'async'], default='development',
+                        help='Serving mode of the services (default: development).')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the data and the requests (default: 0).')
+    parser.add_argument('--output', default='tokens-benchmark-results.json',
+                        help='Where to write the results (default: tokens-benchmark-results.json).')
+    args = parser.parse_args()
+
+    modes: List[str] = [mode for mode in args.modes.split(',') if mode]
+    unknown: List[str] = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        print(f'Unknown modes: {", ".join(unknown)}', file=sys.stderr)
+        return 2
+
+    results: Dict[str, Dict] = {}
+    for mode in modes:
+        work_dir: str = tempfile.mkdtemp(prefix='dms2223-benchmark-')
+        services: Services = Services(
+            work_dir, f'sqlite:///{os.path.join(work_dir, "backend.db")}', args.server_mode,
+            overrides={'dms2223backend': MODES[mode]}
+        )
+        try:
+            print(f'Running the {mode} mode for {args.warmup} + {args.duration} s...', file=sys.stderr)
+            services.run_script('dms2223auth', 'dms2223auth-create-admin')
+            services.run_script(
+                'dms2223backend', 'dms2223backend-generate-data',
+                '--discussions', str(args.discussions), '--seed', str(args.seed)
+            )
+            services.start()
+            services.create_users([('benchtoken', ['DISCUSSION'])])
+            results[mode] = run_load(
+                services, services.login('benchtoken'), args.discussions, args.threads,
+                args.warmup, args.duration, args.seed
+            )
+        except (RuntimeError, subprocess.CalledProcessError) as ex:
+            print(f'Benchmark error: {ex}', file=sys.stderr)
+            return 2
+        finally:
+            services.stop()
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    with open(args.output, 'w', encoding='UTF-8') as stream:
+        json.dump({
+            'meta': {
+                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'revision': git_revision(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpus': os.cpu_count(),
+                'options': {key: value for key, value in vars(args).items() if key != 'output'}
+            },
+            'modes': results
+        }, stream, indent=2)
+    print_table(results)
+    if 'auth-service' in results and results['auth-service'].get('throughput'):
+        for mode, stats in results.items():
+            print(f'{mode}: {stats.get("throughput", 0) / results["auth-service"]["throughput"]:.2f}x '
+                  'the requests per second of the auth-service mode')
+    print(f'Results written to {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,7 +1,7 @@
 """ AuthConfiguration class module.
 """
 
-from typing import Dict
+from typing import Dict, List
 from dms2223common.data.config import ServiceConfiguration
 
 
@@ -25,13 +25,21 @@ class AuthConfiguration(ServiceConfiguration):
         ServiceConfiguration.__init__(self)
 
         self.set_db_connection_string('sqlite:////tmp/dms2223auth.sqlite3.db')
+        self.set_db_engine_options({})
+        self.set_db_pragmas({})
+        self.set_db_profiler({})
         self.set_service_host('127.0.0.1')
         self.set_service_port(4000)
         self.set_debug_flag(True)
         self.set_password_salt('This salt should be changed ASAP')
+        self.set_password_hashing({})
         self.set_jws_secret('This JWS secret should be changed ASAP')
         self.set_jws_ttl(3600)
+        self.set_jws_renewal_window(900)
+        self.set_role_cache({})
+        self.set_login_throttling({})
         self.set_authorized_api_keys([])
+        self.set_token_invalidation_hooks([])
 
     def _set_values(self, values: Dict) -> None:
         """Sets/merges a collection of configuration values.
@@ -43,12 +51,28 @@ class AuthConfiguration(ServiceConfiguration):
 
         if 'db_connection_string' in values:
             self.set_db_connection_string(values['db_connection_string'])
+        if 'db_engine' in values:
+            self.set_db_engine_options(values['db_engine'])
+        if 'db_pragmas' in values:
+            self.set_db_pragmas(values['db_pragmas'])
+        if 'db_profiler' in values:
+            self.set_db_profiler(values['db_profiler'])
         if 'salt' in values:
             self.set_password_salt(values['salt'])
+        if 'password_hashing' in values:
+            self.set_password_hashing(values['password_hashing'])
         if 'jws_secret' in values:
             self.set_jws_secret(values['jws_secret'])
         if 'jws_ttl' in values:
             self.set_jws_ttl(values['jws_ttl'])
+        if 'jws_renewal_window' in values:
+            self.set_jws_renewal_window(values['jws_renewal_window'])
+        if 'role_cache' in values:
+            self.set_role_cache(values['role_cache'])
+        if 'login_throttling' in values:
+            self.set_login_throttling(values['login_throttling'])
+        if 'token_invalidation_hooks' in values:
+            self.set_token_invalidation_hooks(values['token_invalidation_hooks'])
 
     def set_db_connection_string(self, db_connection_string: str) -> None:
         """ Sets the db_connection_string configuration value.
@@ -90,6 +114,54 @@ class AuthConfiguration(ServiceConfiguration):
 
         return str(self._values['salt'])
 
+    def set_password_hashing(self, hashing: Dict) -> None:
+        """ Sets the password hashing configuration value.
+
+        Args:
+            - hashing: A dictionary with the hashing algorithm (`algorithm`, `scrypt` or
+              `pbkdf2_sha256`), its cost parameters (`scrypt_n`, `scrypt_r` and `scrypt_p` for
+              scrypt, `pbkdf2_iterations` for PBKDF2), the size in bytes of the random salts
+              (`salt_size`) and the number of threads computing hashes (`workers`, `0` computing
+              them in the threads handling the requests). Missing keys take their default values.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = {
+            'algorithm': 'scrypt',
+            'scrypt_n': 16384,
+            'scrypt_r': 8,
+            'scrypt_p': 1,
+            'pbkdf2_iterations': 600000,
+            'salt_size': 16,
+            'workers': 2
+        }
+        unknown = set(hashing) - set(values)
+        if unknown:
+            raise ValueError(f'Unknown password hashing options {", ".join(sorted(unknown))}')
+        values.update(hashing)
+        if values['algorithm'] not in ('scrypt', 'pbkdf2_sha256'):
+            raise ValueError(f'Invalid password hashing algorithm {values["algorithm"]}')
+        for key in ('scrypt_n', 'scrypt_r', 'scrypt_p', 'pbkdf2_iterations', 'salt_size'):
+            values[key] = int(values[key])
+            if values[key] <= 0:
+                raise ValueError(f'Invalid password hashing {key} value {values[key]}')
+        if values['scrypt_n'] < 2 or values['scrypt_n'] & (values['scrypt_n'] - 1):
+            raise ValueError(f'Invalid password hashing scrypt_n value {values["scrypt_n"]}')
+        values['workers'] = int(values['workers'])
+        if values['workers'] < 0:
+            raise ValueError(f'Invalid password hashing workers value {values["workers"]}')
+        self._values['password_hashing'] = values
+
+    def get_password_hashing(self) -> Dict:
+        """ Gets the password hashing configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of password_hashing.
+        """
+
+        return self._values['password_hashing']
+
     def set_jws_secret(self, secret: str) -> None:
         """ Sets the JWS secret key configuration value.
 
@@ -129,3 +201,137 @@ class AuthConfiguration(ServiceConfiguration):
         """
 
         return int(self._values['jws_ttl'])
+
+    def set_jws_renewal_window(self, window: int) -> None:
+        """ Sets the number of seconds before their expiration from which tokens are renewed.
+
+        Args:
+            - window: An integer with the configuration value.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if int(window) < 0:
+            raise ValueError(f'Invalid JWS renewal window {window}')
+        self._values['jws_renewal_window'] = int(window)
+
+    def get_jws_renewal_window(self) -> int:
+        """ Gets the number of seconds before their expiration from which tokens are renewed.
+
+        Returns:
+            - int: An integer with the value of jws_renewal_window.
+        """
+
+        return int(self._values['jws_renewal_window'])
+
+    def set_role_cache(self, role_cache: Dict) -> None:
+        """ Sets the role cache configuration value.
+
+        Args:
+            - role_cache: A dictionary with the maximum number of users whose roles are cached
+              (`size`, `0` disabling the cache) and the maximum number of seconds they are kept
+              (`ttl`). Missing keys take their default values.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = {
+            'size': 1024,
+            'ttl': 30.0
+        }
+        unknown = set(role_cache) - set(values)
+        if unknown:
+            raise ValueError(f'Unknown role cache options {", ".join(sorted(unknown))}')
+        values.update(role_cache)
+        values['size'] = int(values['size'])
+        values['ttl'] = float(values['ttl'])
+        if values['size'] < 0:
+            raise ValueError(f'Invalid role cache size value {values["size"]}')
+        if values['ttl'] <= 0:
+            raise ValueError(f'Invalid role cache ttl value {values["ttl"]}')
+        self._values['role_cache'] = values
+
+    def get_role_cache(self) -> Dict:
+        """ Gets the role cache configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of role_cache.
+        """
+
+        return self._values['role_cache']
+
+    def set_login_throttling(self, throttling: Dict) -> None:
+        """ Sets the login attempts throttling configuration value.
+
+        Args:
+            - throttling: A dictionary with the backend where the attempts are counted
+              (`backend`: `none`, disabling the throttling, `memory` or `redis`), the maximum
+              attempts per user name (`username_limit`) and per client (`client_limit`) in a
+              sliding window (`0` disabling that limit) of the given number of seconds (`window`),
+              the maximum number of counters of the `memory` backend (`size`), and the server
+              (`host` and `port`), database number (`db`) and key prefix (`prefix`) of the `redis`
+              backend. Missing keys take their default values.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = {
+            'backend': 'memory',
+            'username_limit': 10,
+            'client_limit': 100,
+            'window': 60.0,
+            'size': 10000,
+            'host': '127.0.0.1',
+            'port': 6379,
+            'db': 0,
+            'prefix': 'dms2223auth:'
+        }
+        unknown = set(throttling) - set(values)
+        if unknown:
+            raise ValueError(f'Unknown login throttling options {", ".join(sorted(unknown))}')
+        values.update(throttling)
+        if values['backend'] not in ('none', 'memory', 'redis'):
+            raise ValueError(f'Invalid login throttling backend {values["backend"]}')
+        values['window'] = float(values['window'])
+        for key in ('username_limit', 'client_limit', 'size', 'port', 'db'):
+            values[key] = int(values[key])
+        if values['username_limit'] < 0 or values['client_limit'] < 0:
+            raise ValueError('The login throttling limits must not be negative')
+        if values['window'] <= 0 or values['size'] <= 0:
+            raise ValueError('The login throttling window and size must be positive')
+        values['host'] = str(values['host'])
+        values['prefix'] = str(values['prefix'])
+        self._values['login_throttling'] = values
+
+    def get_login_throttling(self) -> Dict:
+        """ Gets the login attempts throttling configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of login_throttling.
+        """
+
+        return self._values['login_throttling']
+
+    def set_token_invalidation_hooks(self, hooks: List[Dict]) -> None:
+        """ Sets the token_invalidation_hooks configuration value.
+
+        Args:
+            - hooks: A list of dictionaries with the `url` to notify, and the `apikey_header` and
+              `apikey_secret` used to present this service.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        for hook in hooks:
+            if 'url' not in hook:
+                raise ValueError('Every token invalidation hook must have an url')
+        self._values['token_invalidation_hooks'] = hooks
+
+    def get_token_invalidation_hooks(self) -> List[Dict]:
+        """ Gets the token_invalidation_hooks configuration value.
+
+        Returns:
+            - List[Dict]: A list of dictionaries with the value of token_invalidation_hooks.
+        """
+
+        return self._values['token_invalidation_hooks']
@@ -0,0 +1,44 @@
+""" RoleVersion class module.
+"""
+
+from sqlalchemy import Table, MetaData, Column, ForeignKey, String, Integer  # type: ignore
+from dms2223auth.data.db.results.resultbase import ResultBase
+
+
+class RoleVersion(ResultBase):
+    """ Definition and storage of user role version ORM records.
+
+    The version of the roles of a user is increased every time they change, so tokens carrying
+    the roles of an older version can be told apart.
+    """
+
+    def __init__(self, username: str, version: int = 0):
+        """ Constructor method.
+
+        Initializes a role version record.
+
+        Args:
+            - username (str): A string with the user name.
+            - version (int): The version of the user roles.
+        """
+        self.username: str = username
+        self.version: int = version
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'role_versions',
+            metadata,
+            Column('username', String(32),
+                   ForeignKey('users.username'), primary_key=True),
+            Column('version', Integer, nullable=False, default=0)
+        )
@@ -19,7 +19,7 @@ class User(ResultBase):
 
         Args:
             - username (str): A string with the user name.
-            - password (str): A string with the password hash.
+            - password (str): A string with the encoded password hash.
         """
         self.username: str = username
         self.password: str = password
@@ -39,7 +39,7 @@ class User(ResultBase):
             'users',
             metadata,
             Column('username', String(32), primary_key=True),
-            Column('password', String(64), nullable=False)
+            Column('password', String(255), nullable=False)
         )
 
     @staticmethod
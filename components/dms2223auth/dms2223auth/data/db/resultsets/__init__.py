@@ -3,3 +3,4 @@
 
 from .users import Users
 from .userroles import UserRoles
+from .roleversions import RoleVersions
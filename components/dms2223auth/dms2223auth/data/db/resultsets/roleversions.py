@@ -0,0 +1,62 @@
+""" RoleVersions class module.
+"""
+
+from typing import Optional
+from sqlalchemy import inspect  # type: ignore
+from sqlalchemy.dialects import mysql, postgresql, sqlite  # type: ignore
+from sqlalchemy.orm import Session  # type: ignore
+from dms2223auth.data.db.results import RoleVersion
+
+
+class RoleVersions():
+    """ Class responsible of table-level user role version operations.
+    """
+    @staticmethod
+    def get(session: Session, username: str) -> int:
+        """ Gets the version of the roles of a user.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+
+        Returns:
+            - int: The version, `0` if the roles of the user never changed.
+        """
+        role_version: Optional[RoleVersion] = session.query(RoleVersion).filter_by(
+            username=username
+        ).one_or_none()
+        return role_version.version if role_version is not None else 0
+
+    @staticmethod
+    def increase(session: Session, username: str) -> None:
+        """ Increases the version of the roles of a user.
+
+        The first version of a user is created by the same statement (an upsert), so concurrent
+        first role changes of a user do not race to insert it.
+
+        Note:
+            The change is not committed; it is meant to be committed along with the role change.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+        """
+        table = inspect(RoleVersion).local_table
+        dialect: str = session.get_bind().dialect.name
+        if dialect in ('sqlite', 'postgresql'):
+            insert = (sqlite.insert if dialect == 'sqlite' else postgresql.insert)(table).values(
+                username=username, version=1
+            )
+            session.execute(insert.on_conflict_do_update(
+                index_elements=[table.c.username], set_={'version': table.c.version + 1}
+            ))
+        elif dialect in ('mysql', 'mariadb'):
+            session.execute(mysql.insert(table).values(
+                username=username, version=1
+            ).on_duplicate_key_update(version=table.c.version + 1))
+        else:
+            updated: int = session.query(RoleVersion).filter_by(username=username).update(
+                {RoleVersion.version: RoleVersion.version + 1}, synchronize_session=False
+            )
+            if updated == 0:
+                session.add(RoleVersion(username, 1))
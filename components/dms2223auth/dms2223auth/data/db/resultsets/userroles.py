@@ -8,6 +8,7 @@ from sqlalchemy.orm.exc import NoResultFound  # type: ignore
 from dms2223common.data import Role
 from dms2223auth.data.db.results import UserRole
 from dms2223auth.data.db.exc import UserNotFoundError
+from dms2223auth.data.db.resultsets.roleversions import RoleVersions
 
 
 class UserRoles():
@@ -15,7 +16,7 @@ class UserRoles():
     """
     @staticmethod
     def grant(session: Session, username: str, role: Role) -> UserRole:
-        """ Grants a role to a user.
+        """ Grants a role to a user, increasing the version of their roles.
 
         Note:
             Any existing transaction will be committed.
@@ -40,6 +41,7 @@ class UserRoles():
         try:
             new_user_role = UserRole(username, role)
             session.add(new_user_role)
+            RoleVersions.increase(session, username)
             session.commit()
             return new_user_role
         except IntegrityError as ex:
@@ -51,7 +53,7 @@ class UserRoles():
 
     @staticmethod
     def revoke(session: Session, username: str, role: Role):
-        """ Revokes a role from a user.
+        """ Revokes a role from a user, increasing the version of their roles.
 
         Note:
             Any existing transaction will be committed.
@@ -71,6 +73,7 @@ class UserRoles():
             return
         try:
             session.delete(user_role)
+            RoleVersions.increase(session, username)
             session.commit()
         except:
             session.rollback()
@@ -2,7 +2,7 @@
 """
 
 import hashlib
-from typing import List
+from typing import List, Optional
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
@@ -58,27 +58,52 @@ class Users():
         return query.all()
 
     @staticmethod
-    def user_exists(session: Session, username: str, password_hash: str) -> bool:
-        """ Determines whether a user exists or not.
+    def get(session: Session, username: str) -> Optional[User]:
+        """ Gets a user by name.
 
         Args:
             - session (Session): The session object.
             - username (str): The user name string.
-            - password_hash (str): The password hash string.
 
         Returns:
-            - bool: `True` if a user with the given credentials exists; `False` otherwise.
+            - Optional[User]: The `User` result, or `None` if there is no such user.
         """
         try:
-            query = session.query(User).filter_by(username=username, password=password_hash)
-            query.one()
+            query = session.query(User).filter_by(username=username)
+            return query.one()
         except NoResultFound:
-            return False
-        return True
+            return None
+
+    @staticmethod
+    def update_password(session: Session, username: str, password_hash: str) -> None:
+        """ Replaces the password hash of a user.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+            - password_hash (str): The new password hash string.
+
+        Raises:
+            - ValueError: If either the username or the password_hash is empty.
+        """
+        if not username or not password_hash:
+            raise ValueError('A username and a password hash are required.')
+        try:
+            session.query(User).filter_by(username=username).update({'password': password_hash})
+            session.commit()
+        except:
+            session.rollback()
+            raise
 
     @staticmethod
     def hash_password(password: str, suffix: str = '', salt: str = '') -> str:
-        """ A password hashing function compatible with the schema.
+        """ The legacy (unsalted per user, single SHA-256) password hashing function.
+
+        Only used to verify the passwords hashed before the introduction of `PasswordHasher`, so
+        they are rehashed.
 
         Args:
             - password (str): The password string.
@@ -1,12 +1,14 @@
 """ Schema class module.
 """
 
-from sqlalchemy import create_engine, event  # type: ignore
+from typing import Optional
+from sqlalchemy import event  # type: ignore
 from sqlalchemy.engine import Engine  # type: ignore
 from sqlalchemy.orm import sessionmaker, scoped_session, registry  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
+from dms2223common.data import DatabaseEngine, QueryProfiler
 from dms2223auth.data.config import AuthConfiguration
-from dms2223auth.data.db.results import User, UserRole
+from dms2223auth.data.db.results import User, UserRole, RoleVersion
 
 
 # Required for SQLite to enforce FK integrity when supported
@@ -43,13 +45,38 @@ class Schema():
                 'A value for the configuration parameter `db_connection_string` is needed.'
             )
         db_connection_string: str = config.get_db_connection_string() or ''
-        self.__create_engine = create_engine(db_connection_string)
+        self.__create_engine = DatabaseEngine.create(
+            db_connection_string, config.get_db_engine_options(), config.get_db_pragmas()
+        )
         self.__session_maker = scoped_session(sessionmaker(bind=self.__create_engine))
+        self.__profiler: Optional[QueryProfiler] = QueryProfiler.from_config(
+            config.get_db_profiler()
+        )
+        if self.__profiler is not None:
+            self.__profiler.instrument_engine(self.__create_engine)
 
         User.map(self.__registry)
         UserRole.map(self.__registry)
+        RoleVersion.map(self.__registry)
         self.__registry.metadata.create_all(self.__create_engine)
 
+    def get_engine(self) -> Engine:
+        """ Gets the engine the sessions are bound to.
+
+        Returns:
+            - Engine: The `Engine` object.
+        """
+        return self.__create_engine
+
+    def get_profiler(self) -> Optional[QueryProfiler]:
+        """ Gets the SQL query profiler.
+
+        Returns:
+            - Optional[QueryProfiler]: The profiler recording the statements run by the engine, or
+              `None` if profiling is disabled.
+        """
+        return self.__profiler
+
     def new_session(self) -> Session:
         """ Constructs a new session.
 
@@ -62,3 +89,15 @@ class Schema():
         """ Frees the existing thread-local session.
         """
         self.__session_maker.remove()
+
+    def reset_connections(self) -> None:
+        """ Discards the pooled connections without closing them, and the thread-local sessions.
+
+        To be called in a process forked from the one that created the schema, so the database
+        connections inherited from the parent process are not shared with it. With Gevent, it must
+        be called after the standard library is patched (see `WSGIServer`): the session registry
+        is then rebuilt on the patched thread-local storage, so every greenlet gets its own
+        session instead of sharing one.
+        """
+        self.__create_engine.dispose(close=False)
+        self.__session_maker = scoped_session(sessionmaker(bind=self.__create_engine))
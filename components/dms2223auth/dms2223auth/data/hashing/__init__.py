@@ -0,0 +1,6 @@
+""" Password hashing classes.
+"""
+
+from .passwordhasher import PasswordHasher
+from .scryptpasswordhasher import ScryptPasswordHasher
+from .pbkdf2passwordhasher import Pbkdf2PasswordHasher
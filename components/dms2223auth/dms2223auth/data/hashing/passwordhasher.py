@@ -0,0 +1,239 @@
+""" PasswordHasher class module.
+"""
+
+import base64
+import hmac
+import os
+import secrets
+import sys
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class PasswordHasher():
+    """ Base class of the salted, deliberately slow password hashing functions.
+
+    Hashes are encoded as `<algorithm>$<cost parameters>$<salt>$<hash>` (e.g.,
+    `scrypt$n=16384,r=8,p=1$...$...`), with a random salt per password, so any hash can be
+    verified with the algorithm and parameters it was created with, even after the configured ones
+    change, and hashes created with other ones can be told apart to be rehashed.
+
+    Given a number of workers, hashes are computed in a bounded pool of native threads, so a burst
+    of logins queues there instead of taking over the threads handling the requests. In `async`
+    server mode the Gevent thread pool is used, so hashing does not block the event loop.
+    """
+
+    ALGORITHM: str = ''
+
+    def __init__(self, salt_size: int = 16, workers: int = 0):
+        """ Constructor method.
+
+        Args:
+            - salt_size (int): The number of random bytes of each salt.
+            - workers (int): The number of threads computing hashes. `0` computes them in the
+              calling thread.
+        """
+        self.__salt_size: int = int(salt_size)
+        self.__workers: int = int(workers)
+        self.__executor: Any = None
+        self.__executor_pid: Optional[int] = None
+        self.__lock: Lock = Lock()
+
+    @staticmethod
+    def from_config(config: Dict) -> 'PasswordHasher':
+        """ Creates a password hasher from a configuration dictionary.
+
+        Args:
+            - config (Dict): The password hashing configuration (see
+              `AuthConfiguration.set_password_hashing`).
+
+        Returns:
+            - PasswordHasher: The new password hasher.
+        """
+        hasher_class: Any = PasswordHasher.__algorithm_class(config['algorithm'])
+        if config['algorithm'] == 'pbkdf2_sha256':
+            return hasher_class(
+                config['pbkdf2_iterations'], config['salt_size'], config['workers']
+            )
+        return hasher_class(
+            config['scrypt_n'], config['scrypt_r'], config['scrypt_p'], config['salt_size'],
+            config['workers']
+        )
+
+    @staticmethod
+    def parse(encoded: str) -> Optional[Tuple[str, Dict[str, int], bytes, bytes]]:
+        """ Reads an encoded hash.
+
+        Args:
+            - encoded (str): The encoded hash.
+
+        Returns:
+            - Optional[Tuple[str, Dict[str, int], bytes, bytes]]: The algorithm, the cost
+              parameters, the salt and the hash, or `None` if it is not a hash of this kind (e.g., a
+              legacy unsalted one).
+        """
+        try:
+            algorithm, params, salt, digest = encoded.split('$')
+            return (
+                algorithm,
+                {
+                    key: int(value)
+                    for key, value in (param.split('=') for param in params.split(','))
+                },
+                PasswordHasher.__decode(salt),
+                PasswordHasher.__decode(digest)
+            )
+        except (AttributeError, ValueError):
+            return None
+
+    def get_params(self) -> Dict[str, int]:
+        """ Gets the cost parameters of the new hashes.
+
+        Returns:
+            - Dict[str, int]: The cost parameters, by name.
+        """
+        raise NotImplementedError()
+
+    def hash(self, password: str) -> str:
+        """ Hashes a password with a new random salt.
+
+        Args:
+            - password (str): The password.
+
+        Returns:
+            - str: The encoded hash.
+        """
+        params: Dict[str, int] = self.get_params()
+        salt: bytes = secrets.token_bytes(self.__salt_size)
+        digest: bytes = self.__run(self._derive, password.encode('UTF-8'), salt, params)
+        return '$'.join((
+            self.ALGORITHM,
+            ','.join(f'{key}={value}' for key, value in params.items()),
+            PasswordHasher.__encode(salt),
+            PasswordHasher.__encode(digest)
+        ))
+
+    def verify(self, password: str, encoded: str) -> bool:
+        """ Checks a password against an encoded hash of any algorithm, in constant time.
+
+        Args:
+            - password (str): The password.
+            - encoded (str): The encoded hash.
+
+        Returns:
+            - bool: Whether the password matches the hash.
+        """
+        parsed: Optional[Tuple[str, Dict[str, int], bytes, bytes]] = PasswordHasher.parse(encoded)
+        if parsed is None:
+            return False
+        algorithm, params, salt, digest = parsed
+        try:
+            derived: bytes = self.__run(
+                PasswordHasher.__algorithm_class(algorithm)._derive,  # pylint: disable=protected-access
+                password.encode('UTF-8'), salt, params
+            )
+        except (KeyError, ValueError):
+            return False
+        return hmac.compare_digest(derived, digest)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """ Determines whether an encoded hash was not created by this hasher with its parameters.
+
+        Args:
+            - encoded (str): The encoded hash.
+
+        Returns:
+            - bool: `True` if the password should be hashed again; `False` otherwise.
+        """
+        parsed: Optional[Tuple[str, Dict[str, int], bytes, bytes]] = PasswordHasher.parse(encoded)
+        return parsed is None or parsed[0] != self.ALGORITHM or parsed[1] != self.get_params()
+
+    @staticmethod
+    def _derive(password: bytes, salt: bytes, params: Dict[str, int]) -> bytes:
+        """ Computes the hash of a password.
+
+        Args:
+            - password (bytes): The password.
+            - salt (bytes): The salt.
+            - params (Dict[str, int]): The cost parameters.
+
+        Raises:
+            - KeyError: If a cost parameter is missing.
+            - ValueError: If the cost parameters are invalid.
+
+        Returns:
+            - bytes: The hash.
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def __algorithm_class(algorithm: str) -> Any:
+        """ Gets the hasher class of an algorithm.
+
+        Args:
+            - algorithm (str): The algorithm name.
+
+        Raises:
+            - KeyError: If the algorithm is not supported.
+
+        Returns:
+            - type: The `PasswordHasher` subclass.
+        """
+        # pylint: disable=import-outside-toplevel
+        from dms2223auth.data.hashing.pbkdf2passwordhasher import Pbkdf2PasswordHasher
+        from dms2223auth.data.hashing.scryptpasswordhasher import ScryptPasswordHasher
+        return {
+            ScryptPasswordHasher.ALGORITHM: ScryptPasswordHasher,
+            Pbkdf2PasswordHasher.ALGORITHM: Pbkdf2PasswordHasher
+        }[algorithm]
+
+    def __run(self, function: Callable[..., bytes], *args: Any) -> bytes:
+        """ Runs a hashing function in the worker pool, if any, waiting for its result.
+
+        Args:
+            - function (Callable[..., bytes]): The function.
+            - *args (Any): Its arguments.
+
+        Returns:
+            - bytes: The result of the function.
+        """
+        if self.__workers <= 0:
+            return function(*args)
+        with self.__lock:
+            # Pools are not inherited by forked processes (e.g., the server workers)
+            if self.__executor is None or self.__executor_pid != os.getpid():
+                monkey = sys.modules.get('gevent.monkey')
+                if monkey is not None and monkey.is_module_patched('threading'):
+                    from gevent.threadpool import ThreadPoolExecutor  # type: ignore  # pylint: disable=import-outside-toplevel
+                else:
+                    from concurrent.futures import ThreadPoolExecutor  # pylint: disable=import-outside-toplevel
+                self.__executor = ThreadPoolExecutor(max_workers=self.__workers)
+                self.__executor_pid = os.getpid()
+        return self.__executor.submit(function, *args).result()
+
+    @staticmethod
+    def __encode(data: bytes) -> str:
+        """ Encodes binary data in the hashes.
+
+        Args:
+            - data (bytes): The data.
+
+        Returns:
+            - str: The unpadded base64 encoding of the data.
+        """
+        return base64.b64encode(data).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def __decode(data: str) -> bytes:
+        """ Decodes binary data from the hashes.
+
+        Args:
+            - data (str): The unpadded base64 encoding of the data.
+
+        Raises:
+            - ValueError: If the data is not valid base64.
+
+        Returns:
+            - bytes: The data.
+        """
+        return base64.b64decode(data + '=' * (-len(data) % 4), validate=True)
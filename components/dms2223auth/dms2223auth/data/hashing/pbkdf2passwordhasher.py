@@ -0,0 +1,56 @@
+""" Pbkdf2PasswordHasher class module.
+"""
+
+import hashlib
+from typing import Dict
+from dms2223auth.data.hashing.passwordhasher import PasswordHasher
+
+
+class Pbkdf2PasswordHasher(PasswordHasher):
+    """ Password hashing with PBKDF2-HMAC-SHA256.
+
+    Not memory-hard, but available everywhere (scrypt requires Python to be built against
+    OpenSSL 1.1 or newer).
+    """
+
+    ALGORITHM: str = 'pbkdf2_sha256'
+
+    def __init__(self, iterations: int = 600000, salt_size: int = 16, workers: int = 0):
+        """ Constructor method.
+
+        Args:
+            - iterations (int): The number of HMAC iterations.
+            - salt_size (int): The number of random bytes of each salt.
+            - workers (int): The number of threads computing hashes. `0` computes them in the
+              calling thread.
+        """
+        super().__init__(salt_size, workers)
+        self.__params: Dict[str, int] = {'i': int(iterations)}
+
+    def get_params(self) -> Dict[str, int]:
+        """ Gets the cost parameters of the new hashes.
+
+        Returns:
+            - Dict[str, int]: The number of iterations (key `i`).
+        """
+        return dict(self.__params)
+
+    @staticmethod
+    def _derive(password: bytes, salt: bytes, params: Dict[str, int]) -> bytes:
+        """ Computes the PBKDF2-HMAC-SHA256 hash of a password.
+
+        Args:
+            - password (bytes): The password.
+            - salt (bytes): The salt.
+            - params (Dict[str, int]): The number of iterations (key `i`).
+
+        Raises:
+            - KeyError: If a cost parameter is missing.
+            - ValueError: If the cost parameters are invalid.
+
+        Returns:
+            - bytes: The 32-byte hash.
+        """
+        if params['i'] < 1:
+            raise ValueError(f'Invalid number of iterations {params["i"]}')
+        return hashlib.pbkdf2_hmac('sha256', password, salt, params['i'])
@@ -0,0 +1,60 @@
+""" ScryptPasswordHasher class module.
+"""
+
+import hashlib
+from typing import Dict
+from dms2223auth.data.hashing.passwordhasher import PasswordHasher
+
+
+class ScryptPasswordHasher(PasswordHasher):
+    """ Memory-hard password hashing with scrypt.
+
+    Each hash takes `128 * n * r` bytes of memory (16 MiB with the default parameters) and time
+    proportional to `n * r * p`.
+    """
+
+    ALGORITHM: str = 'scrypt'
+
+    def __init__(self, n: int = 16384, r: int = 8, p: int = 1, salt_size: int = 16,
+                 workers: int = 0):
+        """ Constructor method.
+
+        Args:
+            - n (int): The CPU and memory cost (a power of 2).
+            - r (int): The block size.
+            - p (int): The parallelization.
+            - salt_size (int): The number of random bytes of each salt.
+            - workers (int): The number of threads computing hashes. `0` computes them in the
+              calling thread.
+        """
+        super().__init__(salt_size, workers)
+        self.__params: Dict[str, int] = {'n': int(n), 'r': int(r), 'p': int(p)}
+
+    def get_params(self) -> Dict[str, int]:
+        """ Gets the cost parameters of the new hashes.
+
+        Returns:
+            - Dict[str, int]: The `n`, `r` and `p` parameters.
+        """
+        return dict(self.__params)
+
+    @staticmethod
+    def _derive(password: bytes, salt: bytes, params: Dict[str, int]) -> bytes:
+        """ Computes the scrypt hash of a password.
+
+        Args:
+            - password (bytes): The password.
+            - salt (bytes): The salt.
+            - params (Dict[str, int]): The `n`, `r` and `p` parameters.
+
+        Raises:
+            - KeyError: If a cost parameter is missing.
+            - ValueError: If the cost parameters are invalid.
+
+        Returns:
+            - bytes: The 32-byte hash.
+        """
+        return hashlib.scrypt(
+            password, salt=salt, n=params['n'], r=params['r'], p=params['p'],
+            maxmem=256 * params['n'] * params['r'] * params['p'], dklen=32
+        )
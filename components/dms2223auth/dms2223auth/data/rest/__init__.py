@@ -0,0 +1,4 @@
+""" Data layer REST clients.
+"""
+
+from .tokeninvalidationhooks import TokenInvalidationHooks
@@ -0,0 +1,99 @@
+""" TokenInvalidationHooks class module.
+"""
+
+import logging
+import os
+import sys
+import time
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+import requests
+from dms2223common.data.rest import RestClient
+
+
+class TokenInvalidationHooks():
+    """ REST client notifying the services that cache validated tokens when they must be dropped.
+
+    Notifications are sent by a background worker, so the requests that change the roles of a
+    user do not wait for the notified services. Failed notifications are retried with exponential
+    backoff, and given up (and logged) after the last retry; the cached tokens will then expire on
+    their own.
+    """
+
+    def __init__(self, hooks: List[Dict]):
+        """ Constructor method.
+
+        Args:
+            - hooks (List[Dict]): The hooks to notify. Each one is a dictionary with the endpoint
+              URL (key `url`), the name of the header with the API key (key `apikey_header`) and
+              the API key itself (key `apikey_secret`) that identify this service, and optionally
+              the HTTP client options (key `http_client`, see `RestClient.from_config`; its
+              `retries` and `backoff_factor` also apply to the failed notifications).
+        """
+        self.__hooks: List[Tuple[Dict, RestClient]] = []
+        for hook in hooks:
+            options: Dict = {'pool_size': 1, 'connect_timeout': 2, 'read_timeout': 5}
+            options.update(hook.get('http_client', {}))
+            # The notifications are retried by the worker, not by the client
+            options['retries'] = 0
+            self.__hooks.append((hook, RestClient.from_config(hook['url'], options)))
+        self.__lock: Lock = Lock()
+        self.__executor: Optional[Any] = None
+        self.__executor_pid: Optional[int] = None
+
+    def invalidate_user(self, username: str) -> None:
+        """ Queues the notification to every hook that the cached tokens of a user must be dropped.
+
+        Args:
+            - username (str): The user whose tokens are no longer valid as cached.
+        """
+        if not self.__hooks:
+            return
+        with self.__lock:
+            # Pools are not inherited by forked processes (e.g., the server workers)
+            if self.__executor is None or self.__executor_pid != os.getpid():
+                monkey = sys.modules.get('gevent.monkey')
+                if monkey is not None and monkey.is_module_patched('threading'):
+                    from gevent.threadpool import ThreadPoolExecutor  # type: ignore  # pylint: disable=import-outside-toplevel
+                else:
+                    from concurrent.futures import ThreadPoolExecutor  # pylint: disable=import-outside-toplevel
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='token_invalidation'
+                )
+                self.__executor_pid = os.getpid()
+            for hook, client in self.__hooks:
+                self.__executor.submit(TokenInvalidationHooks.__notify, hook, client, username)
+
+    @staticmethod
+    def __notify(hook: Dict, client: RestClient, username: str) -> bool:
+        """ Notifies a hook, retrying on failure.
+
+        Args:
+            - hook (Dict): The hook configuration.
+            - client (RestClient): The HTTP client of the hook.
+            - username (str): The user whose tokens are no longer valid as cached.
+
+        Returns:
+            - bool: Whether the hook accepted the notification.
+        """
+        options: Dict = hook.get('http_client', {})
+        retries: int = int(options.get('retries', 3))
+        backoff_factor: float = float(options.get('backoff_factor', 0.2))
+        for attempt in range(retries + 1):
+            if attempt > 0:
+                time.sleep(backoff_factor * 2 ** (attempt - 1))
+            try:
+                response: requests.Response = client.post('', json={'user': username}, headers={
+                    hook.get('apikey_header', 'X-ApiKey-Auth'): hook.get('apikey_secret', '')
+                })
+            except requests.RequestException as ex:
+                logging.warning('Token invalidation hook %s failed: %s', hook['url'], ex)
+                continue
+            if response.ok:
+                return True
+            logging.warning('Token invalidation hook %s answered %d',
+                            hook['url'], response.status_code)
+            if response.status_code < 500:
+                return False
+        logging.error('Token invalidation hook %s given up for user %s', hook['url'], username)
+        return False
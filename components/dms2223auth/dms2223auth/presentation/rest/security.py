@@ -4,10 +4,10 @@
 import json
 import time
 from typing import Dict, Optional
-from flask import current_app
+from flask import current_app, request
 from authlib.jose import JsonWebSignature  # type: ignore
-from connexion.exceptions import Unauthorized  # type: ignore
-from dms2223auth.service import UserServices
+from connexion.exceptions import ProblemException, Unauthorized  # type: ignore
+from dms2223auth.service import LoginThrottle, UserServices
 from dms2223auth.data.config import AuthConfiguration
 
 
@@ -37,13 +37,26 @@ def verify_credentials(username: str, password: str) -> Optional[Dict]:
         - username (str): the user's username.
         - password (str): The user's password.
 
+    Raises:
+        - ProblemException: With status 429 and a `Retry-After` header when the attempt exceeds
+          the login throttling limits of the user name or the client.
+
     Returns:
         - Dict: A dictionary with the user name (key `user`) if the credentials are correct.
         - None: The credentials are incorrect.
     """
     with current_app.app_context():
+        throttle: Optional[LoginThrottle] = current_app.login_throttle
+        if throttle is not None:
+            retry_after: int = throttle.check(username, _client_address())
+            if retry_after > 0:
+                raise ProblemException(
+                    status=429, title='Too Many Requests',
+                    detail=f'Too many login attempts. Retry after {retry_after} seconds',
+                    headers={'Retry-After': str(retry_after)}
+                )
         user_exists: bool = UserServices.user_exists(
-            username, password, current_app.db, current_app.cfg
+            username, password, current_app.db, current_app.cfg, current_app.hasher
         )
         if user_exists:
             return {
@@ -53,6 +66,22 @@ def verify_credentials(username: str, password: str) -> Optional[Dict]:
     return None
 
 
+def _client_address() -> Optional[str]:
+    """Gets the address of the client attempting to log in.
+
+    Services presenting a valid API key (e.g., the frontend) are trusted to forward the address of
+    their own client in the `X-Forwarded-For` header.
+
+    Returns:
+        - Optional[str]: The client address, if known.
+    """
+    forwarded: Optional[str] = request.headers.get('X-Forwarded-For')
+    cfg: AuthConfiguration = current_app.cfg
+    if forwarded and request.headers.get('X-ApiKey-Auth') in cfg.get_authorized_api_keys():
+        return forwarded.split(',')[0].strip()
+    return request.remote_addr
+
+
 def verify_token(token: str) -> Dict:
     """Callback testing a JWS user token.
 
@@ -63,7 +92,9 @@ def verify_token(token: str) -> Dict:
         - Unauthorized: When the token is incorrect.
 
     Returns:
-        - Dict: A dictionary with the user name (key `user`) if the credentials are correct.
+        - Dict: A dictionary with the user name (key `user`), the token expiration timestamp (key
+          `exp`), the roles and their version carried by the token (keys `roles` and `rv`, `None`
+          if missing) and the token itself (key `token`) if the token is correct.
     """
     with current_app.app_context():
         token_bytes: bytes = token.encode('ascii')
@@ -77,12 +108,17 @@ def verify_token(token: str) -> Dict:
             payload: Dict = json.loads(data['payload'].decode('UTF-8'))
         except Exception as ex:
             raise Unauthorized from ex
-        if 'user' not in payload:
+        if not isinstance(payload, dict) or not {'user', 'sub', 'exp'} <= payload.keys():
+            raise Unauthorized('Invalid token')
+        if isinstance(payload['exp'], bool) or not isinstance(payload['exp'], (int, float)):
             raise Unauthorized('Invalid token')
         if time.time() > payload['exp']:
             raise Unauthorized('Expired token')
         return {
             'sub': payload['sub'],
             'user': payload['user'],
-            'exp': payload['exp']
+            'exp': payload['exp'],
+            'roles': payload.get('roles'),
+            'rv': payload.get('rv'),
+            'token': token
         }
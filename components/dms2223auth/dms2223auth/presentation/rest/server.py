@@ -7,7 +7,9 @@ from typing import Dict, Tuple, Optional
 from http import HTTPStatus
 from flask import current_app
 from authlib.jose import JsonWebSignature  # type: ignore
+from dms2223common.data import Metrics
 from dms2223auth.data.config.authconfiguration import AuthConfiguration
+from dms2223auth.service import RoleServices
 
 
 def health_test() -> Tuple[None, Optional[int]]:
@@ -22,6 +24,11 @@ def health_test() -> Tuple[None, Optional[int]]:
 def login(token_info: Dict) -> Tuple[str, Optional[int]]:
     """Generates a user token if the user validation was passed.
 
+    Tokens carry the user roles and their version as claims. A session token is only renewed
+    (i.e., a new token is signed) once it is within the renewal window of its expiration, or if
+    the user roles changed since it was signed; until then, the same token is returned. A token
+    carrying a newer version of the roles than the cached one refreshes the cache instead.
+
     Args:
         - token_info (Dict): A dictionary of information provided by the security schema handlers.
 
@@ -31,22 +38,65 @@ def login(token_info: Dict) -> Tuple[str, Optional[int]]:
     with current_app.app_context():
         cfg: AuthConfiguration = current_app.cfg
         jws: JsonWebSignature = current_app.jws
+        metrics: Metrics = current_app.metrics
         user: str = ''
+        grant: str = 'credentials'
         if 'user_token' in token_info:
             user = token_info['user_token']['user']
         elif 'user_credentials' in token_info:
             user = token_info['user_credentials']['user']
+        token_rv: Optional[int] = None
+        if 'user_token' in token_info:
+            token_rv = token_info['user_token']['rv']
+        role_claims: Dict = RoleServices.get_role_claims(
+            user, current_app.db, current_app.role_cache, min_rv=token_rv
+        )
+        if 'user_token' in token_info:
+            grant = 'renewal'
+            # Tokens without a roles version predate it, so they are outdated
+            if (token_info['user_token']['exp'] - time.time() > cfg.get_jws_renewal_window()
+                    and token_rv is not None and token_rv >= role_claims['rv']):
+                metrics.inc('auth_tokens_reused_total')
+                return (token_info['user_token']['token'], HTTPStatus.OK.value)
+        metrics.inc('auth_tokens_signed_total', grant=grant)
         token: bytes = jws.serialize_compact(
             {'alg': 'HS256'},
             bytes(json.dumps({
                 'user': user,
                 'sub': user,
-                'exp': (time.time() + cfg.get_jws_ttl())
+                'exp': (time.time() + cfg.get_jws_ttl()),
+                'roles': role_claims['roles'],
+                'rv': role_claims['rv']
             }), 'UTF-8'),
             bytes(cfg.get_jws_secret(), 'UTF-8')
         )
         return (token.decode('ascii'), HTTPStatus.OK.value)
 
+def validate_token(token_info: Dict) -> Tuple[Optional[str], Optional[int]]:
+    """Validates a user token, without renewing it.
+
+    The token is verified by the security schema handlers, so reaching this endpoint means it is
+    valid; it is only rejected if the roles it carries are older than the current ones. A token
+    carrying a newer version of the roles than the cached one refreshes the cache instead.
+
+    Args:
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Optional[str], Optional[int]]: A tuple of no content and code 204 No Content, or a
+          description message and code 401 Unauthorized if the user roles changed since the token
+          was signed.
+    """
+    token_rv: Optional[int] = token_info['user_token']['rv']
+    with current_app.app_context():
+        role_claims: Dict = RoleServices.get_role_claims(
+            token_info['user_token']['user'], current_app.db, current_app.role_cache,
+            min_rv=token_rv
+        )
+    if token_rv is None or token_rv < role_claims['rv']:
+        return ('Outdated token roles', HTTPStatus.UNAUTHORIZED.value)
+    return (None, HTTPStatus.NO_CONTENT.value)
+
 def get_token_owner(token_info: Dict) -> Tuple[Dict, Optional[int]]:
     """Gets the user associated to a given token.
 
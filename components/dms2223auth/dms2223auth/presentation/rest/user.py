@@ -38,7 +38,7 @@ def create_user(body: Dict, token_info: Dict) -> Tuple[Union[Dict, str], Optiona
     with current_app.app_context():
         if not RoleServices.has_role(
                 token_info['user_token']['user'],
-                Role.ADMINISTRATION, current_app.db
+                Role.ADMINISTRATION, current_app.db, current_app.role_cache
             ):
             return (
                 'Current user has not enough privileges to create a user',
@@ -46,7 +46,8 @@ def create_user(body: Dict, token_info: Dict) -> Tuple[Union[Dict, str], Optiona
             )
         try:
             user: Dict = UserServices.create_user(
-                body['username'], body['password'], current_app.db, current_app.cfg
+                body['username'], body['password'], current_app.db, current_app.cfg,
+                current_app.hasher
             )
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
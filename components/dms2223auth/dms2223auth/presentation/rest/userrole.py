@@ -23,7 +23,7 @@ def user_has_role(username: str, rolename: str) -> Tuple[Optional[str], Optional
     """
     with current_app.app_context():
         has_role: bool = RoleServices.has_role(
-            username, rolename, current_app.db)
+            username, rolename, current_app.db, current_app.role_cache)
         if has_role:
             return (None, HTTPStatus.NO_CONTENT.value)
     return (None, HTTPStatus.NOT_FOUND.value)
@@ -45,7 +45,7 @@ def list_user_roles(username: str, token_info: Dict) -> Tuple[Union[List[str], s
     with current_app.app_context():
         if (not RoleServices.has_role(
                     token_info['user_token']['user'],
-                    Role.ADMINISTRATION, current_app.db
+                    Role.ADMINISTRATION, current_app.db, current_app.role_cache
                 )
                 and username != token_info['user_token']['user']):
             return (
@@ -54,7 +54,7 @@ def list_user_roles(username: str, token_info: Dict) -> Tuple[Union[List[str], s
             )
         try:
             user_roles: List[str] = RoleServices.list_user_roles(
-                username, current_app.db)
+                username, current_app.db, current_app.role_cache)
         except ValueError:
             return ("No username given.", HTTPStatus.BAD_REQUEST.value)
         return (user_roles, HTTPStatus.OK.value)
@@ -80,14 +80,14 @@ def grant_role(
     with current_app.app_context():
         if not RoleServices.has_role(
                 token_info['user_token']['user'],
-                Role.ADMINISTRATION, current_app.db
+                Role.ADMINISTRATION, current_app.db, current_app.role_cache
             ):
             return (
                 'Current user has not enough privileges to grant roles',
                 HTTPStatus.FORBIDDEN.value
             )
         try:
-            RoleServices.grant_role(username, rolename, current_app.db)
+            RoleServices.grant_role(username, rolename, current_app.db, current_app.role_cache)
         except ValueError:
             return (
                 'Both a username and a role name must be given',
@@ -95,6 +95,7 @@ def grant_role(
             )
         except UserNotFoundError:
             return (f'User {username} was not found', HTTPStatus.NOT_FOUND.value)
+        current_app.invalidation_hooks.invalidate_user(username)
         return (None, HTTPStatus.CREATED.value)
 
 
@@ -117,7 +118,7 @@ def revoke_role(
     with current_app.app_context():
         if not RoleServices.has_role(
                 token_info['user_token']['user'],
-                Role.ADMINISTRATION, current_app.db
+                Role.ADMINISTRATION, current_app.db, current_app.role_cache
             ):
             return (
                 'Current user has not enough privileges to revoke roles',
@@ -129,7 +130,8 @@ def revoke_role(
                 HTTPStatus.FORBIDDEN.value
             )
         try:
-            RoleServices.revoke_role(username, rolename, current_app.db)
+            RoleServices.revoke_role(username, rolename, current_app.db, current_app.role_cache)
         except ValueError:
             return 'Both a username and a role name must be given', HTTPStatus.BAD_REQUEST.value
+        current_app.invalidation_hooks.invalidate_user(username)
         return (None, HTTPStatus.NO_CONTENT.value)
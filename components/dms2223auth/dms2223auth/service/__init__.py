@@ -3,3 +3,4 @@
 
 from .userservices import UserServices
 from .roleservices import RoleServices
+from .loginthrottle import LoginThrottle
@@ -0,0 +1,102 @@
+""" LoginThrottle class module.
+"""
+
+import math
+import time
+from typing import List, Optional, Tuple
+from dms2223common.data import Metrics
+from dms2223common.data.cache import Cache
+
+
+class LoginThrottle():
+    """ Sliding-window limit of the login attempts per user name and per client.
+
+    Attempts are counted in fixed windows, and those in the sliding window ending now are estimated
+    as the ones of the current window plus the ones of the previous window weighted by the fraction
+    of it still inside the sliding window. Every check is thus a few constant-time cache operations
+    on two counters per user name and client, which expire on their own. A memory cache bounds the
+    number of counters kept (evicting the least recently used ones); a shared cache (e.g., Redis)
+    enforces the limits across the processes and instances of the service.
+
+    Rejected attempts are not counted, so a client trying too fast is still allowed at the
+    configured rate. If the cache fails, attempts are allowed.
+    """
+
+    def __init__(self, cache: Cache, username_limit: int, client_limit: int, window: float,
+                 metrics: Optional[Metrics] = None):
+        """ Constructor method.
+
+        Args:
+            - cache (Cache): The cache where the counters are kept. Its TTL must be at least twice
+              the window.
+            - username_limit (int): The maximum attempts per user name in a window. `0` disables
+              this limit.
+            - client_limit (int): The maximum attempts per client in a window. `0` disables this
+              limit.
+            - window (float): The number of seconds of the window.
+            - metrics (Optional[Metrics]): The registry where the rejected attempts are counted, if
+              any.
+        """
+        self.__cache: Cache = cache
+        self.__limits: Tuple[Tuple[str, int], ...] = (
+            ('username', int(username_limit)), ('client', int(client_limit))
+        )
+        self.__window: float = float(window)
+        self.__metrics: Optional[Metrics] = metrics
+        if metrics is not None:
+            metrics.counter(
+                'auth_login_rejected_total',
+                'Login attempts rejected for exceeding a limit, by scope (username or client).'
+            )
+
+    def check(self, username: str, client: Optional[str]) -> int:
+        """ Counts a login attempt, unless it exceeds a limit.
+
+        Args:
+            - username (str): The user name being tried.
+            - client (Optional[str]): The client address, if known.
+
+        Returns:
+            - int: `0` if the attempt is allowed; otherwise, the number of seconds after which it
+              would be.
+        """
+        now: float = time.time()
+        index: int = int(now // self.__window)
+        # Fraction of the previous window still inside the sliding window
+        weight: float = 1 - (now - index * self.__window) / self.__window
+        counted: List[str] = []
+        for (scope, limit), identity in zip(self.__limits, (username, client)):
+            if limit <= 0 or not identity:
+                continue
+            key: str = f'login:{scope}:{identity}:'
+            previous: int = int(self.__cache.get(key + str(index - 1)) or 0)
+            current: int = self.__cache.incr(key + str(index))
+            counted.append(key + str(index))
+            if previous * weight + current > limit:
+                for counter in counted:
+                    self.__cache.incr(counter, -1)
+                if self.__metrics is not None:
+                    self.__metrics.inc('auth_login_rejected_total', scope=scope)
+                return self.__retry_after(limit, previous, current - 1, weight)
+        return 0
+
+    def __retry_after(self, limit: int, previous: int, current: int, weight: float) -> int:
+        """ Computes how long until an attempt is allowed, if no other attempt is counted.
+
+        Args:
+            - limit (int): The maximum attempts in a window.
+            - previous (int): The attempts counted in the previous window.
+            - current (int): The attempts counted in the current window.
+            - weight (float): The fraction of the previous window inside the sliding window.
+
+        Returns:
+            - int: The number of seconds, at least 1.
+        """
+        remaining: float = weight * self.__window
+        if current < limit:
+            # Until enough of the previous window leaves the sliding window
+            delay: float = remaining - self.__window * (limit - 1 - current) / previous
+        else:
+            # Until the next window, and then until enough of this one leaves the sliding window
+            delay = remaining + self.__window * max(0.0, 1 - (limit - 1) / current)
+        return max(1, math.ceil(delay))
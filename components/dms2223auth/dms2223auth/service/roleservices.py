@@ -1,30 +1,84 @@
 """ RoleServices class module.
 """
 
-from typing import Union, List
+from typing import Dict, Optional, Union, List
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223common.data import Role
+from dms2223common.data.cache import Cache
 from dms2223auth.data.db import Schema
 from dms2223auth.data.db.exc.usernotfounderror import UserNotFoundError
 from dms2223auth.data.db.results import UserRole
-from dms2223auth.data.db.resultsets import UserRoles
+from dms2223auth.data.db.resultsets import UserRoles, RoleVersions
 
 
 class RoleServices():
     """ Monostate class that provides high-level services to handle role-related use cases.
+
+    Given a cache, the roles of each user are kept there (along with their version) and dropped
+    when they are granted or revoked, so role checks do not query the database.
     """
     @staticmethod
-    def has_role(username: str, role: Union[Role, str], schema: Schema) -> bool:
+    def get_role_claims(username: str, schema: Schema, cache: Optional[Cache] = None,
+                        min_rv: Optional[int] = None) -> Dict:
+        """Gets the roles of a user and their version, as carried by the user tokens.
+
+        Args:
+            - username (str): The user name.
+            - schema (Schema): A database handler where users and roles are mapped into.
+            - cache (Optional[Cache]): The cache of the user roles, if any.
+            - min_rv (Optional[int]): The version of the roles known to exist (e.g., the one of a
+              token signed for the user). Cached claims older than it are outdated, so they are
+              dropped and read again.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - Dict: A dictionary with the list of role names (key `roles`) and the version of the
+              user roles (key `rv`).
+        """
+        claims: Optional[Dict] = None
+        if cache is not None:
+            claims = cache.get(RoleServices.__cache_key(username))
+            if claims is not None:
+                if min_rv is None or claims['rv'] >= min_rv:
+                    return claims
+                cache.delete(RoleServices.__cache_key(username))
+        session: Session = schema.new_session()
+        try:
+            claims = {
+                'roles': [
+                    user_role.role.name
+                    for user_role in UserRoles.list_all_for_user(session, username)
+                ],
+                'rv': RoleVersions.get(session, username)
+            }
+        finally:
+            schema.remove_session()
+        if cache is not None:
+            cache.set(RoleServices.__cache_key(username), claims)
+        return claims
+
+    @staticmethod
+    def has_role(username: str, role: Union[Role, str], schema: Schema,
+                 cache: Optional[Cache] = None) -> bool:
         """Determines whether a user has a certain role or not.
 
         Args:
             - username (str): The username of the user to test.
             - role (Union[Role, str]): The role to be tested.
             - schema (Schema): A database handler where users and roles are mapped into.
+            - cache (Optional[Cache]): The cache of the user roles, if any.
 
         Returns:
             - bool: `True` if the user has the given role. `False` otherwise.
         """
+        if cache is not None:
+            try:
+                role_name: str = role.name if isinstance(role, Role) else Role[role].name
+                return role_name in RoleServices.get_role_claims(username, schema, cache)['roles']
+            except (KeyError, ValueError):
+                return False
         session: Session = schema.new_session()
         has_role: bool
         try:
@@ -40,12 +94,14 @@ class RoleServices():
         return has_role
 
     @staticmethod
-    def list_user_roles(username: str, schema: Schema) -> List[str]:
+    def list_user_roles(username: str, schema: Schema,
+                        cache: Optional[Cache] = None) -> List[str]:
         """Lists the roles assigned to a given user.
 
         Args:
             - username (str): The username of the user queried.
             - schema (Schema): A database handler where users and roles are mapped into.
+            - cache (Optional[Cache]): The cache of the user roles, if any.
 
         Raises:
             - ValueError: If the username is missing.
@@ -53,6 +109,8 @@ class RoleServices():
         Returns:
             - List[str]: The list of role names.
         """
+        if cache is not None:
+            return list(RoleServices.get_role_claims(username, schema, cache)['roles'])
         session: Session = schema.new_session()
         out: List[str] = []
         try:
@@ -67,13 +125,15 @@ class RoleServices():
         return out
 
     @staticmethod
-    def grant_role(username: str, role: Union[Role, str], schema: Schema) -> None:
+    def grant_role(username: str, role: Union[Role, str], schema: Schema,
+                   cache: Optional[Cache] = None) -> None:
         """Grants a role to a user.
 
         Args:
             - username (str): The user name.
             - role (Union[Role, str]): The role to be granted.
             - schema (Schema): A database handler where users and roles are mapped into.
+            - cache (Optional[Cache]): The cache of the user roles, if any.
 
         Raises:
             - ValueError: If either the username or the role name is missing.
@@ -88,15 +148,19 @@ class RoleServices():
             raise
         finally:
             schema.remove_session()
+            if cache is not None:
+                cache.delete(RoleServices.__cache_key(username))
 
     @staticmethod
-    def revoke_role(username: str, role: Union[Role, str], schema: Schema) -> None:
+    def revoke_role(username: str, role: Union[Role, str], schema: Schema,
+                    cache: Optional[Cache] = None) -> None:
         """Revokes a role from a user.
 
         Args:
             - username (str): The user name.
             - role (Union[Role, str]): The role to be granted.
             - schema (Schema): A database handler where users and roles are mapped into.
+            - cache (Optional[Cache]): The cache of the user roles, if any.
 
         Raises:
             - ValueError: If either the username or the role name is missing.
@@ -110,3 +174,17 @@ class RoleServices():
             raise
         finally:
             schema.remove_session()
+            if cache is not None:
+                cache.delete(RoleServices.__cache_key(username))
+
+    @staticmethod
+    def __cache_key(username: str) -> str:
+        """Gets the cache key of the roles of a user.
+
+        Args:
+            - username (str): The user name.
+
+        Returns:
+            - str: The cache key.
+        """
+        return f'roles:{username}'
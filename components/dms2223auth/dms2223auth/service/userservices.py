@@ -1,36 +1,65 @@
 """ UserServices class module.
 """
 
-from typing import List, Dict
+import hmac
+import logging
+from typing import List, Dict, Optional
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223auth.data.config import AuthConfiguration
 from dms2223auth.data.db import Schema
 from dms2223auth.data.db.results import User
 from dms2223auth.data.db.resultsets import Users
+from dms2223auth.data.hashing import PasswordHasher
 
 
 class UserServices():
     """ Monostate class that provides high-level services to handle user-related use cases.
     """
     @staticmethod
-    def user_exists(username: str, password: str, schema: Schema, cfg: AuthConfiguration) -> bool:
+    def user_exists(username: str, password: str, schema: Schema, cfg: AuthConfiguration,
+                    hasher: Optional[PasswordHasher] = None) -> bool:
         """Determines whether a user with the given credentials exists.
 
+        The user is looked up by name, and the password is then checked against its hash in
+        constant time. Passwords hashed with the legacy function, or with other parameters than
+        the configured ones, are rehashed once they are verified.
+
         Args:
             - username (str): The user name.
             - password (str): The user password.
             - schema (Schema): A database handler where the users are mapped into.
             - cfg (AuthConfiguration): The application configuration.
+            - hasher (Optional[PasswordHasher]): The password hasher. If `None`, one is created
+              from the configuration.
 
         Returns:
             - bool: `True` if the given user exists. `False` otherwise.
         """
-        salt: str = cfg.get_password_salt()
-        password_hash: str = Users.hash_password(
-            password, suffix=username, salt=salt)
+        if hasher is None:
+            hasher = PasswordHasher.from_config(cfg.get_password_hashing())
         session: Session = schema.new_session()
-        user_exists: bool = Users.user_exists(session, username, password_hash)
+        user: Optional[User] = Users.get(session, username)
+        password_hash: Optional[str] = user.password if user is not None else None
         schema.remove_session()
+        if password_hash is None:
+            # Spend the same time as for existing users, so they cannot be told apart
+            hasher.hash(password)
+            return False
+        if PasswordHasher.parse(password_hash) is None:
+            user_exists: bool = hmac.compare_digest(
+                Users.hash_password(password, suffix=username, salt=cfg.get_password_salt()),
+                password_hash
+            )
+        else:
+            user_exists = hasher.verify(password, password_hash)
+        if user_exists and hasher.needs_rehash(password_hash):
+            session = schema.new_session()
+            try:
+                Users.update_password(session, username, hasher.hash(password))
+            except Exception as ex:  # pylint: disable=broad-except
+                logging.warning('Cannot rehash the password of %s: %s', username, ex)
+            finally:
+                schema.remove_session()
         return user_exists
 
     @staticmethod
@@ -54,7 +83,8 @@ class UserServices():
         return out
 
     @staticmethod
-    def create_user(username: str, password: str, schema: Schema, cfg: AuthConfiguration) -> Dict:
+    def create_user(username: str, password: str, schema: Schema, cfg: AuthConfiguration,
+                    hasher: Optional[PasswordHasher] = None) -> Dict:
         """Creates a user.
 
         Args:
@@ -62,6 +92,8 @@ class UserServices():
             - password (str): The new user's password.
             - schema (Schema): A database handler where the users are mapped into.
             - cfg (AuthConfiguration): The application configuration.
+            - hasher (Optional[PasswordHasher]): The password hasher. If `None`, one is created
+              from the configuration.
 
         Raises:
             - ValueError: If either the username or the password_hash is empty.
@@ -70,9 +102,9 @@ class UserServices():
         Returns:
             - Dict: A dictionary with the new user's data.
         """
-        salt: str = cfg.get_password_salt()
-        password_hash: str = Users.hash_password(
-            password, suffix=username, salt=salt)
+        if hasher is None:
+            hasher = PasswordHasher.from_config(cfg.get_password_hashing())
+        password_hash: str = hasher.hash(password)
         session: Session = schema.new_session()
         out: Dict = {}
         try:
@@ -0,0 +1,84 @@
+""" Sliding-window tests of the login throttle.
+"""
+
+import unittest
+from unittest import mock
+from dms2223common.data.cache import MemoryCache
+from dms2223auth.service.loginthrottle import LoginThrottle
+
+WINDOW: float = 60
+
+
+class TestLoginThrottle(unittest.TestCase):
+    """ Attempts over the limits are rejected, not counted, and told when to retry.
+    """
+
+    def setUp(self):
+        """ Creates an empty memory cache for the counters.
+        """
+        self.cache: MemoryCache = MemoryCache(1024, 2 * WINDOW)
+
+    def __check(self, throttle: LoginThrottle, now: float, username: str = 'user',
+                client: str = '10.0.0.1') -> int:
+        """ Checks a login attempt at a given time.
+
+        Args:
+            - throttle (LoginThrottle): The throttle.
+            - now (float): The timestamp of the attempt.
+            - username (str): The user name being tried.
+            - client (str): The client address.
+
+        Returns:
+            - int: The result of the check (see `LoginThrottle.check`).
+        """
+        with mock.patch('dms2223auth.service.loginthrottle.time.time', return_value=now):
+            return throttle.check(username, client)
+
+    def test_rejects_at_the_limit(self):
+        """ Attempts up to the limit are allowed, and the next one is rejected.
+        """
+        throttle: LoginThrottle = LoginThrottle(self.cache, 3, 0, WINDOW)
+        start: float = 10 * WINDOW
+        self.assertEqual([self.__check(throttle, start + second) for second in range(3)], [0, 0, 0])
+        self.assertGreater(self.__check(throttle, start + 3), 0)
+        self.assertEqual(self.__check(throttle, start + 3, username='other'), 0)
+
+    def test_client_rejection_rolls_back_the_username_counter(self):
+        """ An attempt rejected by the client limit is not counted for its user name either.
+        """
+        throttle: LoginThrottle = LoginThrottle(self.cache, 5, 2, WINDOW)
+        start: float = 10 * WINDOW
+        self.assertEqual(self.__check(throttle, start), 0)
+        self.assertEqual(self.__check(throttle, start), 0)
+        self.assertGreater(self.__check(throttle, start), 0)
+        self.assertEqual(self.cache.get('login:username:user:10'), 2)
+        self.assertEqual(self.cache.get('login:client:10.0.0.1:10'), 2)
+
+    def test_retry_after_the_next_window(self):
+        """ With the attempts in the current window, retrying waits for the next window and for
+        enough of this one to leave the sliding window.
+        """
+        throttle: LoginThrottle = LoginThrottle(self.cache, 3, 0, WINDOW)
+        start: float = 10 * WINDOW
+        for _ in range(3):
+            self.__check(throttle, start)
+        # 3 attempts weigh less than 3 - 1 once 1/3 of the next window has passed
+        self.assertEqual(self.__check(throttle, start), WINDOW + WINDOW / 3)
+        self.assertEqual(self.__check(throttle, start + WINDOW + WINDOW / 3), 0)
+
+    def test_retry_after_the_previous_window_decays(self):
+        """ With the attempts in the previous window, retrying waits for enough of it to leave the
+        sliding window.
+        """
+        throttle: LoginThrottle = LoginThrottle(self.cache, 3, 0, WINDOW)
+        start: float = 10 * WINDOW
+        for _ in range(3):
+            self.__check(throttle, start)
+        # Another attempt fits once the previous window weighs 2 attempts (2/3 of it), 20 s into
+        # the next window
+        self.assertEqual(self.__check(throttle, start + WINDOW + 10), 10)
+        self.assertEqual(self.__check(throttle, start + WINDOW + 20), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
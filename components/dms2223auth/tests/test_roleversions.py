@@ -0,0 +1,89 @@
+""" Tests of the user role versions.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from typing import List
+from dms2223common.data import Role
+from dms2223auth.data.config import AuthConfiguration
+from dms2223auth.data.db import Schema
+from dms2223auth.data.db.resultsets import RoleVersions, UserRoles, Users
+
+
+class TestRoleVersions(unittest.TestCase):
+    """ Every role change increases the version of the roles of its user exactly once.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """ Creates a schema on a temporary SQLite database.
+        """
+        cfg: AuthConfiguration = AuthConfiguration()
+        directory: str = tempfile.mkdtemp(prefix='dms2223auth-tests-')
+        cfg.set_db_connection_string(f'sqlite:///{os.path.join(directory, "auth.db")}')
+        cls.schema: Schema = Schema(cfg)
+
+    def __version(self, username: str) -> int:
+        """ Gets the version of the roles of a user.
+
+        Args:
+            - username (str): The user name.
+
+        Returns:
+            - int: The version.
+        """
+        try:
+            return RoleVersions.get(self.schema.new_session(), username)
+        finally:
+            self.schema.remove_session()
+
+    def test_role_changes_increase_the_version(self):
+        """ The first role change creates the version, and the next ones increase it.
+        """
+        try:
+            session = self.schema.new_session()
+            Users.create(session, 'versioned', 'hash')
+            self.assertEqual(RoleVersions.get(session, 'versioned'), 0)
+            UserRoles.grant(session, 'versioned', Role.DISCUSSION)
+            self.assertEqual(RoleVersions.get(session, 'versioned'), 1)
+            UserRoles.grant(session, 'versioned', Role.MODERATION)
+            UserRoles.revoke(session, 'versioned', Role.DISCUSSION)
+            self.assertEqual(RoleVersions.get(session, 'versioned'), 3)
+        finally:
+            self.schema.remove_session()
+
+    def test_concurrent_first_changes(self):
+        """ Concurrent first role changes of a user are all counted, without conflicts.
+        """
+        try:
+            Users.create(self.schema.new_session(), 'concurrent', 'hash')
+        finally:
+            self.schema.remove_session()
+        errors: List[Exception] = []
+        barrier: threading.Barrier = threading.Barrier(len(Role))
+
+        def grant(role: Role) -> None:
+            try:
+                session = self.schema.new_session()
+                barrier.wait()
+                UserRoles.grant(session, 'concurrent', role)
+            except Exception as ex:  # pylint: disable=broad-except
+                errors.append(ex)
+            finally:
+                self.schema.remove_session()
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=grant, args=(role,)) for role in Role
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.__version('concurrent'), len(Role))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,10 +25,20 @@ class BackendConfiguration(ServiceConfiguration):
         ServiceConfiguration.__init__(self)
 
         self.set_db_connection_string('sqlite:////tmp/dms2223backend.sqlite3.db')
+        self.set_db_engine_options({})
+        self.set_db_pragmas({})
+        self.set_db_profiler({})
         self.set_service_host('127.0.0.1')
         self.set_service_port(5000)
         self.set_debug_flag(True)
         self.set_password_salt('This salt should be changed ASAP')
+        self.set_jws_secret('This JWS secret should be changed ASAP')
+        self.set_token_revocation_check(False)
+        self.set_token_cache({
+            'size': 1024,
+            'ttl': 60
+        })
+        self.set_cache({})
         self.set_authorized_api_keys([])
         self.set_auth_service({
             'host': '127.0.0.1',
@@ -46,8 +56,22 @@ class BackendConfiguration(ServiceConfiguration):
 
         if 'db_connection_string' in values:
             self.set_db_connection_string(values['db_connection_string'])
+        if 'db_engine' in values:
+            self.set_db_engine_options(values['db_engine'])
+        if 'db_pragmas' in values:
+            self.set_db_pragmas(values['db_pragmas'])
+        if 'db_profiler' in values:
+            self.set_db_profiler(values['db_profiler'])
         if 'salt' in values:
             self.set_password_salt(values['salt'])
+        if 'jws_secret' in values:
+            self.set_jws_secret(values['jws_secret'])
+        if 'token_revocation_check' in values:
+            self.set_token_revocation_check(values['token_revocation_check'])
+        if 'token_cache' in values:
+            self.set_token_cache(values['token_cache'])
+        if 'cache' in values:
+            self.set_cache(values['cache'])
         if 'auth_service' in values:
             self.set_auth_service(values['auth_service'])
 
@@ -91,6 +115,115 @@ class BackendConfiguration(ServiceConfiguration):
 
         return str(self._values['salt'])
 
+    def set_jws_secret(self, secret: str) -> None:
+        """ Sets the JWS secret key configuration value.
+
+        Args:
+            - secret: A string with the configuration value.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['jws_secret'] = str(secret)
+
+    def get_jws_secret(self) -> str:
+        """ Gets the JWS secret key configuration value.
+
+        Returns:
+            - str: A string with the value of jws_secret.
+        """
+
+        return str(self._values['jws_secret'])
+
+    def set_token_revocation_check(self, check: bool) -> None:
+        """ Sets whether the user tokens are also checked against the authentication service.
+
+        Args:
+            - check: A boolean with the value of token_revocation_check.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['token_revocation_check'] = bool(check)
+
+    def get_token_revocation_check(self) -> bool:
+        """ Gets whether the user tokens are also checked against the authentication service.
+
+        Returns:
+            - bool: A boolean with the value of token_revocation_check.
+        """
+
+        return bool(self._values['token_revocation_check'])
+
+    def set_token_cache(self, token_cache: Dict) -> None:
+        """Sets the parameters of the cache of tokens validated against the authentication service.
+
+        Args:
+            token_cache (Dict): The maximum number of cached tokens (key `size`) and the maximum
+              number of seconds a token is cached (key `ttl`).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['token_cache'] = {
+            'size': int(token_cache.get('size', 1024)),
+            'ttl': float(token_cache.get('ttl', 60))
+        }
+
+    def get_token_cache(self) -> Dict:
+        """ Gets the token cache configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of token_cache.
+        """
+
+        return self._values['token_cache']
+
+    def set_cache(self, cache: Dict) -> None:
+        """ Sets the discussion listings and threads cache configuration value.
+
+        Args:
+            - cache: A dictionary with the cache backend (`backend`: `none`, `memory` or `redis`),
+              the number of seconds an entry is kept (`ttl`), the maximum number of entries of the
+              `memory` backend (`size`), and the server (`host` and `port`), database number
+              (`db`) and key prefix (`prefix`) of the `redis` backend. Missing keys take their
+              default values.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = {
+            'backend': 'none',
+            'ttl': 30.0,
+            'size': 4096,
+            'host': '127.0.0.1',
+            'port': 6379,
+            'db': 0,
+            'prefix': 'dms2223backend:'
+        }
+        unknown = set(cache) - set(values)
+        if unknown:
+            raise ValueError(f'Unknown cache options {", ".join(sorted(unknown))}')
+        values.update(cache)
+        if values['backend'] not in ('none', 'memory', 'redis'):
+            raise ValueError(f'Invalid cache backend {values["backend"]}')
+        values['ttl'] = float(values['ttl'])
+        for key in ('size', 'port', 'db'):
+            values[key] = int(values[key])
+        if values['ttl'] <= 0 or values['size'] <= 0:
+            raise ValueError('The cache ttl and size must be positive')
+        values['host'] = str(values['host'])
+        values['prefix'] = str(values['prefix'])
+        self._values['cache'] = values
+
+    def get_cache(self) -> Dict:
+        """ Gets the discussion listings and threads cache configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of cache.
+        """
+
+        return self._values['cache']
 
     def set_auth_service(self, auth_service: Dict) -> None:
         """Sets the connection parameters for the authentication service.
@@ -1,4 +1,5 @@
 """ Backend database-related modules.
 """
 
-from .schema import Schema
\ No newline at end of file
+from .schema import Schema
+from .datagenerator import DataGenerator
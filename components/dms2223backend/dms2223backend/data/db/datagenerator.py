@@ -0,0 +1,385 @@
+""" DataGenerator class module.
+"""
+
+import math
+import random
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import Table, bindparam, func, inspect, insert, select  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2223backend.data.reportstatus import ReportStatus
+from dms2223backend.data.db.results import Discussion, Answer, Comment, Report, Reportanswer, Reportcomment
+from dms2223backend.data.db.results import VoteAnswer, VoteComment
+from dms2223backend.data.db.resultsets import Search
+
+
+class DataGenerator():
+    """ Class responsible of populating the database with synthetic, reproducible data.
+
+    The posts are inserted with bulk core `INSERT` statements (one `executemany` per batch), with
+    their ids assigned here, so no row is loaded back. Answers are spread over the discussions
+    following a Zipf distribution (a few hot threads get most of them), and so are the votes over
+    the answers and comments; which ids are hot is shuffled, so they are not just the oldest ones.
+    The same seed and options always generate the same data.
+    """
+
+    __WORDS: List[str] = (
+        'examen práctica grupo nota tema clase duda entrega fecha profesor trabajo memoria '
+        'código prueba error servidor base datos consulta diseño patrón capa servicio '
+        'usuario sesión token clave rendimiento caché índice tabla respuesta comentario '
+        'pregunta discusión moderación reporte voto enlace documento plazo revisión '
+        'laboratorio horario tutoría apuntes ejercicio solución ejemplo problema idea'
+    ).split()
+    __FRAGMENTS: int = 4096
+
+    def __init__(self,
+                 discussions: int = 1000,
+                 answers_per_discussion: float = 5,
+                 comments_per_answer: float = 2,
+                 votes_per_post: float = 3,
+                 report_rate: float = 0.01,
+                 report_statuses: Optional[Dict[str, float]] = None,
+                 zipf_s: float = 1.1,
+                 seed: int = 0,
+                 batch_size: int = 50000
+                 ):
+        """ Constructor method.
+
+        Args:
+            - discussions (int): Number of discussions to create.
+            - answers_per_discussion (float): Mean number of answers per discussion.
+            - comments_per_answer (float): Mean number of comments per answer.
+            - votes_per_post (float): Mean number of votes per answer and per comment.
+            - report_rate (float): Fraction of the posts (of every kind) that get a report.
+            - report_statuses (Optional[Dict[str, float]]): Relative weight of each report status
+              name. Defaults to 60% pending, 25% accepted and 15% rejected.
+            - zipf_s (float): Skew of the Zipf distributions. `0` spreads the answers and votes
+              uniformly; the greater, the hotter the hot threads.
+            - seed (int): Seed of the random generator.
+            - batch_size (int): Number of rows inserted (and committed) at once.
+
+        Raises:
+            - ValueError: If any count, mean or weight is negative, or a status is unknown.
+        """
+        if min(discussions, answers_per_discussion, comments_per_answer, votes_per_post,
+               report_rate, zipf_s) < 0 or batch_size < 1:
+            raise ValueError('The data generator options cannot be negative.')
+        if report_statuses is None:
+            report_statuses = {'PENDING': 0.6, 'ACCEPTED': 0.25, 'REJECTED': 0.15}
+        unknown: List[str] = [name for name in report_statuses if name not in ReportStatus.__members__]
+        if unknown or min(report_statuses.values(), default=0) < 0:
+            raise ValueError(f'Invalid report statuses: {report_statuses}')
+        self.__discussions: int = int(discussions)
+        self.__answers: int = round(discussions * answers_per_discussion)
+        self.__comments: int = round(self.__answers * comments_per_answer)
+        self.__votes_per_post: float = float(votes_per_post)
+        self.__report_rate: float = min(float(report_rate), 1.0)
+        self.__statuses: List[ReportStatus] = [ReportStatus[name] for name in report_statuses]
+        self.__status_weights: List[float] = list(report_statuses.values())
+        self.__zipf_s: float = float(zipf_s)
+        self.__seed: int = int(seed)
+        self.__batch_size: int = int(batch_size)
+        self.__random: random.Random = random.Random(self.__seed)
+        self.__fragments: List[str] = []
+
+    def generate(self, session: Session, progress: Optional[Callable[[str, int], None]] = None) -> Dict[str, int]:
+        """ Inserts the synthetic data.
+
+        The rows are appended to the existing ones. The full-text search index is dropped during
+        the load and rebuilt at the end, as keeping it in sync row by row is much slower.
+
+        Note:
+            Every batch is committed, so any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - progress (Optional[Callable[[str, int], None]]): Function called after every batch
+              with the table name and the number of rows inserted so far into it.
+
+        Returns:
+            - Dict[str, int]: The number of rows inserted into each table, by table name.
+        """
+        self.__random = random.Random(self.__seed)
+        # Drawing whole fragments is much cheaper than drawing every word of every post
+        self.__fragments = [
+            ' '.join(self.__random.choices(DataGenerator.__WORDS, k=self.__random.randint(2, 8)))
+            for _ in range(DataGenerator.__FRAGMENTS)
+        ]
+        session.commit()
+        Search.undeploy(session.connection())
+        session.commit()
+        counts: Dict[str, int] = {}
+        try:
+            discussion_ids: range = self.__insert_discussions(session, counts, progress)
+            answer_ids, answer_discussions = self.__insert_answers(
+                session, discussion_ids, counts, progress
+            )
+            comment_ids: range = self.__insert_comments(
+                session, answer_ids, answer_discussions, counts, progress
+            )
+            self.__insert_votes(session, Answer, VoteAnswer, 'aid', answer_ids, counts, progress)
+            self.__insert_votes(session, Comment, VoteComment, 'cid', comment_ids, counts, progress)
+            self.__insert_reports(session, Report, 'discussionid', discussion_ids, counts, progress,
+                                  tipo=1)
+            self.__insert_reports(session, Reportanswer, 'answerid', answer_ids, counts, progress)
+            self.__insert_reports(session, Reportcomment, 'commentid', comment_ids, counts, progress)
+        finally:
+            Search.deploy(session.connection())
+            session.commit()
+        return counts
+
+    @staticmethod
+    def __table(result: type) -> Table:
+        """ Gets the table a result class is mapped to.
+
+        Args:
+            - result (type): The result class.
+
+        Returns:
+            - Table: The mapped table.
+        """
+        return inspect(result).local_table
+
+    @staticmethod
+    def __next_ids(session: Session, result: type, count: int) -> range:
+        """ Reserves the ids of the rows to insert into a table.
+
+        Args:
+            - session (Session): The session object.
+            - result (type): The result class mapped to the table.
+            - count (int): The number of rows to insert.
+
+        Returns:
+            - range: The ids following the greatest existing one.
+        """
+        table: Table = DataGenerator.__table(result)
+        first: int = (session.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+        return range(first, first + count)
+
+    def __bulk_insert(self, session: Session, result: type, rows: Iterator[Dict], counts: Dict[str, int],
+                      progress: Optional[Callable[[str, int], None]]) -> None:
+        """ Inserts rows into a table in batches, committing each one.
+
+        Args:
+            - session (Session): The session object.
+            - result (type): The result class mapped to the table.
+            - rows (Iterator[Dict]): The rows to insert, as column values by name.
+            - counts (Dict[str, int]): The inserted row counts by table name, updated here.
+            - progress (Optional[Callable[[str, int], None]]): See `generate`.
+        """
+        table: Table = DataGenerator.__table(result)
+        counts.setdefault(table.name, 0)
+        batch: List[Dict] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.__batch_size:
+                DataGenerator.__flush(session, table, batch, counts, progress)
+                batch = []
+        if batch:
+            DataGenerator.__flush(session, table, batch, counts, progress)
+
+    @staticmethod
+    def __flush(session: Session, table: Table, batch: List[Dict], counts: Dict[str, int],
+                progress: Optional[Callable[[str, int], None]]) -> None:
+        """ Inserts and commits a batch of rows.
+
+        With positional DB-API drivers (such as SQLite's), the statement is compiled once and the
+        rows are passed straight to the driver's `executemany`, after the conversions of their
+        column types, which saves the per-row parameter processing of `Session.execute`.
+
+        Args:
+            - session (Session): The session object.
+            - table (Table): The table.
+            - batch (List[Dict]): The rows to insert, all of them with the same columns.
+            - counts (Dict[str, int]): The inserted row counts by table name, updated here.
+            - progress (Optional[Callable[[str, int], None]]): See `generate`.
+        """
+        connection = session.connection()
+        dialect = connection.dialect
+        compiled = insert(table).compile(dialect=dialect, column_keys=list(batch[0]))
+        if compiled.positional:
+            keys: List[str] = list(compiled.positiontup)
+            processors = [
+                table.c[key].type.dialect_impl(dialect).bind_processor(dialect) for key in keys
+            ]
+            if any(processors):
+                parameters = [
+                    tuple(row[key] if processor is None else processor(row[key])
+                          for key, processor in zip(keys, processors))
+                    for row in batch
+                ]
+            else:
+                parameters = [tuple(row[key] for key in keys) for row in batch]
+            connection.exec_driver_sql(str(compiled), parameters)
+        else:
+            connection.execute(insert(table), batch)
+        session.commit()
+        counts[table.name] += len(batch)
+        if progress is not None:
+            progress(table.name, counts[table.name])
+
+    def __text(self, min_fragments: int, max_fragments: int, max_length: int) -> str:
+        """ Generates a random sentence by joining fragments of the pool.
+
+        Args:
+            - min_fragments (int): Minimum number of fragments.
+            - max_fragments (int): Maximum number of fragments.
+            - max_length (int): Maximum number of characters.
+
+        Returns:
+            - str: The sentence.
+        """
+        rnd = self.__random.random
+        size: int = len(self.__fragments)
+        count: int = min_fragments + int(rnd() * (max_fragments - min_fragments + 1))
+        return ' '.join(
+            self.__fragments[int(rnd() * size)] for _ in range(count)
+        ).capitalize()[:max_length]
+
+    def __zipf(self, ids: range) -> Callable[[int], List[int]]:
+        """ Builds a sampler of ids following a Zipf distribution.
+
+        The rank of every id is shuffled with an affine permutation, so the hottest ids are
+        scattered instead of being the first ones.
+
+        Args:
+            - ids (range): The ids to sample.
+
+        Returns:
+            - Callable[[int], List[int]]: A function returning the given number of sampled ids.
+        """
+        size: int = len(ids)
+        if size == 0:
+            return lambda k: []
+        step: int = 2654435761 % size or 1
+        while math.gcd(step, size) != 1:
+            step += 1
+        offset: int = self.__random.randrange(size)
+        cum_weights: List[float] = list(accumulate(
+            1 / (rank ** self.__zipf_s) for rank in range(1, size + 1)
+        ))
+        ranks: range = range(size)
+
+        def sample(k: int) -> List[int]:
+            return [
+                ids.start + (rank * step + offset) % size
+                for rank in self.__random.choices(ranks, cum_weights=cum_weights, k=k)
+            ]
+        return sample
+
+    def __insert_discussions(self, session: Session, counts: Dict[str, int],
+                             progress: Optional[Callable[[str, int], None]]) -> range:
+        """ Inserts the discussions.
+
+        Returns:
+            - range: The ids of the new discussions.
+        """
+        ids: range = DataGenerator.__next_ids(session, Discussion, self.__discussions)
+        self.__bulk_insert(session, Discussion, (
+            {'id': id, 'title': self.__text(1, 1, 50), 'content': self.__text(2, 8, 250)}
+            for id in ids
+        ), counts, progress)
+        return ids
+
+    def __insert_answers(self, session: Session, discussion_ids: range, counts: Dict[str, int],
+                         progress: Optional[Callable[[str, int], None]]) -> Tuple[range, List[int]]:
+        """ Inserts the answers, spread over the discussions following a Zipf distribution.
+
+        Returns:
+            - Tuple[range, List[int]]: The ids of the new answers and the discussion id of each
+              one, in the same order.
+        """
+        ids: range = DataGenerator.__next_ids(session, Answer, self.__answers)
+        discussions: List[int] = []
+        sample = self.__zipf(discussion_ids)
+        for start in range(0, len(ids), self.__batch_size):
+            discussions.extend(sample(min(self.__batch_size, len(ids) - start)))
+        self.__bulk_insert(session, Answer, (
+            {'id': id, 'discussionid': discussionid, 'content': self.__text(1, 8, 250), 'vote_count': 0}
+            for id, discussionid in zip(ids, discussions)
+        ), counts, progress)
+        return (ids, discussions)
+
+    def __insert_comments(self, session: Session, answer_ids: range, answer_discussions: List[int],
+                          counts: Dict[str, int], progress: Optional[Callable[[str, int], None]]) -> range:
+        """ Inserts the comments, spread uniformly over the answers (so hot threads get the most).
+
+        Returns:
+            - range: The ids of the new comments.
+        """
+        if not answer_ids:
+            return range(0)
+        ids: range = DataGenerator.__next_ids(session, Comment, self.__comments)
+
+        def rows() -> Iterator[Dict]:
+            for id in ids:
+                index: int = self.__random.randrange(len(answer_ids))
+                yield {
+                    'id': id, 'discussionid': answer_discussions[index],
+                    'answerid': answer_ids.start + index, 'content': self.__text(1, 5, 250),
+                    'vote_count': 0
+                }
+        self.__bulk_insert(session, Comment, rows(), counts, progress)
+        return ids
+
+    def __insert_votes(self, session: Session, post: type, vote: type, column: str, post_ids: range,
+                       counts: Dict[str, int], progress: Optional[Callable[[str, int], None]]) -> None:
+        """ Inserts the votes of some posts, following a Zipf distribution, and their counters.
+
+        Args:
+            - post (type): The result class of the voted posts.
+            - vote (type): The result class of the votes.
+            - column (str): The name of the voted post id column of the votes.
+            - post_ids (range): The ids of the posts to vote.
+        """
+        total: int = round(len(post_ids) * self.__votes_per_post)
+        if total == 0:
+            return
+        sample = self.__zipf(post_ids)
+        votes: Dict[int, int] = {}
+
+        def rows() -> Iterator[Dict]:
+            for start in range(0, total, self.__batch_size):
+                for post_id in sample(min(self.__batch_size, total - start)):
+                    votes[post_id] = votes.get(post_id, 0) + 1
+                    yield {column: post_id}
+        self.__bulk_insert(session, vote, rows(), counts, progress)
+        table: Table = DataGenerator.__table(post)
+        statement = table.update().where(table.c.id == bindparam('post_id')).values(
+            vote_count=table.c.vote_count + bindparam('votes')
+        )
+        items = list(votes.items())
+        for start in range(0, len(items), self.__batch_size):
+            session.execute(statement, [
+                {'post_id': post_id, 'votes': count}
+                for post_id, count in items[start:start + self.__batch_size]
+            ])
+            session.commit()
+
+    def __insert_reports(self, session: Session, report: type, column: str, post_ids: range,
+                         counts: Dict[str, int], progress: Optional[Callable[[str, int], None]],
+                         **values) -> None:
+        """ Inserts the reports of a random fraction of some posts.
+
+        Args:
+            - report (type): The result class of the reports.
+            - column (str): The name of the reported post id column of the reports.
+            - post_ids (range): The ids of the posts that can be reported.
+            - **values: Any other fixed column value of the reports.
+        """
+        total: int = round(len(post_ids) * self.__report_rate)
+        if total == 0:
+            return
+        # A fixed date keeps the data reproducible
+        end: datetime = datetime(2023, 6, 30)
+
+        def rows() -> Iterator[Dict]:
+            for post_id in sorted(self.__random.sample(post_ids, total)):
+                yield dict(values, **{
+                    column: post_id,
+                    'reason': self.__text(1, 3, 250),
+                    'status': self.__random.choices(self.__statuses, self.__status_weights)[0],
+                    'timestamp': end - timedelta(seconds=self.__random.randrange(90 * 24 * 3600))
+                })
+        self.__bulk_insert(session, report, rows(), counts, progress)
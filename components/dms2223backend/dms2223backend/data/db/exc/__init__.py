@@ -4,3 +4,4 @@
 from .discussionexistserror import DiscussionExistsError
 from .reportexisterror import ReportExistsError
 from .discussionnotfounderror import DiscussionNotFoundError
+from .searchunavailableerror import SearchUnavailableError
@@ -0,0 +1,7 @@
+""" SearchUnavailableError class module.
+"""
+
+
+class SearchUnavailableError(Exception):
+    """ Error raised when the database does not support the full-text search.
+    """
@@ -1,8 +1,8 @@
 """Answer Class Module
 """
 
-from typing import Dict
-from sqlalchemy import Table, MetaData, Column, String , Integer ,ForeignKey # type: ignore
+from typing import Dict, List
+from sqlalchemy import Index, Table, MetaData, Column, String , Integer ,ForeignKey # type: ignore
 from sqlalchemy.orm import relationship  # type: ignore
 from dms2223backend.data.db.results.resultbase import ResultBase
 from dms2223backend.data.db.results.reportanswer import Reportanswer
@@ -28,6 +28,7 @@ class Answer(ResultBase):
         self.discussionid: int = discussionid
         #self.user: str = user
         self.content: str = content
+        self.vote_count: int = 0
         
         
     @staticmethod
@@ -47,10 +48,24 @@ class Answer(ResultBase):
             metadata,
             Column('id', Integer, autoincrement='auto', primary_key=True),
             Column('discussionid', Integer, ForeignKey('discussions.id'), nullable=False),
-            Column('content', String(250), nullable=False)
-          
+            Column('content', String(250), nullable=False),
+            Column('vote_count', Integer, nullable=False, default=0, server_default='0')
         )
 
+    @staticmethod
+    def _table_indexes(table: Table) -> List[Index]:
+        """ Gets the secondary indexes of the table.
+
+        Args:
+            - table (Table): The `Table` object with the table definition.
+
+        Returns:
+            - List[Index]: A list of `Index` objects.
+        """
+        return [
+            Index('ix_answers_discussionid_id', table.c.discussionid, table.c.id)
+        ]
+
     @staticmethod
     def _mapping_properties() -> Dict:
         """ Gets the mapping properties dictionary.
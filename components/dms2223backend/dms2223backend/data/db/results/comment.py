@@ -1,7 +1,7 @@
 """Comment Class Module
 """
-from typing import Dict
-from sqlalchemy import Table, MetaData, Column, String , Integer, ForeignKey # type: ignore
+from typing import Dict, List
+from sqlalchemy import Index, Table, MetaData, Column, String , Integer, ForeignKey # type: ignore
 from sqlalchemy.orm import relationship  # type: ignore
 from dms2223backend.data.db.results.resultbase import ResultBase
 from dms2223backend.data.db.results.reportcomment import Reportcomment
@@ -25,6 +25,7 @@ class Comment(ResultBase):
         self.discussionid: int = discussionid
         self.answerid: int = answerid
         self.content: str = content
+        self.vote_count: int = 0
 
 
     @staticmethod
@@ -44,9 +45,25 @@ class Comment(ResultBase):
             Column('id', Integer, autoincrement='auto', primary_key=True),
             Column('discussionid', Integer, nullable=False),
             Column('answerid', Integer, ForeignKey('answers.id'), nullable=False),
-            Column('content', String(250), nullable=False)
+            Column('content', String(250), nullable=False),
+            Column('vote_count', Integer, nullable=False, default=0, server_default='0')
         )
 
+    @staticmethod
+    def _table_indexes(table: Table) -> List[Index]:
+        """ Gets the secondary indexes of the table.
+
+        Args:
+            - table (Table): The `Table` object with the table definition.
+
+        Returns:
+            - List[Index]: A list of `Index` objects.
+        """
+        return [
+            Index('ix_comments_discussionid_id', table.c.discussionid, table.c.id),
+            Index('ix_comments_answerid_id', table.c.answerid, table.c.id)
+        ]
+
     @staticmethod
     def _mapping_properties() -> Dict:
         """ Gets the mapping properties dictionary.
@@ -1,8 +1,8 @@
 """report Class Module
 """
 
-from typing import Dict
-from sqlalchemy import Table, MetaData,Enum ,DateTime,Column,func ,String , Integer, TIME, DATE ,ForeignKey# type: ignore
+from typing import Dict, List
+from sqlalchemy import Index, Table, MetaData,Enum ,DateTime,Column,func ,String , Integer, TIME, DATE ,ForeignKey# type: ignore
 from sqlalchemy.orm import relationship  # type: ignore
 from dms2223backend.data.db.results.resultbase import ResultBase
 from dms2223backend.data.db.results.answer import Answer
@@ -53,4 +53,16 @@ class Report(ResultBase):
             Column('timestamp', DateTime, nullable=False, default = func.now())
         )
 
+    @staticmethod
+    def _table_indexes(table: Table) -> List[Index]:
+        """ Gets the secondary indexes of the table.
+
+        Args:
+            - table (Table): The `Table` object with the table definition.
 
+        Returns:
+            - List[Index]: A list of `Index` objects.
+        """
+        return [
+            Index('ix_reports_discussionid', table.c.discussionid)
+        ]
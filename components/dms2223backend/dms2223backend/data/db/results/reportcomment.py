@@ -1,8 +1,8 @@
 """report Class Module
 """
 
-from typing import Dict
-from sqlalchemy import Table, MetaData, Column, func ,DateTime,String ,Enum, Integer, TIME, DATE ,ForeignKey# type: ignore
+from typing import Dict, List
+from sqlalchemy import Index, Table, MetaData, Column, func ,DateTime,String ,Enum, Integer, TIME, DATE ,ForeignKey# type: ignore
 from sqlalchemy.orm import relationship  # type: ignore
 from dms2223backend.data.db.results.resultbase import ResultBase
 from dms2223backend.data.reportstatus import ReportStatus
@@ -49,3 +49,17 @@ class Reportcomment(ResultBase):
             #Column('user', String(15), nullable=False),
             #Column('date', DATE, nullable = False)
         )
+
+    @staticmethod
+    def _table_indexes(table: Table) -> List[Index]:
+        """ Gets the secondary indexes of the table.
+
+        Args:
+            - table (Table): The `Table` object with the table definition.
+
+        Returns:
+            - List[Index]: A list of `Index` objects.
+        """
+        return [
+            Index('ix_reportscomment_commentid', table.c.commentid)
+        ]
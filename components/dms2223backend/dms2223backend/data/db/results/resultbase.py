@@ -2,8 +2,8 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict
-from sqlalchemy import Table, MetaData  # type: ignore
+from typing import Dict, List
+from sqlalchemy import Table, MetaData, Index  # type: ignore
 from sqlalchemy.orm import registry  # type: ignore
 
 
@@ -20,9 +20,11 @@ class ResultBase(ABC):
             - schema_registry (registry): A generalized registry to map classes
                         (used to gather the entities' definitions and mapping)
         """
+        table: Table = cls._table_definition(schema_registry.metadata)  # type: ignore
+        cls._table_indexes(table)  # type: ignore
         schema_registry.map_imperatively(
             cls,
-            cls._table_definition(schema_registry.metadata),  # type: ignore
+            table,
             properties=cls._mapping_properties()  # type: ignore
         )
 
@@ -39,6 +41,21 @@ class ResultBase(ABC):
             - Table: A `Table` object with the table definition.
         """
 
+    @staticmethod
+    def _table_indexes(table: Table) -> List[Index]:
+        """ Gets the secondary indexes of the table.
+
+        Indexes built over the table columns are attached to the table, so they are
+        created along with it.
+
+        Args:
+            - table (Table): The `Table` object with the table definition.
+
+        Returns:
+            - List[Index]: A list of `Index` objects.
+        """
+        return []
+
     @staticmethod
     def _mapping_properties() -> Dict:
         """ Gets the mapping properties dictionary.
@@ -1,5 +1,5 @@
-from typing import Dict
-from sqlalchemy import Table, MetaData, Column, String , Integer ,ForeignKey # type: ignore
+from typing import Dict, List
+from sqlalchemy import Index, Table, MetaData, Column, String , Integer ,ForeignKey # type: ignore
 from sqlalchemy.orm import relationship  # type: ignore
 from dms2223backend.data.db.results.resultbase import ResultBase
 
@@ -45,3 +45,16 @@ class VoteComment(ResultBase):
             Column('cid', Integer, ForeignKey('comments.id'), nullable=False),
         )
 
+    @staticmethod
+    def _table_indexes(table: Table) -> List[Index]:
+        """ Gets the secondary indexes of the table.
+
+        Args:
+            - table (Table): The `Table` object with the table definition.
+
+        Returns:
+            - List[Index]: A list of `Index` objects.
+        """
+        return [
+            Index('ix_votecomments_cid', table.c.cid)
+        ]
@@ -5,3 +5,5 @@ from .discussions import Discussions
 from .answers import Answers
 from .comments import Comments
 from .reports import Reports
+from .pagination import Pagination
+from .search import Search
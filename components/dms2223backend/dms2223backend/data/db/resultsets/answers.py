@@ -2,12 +2,14 @@
 """
 
 import hashlib
-from typing import List
+from typing import List, Optional, Tuple
+from sqlalchemy import func  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
 from dms2223backend.data.db.results import Answer, VoteAnswer
 from dms2223backend.data.db.exc.discussionnotfounderror import DiscussionNotFoundError
+from .pagination import Pagination
 
 
 class Answers():
@@ -60,19 +62,35 @@ class Answers():
 
     @staticmethod
     def discussion_has_answers(session: Session, discussionid: int) -> bool:
+        """Determines whether a discussion has any answer.
+
+        The check is done with an `EXISTS` query, so no answer is loaded.
+
+        Args:
+            - session (Session): The session object.
+            - discussionid (int): The discussion id.
+
+        Raises:
+            - ValueError: If the discussion id is missing.
+
+        Returns:
+            - bool: `True` if the discussion has at least one answer; `False` otherwise.
+        """
         if not discussionid:
             raise ValueError('A discussion id is required.')
-        discussions = Answers.list_all_for_discussion(session, discussionid)
-
-        return len(discussions) != 0
+        query = session.query(Answer).filter_by(discussionid=discussionid)
+        return bool(session.query(query.exists()).scalar())
 
     @staticmethod
-    def list_all_for_discussion(session: Session, discussionid: int) -> List[Answer]:
-        """Lists the `answers made to a certain question.
+    def list_all_for_discussion(session: Session, discussionid: int, limit: Optional[int] = None,
+                                after: Optional[int] = None) -> List[Answer]:
+        """Lists the `answers made to a certain question, ordered by id.
 
         Args:
             - session (Session): The session object.
             - id (int): The question id.
+            - limit (Optional[int]): Maximum number of answers to list (no limit if `None`).
+            - after (Optional[int]): Only answers with an id greater than this one are listed.
 
         Raises:
             - ValueError: If the question id is missing.
@@ -83,6 +101,7 @@ class Answers():
         if not discussionid:
             raise ValueError('A discussion id is required')
         query = session.query(Answer).filter_by(discussionid=discussionid)
+        query = Pagination.keyset(query, Answer.id, limit, after)  # type: ignore
         return query.all()
 
     @staticmethod
@@ -108,24 +127,125 @@ class Answers():
         return query.all()
 
     @staticmethod
-    def get_vote(session: Session, answerid: int) -> Answer:
-        """Return a answer of a certain question and user.
+    def get_discussion_id(session: Session, answerid: int) -> Optional[int]:
+        """Finds the discussion of an answer.
 
         Args:
             - session (Session): The session object.
-            - user (str): The user name string.
-            - id (int): The question id.
+            - answerid (int): The answer id.
+
+        Returns:
+            - Optional[int]: The discussion id, or `None` if the answer does not exist.
+        """
+        return session.query(Answer.discussionid).filter_by(id=answerid).scalar()  # type: ignore
+
+    @staticmethod
+    def vote(session: Session, answerid: int) -> VoteAnswer:
+        """ Casts a vote on an answer.
+
+        The vote record is added and the answer `vote_count` counter is incremented in the same
+        transaction, so both stay consistent.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - answerid (int): The answer id.
 
         Raises:
-            - ValueError: If the username is missing.
+            - ValueError: If the answer id is missing.
+            - DiscussionNotFoundError: If the answer does not exist.
 
         Returns:
-            - Answer: Answer of the question.
+            - VoteAnswer: The created `VoteAnswer` result.
+        """
+        if not answerid:
+            raise ValueError('An answer id is required.')
+        try:
+            new_vote = VoteAnswer(answerid)
+            session.add(new_vote)
+            session.query(Answer).filter_by(id=answerid).update(
+                {Answer.vote_count: Answer.vote_count + 1},  # type: ignore
+                synchronize_session=False
+            )
+            session.commit()
+            return new_vote
+        except IntegrityError as ex:
+            session.rollback()
+            raise DiscussionNotFoundError(
+                'An answer with id ' + str(answerid) + ' not exists.'
+                ) from ex
+
+    @staticmethod
+    def get_vote(session: Session, answerid: int) -> int:
+        """Return the number of votes of an answer.
+
+        The denormalized `vote_count` counter is read, so the votes are not counted.
+
+        Args:
+            - session (Session): The session object.
+            - answerid (int): The answer id.
+
+        Raises:
+            - ValueError: If the answer id is missing.
+
+        Returns:
+            - int: The number of votes of the answer.
         """
         if not answerid:
             raise ValueError('All fields are required.')
-        query = session.query(VoteAnswer).filter_by(
-            aid=answerid
+        query = session.query(Answer.vote_count).filter_by(  # type: ignore
+            id=answerid
         )
-        
-        return query.count()        
\ No newline at end of file
+        return query.scalar() or 0
+
+    @staticmethod
+    def __counted_votes(session: Session):
+        """Builds a scalar subquery counting the vote records of each answer.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - ScalarSelect: The correlated subquery.
+        """
+        return session.query(func.count(VoteAnswer.id)).filter(  # type: ignore
+            VoteAnswer.aid == Answer.id  # type: ignore
+        ).correlate(Answer).scalar_subquery()
+
+    @staticmethod
+    def find_inconsistent_vote_counts(session: Session) -> List[Tuple[int, int, int]]:
+        """Lists the answers whose `vote_count` counter does not match their vote records.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - List[Tuple[int, int, int]]: A list of `(answer id, stored count, actual count)` tuples.
+        """
+        counted = Answers.__counted_votes(session)
+        query = session.query(
+            Answer.id, Answer.vote_count, counted  # type: ignore
+        ).filter(Answer.vote_count != counted)  # type: ignore
+        return [(row[0], row[1], row[2]) for row in query.all()]
+
+    @staticmethod
+    def reconcile_vote_counts(session: Session) -> int:
+        """Rebuilds the `vote_count` counters from the vote records.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - int: The number of answers whose counter has been fixed.
+        """
+        counted = Answers.__counted_votes(session)
+        fixed: int = session.query(Answer).filter(
+            Answer.vote_count != counted  # type: ignore
+        ).update({Answer.vote_count: counted}, synchronize_session=False)  # type: ignore
+        session.commit()
+        return fixed
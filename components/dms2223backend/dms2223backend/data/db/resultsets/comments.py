@@ -1,11 +1,13 @@
 """ Comments class module.
 """
 
-from typing import List
+from typing import List, Optional, Tuple
+from sqlalchemy import func  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223backend.data.db.results import Comment, VoteComment
 from dms2223backend.data.db.exc import DiscussionNotFoundError
+from .pagination import Pagination
 
 class Comments():
     """ Class responsible of table-level comments operations.
@@ -63,12 +65,15 @@ class Comments():
         return len(answers) != 0
 
     @staticmethod
-    def list_all_for_discussion(session: Session, discussionid: int) -> List[Comment]:
-        """Lists the `answers made to a certain question.
+    def list_all_for_discussion(session: Session, discussionid: int, limit: Optional[int] = None,
+                                after: Optional[int] = None) -> List[Comment]:
+        """Lists the comments made in a certain question, ordered by id.
 
         Args:
             - session (Session): The session object.
             - id (int): The question id.
+            - limit (Optional[int]): Maximum number of comments to list (no limit if `None`).
+            - after (Optional[int]): Only comments with an id greater than this one are listed.
 
         Raises:
             - ValueError: If the question id is missing.
@@ -79,6 +84,7 @@ class Comments():
         if not discussionid:
             raise ValueError('An answer id is required')
         query = session.query(Comment).filter_by(discussionid=discussionid)
+        query = Pagination.keyset(query, Comment.id, limit, after)  # type: ignore
         return query.all()
 
     @staticmethod
@@ -123,25 +129,125 @@ class Comments():
         return query.all()
         
     @staticmethod
-    def get_vote(session: Session, commentid: int) -> Comment:
-        """Return a answer of a certain question and user.
+    def get_discussion_id(session: Session, commentid: int) -> Optional[int]:
+        """Finds the discussion of a comment.
 
         Args:
             - session (Session): The session object.
-            - user (str): The user name string.
-            - id (int): The question id.
+            - commentid (int): The comment id.
+
+        Returns:
+            - Optional[int]: The discussion id, or `None` if the comment does not exist.
+        """
+        return session.query(Comment.discussionid).filter_by(id=commentid).scalar()  # type: ignore
+
+    @staticmethod
+    def vote(session: Session, commentid: int) -> VoteComment:
+        """ Casts a vote on a comment.
+
+        The vote record is added and the comment `vote_count` counter is incremented in the same
+        transaction, so both stay consistent.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - commentid (int): The comment id.
 
         Raises:
-            - ValueError: If the username is missing.
+            - ValueError: If the comment id is missing.
+            - DiscussionNotFoundError: If the comment does not exist.
 
         Returns:
-            - Answer: Answer of the question.
+            - VoteComment: The created `VoteComment` result.
+        """
+        if not commentid:
+            raise ValueError('A comment id is required.')
+        try:
+            new_vote = VoteComment(commentid)
+            session.add(new_vote)
+            session.query(Comment).filter_by(id=commentid).update(
+                {Comment.vote_count: Comment.vote_count + 1},  # type: ignore
+                synchronize_session=False
+            )
+            session.commit()
+            return new_vote
+        except IntegrityError as ex:
+            session.rollback()
+            raise DiscussionNotFoundError(
+                'A comment with id ' + str(commentid) + ' not exists.'
+                ) from ex
+
+    @staticmethod
+    def get_vote(session: Session, commentid: int) -> int:
+        """Return the number of votes of a comment.
+
+        The denormalized `vote_count` counter is read, so the votes are not counted.
+
+        Args:
+            - session (Session): The session object.
+            - commentid (int): The comment id.
+
+        Raises:
+            - ValueError: If the comment id is missing.
+
+        Returns:
+            - int: The number of votes of the comment.
         """
         if not commentid:
             raise ValueError('All fields are required.')
-        query = session.query(VoteComment).filter_by(
-            cid=commentid
+        query = session.query(Comment.vote_count).filter_by(  # type: ignore
+            id=commentid
         )
-        
-        return query.count() 
-        
\ No newline at end of file
+        return query.scalar() or 0
+
+    @staticmethod
+    def __counted_votes(session: Session):
+        """Builds a scalar subquery counting the vote records of each comment.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - ScalarSelect: The correlated subquery.
+        """
+        return session.query(func.count(VoteComment.id)).filter(  # type: ignore
+            VoteComment.cid == Comment.id  # type: ignore
+        ).correlate(Comment).scalar_subquery()
+
+    @staticmethod
+    def find_inconsistent_vote_counts(session: Session) -> List[Tuple[int, int, int]]:
+        """Lists the comments whose `vote_count` counter does not match their vote records.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - List[Tuple[int, int, int]]: A list of `(comment id, stored count, actual count)` tuples.
+        """
+        counted = Comments.__counted_votes(session)
+        query = session.query(
+            Comment.id, Comment.vote_count, counted  # type: ignore
+        ).filter(Comment.vote_count != counted)  # type: ignore
+        return [(row[0], row[1], row[2]) for row in query.all()]
+
+    @staticmethod
+    def reconcile_vote_counts(session: Session) -> int:
+        """Rebuilds the `vote_count` counters from the vote records.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - int: The number of comments whose counter has been fixed.
+        """
+        counted = Comments.__counted_votes(session)
+        fixed: int = session.query(Comment).filter(
+            Comment.vote_count != counted  # type: ignore
+        ).update({Comment.vote_count: counted}, synchronize_session=False)  # type: ignore
+        session.commit()
+        return fixed
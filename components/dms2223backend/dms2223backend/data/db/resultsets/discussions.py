@@ -2,12 +2,15 @@
 """
 
 import hashlib
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import func  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
+from sqlalchemy.orm import selectinload  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
-from dms2223backend.data.db.results import Discussion
+from dms2223backend.data.db.results import Discussion, Answer
 from dms2223backend.data.db.exc import DiscussionExistsError
+from .pagination import Pagination
 
 
 class Discussions():
@@ -57,6 +60,72 @@ class Discussions():
         query = session.query(Discussion)
         return query.all()
 
+    @staticmethod
+    def __query_with_answer_count(session: Session, *columns):
+        """Builds a query of discussions along with their number of answers.
+
+        The answers are counted in the database through an outer join, so a single
+        round trip is needed regardless of the number of discussions.
+
+        Args:
+            - session (Session): The session object.
+            - *columns: The discussion entity or columns selected before the answer count.
+
+        Returns:
+            - Query: A query yielding rows of the selected columns followed by the answer count.
+        """
+        return session.query(
+            *columns, func.count(Answer.id)  # type: ignore
+        ).outerjoin(
+            Answer, Answer.discussionid == Discussion.id  # type: ignore
+        ).group_by(Discussion.id)  # type: ignore
+
+    @staticmethod
+    def list_all_with_answer_count(session: Session, limit: Optional[int] = None,
+                                   after: Optional[int] = None) -> List[Tuple]:
+        """Lists the discussions along with their number of answers, ordered by id.
+
+        Only the listed columns are selected, and the rows are returned as they are fetched (as
+        tuples), so no `Discussion` object is built and tracked by the session for each one.
+
+        Args:
+            - session (Session): The session object.
+            - limit (Optional[int]): Maximum number of discussions to list (no limit if `None`).
+            - after (Optional[int]): Only discussions with an id greater than this one are listed.
+
+        Returns:
+            - List[Tuple]: A list of `(id, title, content, answer count)` tuples.
+        """
+        query = Discussions.__query_with_answer_count(
+            session, Discussion.id, Discussion.title, Discussion.content  # type: ignore
+        )
+        return Pagination.keyset(query, Discussion.id, limit, after).all()  # type: ignore
+
+    @staticmethod
+    def get_discussion_with_answer_count(session: Session, id: int) -> Optional[Tuple[Discussion, int]]:
+        """Obtains a discussion by an id along with its number of answers.
+
+        Args:
+            - session (Session): The session object.
+            - id (int): Id discussion integer.
+
+        Raises:
+            - ValueError: If the id is missing.
+
+        Returns:
+            - Optional[Tuple[Discussion, int]]: The `(Discussion, answer count)` tuple, or `None`
+              if the discussion does not exist.
+        """
+        if not id:
+            raise ValueError('An id is requiered.')
+        query = Discussions.__query_with_answer_count(session, Discussion).filter(
+            Discussion.id == id  # type: ignore
+        )
+        row = query.one_or_none()
+        if row is None:
+            return None
+        return (row[0], int(row[1]))
+
     @staticmethod
     def get_discussion_by_id(session: Session, id: int,) -> Optional[Discussion]:
         """Obtains a discussion by an id.
@@ -76,3 +145,29 @@ class Discussions():
         except NoResultFound:
             return None
         return discussion
+
+    @staticmethod
+    def get_thread(session: Session, id: int) -> Optional[Discussion]:
+        """Obtains a discussion by an id with its answers and their comments already loaded.
+
+        The answers and the comments are eagerly loaded with one `SELECT ... IN` query each, so
+        the whole thread takes three queries regardless of its size.
+
+        Args:
+            - session (Session): The session object.
+            - id (int): Id discussion integer.
+
+        Raises:
+            - ValueError: If the id is missing.
+
+        Returns:
+            - Optional[Discussion]: The `Discussion` result, whose `discussions` relationship holds
+              its answers and their `answers` relationship their comments; or `None` if the
+              discussion does not exist.
+        """
+        if not id:
+            raise ValueError('An id is requiered.')
+        query = session.query(Discussion).options(
+            selectinload(Discussion.discussions).selectinload(Answer.answers)  # type: ignore
+        ).filter_by(id=id)
+        return query.one_or_none()
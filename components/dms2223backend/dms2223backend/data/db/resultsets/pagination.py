@@ -0,0 +1,52 @@
+""" Pagination class module.
+"""
+
+from typing import Any, Callable, List, Optional, Tuple
+from sqlalchemy.orm.query import Query  # type: ignore
+
+
+class Pagination():
+    """ Class responsible of the keyset (cursor-based) pagination of the listings.
+
+    Rows are ordered by their (monotonically increasing) id, so a page is fetched with
+    `WHERE id > :after ORDER BY id LIMIT :limit`, which the primary key index resolves
+    without scanning the skipped rows.
+    """
+    @staticmethod
+    def keyset(query: Query, column, limit: Optional[int] = None, after: Optional[int] = None) -> Query:
+        """ Restricts a query to a single page.
+
+        Args:
+            - query (Query): The query to paginate.
+            - column (Column): The unique, ordered column used as the key (usually the id).
+            - limit (Optional[int]): The maximum number of rows to fetch, or `None` for no limit.
+            - after (Optional[int]): The key of the last row of the previous page, or `None` to
+              start from the beginning.
+
+        Returns:
+            - Query: The paginated query.
+        """
+        if after is not None:
+            query = query.filter(column > after)
+        query = query.order_by(column)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    @staticmethod
+    def split(rows: List, limit: int, key: Callable[[Any], int]) -> Tuple[List, Optional[int]]:
+        """ Splits the rows fetched with a limit of `limit + 1` into a page and the next cursor.
+
+        Args:
+            - rows (List): The fetched rows (up to `limit + 1`).
+            - limit (int): The page size.
+            - key (Callable[[Any], int]): Function extracting the key from a row.
+
+        Returns:
+            - Tuple[List, Optional[int]]: The rows of the page and the cursor for the next page,
+              or `None` if this is the last one.
+        """
+        if len(rows) <= limit:
+            return (rows, None)
+        page = rows[:limit]
+        return (page, key(page[-1]))
@@ -2,7 +2,7 @@
 """
 
 import hashlib
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
@@ -11,6 +11,7 @@ from dms2223backend.data.db.results import Reportanswer
 from dms2223backend.data.db.exc import ReportExistsError
 from dms2223backend.data.db.results import Reportcomment
 from dms2223backend.data.reportstatus import ReportStatus
+from .pagination import Pagination
 
 class Reports():
     """ Class responsible of table-level reports operations.
@@ -112,42 +113,77 @@ class Reports():
                 ) from ex
 
     @staticmethod
-    def list_all(session: Session) -> List[Report]:
-        """Lists every report.
+    def list_all(session: Session, limit: Optional[int] = None,
+                 after: Optional[int] = None) -> List[Tuple]:
+        """Lists the reports, ordered by id.
 
         Args:
             - session (Session): The session object.
+            - limit (Optional[int]): Maximum number of reports to list (no limit if `None`).
+            - after (Optional[int]): Only reports with an id greater than this one are listed.
 
         Returns:
-            - List[report]: A list of `report` registers.
+            - List[Tuple]: A list of `(id, discussionid, reason, timestamp, status)` tuples.
         """
-        query = session.query(Report)
-        return query.all()
+        return Reports.__list_rows(
+            session, Report, Report.discussionid, limit, after  # type: ignore
+        )
 
     @staticmethod
-    def list_all_report_answer(session: Session) -> List[Report]:
-        """Lists every report.
+    def list_all_report_answer(session: Session, limit: Optional[int] = None,
+                               after: Optional[int] = None) -> List[Tuple]:
+        """Lists the reports, ordered by id.
 
         Args:
             - session (Session): The session object.
+            - limit (Optional[int]): Maximum number of reports to list (no limit if `None`).
+            - after (Optional[int]): Only reports with an id greater than this one are listed.
 
         Returns:
-            - List[report]: A list of `report` registers.
+            - List[Tuple]: A list of `(id, answerid, reason, timestamp, status)` tuples.
         """
-        query = session.query(Reportanswer)
-        return query.all()
+        return Reports.__list_rows(
+            session, Reportanswer, Reportanswer.answerid, limit, after  # type: ignore
+        )
 
     @staticmethod
-    def list_all_report_comments(session: Session) -> List[Report]:
-        """Lists every report.
+    def list_all_report_comments(session: Session, limit: Optional[int] = None,
+                                 after: Optional[int] = None) -> List[Tuple]:
+        """Lists the reports, ordered by id.
+
+        Args:
+            - session (Session): The session object.
+            - limit (Optional[int]): Maximum number of reports to list (no limit if `None`).
+            - after (Optional[int]): Only reports with an id greater than this one are listed.
+
+        Returns:
+            - List[Tuple]: A list of `(id, commentid, reason, timestamp, status)` tuples.
+        """
+        return Reports.__list_rows(
+            session, Reportcomment, Reportcomment.commentid, limit, after  # type: ignore
+        )
+
+    @staticmethod
+    def __list_rows(session: Session, result: type, target, limit: Optional[int],
+                    after: Optional[int]) -> List[Tuple]:
+        """Lists the listing columns of the reports of a kind, ordered by id.
+
+        Only those columns are selected, and the rows are returned as they are fetched (as tuples),
+        so no result object is built and tracked by the session for each report.
 
         Args:
             - session (Session): The session object.
+            - result (type): The report result class (`Report`, `Reportanswer` or `Reportcomment`).
+            - target (Column): The column of the reported post id.
+            - limit (Optional[int]): Maximum number of reports to list (no limit if `None`).
+            - after (Optional[int]): Only reports with an id greater than this one are listed.
 
         Returns:
-            - List[report]: A list of `report` registers.
+            - List[Tuple]: A list of `(id, reported post id, reason, timestamp, status)` tuples.
         """
-        query = session.query(Reportcomment)
+        query = Pagination.keyset(session.query(
+            result.id, target, result.reason, result.timestamp, result.status  # type: ignore
+        ), result.id, limit, after)  # type: ignore
         return query.all()
 
     @staticmethod
@@ -0,0 +1,174 @@
+""" Search class module.
+"""
+
+import re
+from typing import List, Optional, Tuple
+from sqlalchemy import text  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2223backend.data.db.exc import SearchUnavailableError
+
+
+class Search():
+    """ Class responsible of the full-text search over the discussions, answers and comments.
+
+    Every post is indexed in the `posts_fts` SQLite FTS5 virtual table, which triggers on the
+    `discussions`, `answers` and `comments` tables keep in sync. The index row id encodes both
+    the kind and the id of the post (`id * 4 + kind code`), so the triggers update it by row id,
+    and only when the indexed columns change (e.g. not when an answer or a comment is voted).
+    """
+    SNIPPET_START: str = '\x02'
+    SNIPPET_END: str = '\x03'
+
+    __SOURCES: List[Tuple[str, int, str, str, str, str]] = [
+        # (kind, code, table, indexed columns, title expression, discussion id expression)
+        ('discussion', 1, 'discussions', 'title, content', '{row}.title', '{row}.id'),
+        ('answer', 2, 'answers', 'content', 'NULL', '{row}.discussionid'),
+        ('comment', 3, 'comments', 'content', 'NULL', '{row}.discussionid')
+    ]
+
+    @staticmethod
+    def deploy(connection: Connection) -> None:
+        """ Creates the full-text index and its synchronization triggers if they do not exist.
+
+        When the index is created, the existing posts are indexed too. Triggers that differ from
+        the current ones (created by previous versions) are replaced.
+
+        Args:
+            - connection (Connection): The connection to the database, within a transaction.
+        """
+        if connection.dialect.name != 'sqlite':
+            return
+        exists = connection.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'"
+        )).first()
+        if exists is None:
+            connection.execute(text(
+                'CREATE VIRTUAL TABLE posts_fts USING fts5('
+                'title, content, kind UNINDEXED, discussionid UNINDEXED, '
+                "tokenize = 'unicode61 remove_diacritics 2')"
+            ))
+            # Matches in the title weigh ten times those in the content
+            connection.execute(text(
+                "INSERT INTO posts_fts(posts_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0, 0.0, 0.0)')"
+            ))
+        for kind, code, table, columns, title, discussionid in Search.__SOURCES:
+            def values(row: str) -> str:
+                return (
+                    f"{row}.id * 4 + {code}, {title.format(row=row)}, {row}.content, "  # pylint: disable=cell-var-from-loop
+                    f"'{kind}', {discussionid.format(row=row)}"  # pylint: disable=cell-var-from-loop
+                )
+            insert: str = (
+                'INSERT INTO posts_fts(rowid, title, content, kind, discussionid) '
+                f'VALUES ({values("new")});'
+            )
+            delete: str = f'DELETE FROM posts_fts WHERE rowid = old.id * 4 + {code};'
+            Search.__create_trigger(
+                connection, f'{table}_fts_insert', f'AFTER INSERT ON {table} BEGIN {insert} END'
+            )
+            Search.__create_trigger(
+                connection, f'{table}_fts_delete', f'AFTER DELETE ON {table} BEGIN {delete} END'
+            )
+            Search.__create_trigger(
+                connection, f'{table}_fts_update',
+                f'AFTER UPDATE OF {columns} ON {table} BEGIN {delete} {insert} END'
+            )
+            if exists is None:
+                connection.execute(text(
+                    'INSERT INTO posts_fts(rowid, title, content, kind, discussionid) '
+                    f'SELECT {values(table)} FROM {table}'
+                ))
+
+    @staticmethod
+    def __create_trigger(connection: Connection, name: str, definition: str) -> None:
+        """ Creates a trigger, replacing any existing one with a different definition.
+
+        Args:
+            - connection (Connection): The connection to the database, within a transaction.
+            - name (str): The trigger name.
+            - definition (str): The trigger definition, following its name.
+        """
+        statement: str = f'CREATE TRIGGER {name} {definition}'
+        existing = connection.execute(text(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = :name"
+        ), {'name': name}).first()
+        if existing is not None:
+            if existing[0] == statement:
+                return
+            connection.execute(text(f'DROP TRIGGER {name}'))
+        connection.execute(text(statement))
+
+    @staticmethod
+    def undeploy(connection: Connection) -> None:
+        """ Drops the full-text index and its synchronization triggers, if they exist.
+
+        Meant for bulk loads, which are much faster without indexing every row as it is inserted;
+        `deploy` rebuilds the index afterwards.
+
+        Args:
+            - connection (Connection): The connection to the database, within a transaction.
+        """
+        if connection.dialect.name != 'sqlite':
+            return
+        for _, _, table, _, _, _ in Search.__SOURCES:
+            for event in ('insert', 'delete', 'update'):
+                connection.execute(text(f'DROP TRIGGER IF EXISTS {table}_fts_{event}'))
+        connection.execute(text('DROP TABLE IF EXISTS posts_fts'))
+
+    @staticmethod
+    def match_expression(terms: str) -> Optional[str]:
+        """ Builds a safe FTS5 query from the terms typed by a user.
+
+        Every word must appear in the post, the last one as a prefix (so results show up while
+        typing). Any FTS5 syntax in the terms is ignored.
+
+        Args:
+            - terms (str): The search terms.
+
+        Returns:
+            - Optional[str]: The FTS5 query, or `None` if there are no words in the terms.
+        """
+        words: List[str] = re.findall(r'\w+', terms or '')
+        if not words:
+            return None
+        return ' '.join(f'"{word}"' for word in words) + '*'
+
+    @staticmethod
+    def search(session: Session, terms: str, limit: Optional[int] = None,
+               after: Optional[int] = None) -> List[Tuple[str, int, int, str, str]]:
+        """ Searches the posts matching some terms, best matches first.
+
+        Args:
+            - session (Session): The session object.
+            - terms (str): The search terms.
+            - limit (Optional[int]): Maximum number of posts to list (no limit if `None`).
+            - after (Optional[int]): Number of best matches to skip.
+
+        Raises:
+            - SearchUnavailableError: If the database does not support the full-text index.
+
+        Returns:
+            - List[Tuple[str, int, int, str, str]]: A list of `(kind, id, discussion id,
+              discussion title, snippet)` tuples. In the snippet, the matched words are enclosed
+              between `SNIPPET_START` and `SNIPPET_END`.
+        """
+        if session.get_bind().dialect.name != 'sqlite':
+            raise SearchUnavailableError('Full-text search requires an SQLite database.')
+        match: Optional[str] = Search.match_expression(terms)
+        if match is None:
+            return []
+        query = text(
+            'SELECT f.kind, f.id, f.discussionid, d.title, f.snippet FROM ('
+            '  SELECT kind, rowid / 4 AS id, discussionid, rank, '
+            "    snippet(posts_fts, -1, :start, :end, '…', 16) AS snippet "
+            '  FROM posts_fts WHERE posts_fts MATCH :match ORDER BY rank LIMIT :limit OFFSET :offset'
+            ') AS f JOIN discussions AS d ON d.id = f.discussionid ORDER BY f.rank'
+        )
+        rows = session.execute(query, {
+            'start': Search.SNIPPET_START,
+            'end': Search.SNIPPET_END,
+            'match': match,
+            'limit': -1 if limit is None else limit,
+            'offset': after or 0
+        })
+        return [(row[0], int(row[1]), int(row[2]), row[3], row[4]) for row in rows]
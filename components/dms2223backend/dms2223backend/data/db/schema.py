@@ -1,12 +1,15 @@
 """ Schema class module.
 """
 
-from sqlalchemy import create_engine, event  # type: ignore
+from typing import Optional
+from sqlalchemy import event, inspect, text  # type: ignore
 from sqlalchemy.engine import Engine  # type: ignore
 from sqlalchemy.orm import sessionmaker, scoped_session, registry  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
+from dms2223common.data import DatabaseEngine, QueryProfiler
 from dms2223backend.data.config import BackendConfiguration
 from dms2223backend.data.db.results import Discussion, Answer, Comment, Report , Reportanswer , Reportcomment, VoteAnswer, VoteComment
+from dms2223backend.data.db.resultsets import Search
 
 
 # Required for SQLite to enforce FK integrity when supported
@@ -43,8 +46,15 @@ class Schema():
                 'A value for the configuration parameter `db_connection_string` is needed.'
             )
         db_connection_string: str = config.get_db_connection_string() or ''
-        self.__create_engine = create_engine(db_connection_string)
+        self.__create_engine = DatabaseEngine.create(
+            db_connection_string, config.get_db_engine_options(), config.get_db_pragmas()
+        )
         self.__session_maker = scoped_session(sessionmaker(bind=self.__create_engine))
+        self.__profiler: Optional[QueryProfiler] = QueryProfiler.from_config(
+            config.get_db_profiler()
+        )
+        if self.__profiler is not None:
+            self.__profiler.instrument_engine(self.__create_engine)
 
         Discussion.map(self.__registry)
         Answer.map(self.__registry)
@@ -55,6 +65,52 @@ class Schema():
         VoteAnswer.map(self.__registry)
         VoteComment.map(self.__registry)
         self.__registry.metadata.create_all(self.__create_engine)
+        self.__upgrade_tables()
+        with self.__create_engine.begin() as connection:
+            Search.deploy(connection)
+
+    def __upgrade_tables(self) -> None:
+        """ Adds to the existing tables the columns and indexes defined after they were created.
+
+        `create_all` only creates the missing tables (along with their indexes), so databases
+        deployed with a previous version of the schema are upgraded here. Such columns must be
+        nullable or have a server default.
+        """
+        inspector = inspect(self.__create_engine)
+        with self.__create_engine.begin() as connection:
+            for table in self.__registry.metadata.sorted_tables:
+                existing = [column['name'] for column in inspector.get_columns(table.name)]
+                for column in table.columns:
+                    if column.name in existing:
+                        continue
+                    ddl: str = (
+                        f'ALTER TABLE {table.name} ADD COLUMN {column.name} '
+                        f'{column.type.compile(dialect=self.__create_engine.dialect)}'
+                    )
+                    if column.server_default is not None:
+                        ddl += f' DEFAULT {column.server_default.arg}'
+                    if not column.nullable:
+                        ddl += ' NOT NULL'
+                    connection.execute(text(ddl))
+                for index in table.indexes:
+                    index.create(connection, checkfirst=True)
+
+    def get_engine(self) -> Engine:
+        """ Gets the engine the sessions are bound to.
+
+        Returns:
+            - Engine: The `Engine` object.
+        """
+        return self.__create_engine
+
+    def get_profiler(self) -> Optional[QueryProfiler]:
+        """ Gets the SQL query profiler.
+
+        Returns:
+            - Optional[QueryProfiler]: The profiler recording the statements run by the engine, or
+              `None` if profiling is disabled.
+        """
+        return self.__profiler
 
     def new_session(self) -> Session:
         """ Constructs a new session.
@@ -68,3 +124,15 @@ class Schema():
         """ Frees the existing thread-local session.
         """
         self.__session_maker.remove()
+
+    def reset_connections(self) -> None:
+        """ Discards the pooled connections without closing them, and the thread-local sessions.
+
+        To be called in a process forked from the one that created the schema, so the database
+        connections inherited from the parent process are not shared with it. With Gevent, it must
+        be called after the standard library is patched (see `WSGIServer`): the session registry
+        is then rebuilt on the patched thread-local storage, so every greenlet gets its own
+        session instead of sharing one.
+        """
+        self.__create_engine.dispose(close=False)
+        self.__session_maker = scoped_session(sessionmaker(bind=self.__create_engine))
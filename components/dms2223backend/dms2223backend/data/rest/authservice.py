@@ -1,10 +1,10 @@
 """ AuthService class module.
 """
 
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 import requests
 from dms2223common.data import Role
-from dms2223common.data.rest import ResponseData
+from dms2223common.data.rest import ResponseData, RestClient
 
 
 class AuthService():
@@ -15,7 +15,8 @@ class AuthService():
                  host: str, port: int,
                  api_base_path: str = '/api/v1',
                  apikey_header: str = 'X-ApiKey-Auth',
-                 apikey_secret: str = ''
+                 apikey_secret: str = '',
+                 client_options: Optional[Dict] = None
                  ):
         """ Constructor method.
 
@@ -27,12 +28,15 @@ class AuthService():
             - api_base_path (str): The base path that is prepended to every request's path.
             - apikey_header (str): Name of the header with the API key that identifies this client.
             - apikey_secret (str): The API key that identifies this client.
+            - client_options (Optional[Dict]): The HTTP client pool, timeout and retry options (see
+              `RestClient.from_config`).
         """
         self.__host: str = host
         self.__port: int = port
         self.__api_base_path: str = api_base_path
         self.__apikey_header: str = apikey_header
         self.__apikey_secret: str = apikey_secret
+        self.__client: RestClient = RestClient.from_config(self.__base_url(), client_options)
 
     def __base_url(self) -> str:
         """ Constructs the base URL for the requests.
@@ -42,7 +46,63 @@ class AuthService():
         """
         return f'http://{self.__host}:{self.__port}{self.__api_base_path}'
 
-    
+    def get_client(self) -> RestClient:
+        """ Gets the pooled HTTP client used to send the requests.
+
+        Returns:
+            - RestClient: The HTTP client.
+        """
+        return self.__client
+
+    def get_token_owner(self, token: Optional[str]) -> ResponseData:
+        """ Requests the user associated to a token to the authentication service.
+
+        Args:
+            - token (Optional[str]): The user session token to validate.
+
+        Returns:
+            - ResponseData: If successful, the contents hold a dictionary with the user data.
+              Otherwise, the token is rejected (e.g., timed out, was invalidated, was missing)
+        """
+        response_data: ResponseData = ResponseData()
+        response: requests.Response = self.__client.get(
+            '/auth',
+            headers={
+                'Authorization': f'Bearer {token}',
+                self.__apikey_header: self.__apikey_secret
+            }
+        )
+        response_data.set_successful(response.ok)
+        if response_data.is_successful():
+            response_data.set_content(response.json())
+        else:
+            response_data.add_message(response.content.decode('ascii'))
+        return response_data
+
+    def validate_token(self, token: Optional[str]) -> ResponseData:
+        """ Checks a token against the authentication service, without renewing it nor reading
+        its owner.
+
+        Args:
+            - token (Optional[str]): The user session token to validate.
+
+        Returns:
+            - ResponseData: Whether the token is valid. Otherwise, the token is rejected (e.g.,
+              timed out, was invalidated, was missing)
+        """
+        response_data: ResponseData = ResponseData()
+        response: requests.Response = self.__client.get(
+            '/auth/validation',
+            headers={
+                'Authorization': f'Bearer {token}',
+                self.__apikey_header: self.__apikey_secret
+            }
+        )
+        response_data.set_successful(response.ok)
+        if not response_data.is_successful():
+            response_data.add_message(response.content.decode('ascii'))
+        return response_data
+
 
     def user_role(self, token: Optional[str], username: str, rolename: str)-> ResponseData:
         """ Performs an authentication request to the authentication service.
@@ -56,8 +116,8 @@ class AuthService():
         """
         response_data: ResponseData = ResponseData()
        
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/user/{username}/role/{rolename}',
+        response: requests.Response = self.__client.get(
+            f'/user/{username}/role/{rolename}',
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -4,4 +4,5 @@
 from .discussionlogic import DiscussionLogic
 from .answerlogic import AnswerLogic
 from .commentlogic import CommentLogic
-from .reportlogic import ReportLogic
\ No newline at end of file
+from .reportlogic import ReportLogic
+from .searchlogic import SearchLogic
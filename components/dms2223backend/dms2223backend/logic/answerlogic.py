@@ -1,7 +1,7 @@
 """ AnswerLogic class module.
 """
 
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223backend.data.db.results import Answer
 from dms2223backend.data.db.resultsets import Answers, Comments
@@ -62,12 +62,15 @@ class AnswerLogic():
         # return list_of_answers
     
     @staticmethod
-    def list_all_for_discussion(discussionid: int, session: Session) -> List[Answer]:
-        """Lists the `answers made to a certain question.
+    def list_all_for_discussion(discussionid: int, session: Session, limit: Optional[int] = None,
+                                after: Optional[int] = None) -> List[Answer]:
+        """Lists the `answers made to a certain question, ordered by id.
 
         Args:
             - session (Session): The session object.
             - id (int): The question id.
+            - limit (Optional[int]): Maximum number of answers to list (no limit if `None`).
+            - after (Optional[int]): Only answers with an id greater than this one are listed.
 
         Raises:
             - ValueError: If the question id is missing.
@@ -75,7 +78,7 @@ class AnswerLogic():
         Returns:
             - List[Answer]: A list of answer registers with the question answers.
         """
-        return Answers.list_all_for_discussion(session, discussionid)
+        return Answers.list_all_for_discussion(session, discussionid, limit, after)
     
     @staticmethod
     def get_answer(session: Session ,discussionid: int) -> Answer:
@@ -107,24 +110,31 @@ class AnswerLogic():
         # return list_of_answers
     
     @staticmethod
-    def vote_answer(session: Session, aid: int ):
-        """Vote an Answer
+    def get_discussion_id(session: Session, answerid: int) -> Optional[int]:
+        """Finds the discussion of an answer.
 
         Args:
-            
-            - aid: answer id.
-            
+            - session (Session): The session object.
+            - answerid (int): The answer id.
 
         Returns:
-            - Dict: Answer of the discussion.
+            - Optional[int]: The discussion id, or `None` if the answer does not exist.
         """
-        
-    
+        return Answers.get_discussion_id(session, answerid)
+
+    @staticmethod
+    def vote_answer(session: Session, aid: int ) -> VoteAnswer:
+        """Vote an Answer, updating its vote counter in the same transaction.
 
+        Args:
+            - session (Session): The session object.
+            - aid: answer id.
+
+        Returns:
+            - VoteAnswer: The created vote.
+        """
         try:
-            vote: VoteAnswer = VoteAnswer(aid)
-            session.add(vote)
-            session.commit()
+            vote: VoteAnswer = Answers.vote(session, aid)
         except Exception as ex:
             raise ex
         return vote
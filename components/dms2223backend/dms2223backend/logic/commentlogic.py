@@ -1,7 +1,7 @@
 """ CommentLogic class module.
 """
 
-from typing import List
+from typing import List, Optional
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223backend.data.db.results import Comment
 from dms2223backend.data.db.resultsets import Comments
@@ -50,12 +50,15 @@ class CommentLogic():
         return Comments.list_all(session)
 
     @staticmethod
-    def list_all_for_discussion(discussionid: int, session: Session) -> List[Comment]:
-        """Lists the `answers made to a certain question.
+    def list_all_for_discussion(discussionid: int, session: Session, limit: Optional[int] = None,
+                                after: Optional[int] = None) -> List[Comment]:
+        """Lists the comments made in a certain question, ordered by id.
 
         Args:
             - session (Session): The session object.
             - id (int): The question id.
+            - limit (Optional[int]): Maximum number of comments to list (no limit if `None`).
+            - after (Optional[int]): Only comments with an id greater than this one are listed.
 
         Raises:
             - ValueError: If the question id is missing.
@@ -63,7 +66,7 @@ class CommentLogic():
         Returns:
             - List[Answer]: A list of answer registers with the question answers.
         """
-        return Comments.list_all_for_discussion(session, discussionid)
+        return Comments.list_all_for_discussion(session, discussionid, limit, after)
 
     @staticmethod
     def list_all_for_answer(answerid: int, session: Session) -> List[Comment]:
@@ -100,22 +103,31 @@ class CommentLogic():
         return comment
 
     @staticmethod
-    def vote_comment(session: Session, cid: int ):
-        """Vote an Answer
+    def get_discussion_id(session: Session, commentid: int) -> Optional[int]:
+        """Finds the discussion of a comment.
 
         Args:
-            
-            - aid: answer id.
-            
+            - session (Session): The session object.
+            - commentid (int): The comment id.
 
         Returns:
-            - Dict: Answer of the discussion.
+            - Optional[int]: The discussion id, or `None` if the comment does not exist.
         """
+        return Comments.get_discussion_id(session, commentid)
 
+    @staticmethod
+    def vote_comment(session: Session, cid: int ) -> VoteComment:
+        """Vote a Comment, updating its vote counter in the same transaction.
+
+        Args:
+            - session (Session): The session object.
+            - cid: comment id.
+
+        Returns:
+            - VoteComment: The created vote.
+        """
         try:
-            vote: VoteComment = VoteComment(cid)
-            session.add(vote)
-            session.commit()
+            vote: VoteComment = Comments.vote(session, cid)
         except Exception as ex:
             raise ex
         return vote
@@ -2,12 +2,12 @@
 """
 
 import hashlib
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
 from dms2223backend.data.db.results import Discussion
-from dms2223backend.data.db.resultsets import Discussions, Answers
+from dms2223backend.data.db.resultsets import Discussions
 from dms2223backend.data.db.exc import DiscussionExistsError
 
 
@@ -42,23 +42,23 @@ class DiscussionLogic():
         return new_discussion
 
     @staticmethod
-    def list_all(session: Session) -> List[List]:
-        """Lists every discussion.
+    def list_all(session: Session, limit: Optional[int] = None, after: Optional[int] = None) -> List[Tuple]:
+        """Lists the discussions, ordered by id.
 
         Args:
             - session (Session): The session object.
+            - limit (Optional[int]): Maximum number of discussions to list (no limit if `None`).
+            - after (Optional[int]): Only discussions with an id greater than this one are listed.
 
         Returns:
-            - List[Discussion]: A list of `Discussion` registers.
+            - List[Tuple]: A list of `(id, title, content, answered, answer count)` tuples.
         """
-        discussions = Discussions.list_all(session)
-        list_of_discussions : List[List] = []
-        for discussion in discussions:
-            if (Answers.discussion_has_answers(session, discussion.id)): #type: ignore
-                list_of_discussions.append([discussion,1])
-            else:
-                list_of_discussions.append([discussion,0])
-        return list_of_discussions
+        return [
+            (discussionid, title, content, 1 if answers > 0 else 0, answers)
+            for discussionid, title, content, answers in Discussions.list_all_with_answer_count(
+                session, limit, after
+            )
+        ]
 
     @staticmethod
     def get_discussion_by_id(session: Session, id: int,) -> List:
@@ -68,17 +68,31 @@ class DiscussionLogic():
             - id (int): Id discussion integer.
 
         Returns:
-            - Optional[Discussion]: The result of the `Discussion`.
+            - List: A list with the `[Discussion, answered, answer count]` register, or
+              `[None, 0, 0]` if the discussion does not exist.
         """
         list_of_discussions = []
         try:
-            discussion = Discussions.get_discussion_by_id(session, id)
-            if (Answers.discussion_has_answers(session, id)):
-                list_of_discussions.append([discussion, 1])
+            result = Discussions.get_discussion_with_answer_count(session, id)
+            if result is None:
+                list_of_discussions.append([None, 0, 0])
             else:
-                list_of_discussions.append([discussion, 0])
+                discussion, answers = result
+                list_of_discussions.append([discussion, 1 if answers > 0 else 0, answers])
         except Exception as ex:
             raise ex
         return list_of_discussions
 
-    
\ No newline at end of file
+    @staticmethod
+    def get_thread(session: Session, id: int) -> Optional[Discussion]:
+        """Obtains a discussion by an id along with its answers and their comments.
+
+        Args:
+            - session (Session): The session object.
+            - id (int): Id discussion integer.
+
+        Returns:
+            - Optional[Discussion]: The `Discussion` result with its answers and comments loaded,
+              or `None` if the discussion does not exist.
+        """
+        return Discussions.get_thread(session, id)
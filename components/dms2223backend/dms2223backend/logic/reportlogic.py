@@ -2,7 +2,7 @@
 """
 
 import hashlib
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
@@ -43,42 +43,51 @@ class ReportLogic():
         return new_report
 
     @staticmethod
-    def list_all(session: Session) -> List[List]:
-        """Lists every report.
+    def list_all(session: Session, limit: Optional[int] = None,
+                 after: Optional[int] = None) -> List[Tuple]:
+        """Lists the reports, ordered by id.
 
         Args:
             - session (Session): The session object.
+            - limit (Optional[int]): Maximum number of reports to list (no limit if `None`).
+            - after (Optional[int]): Only reports with an id greater than this one are listed.
 
         Returns:
-            - List[Report]: A list of `Report` registers.
+            - List[Tuple]: A list of `(id, discussionid, reason, timestamp, status)` tuples.
         """
 
-        return Reports.list_all(session)
+        return Reports.list_all(session, limit, after)
 
     @staticmethod
-    def list_all_report_answer(session: Session) -> List[List]:
-        """Lists every report.
+    def list_all_report_answer(session: Session, limit: Optional[int] = None,
+                               after: Optional[int] = None) -> List[Tuple]:
+        """Lists the reports, ordered by id.
 
         Args:
             - session (Session): The session object.
+            - limit (Optional[int]): Maximum number of reports to list (no limit if `None`).
+            - after (Optional[int]): Only reports with an id greater than this one are listed.
 
         Returns:
-            - List[Report]: A list of `Report` registers.
+            - List[Tuple]: A list of `(id, answerid, reason, timestamp, status)` tuples.
         """
 
-        return Reports.list_all_report_answer(session)
+        return Reports.list_all_report_answer(session, limit, after)
 
-    def list_all_report_comments(session: Session) -> List[List]:
-        """Lists every report.
+    def list_all_report_comments(session: Session, limit: Optional[int] = None,
+                                 after: Optional[int] = None) -> List[Tuple]:
+        """Lists the reports, ordered by id.
 
         Args:
             - session (Session): The session object.
+            - limit (Optional[int]): Maximum number of reports to list (no limit if `None`).
+            - after (Optional[int]): Only reports with an id greater than this one are listed.
 
         Returns:
-            - List[Report]: A list of `Report` registers.
+            - List[Tuple]: A list of `(id, commentid, reason, timestamp, status)` tuples.
         """
 
-        return Reports.list_all_report_comments(session)
+        return Reports.list_all_report_comments(session, limit, after)
 
     @staticmethod
     def create_report_comment(session : Session, id :int, reason : str)-> Reportcomment:
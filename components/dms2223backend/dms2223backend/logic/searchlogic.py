@@ -0,0 +1,52 @@
+""" SearchLogic class module.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2223backend.data.db.resultsets import Search
+
+
+class SearchLogic():
+    """ Class with logic-level operations with the search-related use cases.
+    """
+    __HIGHLIGHT = re.compile(
+        re.escape(Search.SNIPPET_START) + '(.*?)' + re.escape(Search.SNIPPET_END), re.DOTALL
+    )
+
+    @staticmethod
+    def search(session: Session, terms: str, limit: Optional[int] = None,
+               after: Optional[int] = None) -> List[Tuple[str, int, int, str, str]]:
+        """ Searches the discussions, answers and comments matching some terms, best matches first.
+
+        Args:
+            - session (Session): The session object.
+            - terms (str): The search terms.
+            - limit (Optional[int]): Maximum number of posts to list (no limit if `None`).
+            - after (Optional[int]): Number of best matches to skip.
+
+        Raises:
+            - SearchUnavailableError: If the database does not support the full-text search.
+
+        Returns:
+            - List[Tuple[str, int, int, str, str]]: A list of `(kind, id, discussion id,
+              discussion title, snippet)` tuples.
+        """
+        return Search.search(session, terms, limit, after)
+
+    @staticmethod
+    def split_snippet(snippet: str) -> List[Dict]:
+        """ Splits a search snippet into its plain and highlighted parts.
+
+        Args:
+            - snippet (str): The snippet returned by the search.
+
+        Returns:
+            - List[Dict]: A list of dictionaries with the text of each part (key `text`) and
+              whether it matches the search terms (key `match`).
+        """
+        parts: List[Dict] = []
+        for index, text in enumerate(SearchLogic.__HIGHLIGHT.split(snippet or '')):
+            if text:
+                parts.append({'text': text, 'match': index % 2 == 1})
+        return parts
@@ -27,7 +27,7 @@ def answer(body: Dict, id: int) -> Tuple[Union[Dict, str], Optional[int]]:
     with current_app.app_context():
         try:
             answer = AnswersServices.answer(
-                id, body['content'], current_app.db
+                id, body['content'], current_app.db, current_app.cache
             )
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
@@ -38,22 +38,25 @@ def answer(body: Dict, id: int) -> Tuple[Union[Dict, str], Optional[int]]:
     return (answer, HTTPStatus.OK.value)
 
 
-def list_all_for_discussion(id: int) -> Tuple[Union[List[Dict], str], Optional[int]]:
-    """Lists the answers of a discussion if the requestor has the discussion role.
+def list_all_for_discussion(id: int, limit: int = 50,
+                            after: Optional[int] = None) -> Tuple[Union[Dict, str], Optional[int]]:
+    """Lists a page of the answers of a discussion if the requestor has the discussion role.
 
     Args:
         - disucssionId (int): Discussion id.
-        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+        - limit (int): Maximum number of answers in the page.
+        - after (Optional[int]): Cursor returned with the previous page, if any.
 
     Returns:
-        - Tuple[Union[List[Dict], str], Optional[int]]: On success, a tuple with the dictionary of the
-          new discussion data and a code 200 OK. On error, a description message and code:
+        - Tuple[Union[Dict, str], Optional[int]]: On success, a tuple with the page of answers (a
+          list of dictionaries for the answers' data and the cursor of the next page) and a code
+          200 OK. On error, a description message and code:
             - 400 BAD REQUEST when a mandatory argument is missing.
     """
     with current_app.app_context():
         try:
-            answers: List[Dict] = AnswersServices.list_all_for_discussion(
-                id, current_app.db
+            answers: Dict = AnswersServices.list_all_for_discussion(
+                id, current_app.db, limit, after, current_app.cache
             )
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
@@ -98,12 +101,15 @@ def vote_answer(id: int) -> Tuple[Dict, int]:
         - Tuple[Dict, str]]: On success, a tuple with the dictionary of the
           answer data and a code 200 OK. On error, a description message and code:
             - 400 BAD REQUEST when a mandatory argument is missing.
+            - 404 NOT FOUND when the answer does not exist.
     """
     with current_app.app_context():
         try:
-            vote = AnswersServices.vote_answer(id,current_app.db)
+            vote = AnswersServices.vote_answer(id,current_app.db, current_app.cache)
             
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
+        except DiscussionNotFoundError:
+            return ('The answer does not exist', HTTPStatus.NOT_FOUND.value)
 
     return (HTTPStatus.OK.value)
\ No newline at end of file
@@ -25,7 +25,7 @@ def comment(body: Dict, id: int) -> Tuple[Union[Dict, str], Optional[int]]:
     with current_app.app_context():
         try:
             comment = CommentsServices.comment(
-                body['discussionid'], id, body['content'], current_app.db
+                body['discussionid'], id, body['content'], current_app.db, current_app.cache
             )
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
@@ -36,22 +36,25 @@ def comment(body: Dict, id: int) -> Tuple[Union[Dict, str], Optional[int]]:
     return (comment, HTTPStatus.OK.value)
 
 
-def list_all_for_discussion(id: int) -> Tuple[Union[List[Dict], str], Optional[int]]:
-    """Lists the comments of an answer if the requestor has the discussion role.
+def list_all_for_discussion(id: int, limit: int = 50,
+                            after: Optional[int] = None) -> Tuple[Union[Dict, str], Optional[int]]:
+    """Lists a page of the comments of an answer if the requestor has the discussion role.
 
     Args:
         - answerId (int): Answer id.
-        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+        - limit (int): Maximum number of comments in the page.
+        - after (Optional[int]): Cursor returned with the previous page, if any.
 
     Returns:
-        - Tuple[Union[List[Dict], str], Optional[int]]: On success, a tuple with the dictionary of the
-          new discussion data and a code 200 OK. On error, a description message and code:
+        - Tuple[Union[Dict, str], Optional[int]]: On success, a tuple with the page of comments (a
+          list of dictionaries for the comments' data and the cursor of the next page) and a code
+          200 OK. On error, a description message and code:
             - 400 BAD REQUEST when a mandatory argument is missing.
     """
     with current_app.app_context():
         try:
-            comments: List[Dict] = CommentsServices.list_all_for_discussion(
-                id, current_app.db
+            comments: Dict = CommentsServices.list_all_for_discussion(
+                id, current_app.db, limit, after, current_app.cache
             )
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
@@ -116,13 +119,16 @@ def vote_comment(id: int) -> Tuple[Dict, int]:
         - Tuple[Dict, str]]: On success, a tuple with the dictionary of the
           answer data and a code 200 OK. On error, a description message and code:
             - 400 BAD REQUEST when a mandatory argument is missing.
+            - 404 NOT FOUND when the comment does not exist.
     """
     with current_app.app_context():
         try:
-            vote = CommentsServices.vote_comment(id,current_app.db)
+            vote = CommentsServices.vote_comment(id,current_app.db, current_app.cache)
             
             
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
+        except DiscussionNotFoundError:
+            return ('The comment does not exist', HTTPStatus.NOT_FOUND.value)
 
     return (HTTPStatus.OK.value)
\ No newline at end of file
@@ -7,15 +7,21 @@ from flask import current_app
 from dms2223backend.logic.exc.operationerror import OperationError
 from dms2223backend.service import DiscussionsServices
 
-def list_discussions() -> Tuple[List[Dict], Optional[int]]:
-    """Lists the existing discussions.
+def list_discussions(limit: int = 50, after: Optional[int] = None) -> Tuple[Dict, Optional[int]]:
+    """Lists a page of the existing discussions.
+
+    Args:
+        - limit (int): Maximum number of discussions in the page.
+        - after (Optional[int]): Cursor returned with the previous page, if any.
 
     Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list of dictionaries for the discussions' data
-          and a code 200 OK.
+        - Tuple[Dict, Optional[int]]: A tuple with the page of discussions (a list of dictionaries
+          for the discussions' data and the cursor of the next page) and a code 200 OK.
     """
     with current_app.app_context():
-        discussions: List[Dict] = DiscussionsServices.list_discussions(current_app.db)
+        discussions: Dict = DiscussionsServices.list_discussions(
+            current_app.db, limit, after, current_app.cache
+        )
     return (discussions, HTTPStatus.OK.value)
 
 
@@ -36,7 +42,7 @@ def create_discussion(body: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
     with current_app.app_context():
         try:
             discussion: Dict = DiscussionsServices.create_discussion(
-                body['title'], body['content'],current_app.db
+                body['title'], body['content'],current_app.db, current_app.cache
             )
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
@@ -58,8 +64,31 @@ def get_discussion_by_id(id: int) -> Tuple[Union[Dict, str], Optional[int]]:
     with current_app.app_context():
         try:
             discussion: Dict = DiscussionsServices.get_discussion_by_id(
-               id, current_app.db
+               id, current_app.db, current_app.cache
             )
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
     return (discussion, HTTPStatus.OK.value)
+
+def get_discussion_thread(id: int) -> Tuple[Union[Dict, str], Optional[int]]:
+    """Get a whole discussion thread (the discussion, its answers and their comments) by id.
+
+    Args:
+        - id (int): Id for discussion.
+
+    Returns:
+        - Tuple[Union[Dict, str], Optional[int]]: On success, a tuple with the dictionary of the
+          thread data and a code 200 OK. On error, a description message and code:
+            - 400 BAD REQUEST when a mandatory argument is missing.
+            - 404 NOT FOUND when the discussion does not exist.
+    """
+    with current_app.app_context():
+        try:
+            thread: Optional[Dict] = DiscussionsServices.get_thread(
+                id, current_app.db, current_app.cache
+            )
+        except ValueError:
+            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
+    if thread is None:
+        return (f'The question with qid {id} does not exist.', HTTPStatus.NOT_FOUND.value)
+    return (thread, HTTPStatus.OK.value)
@@ -7,37 +7,49 @@ from flask import current_app
 from dms2223backend.logic.exc.operationerror import OperationError
 from dms2223backend.service import reportsServices
 
-def list_reports() -> Tuple[List[Dict], Optional[int]]:
-    """Lists the existing reports.
+def list_reports(limit: int = 50, after: Optional[int] = None) -> Tuple[Dict, Optional[int]]:
+    """Lists a page of the existing reports.
+
+    Args:
+        - limit (int): Maximum number of reports in the page.
+        - after (Optional[int]): Cursor returned with the previous page, if any.
 
     Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list of dictionaries for the reports' data
-          and a code 200 OK.
+        - Tuple[Dict, Optional[int]]: A tuple with the page of reports (a list of dictionaries for
+          the reports' data and the cursor of the next page) and a code 200 OK.
     """
     with current_app.app_context():
-        reports: List[Dict] = reportsServices.list_reports(current_app.db)
+        reports: Dict = reportsServices.list_reports(current_app.db, limit, after)
     return (reports, HTTPStatus.OK.value)
 
-def list_reports_answer() -> Tuple[List[Dict], Optional[int]]:
-    """Lists the existing reports.
+def list_reports_answer(limit: int = 50, after: Optional[int] = None) -> Tuple[Dict, Optional[int]]:
+    """Lists a page of the existing reports.
+
+    Args:
+        - limit (int): Maximum number of reports in the page.
+        - after (Optional[int]): Cursor returned with the previous page, if any.
 
     Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list of dictionaries for the reports' data
-          and a code 200 OK.
+        - Tuple[Dict, Optional[int]]: A tuple with the page of reports (a list of dictionaries for
+          the reports' data and the cursor of the next page) and a code 200 OK.
     """
     with current_app.app_context():
-        reports: List[Dict] = reportsServices.list_reports_answer(current_app.db)
+        reports: Dict = reportsServices.list_reports_answer(current_app.db, limit, after)
     return (reports, HTTPStatus.OK.value)
 
-def list_reports_comments() -> Tuple[List[Dict], Optional[int]]:
-    """Lists the existing reports.
+def list_reports_comments(limit: int = 50, after: Optional[int] = None) -> Tuple[Dict, Optional[int]]:
+    """Lists a page of the existing reports.
+
+    Args:
+        - limit (int): Maximum number of reports in the page.
+        - after (Optional[int]): Cursor returned with the previous page, if any.
 
     Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list of dictionaries for the reports' data
-          and a code 200 OK.
+        - Tuple[Dict, Optional[int]]: A tuple with the page of reports (a list of dictionaries for
+          the reports' data and the cursor of the next page) and a code 200 OK.
     """
     with current_app.app_context():
-        reports: List[Dict] = reportsServices.list_reports_comments(current_app.db)
+        reports: Dict = reportsServices.list_reports_comments(current_app.db, limit, after)
     return (reports, HTTPStatus.OK.value)
 
 def create_report(body: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
@@ -174,7 +186,9 @@ def update_report_status(body : Dict , id : int) -> Tuple[Union[Dict, str], Opti
     """
     with current_app.app_context():
         try:
-            reportsServices.update_report_status(current_app.db , id , body['status'])
+            reportsServices.update_report_status(
+                current_app.db , id , body['status'], current_app.cache
+            )
             reporte: Dict = reportsServices.get_report_by_id(id,current_app.db) #cambiar
             return reporte , HTTPStatus.OK
 
@@ -0,0 +1,30 @@
+""" REST API controllers responsible of handling the search operations.
+"""
+
+from typing import Tuple, Union, Optional, Dict
+from http import HTTPStatus
+from flask import current_app
+from dms2223backend.data.db.exc import SearchUnavailableError
+from dms2223backend.service import SearchServices
+
+
+def search(q: str, limit: int = 50, after: Optional[int] = None) -> Tuple[Union[Dict, str], Optional[int]]:
+    """Searches a page of the discussions, answers and comments matching some terms.
+
+    Args:
+        - q (str): The search terms.
+        - limit (int): Maximum number of results in the page.
+        - after (Optional[int]): Cursor returned with the previous page, if any.
+
+    Returns:
+        - Tuple[Union[Dict, str], Optional[int]]: On success, a tuple with the page of results (a
+          list of dictionaries for the matching posts' data and the cursor of the next page) and a
+          code 200 OK. On error, a description message and code:
+            - 503 SERVICE UNAVAILABLE when the database does not support the full-text search.
+    """
+    with current_app.app_context():
+        try:
+            results: Dict = SearchServices.search(q, current_app.db, limit, after)
+        except SearchUnavailableError:
+            return ('The full-text search is not available', HTTPStatus.SERVICE_UNAVAILABLE.value)
+    return (results, HTTPStatus.OK.value)
@@ -5,9 +5,11 @@ import json
 import time
 from typing import Dict, Optional
 from flask import current_app
-import requests
+from authlib.jose import JsonWebSignature  # type: ignore
 from connexion.exceptions import Unauthorized  # type: ignore
+from dms2223common.data import TokenCache
 from dms2223backend.data.config import BackendConfiguration
+from dms2223backend.data.rest import AuthService
 
 
 def verify_api_key(token: str) -> Dict:
@@ -30,9 +32,14 @@ def verify_api_key(token: str) -> Dict:
 
 
 
-def verify_token(token: str) -> bool:
+def verify_token(token: str) -> Dict:
     """Callback testing a JWS user token.
 
+    The token signature and expiration are verified locally with the secret shared with the
+    authentication service. Only if `token_revocation_check` is enabled the token is also
+    validated against the authentication service, to honour revocations. Those validations are
+    cached for a while (see `token_cache`) to avoid a round trip on every request.
+
     Args:
         - token (str): The JWS user token received.
 
@@ -42,22 +49,32 @@ def verify_token(token: str) -> bool:
     Returns:
         - Dict: A dictionary with the user name (key `user`) if the credentials are correct.
     """
-
     with current_app.app_context():
-        cfg = current_app.cfg.get_auth_service()
-        base_url = f"http://{cfg['host']}:{cfg['port']}/api/v1"
-        current_app.logger.warn(base_url)
-        current_app.logger.warn(token)
-        response: requests.Response = requests.get(
-            base_url + '/auth',
-            headers={
-                'Authorization': f'Bearer {token}',
-                'X-ApiKey-Auth': cfg['apikey_secret']
-            },
-            timeout=60
-        )
-
-        if not response.ok:
+        cfg: BackendConfiguration = current_app.cfg
+        jws: JsonWebSignature = current_app.jws
+        try:
+            data: Dict = jws.deserialize_compact(
+                token.encode('ascii'),
+                bytes(cfg.get_jws_secret(), 'UTF-8')
+            )
+            payload: Dict = json.loads(data['payload'].decode('UTF-8'))
+        except Exception as ex:
+            raise Unauthorized('Invalid token') from ex
+        if not isinstance(payload, dict) or not {'user', 'sub', 'exp'} <= payload.keys():
             raise Unauthorized('Invalid token')
-
-    return True
\ No newline at end of file
+        if isinstance(payload['exp'], bool) or not isinstance(payload['exp'], (int, float)):
+            raise Unauthorized('Invalid token')
+        if time.time() > payload['exp']:
+            raise Unauthorized('Expired token')
+        if cfg.get_token_revocation_check():
+            token_cache: TokenCache = current_app.token_cache
+            if token_cache.get(token) is None:
+                auth_service: AuthService = current_app.authservice
+                if not auth_service.validate_token(token).is_successful():
+                    raise Unauthorized('Revoked token')
+                token_cache.put(token, payload['user'], payload['exp'])
+        return {
+            'sub': payload['sub'],
+            'user': payload['user'],
+            'exp': payload['exp']
+        }
\ No newline at end of file
@@ -4,6 +4,7 @@
 from typing import Dict, Tuple, Optional
 from http import HTTPStatus
 from flask import current_app
+from dms2223common.data import TokenCache
 
 def health_test() -> Tuple[None, Optional[int]]:
     """Simple health test endpoint.
@@ -12,3 +13,24 @@ def health_test() -> Tuple[None, Optional[int]]:
         - Tuple[None, Optional[int]]: A tuple of no content and code 204 No Content.
     """
     return (None, HTTPStatus.NO_CONTENT.value)
+
+def invalidate_tokens(body: Dict) -> Tuple[Optional[str], Optional[int]]:
+    """Drops user tokens from the validated token cache.
+
+    Args:
+        - body (Dict): A dictionary with either the user name (key `user`) whose tokens are
+          dropped, or a single token (key `token`).
+
+    Returns:
+        - Tuple[Optional[str], Optional[int]]: A tuple of no content and code 204 NO CONTENT on
+          success, or a description message and code 400 BAD REQUEST if nothing was given.
+    """
+    with current_app.app_context():
+        token_cache: TokenCache = current_app.token_cache
+        if not body.get('user') and not body.get('token'):
+            return ('Either a user or a token must be given', HTTPStatus.BAD_REQUEST.value)
+        if body.get('user'):
+            token_cache.invalidate_user(body['user'])
+        if body.get('token'):
+            token_cache.invalidate(body['token'])
+    return (None, HTTPStatus.NO_CONTENT.value)
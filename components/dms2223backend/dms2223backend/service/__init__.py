@@ -3,4 +3,6 @@
 from .discussionservices import DiscussionsServices
 from .answerservices import AnswersServices
 from .commentservices import CommentsServices
-from .moderateservices import reportsServices
\ No newline at end of file
+from .moderateservices import reportsServices
+from .searchservices import SearchServices
+from .threadcache import ThreadCache
@@ -1,25 +1,29 @@
 """ AnswerServices class module.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223backend.data.rest import AuthService
 from dms2223backend.data.db import Schema
 from dms2223backend.data.db.results import Answer
+from dms2223backend.data.db.resultsets import Pagination
 from dms2223backend.logic import AnswerLogic
+from dms2223backend.service.threadcache import ThreadCache
 
 
 class AnswersServices():
     """ Monostate class that provides high-level services to handle user-related use cases.
     """
     @staticmethod
-    def answer(discussionid: int, content: str, schema: Schema) -> Dict:
+    def answer(discussionid: int, content: str, schema: Schema,
+               cache: Optional[ThreadCache] = None) -> Dict:
         """Answers a discussion.
 
         Args:
             - username (str): Username string.
             - discussionId (int): Discussion id.
             - schema (Schema): A database handler where the discussions are mapped into.
+            - cache (Optional[ThreadCache]): The cache to invalidate the discussion in, if any.
 
         Returns:
             - Dict: Dictonary that contains the answer's data.
@@ -38,35 +42,59 @@ class AnswersServices():
             raise ex
         finally:
             schema.remove_session()
+        if cache is not None:
+            cache.discussion_changed(discussionid, listing=True)
         return out
 
 
 
     @staticmethod
-    def list_all_for_discussion(discussionid: int, schema: Schema) -> List[Dict]:
-        """Lists the answers of a discussion if the requestor has the discussion role.
+    def list_all_for_discussion(discussionid: int, schema: Schema, limit: int = 50,
+                                after: Optional[int] = None,
+                                cache: Optional[ThreadCache] = None) -> Dict:
+        """Lists a page of the answers of a discussion if the requestor has the discussion role.
 
         Args:
             - disucssionId (int): Discussion id.
             - schema (Schema): A database handler where the discussions are mapped into.
+            - limit (int): Maximum number of answers in the page.
+            - after (Optional[int]): Cursor returned with the previous page, if any.
+            - cache (Optional[ThreadCache]): The cache to read the page through, if any.
 
         Returns:
-            - List[Dict]: List of dictionaries with the answers' data.
+            - Dict: A dictionary with the list of dictionaries with the answers' data (key `items`)
+              and the cursor of the next page, or `None` if there are no more (key `next_cursor`).
+        """
+        if cache is not None:
+            return cache.discussion_item(
+                discussionid, 'answers', lambda: AnswersServices.__list_all_for_discussion(
+                    discussionid, schema, limit, after
+                ), limit, after
+            )
+        return AnswersServices.__list_all_for_discussion(discussionid, schema, limit, after)
+
+    @staticmethod
+    def __list_all_for_discussion(discussionid: int, schema: Schema, limit: int,
+                                  after: Optional[int]) -> Dict:
+        """Loads a page of the answers of a discussion from the database (see
+        `list_all_for_discussion`).
         """
         out: List[Dict] = []
         session: Session = schema.new_session()
-        answers: List[Answer] = AnswerLogic.list_all_for_discussion(discussionid,session)
+        answers, next_cursor = Pagination.split(
+            AnswerLogic.list_all_for_discussion(discussionid, session, limit + 1, after),
+            limit, lambda answer: answer.id
+        )
         
         for answer in answers:
-            vote = AnswerLogic.get_vote(session, answer.id)
             out.append({
                 'id': answer.id, #type: ignore
                 'discussionid': answer.discussionid,
                 'content': answer.content,
-                'vote': vote
+                'vote': answer.vote_count
             })
         schema.remove_session()
-        return out
+        return {'items': out, 'next_cursor': next_cursor}
 
     @staticmethod
     def get_answer(discussionid: int, schema: Schema) -> Dict:
@@ -91,12 +119,13 @@ class AnswersServices():
         return out
 
     @staticmethod
-    def vote_answer(aid: int, schema: Schema):
+    def vote_answer(aid: int, schema: Schema, cache: Optional[ThreadCache] = None):
         """Vote an Answer
 
         Args:
             
             - aid: answer id.
+            - cache (Optional[ThreadCache]): The cache to invalidate the discussion in, if any.
             
 
         Returns:
@@ -104,8 +133,12 @@ class AnswersServices():
         """
         
         session: Session = schema.new_session()
-        
-        vote: Answer = AnswerLogic.vote_answer(session, aid)
-   
-        schema.remove_session()
+        try:
+            AnswerLogic.vote_answer(session, aid)
+            if cache is not None:
+                discussionid: Optional[int] = AnswerLogic.get_discussion_id(session, aid)
+                if discussionid is not None:
+                    cache.discussion_changed(discussionid)
+        finally:
+            schema.remove_session()
         return True
\ No newline at end of file
@@ -1,23 +1,27 @@
 """ CommentServices class module.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223backend.data.rest import AuthService
 from dms2223backend.data.db import Schema
 from dms2223backend.data.db.results import Comment
-from dms2223backend.logic import CommentLogic
+from dms2223backend.data.db.resultsets import Pagination
+from dms2223backend.logic import AnswerLogic, CommentLogic
+from dms2223backend.service.threadcache import ThreadCache
 
 class CommentsServices():
     """ Monostate class that provides high-level services to handle user-related use cases.
     """
     @staticmethod
-    def comment(discussionid: int, answerid: int, content: str, schema: Schema) -> Dict:
+    def comment(discussionid: int, answerid: int, content: str, schema: Schema,
+                cache: Optional[ThreadCache] = None) -> Dict:
         """Comments an answer.
 
         Args:
             - discussionId (int): Discussion id.
             - schema (Schema): A database handler where the discussions are mapped into.
+            - cache (Optional[ThreadCache]): The cache to invalidate the discussion in, if any.
 
         Returns:
             - Dict: Dictonary that contains the answer's data.
@@ -32,6 +36,13 @@ class CommentsServices():
             out['discussionid'] = new_comment.discussionid 
             out['answerid'] = new_comment.answerid
             out['content'] = new_comment.content
+            if cache is not None:
+                # The thread lists the comment under its answer, and the comments listing under
+                # the given discussion
+                cache.discussion_changed(discussionid)
+                thread_id: Optional[int] = AnswerLogic.get_discussion_id(session, answerid)
+                if thread_id is not None and thread_id != discussionid:
+                    cache.discussion_changed(thread_id)
 
         except Exception as ex:
             raise ex
@@ -40,30 +51,52 @@ class CommentsServices():
         return out
 
     @staticmethod
-    def list_all_for_discussion(discussionid: int, schema: Schema) -> List[Dict]:
-        """Lists the comments of a discussion if the requestor has the discussion role.
+    def list_all_for_discussion(discussionid: int, schema: Schema, limit: int = 50,
+                                after: Optional[int] = None,
+                                cache: Optional[ThreadCache] = None) -> Dict:
+        """Lists a page of the comments of a discussion if the requestor has the discussion role.
 
         Args:
             - disucssionId (int): Discussion id.
             - schema (Schema): A database handler where the discussions are mapped into.
+            - limit (int): Maximum number of comments in the page.
+            - after (Optional[int]): Cursor returned with the previous page, if any.
+            - cache (Optional[ThreadCache]): The cache to read the page through, if any.
 
         Returns:
-            - List[Dict]: List of dictionaries with the comments' data.
+            - Dict: A dictionary with the list of dictionaries with the comments' data (key `items`)
+              and the cursor of the next page, or `None` if there are no more (key `next_cursor`).
+        """
+        if cache is not None:
+            return cache.discussion_item(
+                discussionid, 'comments', lambda: CommentsServices.__list_all_for_discussion(
+                    discussionid, schema, limit, after
+                ), limit, after
+            )
+        return CommentsServices.__list_all_for_discussion(discussionid, schema, limit, after)
+
+    @staticmethod
+    def __list_all_for_discussion(discussionid: int, schema: Schema, limit: int,
+                                  after: Optional[int]) -> Dict:
+        """Loads a page of the comments of a discussion from the database (see
+        `list_all_for_discussion`).
         """
         out: List[Dict] = []
         session: Session = schema.new_session()
-        comments: List[Comment] = CommentLogic.list_all_for_discussion(discussionid, session)
+        comments, next_cursor = Pagination.split(
+            CommentLogic.list_all_for_discussion(discussionid, session, limit + 1, after),
+            limit, lambda comment: comment.id
+        )
         for comment in comments:
-            vote = CommentLogic.get_vote(session, comment.id)
             out.append({
                 'id': comment.id, #type: ignore
                 'discussionid': comment.discussionid,
                 'answerid': comment.answerid,
                 'content': comment.content,
-                'vote': vote
+                'vote': comment.vote_count
             })
         schema.remove_session()
-        return out
+        return {'items': out, 'next_cursor': next_cursor}
 
     @staticmethod
     def list_all_for_answer(answerid: int, schema: Schema) -> List[Dict]:
@@ -112,12 +145,13 @@ class CommentsServices():
         return out
 
     @staticmethod
-    def vote_comment(cid: int, schema: Schema):
+    def vote_comment(cid: int, schema: Schema, cache: Optional[ThreadCache] = None):
         """Vote an cooment
 
         Args:
             
             - cid: comment id.
+            - cache (Optional[ThreadCache]): The cache to invalidate the discussion in, if any.
             
 
         Returns:
@@ -125,8 +159,12 @@ class CommentsServices():
         """
         
         session: Session = schema.new_session()
-        
-        vote: Comment = CommentLogic.vote_comment(session, cid)
-   
-        schema.remove_session()
+        try:
+            CommentLogic.vote_comment(session, cid)
+            if cache is not None:
+                discussionid: Optional[int] = CommentLogic.get_discussion_id(session, cid)
+                if discussionid is not None:
+                    cache.discussion_changed(discussionid)
+        finally:
+            schema.remove_session()
         return True
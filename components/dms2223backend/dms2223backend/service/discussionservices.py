@@ -1,41 +1,55 @@
 """ DiscussionServices class module.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223backend.data.rest import AuthService
 from dms2223backend.data.db import Schema
 from dms2223backend.data.db.results import Discussion
+from dms2223backend.data.db.resultsets import Pagination
 from dms2223backend.logic import DiscussionLogic
+from dms2223backend.service.threadcache import ThreadCache
 
 
 class DiscussionsServices():
     """ Monostate class that provides high-level services to handle user-related use cases.
     """
     @staticmethod
-    def get_discussion_by_id(id: int, schema: Schema) -> Dict:
+    def get_discussion_by_id(id: int, schema: Schema, cache: Optional[ThreadCache] = None) -> Dict:
         """Determines whether a user with the given credentials exists.
 
         Args:
             - schema (Schema): A database handler where the discussions are mapped into.
             - id (int): Discussion id.
+            - cache (Optional[ThreadCache]): The cache to read the discussion through, if any.
 
         Returns:
             - Dict: Dictonary that contains the discussions's data.
         """
-      
+        if cache is not None:
+            return cache.discussion_item(
+                id, 'discussion', lambda: DiscussionsServices.__get_discussion_by_id(id, schema)
+            )
+        return DiscussionsServices.__get_discussion_by_id(id, schema)
+
+    @staticmethod
+    def __get_discussion_by_id(id: int, schema: Schema) -> Dict:
+        """Loads a discussion from the database (see `get_discussion_by_id`).
+        """
         session: Session = schema.new_session()
         out:  List[Dict] = []
         try:
             discussions = DiscussionLogic.get_discussion_by_id(session, id)
             discussion: Discussion = discussions[0][0]
             answered: int = discussions[0][1]
+            answers: int = discussions[0][2]
             if discussion is not None:
                 out.append({
                 'id': discussion.id,#type: ignore
                 'title': discussion.title,
                 'content': discussion.content,
-                'answered': answered})
+                'answered': answered,
+                'answers': answers})
 
         except Exception as ex:
             raise ex
@@ -47,37 +61,114 @@ class DiscussionsServices():
         return salida
 
     @staticmethod
-    def list_discussions(schema: Schema) -> List[Dict]:
-        """Lists the existing discussions.
+    def list_discussions(schema: Schema, limit: int = 50, after: Optional[int] = None,
+                         cache: Optional[ThreadCache] = None) -> Dict:
+        """Lists a page of the existing discussions.
 
         Args:
             - schema (Schema): A database handler where the discussions are mapped into.
+            - limit (int): Maximum number of discussions in the page.
+            - after (Optional[int]): Cursor returned with the previous page, if any.
+            - cache (Optional[ThreadCache]): The cache to read the page through, if any.
 
         Returns:
-            - List[Dict]: A list of dictionaries with the discussions' data.
+            - Dict: A dictionary with the list of dictionaries with the discussions' data (key
+              `items`) and the cursor of the next page, or `None` if there are no more (key
+              `next_cursor`).
+        """
+        if cache is not None:
+            return cache.listing_page(
+                limit, after, lambda: DiscussionsServices.__list_discussions(schema, limit, after)
+            )
+        return DiscussionsServices.__list_discussions(schema, limit, after)
+
+    @staticmethod
+    def __list_discussions(schema: Schema, limit: int, after: Optional[int]) -> Dict:
+        """Loads a page of the discussions from the database (see `list_discussions`).
         """
         out: List[Dict] = []
         session: Session = schema.new_session()
-        discussions: List[List] = DiscussionLogic.list_all(session)
-        for discuss in discussions:
-            discussion: Discussion = discuss[0]
-            answered: int = discuss[1]
+        discussions, next_cursor = Pagination.split(
+            DiscussionLogic.list_all(session, limit + 1, after), limit, lambda row: row[0]
+        )
+        for discussionid, title, content, answered, answers in discussions:
             out.append({
-                'id': discussion.id,#type: ignore
-                'title': discussion.title,
-                'content': discussion.content,
-                'answered': answered
+                'id': discussionid,
+                'title': title,
+                'content': content,
+                'answered': answered,
+                'answers': answers
             })
         schema.remove_session()
-        return out
+        return {'items': out, 'next_cursor': next_cursor}
+
+    @staticmethod
+    def get_thread(id: int, schema: Schema, cache: Optional[ThreadCache] = None) -> Optional[Dict]:
+        """Obtains a whole discussion thread: the discussion, its answers and their comments.
+
+        Args:
+            - id (int): Discussion id.
+            - schema (Schema): A database handler where the discussions are mapped into.
+            - cache (Optional[ThreadCache]): The cache to read the thread through, if any.
+
+        Returns:
+            - Optional[Dict]: A dictionary with the discussion's data (key `discussion`) and the list
+              of its answers' data ordered by id (key `answers`), each one with the list of its
+              comments' data ordered by id (key `comments`); or `None` if the discussion does not
+              exist.
+        """
+        if cache is not None:
+            return cache.discussion_item(
+                id, 'thread', lambda: DiscussionsServices.__get_thread(id, schema)
+            )
+        return DiscussionsServices.__get_thread(id, schema)
+
+    @staticmethod
+    def __get_thread(id: int, schema: Schema) -> Optional[Dict]:
+        """Loads a whole discussion thread from the database (see `get_thread`).
+        """
+        session: Session = schema.new_session()
+        try:
+            discussion: Optional[Discussion] = DiscussionLogic.get_thread(session, id)
+            if discussion is None:
+                return None
+            answers: List[Dict] = []
+            for answer in sorted(discussion.discussions, key=lambda answer: answer.id):  # type: ignore
+                answers.append({
+                    'id': answer.id,
+                    'discussionid': answer.discussionid,
+                    'content': answer.content,
+                    'vote': answer.vote_count,
+                    'comments': [{
+                        'id': comment.id,
+                        'discussionid': comment.discussionid,
+                        'answerid': comment.answerid,
+                        'content': comment.content,
+                        'vote': comment.vote_count
+                    } for comment in sorted(answer.answers, key=lambda comment: comment.id)]
+                })
+            return {
+                'discussion': {
+                    'id': discussion.id,  # type: ignore
+                    'title': discussion.title,
+                    'content': discussion.content,
+                    'answered': 1 if answers else 0,
+                    'answers': len(answers)
+                },
+                'answers': answers
+            }
+        finally:
+            schema.remove_session()
 
     @staticmethod
-    def create_discussion(title:str, content: str, schema: Schema) -> Dict:
+    def create_discussion(title:str, content: str, schema: Schema,
+                          cache: Optional[ThreadCache] = None) -> Dict:
         """Creates a discussion.
 
         Args:
             - schema (Schema): A database handler where the discussions are mapped into.
             - id (int): Discussion id.
+            - cache (Optional[ThreadCache]): The cache to invalidate the listing in, if any.
 
         Returns:
             - Dict: Dictonary that contains the discussions's data.
@@ -96,4 +187,6 @@ class DiscussionsServices():
             raise ex
         finally:
             schema.remove_session()
+        if cache is not None:
+            cache.discussion_created()
         return out
@@ -1,14 +1,16 @@
 """ reportServices class module.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2223backend.data.rest import AuthService
 from dms2223backend.data.db import Schema
 from dms2223backend.data.reportstatus import ReportStatus
 from dms2223backend.data.db.results import Report, Reportcomment , Reportanswer
+from dms2223backend.data.db.resultsets import Pagination
 from dms2223backend.logic import ReportLogic , DiscussionLogic
 from dms2223backend.data.db.results.discussion import Discussion
+from dms2223backend.service.threadcache import ThreadCache
 
 
 class reportsServices():
@@ -43,79 +45,91 @@ class reportsServices():
         return out
 
     @staticmethod
-    def list_reports(schema: Schema) -> List[Dict]: 
-        """Lists the existing reports.
+    def list_reports(schema: Schema, limit: int = 50, after: Optional[int] = None) -> Dict:
+        """Lists a page of the existing reports.
 
         Args:
             - schema (Schema): A database handler where the reports are mapped into.
+            - limit (int): Maximum number of reports in the page.
+            - after (Optional[int]): Cursor returned with the previous page, if any.
 
         Returns:
-            - List[Dict]: A list of dictionaries with the reports' data.
+            - Dict: A dictionary with the list of dictionaries with the reports' data (key `items`)
+              and the cursor of the next page, or `None` if there are no more (key `next_cursor`).
         """
         out: List[Dict] = []
         session: Session = schema.new_session()
-        reports: List[List] = ReportLogic.list_all(session)
-        for report in reports:
+        reports, next_cursor = Pagination.split(
+            ReportLogic.list_all(session, limit + 1, after), limit, lambda row: row[0]
+        )
+        for reportid, discussionid, reason, timestamp, status in reports:
             out.append({
-                'id': report.id, # type: ignore
-                'discussionid': report.discussionid, # type: ignore
-                'reason': report.reason, # type: ignore
-                'timestamp': report.timestamp, # type: ignore
-                'status': report.status.name # type: ignore
-                #'user': report.user
+                'id': reportid,
+                'discussionid': discussionid,
+                'reason': reason,
+                'timestamp': timestamp,
+                'status': status.name
             })
         schema.remove_session()
-        return out
+        return {'items': out, 'next_cursor': next_cursor}
 
     @staticmethod
-    def list_reports_answer(schema: Schema) -> List[Dict]: 
-        """Lists the existing reports.
+    def list_reports_answer(schema: Schema, limit: int = 50, after: Optional[int] = None) -> Dict:
+        """Lists a page of the existing reports.
 
         Args:
             - schema (Schema): A database handler where the reports are mapped into.
+            - limit (int): Maximum number of reports in the page.
+            - after (Optional[int]): Cursor returned with the previous page, if any.
 
         Returns:
-            - List[Dict]: A list of dictionaries with the reports' data.
+            - Dict: A dictionary with the list of dictionaries with the reports' data (key `items`)
+              and the cursor of the next page, or `None` if there are no more (key `next_cursor`).
         """
         out: List[Dict] = []
         session: Session = schema.new_session()
-        reports: List[List] = ReportLogic.list_all_report_answer(session)
-        for report in reports:
+        reports, next_cursor = Pagination.split(
+            ReportLogic.list_all_report_answer(session, limit + 1, after), limit, lambda row: row[0]
+        )
+        for reportid, answerid, reason, timestamp, status in reports:
             out.append({
-                'id': report.id, # type: ignore
-                'answerid': report.answerid, # type: ignore
-                'reason': report.reason, # type: ignore
-                'timestamp': report.timestamp, # type: ignore
-                'status': report.status.name # type: ignore
-                #'user': report.user 
+                'id': reportid,
+                'answerid': answerid,
+                'reason': reason,
+                'timestamp': timestamp,
+                'status': status.name
             })
         schema.remove_session()
-        return out
+        return {'items': out, 'next_cursor': next_cursor}
 
     @staticmethod
-    def list_reports_comments(schema: Schema) -> List[Dict]: 
-        """Lists the existing reports.
+    def list_reports_comments(schema: Schema, limit: int = 50, after: Optional[int] = None) -> Dict:
+        """Lists a page of the existing reports.
 
         Args:
             - schema (Schema): A database handler where the reports are mapped into.
+            - limit (int): Maximum number of reports in the page.
+            - after (Optional[int]): Cursor returned with the previous page, if any.
 
         Returns:
-            - List[Dict]: A list of dictionaries with the reports' data.
+            - Dict: A dictionary with the list of dictionaries with the reports' data (key `items`)
+              and the cursor of the next page, or `None` if there are no more (key `next_cursor`).
         """
         out: List[Dict] = []
         session: Session = schema.new_session()
-        reports: List[List] = ReportLogic.list_all_report_comments(session)
-        for report in reports:
+        reports, next_cursor = Pagination.split(
+            ReportLogic.list_all_report_comments(session, limit + 1, after), limit, lambda row: row[0]
+        )
+        for reportid, commentid, reason, timestamp, status in reports:
             out.append({
-                'id': report.id, # type: ignore
-                'commentid': report.commentid, # type: ignore
-                'reason': report.reason, # type: ignore
-                'timestamp': report.timestamp, # type: ignore
-                'status': report.status.name # type: ignore
-                #'user': report.user
+                'id': reportid,
+                'commentid': commentid,
+                'reason': reason,
+                'timestamp': timestamp,
+                'status': status.name
             })
         schema.remove_session()
-        return out
+        return {'items': out, 'next_cursor': next_cursor}
 
     @staticmethod
     def create_report(id:int, reason: str  ,schema: Schema) -> Dict:
@@ -206,17 +220,26 @@ class reportsServices():
         return out
 
     @staticmethod
-    def update_report_status(schema: Schema, id: int , status: str):
-        session: Session = schema.new_session()
-
-        reporte : ReportLogic = ReportLogic.get_report_by_id(session , id)
-        reporte.status = ReportStatus[status]
-        if status == 'ACCEPTED':
-            reportsServices.quitar_discusion(schema. reporte.id)
+    def update_report_status(schema: Schema, id: int , status: str,
+                             cache: Optional[ThreadCache] = None):
+        """Changes the status of a discussion report.
 
+        Args:
+            - schema (Schema): A database handler where the reports are mapped into.
+            - id (int): report id.
+            - status (str): The name of the new status.
+            - cache (Optional[ThreadCache]): The cache to invalidate the reported discussion in,
+              if any.
+        """
+        session: Session = schema.new_session()
+        try:
+            reporte: Report = ReportLogic.get_report_by_id(session , id)
+            reporte.status = ReportStatus[status]
             session.add(reporte)
             session.commit()
-
+            if status == 'ACCEPTED' and cache is not None:
+                cache.discussion_changed(reporte.discussionid)  # type: ignore
+        finally:
             schema.remove_session()
 
     @staticmethod
@@ -0,0 +1,52 @@
+""" SearchServices class module.
+"""
+
+from typing import List, Dict, Optional
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2223backend.data.db import Schema
+from dms2223backend.logic import SearchLogic
+
+
+class SearchServices():
+    """ Monostate class that provides high-level services to handle search-related use cases.
+    """
+    @staticmethod
+    def search(terms: str, schema: Schema, limit: int = 50, after: Optional[int] = None) -> Dict:
+        """Searches a page of the discussions, answers and comments matching some terms.
+
+        Results are ranked by relevance, so the cursor of the next page is the number of results
+        already listed.
+
+        Args:
+            - terms (str): The search terms.
+            - schema (Schema): A database handler where the posts are mapped into.
+            - limit (int): Maximum number of results in the page.
+            - after (Optional[int]): Cursor returned with the previous page, if any.
+
+        Raises:
+            - SearchUnavailableError: If the database does not support the full-text search.
+
+        Returns:
+            - Dict: A dictionary with the list of dictionaries with the matching posts' data (key
+              `items`) and the cursor of the next page, or `None` if there are no more (key
+              `next_cursor`).
+        """
+        out: List[Dict] = []
+        session: Session = schema.new_session()
+        try:
+            results = SearchLogic.search(session, terms, limit + 1, after)
+        finally:
+            schema.remove_session()
+        next_cursor: Optional[int] = None
+        if len(results) > limit:
+            results = results[:limit]
+            next_cursor = (after or 0) + limit
+        for kind, id, discussionid, title, snippet in results:
+            out.append({
+                'kind': kind,
+                'id': id,
+                'discussionid': discussionid,
+                'title': title,
+                'snippet': SearchLogic.split_snippet(snippet)
+            })
+        return {'items': out, 'next_cursor': next_cursor}
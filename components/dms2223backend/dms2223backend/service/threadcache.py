@@ -0,0 +1,158 @@
+""" ThreadCache class module.
+"""
+
+import secrets
+from typing import Any, Callable, Dict, Optional
+from dms2223common.data import Metrics
+from dms2223common.data.cache import Cache
+
+
+class ThreadCache():
+    """ Read-through cache of the discussion listing pages and of the discussion threads.
+
+    Entries are grouped in namespaces: one for the discussion listing pages and one per
+    discussion, holding its thread and its answers and comments listing pages. Each namespace
+    has a version (a random token, cached as well), which is part of the keys of its entries;
+    invalidating a namespace replaces its version, so all its entries become unreachable at once
+    and expire on their own. A value loaded while a write is committed is cached under the version
+    read before loading it, so a stale value is never stored under the new version.
+
+    The last page of the discussion listing (the one without a next page) is also tagged with the
+    version of the listing tail, so creating a discussion only invalidates the last pages.
+    """
+
+    __LISTING: str = 'discussions'
+    __TAIL: str = 'discussions-tail'
+
+    def __init__(self, cache: Cache, metrics: Optional[Metrics] = None):
+        """ Constructor method.
+
+        Args:
+            - cache (Cache): The cache where the entries are kept.
+            - metrics (Optional[Metrics]): The registry where the lookups and invalidations are
+              counted, if any.
+        """
+        self.__cache: Cache = cache
+        self.__metrics: Optional[Metrics] = metrics
+        if metrics is not None:
+            metrics.counter(
+                'cache_requests_total', 'Cache lookups, by kind of entry and result (hit or miss).'
+            )
+            metrics.counter('cache_invalidations_total', 'Cache invalidations, by namespace.')
+
+    def get_cache(self) -> Cache:
+        """ Gets the cache where the entries are kept.
+
+        Returns:
+            - Cache: The cache.
+        """
+        return self.__cache
+
+    def listing_page(self, limit: int, after: Optional[int], loader: Callable[[], Dict]) -> Dict:
+        """ Gets a page of the discussion listing, loading it on a miss.
+
+        Args:
+            - limit (int): Maximum number of discussions in the page.
+            - after (Optional[int]): Cursor of the page.
+            - loader (Callable[[], Dict]): Loads the page (see
+              `DiscussionsServices.list_discussions`).
+
+        Returns:
+            - Dict: The page.
+        """
+        version: str = self.__version(ThreadCache.__LISTING)
+        tail: str = self.__version(ThreadCache.__TAIL)
+        key: str = f'{ThreadCache.__LISTING}:{version}:{limit}:{after}'
+        entry: Optional[Dict] = self.__cache.get(key)
+        # Only the last page records the tail version it was loaded with
+        if entry is not None and entry['tail'] in (None, tail):
+            self.__count('listing', 'hit')
+            return entry['page']
+        self.__count('listing', 'miss')
+        page: Dict = loader()
+        self.__cache.set(key, {'page': page, 'tail': tail if page['next_cursor'] is None else None})
+        return page
+
+    def discussion_item(self, discussionid: int, kind: str, loader: Callable[[], Any],
+                        *key: Any) -> Any:
+        """ Gets an entry of the namespace of a discussion, loading it on a miss.
+
+        Loaded values that are empty or `None` (e.g., a discussion not found) are not cached.
+
+        Args:
+            - discussionid (int): The discussion id.
+            - kind (str): The kind of entry (e.g., `thread` or `answers`).
+            - loader (Callable[[], Any]): Loads the value.
+            - *key (Any): The arguments identifying the entry among those of its kind (e.g., the
+              page limit and cursor).
+
+        Returns:
+            - Any: The value.
+        """
+        namespace: str = f'discussion:{discussionid}'
+        version: str = self.__version(namespace)
+        cache_key: str = ':'.join([namespace, version, kind] + [str(part) for part in key])
+        value: Any = self.__cache.get(cache_key)
+        if value is not None:
+            self.__count(kind, 'hit')
+            return value
+        self.__count(kind, 'miss')
+        value = loader()
+        if value:
+            self.__cache.set(cache_key, value)
+        return value
+
+    def discussion_created(self) -> None:
+        """ Invalidates the last pages of the discussion listing, after a discussion is created.
+        """
+        self.__invalidate(ThreadCache.__TAIL)
+
+    def discussion_changed(self, discussionid: int, listing: bool = False) -> None:
+        """ Invalidates the entries of a discussion, after it, or its answers or comments, change.
+
+        Args:
+            - discussionid (int): The discussion id.
+            - listing (bool): Whether the change is also visible in the discussion listing (e.g.,
+              its number of answers), so the listing pages are invalidated too.
+        """
+        self.__invalidate(f'discussion:{discussionid}')
+        if listing:
+            self.__invalidate(ThreadCache.__LISTING)
+
+    def __version(self, namespace: str) -> str:
+        """ Gets the current version of a namespace, starting a new one if there is none.
+
+        Args:
+            - namespace (str): The namespace.
+
+        Returns:
+            - str: The version.
+        """
+        key: str = f'version:{namespace}'
+        version: Optional[str] = self.__cache.get(key)
+        if version is None:
+            version = secrets.token_hex(8)
+            if not self.__cache.add(key, version):
+                # Another process started it first
+                version = self.__cache.get(key) or version
+        return version
+
+    def __invalidate(self, namespace: str) -> None:
+        """ Invalidates every entry of a namespace.
+
+        Args:
+            - namespace (str): The namespace.
+        """
+        self.__cache.delete(f'version:{namespace}')
+        if self.__metrics is not None:
+            self.__metrics.inc('cache_invalidations_total', namespace=namespace.split(':')[0])
+
+    def __count(self, kind: str, result: str) -> None:
+        """ Counts a lookup.
+
+        Args:
+            - kind (str): The kind of entry.
+            - result (str): `hit` or `miss`.
+        """
+        if self.__metrics is not None:
+            self.__metrics.inc('cache_requests_total', kind=kind, result=result)
@@ -0,0 +1,2 @@
+""" Tests of the backend service.
+"""
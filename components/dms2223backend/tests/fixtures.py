@@ -0,0 +1,89 @@
+""" Shared fixtures of the backend tests.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Tuple
+from sqlalchemy import event, text  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2223backend.data.config import BackendConfiguration
+from dms2223backend.data.db import DataGenerator, Schema
+
+_SCHEMA: List[Schema] = []
+
+
+def schema() -> Schema:
+    """ Gets the schema of the test database, creating it on the first call.
+
+    The result classes can only be mapped once per process, so every test shares the same schema
+    (on a temporary SQLite database), and must not rely on the data generated by other tests.
+
+    Returns:
+        - Schema: The test database schema.
+    """
+    if not _SCHEMA:
+        cfg: BackendConfiguration = BackendConfiguration()
+        directory: str = tempfile.mkdtemp(prefix='dms2223backend-tests-')
+        cfg.set_db_connection_string(f'sqlite:///{os.path.join(directory, "backend.db")}')
+        _SCHEMA.append(Schema(cfg))
+    return _SCHEMA[0]
+
+
+def generate(discussions: int, **options) -> int:
+    """ Adds synthetic data to the test database.
+
+    Args:
+        - discussions (int): The number of discussions to add.
+        - **options: Other `DataGenerator` options.
+
+    Returns:
+        - int: The id of the last discussion added.
+    """
+    session: Session = schema().new_session()
+    try:
+        DataGenerator(discussions=discussions, **options).generate(session)
+        return session.execute(text('SELECT MAX(id) FROM discussions')).scalar_one()
+    finally:
+        schema().remove_session()
+
+
+@contextmanager
+def statements() -> Iterator[List[Tuple[str, Any]]]:
+    """ Records the SQL statements executed on the test database meanwhile.
+
+    Yields:
+        - List[Tuple[str, Any]]: The list where the executed statements are appended, along with
+          their parameters.
+    """
+    recorded: List[Tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, *args):  # pylint: disable=unused-argument
+        recorded.append((statement, parameters))
+
+    engine = schema().get_engine()
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        yield recorded
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+
+def query_plan(statement: str, parameters: Any) -> List[str]:
+    """ Gets the SQLite query plan of a statement.
+
+    Args:
+        - statement (str): The SQL statement.
+        - parameters (Any): The statement parameters, as recorded by `statements`.
+
+    Returns:
+        - List[str]: The description of every step of the plan (e.g. `SEARCH answers USING INDEX
+          ix_answers_discussionid_id (discussionid=?)`).
+    """
+    connection = schema().get_engine().raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(f'EXPLAIN QUERY PLAN {statement}', parameters)
+        return [row[3] for row in cursor.fetchall()]
+    finally:
+        connection.close()
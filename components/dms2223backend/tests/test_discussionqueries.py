@@ -0,0 +1,33 @@
+""" Query count tests of the discussion listing and lookup.
+"""
+
+import unittest
+from typing import List
+from dms2223backend.service import DiscussionsServices
+from tests import fixtures
+
+
+class TestDiscussionQueries(unittest.TestCase):
+    """ The discussion listing and lookup run a fixed number of queries, whatever the number of
+    discussions and answers.
+    """
+
+    def test_query_count_does_not_grow_with_the_data(self):
+        """ The first listing page and a discussion lookup run one query each, with 100 and with
+        1000 more discussions.
+        """
+        schema = fixtures.schema()
+        counts: List[List[int]] = []
+        for discussions in (100, 1000):
+            fixtures.generate(discussions, answers_per_discussion=3, comments_per_answer=0)
+            with fixtures.statements() as listing:
+                page = DiscussionsServices.list_discussions(schema, 50)
+            with fixtures.statements() as lookup:
+                DiscussionsServices.get_discussion_by_id(page['items'][-1]['id'], schema)
+            self.assertEqual(len(page['items']), 50)
+            counts.append([len(listing), len(lookup)])
+        self.assertEqual(counts, [[1, 1], [1, 1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+""" Query plan tests of the hot backend queries.
+"""
+
+import unittest
+from typing import Any, Callable, List, Tuple
+from dms2223backend.data.db.resultsets import Answers, Comments
+from dms2223backend.service import (
+    AnswersServices, CommentsServices, DiscussionsServices, reportsServices
+)
+from tests import fixtures
+
+
+class TestQueryPlans(unittest.TestCase):
+    """ The hot queries look rows up through the primary keys and the secondary indexes instead of
+    scanning the tables.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """ Adds enough data (and reports) for SQLite to prefer the indexes.
+        """
+        cls.discussionid: int = fixtures.generate(200, report_rate=0.2)
+
+    def __assert_searches(self, read: Callable[[], Any]) -> None:
+        """ Asserts that every step of the plans of the statements run by a read is a search.
+
+        Args:
+            - read (Callable[[], Any]): The read to run.
+        """
+        with fixtures.statements() as executed:
+            read()
+        self.assertGreater(len(executed), 0)
+        for statement, parameters in executed:
+            plan: List[str] = fixtures.query_plan(statement, parameters)
+            for step in plan:
+                self.assertTrue(step.startswith('SEARCH'), f'{step} in the plan of {statement}')
+
+    def test_thread_reads_search(self):
+        """ Reading a thread, its answers and its comments searches them by discussion and answer.
+        """
+        schema = fixtures.schema()
+        self.__assert_searches(lambda: DiscussionsServices.get_thread(self.discussionid, schema))
+        self.__assert_searches(
+            lambda: DiscussionsServices.get_discussion_by_id(self.discussionid, schema)
+        )
+        self.__assert_searches(
+            lambda: AnswersServices.list_all_for_discussion(self.discussionid, schema)
+        )
+        self.__assert_searches(
+            lambda: CommentsServices.list_all_for_discussion(self.discussionid, schema)
+        )
+
+    def test_listing_pages_search(self):
+        """ The pages after the first one of every listing search from the cursor on, and the
+        answer counts of the discussions are searched by discussion.
+        """
+        schema = fixtures.schema()
+        listings: List[Tuple[str, Callable]] = [
+            ('discussions', DiscussionsServices.list_discussions),
+            ('reports', reportsServices.list_reports),
+            ('answer reports', reportsServices.list_reports_answer),
+            ('comment reports', reportsServices.list_reports_comments)
+        ]
+        for name, listing in listings:
+            with self.subTest(listing=name):
+                cursor = listing(schema, 10)['next_cursor']
+                self.assertIsNotNone(cursor)
+                self.__assert_searches(lambda listing=listing, cursor=cursor: listing(
+                    schema, 10, cursor
+                ))
+
+    def test_first_listing_page_does_not_sort(self):
+        """ The first page of the discussions is read in primary key order, without sorting the
+        whole table.
+        """
+        with fixtures.statements() as executed:
+            DiscussionsServices.list_discussions(fixtures.schema(), 10)
+        for statement, parameters in executed:
+            plan: List[str] = fixtures.query_plan(statement, parameters)
+            self.assertFalse([step for step in plan if 'TEMP B-TREE' in step], plan)
+            self.assertEqual(
+                [step for step in plan if step.startswith('SCAN')], ['SCAN discussions']
+            )
+
+    def test_vote_counter_checks_search(self):
+        """ The vote counter consistency check searches the votes of each answer and comment.
+        """
+        session = fixtures.schema().new_session()
+        try:
+            with fixtures.statements() as executed:
+                Answers.find_inconsistent_vote_counts(session)
+                Comments.find_inconsistent_vote_counts(session)
+        finally:
+            fixtures.schema().remove_session()
+        for statement, parameters in executed:
+            plan: List[str] = fixtures.query_plan(statement, parameters)
+            self.assertFalse(
+                [step for step in plan if step.startswith('SCAN vote')], f'{plan} of {statement}'
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+""" Synchronization tests of the full-text search index.
+"""
+
+import unittest
+from sqlalchemy import text  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2223backend.data.db.resultsets import Search
+from dms2223backend.service import SearchServices
+from tests import fixtures
+
+
+class TestSearch(unittest.TestCase):
+    """ The index triggers only rewrite a post when its indexed columns change.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """ Adds a discussion with answers to index.
+        """
+        cls.discussionid: int = fixtures.generate(1, answers_per_discussion=5)
+
+    @staticmethod
+    def __changes(statement: str) -> int:
+        """ Counts the rows changed by a statement, including those changed by its triggers.
+
+        Args:
+            - statement (str): The SQL statement.
+
+        Returns:
+            - int: The number of rows changed.
+        """
+        session: Session = fixtures.schema().new_session()
+        try:
+            before: int = session.execute(text('SELECT total_changes()')).scalar_one()
+            session.execute(text(statement))
+            changes: int = session.execute(text('SELECT total_changes()')).scalar_one() - before
+            session.commit()
+            return changes
+        finally:
+            fixtures.schema().remove_session()
+
+    def test_votes_do_not_reindex(self):
+        """ Updating the vote counter of an answer only rewrites the answer row.
+        """
+        self.assertEqual(self.__changes(
+            'UPDATE answers SET vote_count = vote_count '
+            f'WHERE id = (SELECT MIN(id) FROM answers WHERE discussionid = {self.discussionid})'
+        ), 1)
+
+    def test_content_edits_reindex(self):
+        """ Editing the content of a discussion updates the index.
+        """
+        self.assertGreater(self.__changes(
+            f"UPDATE discussions SET content = 'zyxwvut' WHERE id = {self.discussionid}"
+        ), 1)
+        results = SearchServices.search('zyxwvut', fixtures.schema())['items']
+        self.assertEqual([result['id'] for result in results], [self.discussionid])
+
+    def test_deploy_replaces_outdated_triggers(self):
+        """ Deploying the index replaces the update triggers fired by any column.
+        """
+        session: Session = fixtures.schema().new_session()
+        try:
+            session.execute(text('DROP TRIGGER answers_fts_update'))
+            session.execute(text(
+                'CREATE TRIGGER answers_fts_update AFTER UPDATE ON answers BEGIN SELECT 1; END'
+            ))
+            Search.deploy(session.connection())
+            session.commit()
+            definition: str = session.execute(text(
+                "SELECT sql FROM sqlite_master WHERE type = 'trigger' "
+                "AND name = 'answers_fts_update'"
+            )).scalar_one()
+        finally:
+            fixtures.schema().remove_session()
+        self.assertIn('AFTER UPDATE OF content ON answers', definition)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+""" User token verification tests.
+"""
+
+import json
+import time
+import unittest
+from typing import Any
+from authlib.jose import JsonWebSignature  # type: ignore
+from flask import Flask
+from werkzeug.exceptions import Unauthorized
+from dms2223backend.data.config import BackendConfiguration
+from dms2223backend.presentation.rest.security import verify_token
+
+
+class TestVerifyToken(unittest.TestCase):
+    """ Signed tokens missing or with malformed claims are rejected as unauthorized.
+    """
+
+    def setUp(self):
+        """ Creates an application with the configuration and signer the verification uses.
+        """
+        self.app: Flask = Flask(__name__)
+        self.app.cfg = BackendConfiguration()
+        self.app.jws = JsonWebSignature()
+
+    def __sign(self, payload: Any) -> str:
+        """ Signs a token with the configured secret.
+
+        Args:
+            - payload (Any): The token payload.
+
+        Returns:
+            - str: The token.
+        """
+        return self.app.jws.serialize_compact(
+            {'alg': 'HS256'}, bytes(json.dumps(payload), 'UTF-8'),
+            bytes(self.app.cfg.get_jws_secret(), 'UTF-8')
+        ).decode('ascii')
+
+    def test_valid_token(self):
+        """ A token with every claim is accepted.
+        """
+        with self.app.app_context():
+            self.assertEqual(
+                verify_token(self.__sign({'user': 'a', 'sub': 'a', 'exp': time.time() + 60}))['user'],
+                'a'
+            )
+
+    def test_invalid_claims(self):
+        """ Tokens without the subject or the expiration, with a non-numeric expiration, or
+        without a claims object are rejected.
+        """
+        exp: float = time.time() + 60
+        with self.app.app_context():
+            for payload in (
+                {'user': 'a', 'exp': exp}, {'user': 'a', 'sub': 'a'},
+                {'user': 'a', 'sub': 'a', 'exp': 'never'}, {'user': 'a', 'sub': 'a', 'exp': True},
+                ['a']
+            ):
+                with self.subTest(payload=payload), self.assertRaises(Unauthorized):
+                    verify_token(self.__sign(payload))
+
+    def test_expired_token(self):
+        """ Expired tokens are rejected.
+        """
+        with self.app.app_context(), self.assertRaises(Unauthorized):
+            verify_token(self.__sign({'user': 'a', 'sub': 'a', 'exp': time.time() - 1}))
+
+
+if __name__ == '__main__':
+    unittest.main()
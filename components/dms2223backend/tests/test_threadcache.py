@@ -0,0 +1,86 @@
+""" Invalidation tests of the discussion thread cache.
+"""
+
+import unittest
+from typing import Any, Callable, Dict, List, Optional
+from dms2223common.data.cache import MemoryCache
+from dms2223backend.service import ThreadCache
+
+
+class TestThreadCache(unittest.TestCase):
+    """ The cache never serves an entry loaded before the last invalidation of its namespace.
+    """
+
+    def setUp(self):
+        """ Creates a thread cache on an empty memory cache.
+        """
+        self.cache: ThreadCache = ThreadCache(MemoryCache(1024, 60))
+        self.loads: List[str] = []
+
+    def __loader(self, value: Any, during: Optional[Callable[[], None]] = None) -> Callable[[], Any]:
+        """ Builds a loader that records its calls.
+
+        Args:
+            - value (Any): The value loaded.
+            - during (Optional[Callable[[], None]]): Run while loading (e.g., a concurrent write).
+
+        Returns:
+            - Callable[[], Any]: The loader.
+        """
+        def load() -> Any:
+            self.loads.append(str(value))
+            if during is not None:
+                during()
+            return value
+        return load
+
+    def test_stale_thread_racing_an_invalidation_is_orphaned(self):
+        """ A thread loaded while its discussion changes is not served after the change.
+        """
+        stale: Any = self.cache.discussion_item(1, 'thread', self.__loader(
+            'stale', lambda: self.cache.discussion_changed(1)
+        ))
+        self.assertEqual(stale, 'stale')
+        self.assertEqual(self.cache.discussion_item(1, 'thread', self.__loader('fresh')), 'fresh')
+        self.assertEqual(self.cache.discussion_item(1, 'thread', self.__loader('later')), 'fresh')
+        self.assertEqual(self.loads, ['stale', 'fresh'])
+
+    def test_stale_listing_racing_an_invalidation_is_orphaned(self):
+        """ A listing page loaded while the listing changes is not served after the change.
+        """
+        stale: Dict = {'items': ['stale'], 'next_cursor': 1}
+        fresh: Dict = {'items': ['fresh'], 'next_cursor': 1}
+        self.cache.listing_page(50, None, self.__loader(
+            stale, lambda: self.cache.discussion_changed(1, listing=True)
+        ))
+        self.assertEqual(self.cache.listing_page(50, None, self.__loader(fresh)), fresh)
+        self.assertEqual(self.cache.listing_page(50, None, self.__loader(stale)), fresh)
+
+    def test_discussion_creation_only_drops_the_last_listing_page(self):
+        """ Creating a discussion reloads the last listing page, but not the previous ones.
+        """
+        first: Dict = {'items': [1], 'next_cursor': 1}
+        last: Dict = {'items': [2], 'next_cursor': None}
+        self.cache.listing_page(1, None, self.__loader(first))
+        self.cache.listing_page(1, 1, self.__loader(last))
+        self.cache.discussion_created()
+        self.loads.clear()
+        self.assertEqual(self.cache.listing_page(1, None, self.__loader(first)), first)
+        self.assertEqual(self.cache.listing_page(1, 1, self.__loader(last)), last)
+        self.assertEqual(self.loads, [str(last)])
+
+    def test_empty_values_are_not_cached(self):
+        """ Threads not found and empty pages are loaded again on every lookup.
+        """
+        for empty in (None, [], {}):
+            with self.subTest(value=empty):
+                self.loads.clear()
+                for _ in range(2):
+                    self.assertEqual(
+                        self.cache.discussion_item(2, 'answers', self.__loader(empty), 50), empty
+                    )
+                self.assertEqual(len(self.loads), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
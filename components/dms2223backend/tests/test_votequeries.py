@@ -0,0 +1,77 @@
+""" Query count and consistency tests of the answer and comment vote counters.
+"""
+
+import unittest
+from typing import Dict, List
+from dms2223backend.data.db.resultsets import Answers, Comments
+from dms2223backend.service import AnswersServices, CommentsServices, DiscussionsServices
+from tests import fixtures
+
+
+class TestVoteQueries(unittest.TestCase):
+    """ Reading the votes of a thread runs a fixed number of queries, however many votes its
+    answers and comments have.
+    """
+
+    @staticmethod
+    def __count_thread_statements(discussionid: int) -> List[int]:
+        """ Counts the statements run to read a thread, its answers and its comments.
+
+        Args:
+            - discussionid (int): The discussion id.
+
+        Returns:
+            - List[int]: The number of statements of each read.
+        """
+        counts: List[int] = []
+        with fixtures.statements() as thread:
+            DiscussionsServices.get_thread(discussionid, fixtures.schema())
+        counts.append(len(thread))
+        with fixtures.statements() as answers:
+            AnswersServices.list_all_for_discussion(discussionid, fixtures.schema())
+        counts.append(len(answers))
+        with fixtures.statements() as comments:
+            CommentsServices.list_all_for_discussion(discussionid, fixtures.schema())
+        counts.append(len(comments))
+        return counts
+
+    def test_query_count_does_not_grow_with_the_votes(self):
+        """ A thread with 200 votes per post is read with as many queries as one with a vote per
+        post.
+        """
+        options: Dict = {'answers_per_discussion': 20, 'comments_per_answer': 3}
+        lightly_voted: int = fixtures.generate(1, votes_per_post=1, **options)
+        heavily_voted: int = fixtures.generate(1, votes_per_post=200, **options)
+        thread = DiscussionsServices.get_thread(heavily_voted, fixtures.schema())
+        self.assertIsNotNone(thread)
+        self.assertGreater(sum(answer['vote'] for answer in thread['answers']), 20 * 100)
+        self.assertEqual(
+            self.__count_thread_statements(lightly_voted),
+            self.__count_thread_statements(heavily_voted)
+        )
+        self.assertEqual(self.__count_thread_statements(heavily_voted), [3, 1, 1])
+
+    def test_vote_counters_match_the_votes(self):
+        """ The counters kept by the generator and by voting match the vote records.
+        """
+        discussionid: int = fixtures.generate(1, answers_per_discussion=5, votes_per_post=50)
+        answer: Dict = AnswersServices.list_all_for_discussion(
+            discussionid, fixtures.schema()
+        )['items'][0]
+        for _ in range(3):
+            AnswersServices.vote_answer(answer['id'], fixtures.schema())
+        self.assertEqual(
+            AnswersServices.list_all_for_discussion(
+                discussionid, fixtures.schema()
+            )['items'][0]['vote'], answer['vote'] + 3
+        )
+        session = fixtures.schema().new_session()
+        try:
+            self.assertEqual(Answers.find_inconsistent_vote_counts(session), [])
+            self.assertEqual(Comments.find_inconsistent_vote_counts(session), [])
+        finally:
+            fixtures.schema().remove_session()
+
+
+if __name__ == '__main__':
+    unittest.main()
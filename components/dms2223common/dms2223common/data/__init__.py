@@ -1,4 +1,8 @@
 """ Common data layer modules to be used by the different services.
 """
 
+from .databaseengine import DatabaseEngine
+from .metrics import Metrics
+from .queryprofiler import QueryProfiler
 from .role import Role
+from .tokencache import TokenCache
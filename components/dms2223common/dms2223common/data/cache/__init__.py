@@ -0,0 +1,6 @@
+""" Key-value cache classes.
+"""
+
+from .cache import Cache
+from .memorycache import MemoryCache
+from .rediscache import RedisCache
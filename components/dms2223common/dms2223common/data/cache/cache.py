@@ -0,0 +1,123 @@
+""" Cache class module.
+"""
+
+from typing import Any, Dict, Optional
+
+
+class Cache():
+    """ Base class of the key-value caches.
+
+    Values are kept for a limited time (the cache TTL) and may be evicted earlier, so a missing
+    key never means more than having to load the value again.
+    """
+
+    @staticmethod
+    def from_config(config: Dict) -> Optional['Cache']:
+        """ Creates a cache from a configuration dictionary.
+
+        Args:
+            - config (Dict): A dictionary with the cache backend (key `backend`: `memory`, `redis`
+              or `none`) and its constructor arguments (`size` and `ttl` for `memory`; `ttl`,
+              `host`, `port`, `db` and `prefix` for `redis`).
+
+        Returns:
+            - Optional[Cache]: The new cache, or `None` if the backend is `none`.
+        """
+        if config['backend'] == 'memory':
+            from dms2223common.data.cache.memorycache import MemoryCache  # pylint: disable=import-outside-toplevel
+            return MemoryCache(config['size'], config['ttl'])
+        if config['backend'] == 'redis':
+            from dms2223common.data.cache.rediscache import RedisCache  # pylint: disable=import-outside-toplevel
+            return RedisCache(
+                config['host'], config['port'], config['db'], config['ttl'], config['prefix']
+            )
+        return None
+
+    def get(self, key: str) -> Optional[Any]:
+        """ Gets a cached value.
+
+        Args:
+            - key (str): The key.
+
+        Returns:
+            - Optional[Any]: The value, or `None` if it is not cached.
+
+        Raises:
+            - NotImplementedError: If the subclass does not implement it.
+        """
+        raise NotImplementedError()
+
+    def set(self, key: str, value: Any) -> None:
+        """ Caches a value, replacing the current one, if any.
+
+        Args:
+            - key (str): The key.
+            - value (Any): The value. It must not be `None`.
+
+        Raises:
+            - NotImplementedError: If the subclass does not implement it.
+        """
+        raise NotImplementedError()
+
+    def add(self, key: str, value: Any) -> bool:
+        """ Caches a value, unless the key is already cached.
+
+        Args:
+            - key (str): The key.
+            - value (Any): The value. It must not be `None`.
+
+        Returns:
+            - bool: `True` if the value was cached; `False` if the key was already cached.
+
+        Raises:
+            - NotImplementedError: If the subclass does not implement it.
+        """
+        raise NotImplementedError()
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        """ Atomically increases a cached counter, caching it if the key is not cached.
+
+        The TTL of a counter starts when it is cached, and is not extended by the increases.
+
+        Args:
+            - key (str): The key.
+            - amount (int): The amount to add.
+
+        Returns:
+            - int: The new value of the counter.
+
+        Raises:
+            - NotImplementedError: If the subclass does not implement it.
+        """
+        raise NotImplementedError()
+
+    def delete(self, key: str) -> None:
+        """ Forgets a cached value.
+
+        Args:
+            - key (str): The key.
+
+        Raises:
+            - NotImplementedError: If the subclass does not implement it.
+        """
+        raise NotImplementedError()
+
+    def clear(self) -> None:
+        """ Forgets every cached value.
+
+        Raises:
+            - NotImplementedError: If the subclass does not implement it.
+        """
+        raise NotImplementedError()
+
+    def get_stats(self) -> Dict:
+        """ Gets the cache usage statistics.
+
+        Returns:
+            - Dict: A dictionary with the hit and miss counters (keys `hits` and `misses`), and
+              any other statistic known by the backend.
+
+        Raises:
+            - NotImplementedError: If the subclass does not implement it.
+        """
+        raise NotImplementedError()
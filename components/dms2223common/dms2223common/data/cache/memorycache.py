@@ -0,0 +1,142 @@
+""" MemoryCache class module.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+from dms2223common.data.cache.cache import Cache
+
+
+class MemoryCache(Cache):
+    """ Bounded, thread-safe in-process cache.
+
+    Entries expire after the TTL, and the least recently used entries are evicted when the cache
+    is full. Values are kept (and returned) as they are, not copied, so they must not be modified
+    once cached. Each process has its own cache.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 30):
+        """ Constructor method.
+
+        Args:
+            - max_size (int): The maximum number of entries.
+            - ttl (float): The number of seconds an entry is kept.
+        """
+        self.__max_size: int = max(1, int(max_size))
+        self.__ttl: float = float(ttl)
+        self.__entries: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+        self.__lock: Lock = Lock()
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """ Gets a cached value, counting the hit or miss.
+
+        Args:
+            - key (str): The key.
+
+        Returns:
+            - Optional[Any]: The value, or `None` if it is not cached or has expired.
+        """
+        with self.__lock:
+            entry: Optional[Tuple[Any, float]] = self.__entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                del self.__entries[key]
+                entry = None
+            if entry is None:
+                self.__misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return entry[0]
+
+    def set(self, key: str, value: Any) -> None:
+        """ Caches a value, replacing the current one, if any.
+
+        Args:
+            - key (str): The key.
+            - value (Any): The value.
+        """
+        with self.__lock:
+            self.__store(key, value)
+
+    def add(self, key: str, value: Any) -> bool:
+        """ Caches a value, unless the key is already cached (and not expired).
+
+        Args:
+            - key (str): The key.
+            - value (Any): The value.
+
+        Returns:
+            - bool: `True` if the value was cached; `False` if the key was already cached.
+        """
+        with self.__lock:
+            entry: Optional[Tuple[Any, float]] = self.__entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                return False
+            self.__store(key, value)
+            return True
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        """ Atomically increases a cached counter, caching it if the key is not cached (or expired).
+
+        Args:
+            - key (str): The key.
+            - amount (int): The amount to add.
+
+        Returns:
+            - int: The new value of the counter.
+        """
+        with self.__lock:
+            entry: Optional[Tuple[Any, float]] = self.__entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                self.__store(key, amount)
+                return amount
+            self.__entries[key] = (entry[0] + amount, entry[1])
+            self.__entries.move_to_end(key)
+            return entry[0] + amount
+
+    def __store(self, key: str, value: Any) -> None:
+        """ Stores an entry, evicting the least recently used ones if the cache is full.
+
+        The caller must hold the lock.
+
+        Args:
+            - key (str): The key.
+            - value (Any): The value.
+        """
+        self.__entries[key] = (value, time.monotonic() + self.__ttl)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """ Forgets a cached value.
+
+        Args:
+            - key (str): The key.
+        """
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        """ Forgets every cached value.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def get_stats(self) -> Dict:
+        """ Gets the cache usage statistics.
+
+        Returns:
+            - Dict: A dictionary with the number of entries (key `size`), the maximum number of
+              entries (key `max_size`), and the hit and miss counters (keys `hits` and `misses`).
+        """
+        with self.__lock:
+            return {
+                'size': len(self.__entries),
+                'max_size': self.__max_size,
+                'hits': self.__hits,
+                'misses': self.__misses
+            }
@@ -0,0 +1,165 @@
+""" RedisCache class module.
+"""
+
+import json
+import logging
+from threading import Lock
+from typing import Any, Dict, Optional
+from dms2223common.data.cache.cache import Cache
+
+
+class RedisCache(Cache):
+    """ Cache kept in a Redis (or Redis-compatible, e.g., Valkey or KeyDB) server.
+
+    The cache is shared by every process connected to the same server and database, so an
+    entry forgotten by one of them is forgotten for all. Values are stored as JSON, so only
+    JSON-serializable values can be cached. Every key is prefixed, so several services can
+    share a database.
+
+    A server error is logged and handled as a miss (or an ignored write), so the callers fall back
+    to loading the values themselves while the server is unavailable.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 6379, db: int = 0,
+                 ttl: float = 30, prefix: str = ''):
+        """ Constructor method.
+
+        Args:
+            - host (str): The server host.
+            - port (int): The server port.
+            - db (int): The database number.
+            - ttl (float): The number of seconds an entry is kept.
+            - prefix (str): The prefix of the keys.
+
+        Raises:
+            - RuntimeError: If the Redis client is not installed.
+        """
+        try:
+            import redis  # type: ignore  # pylint: disable=import-outside-toplevel
+        except ImportError as ex:
+            raise RuntimeError(
+                'The redis cache backend requires the Redis client (install the "redis" extra)'
+            ) from ex
+        self.__errors_type = redis.RedisError
+        self.__client = redis.Redis(
+            host=host, port=int(port), db=int(db), socket_timeout=1, socket_connect_timeout=1
+        )
+        self.__ttl_ms: int = max(1, int(float(ttl) * 1000))
+        self.__prefix: str = str(prefix)
+        self.__lock: Lock = Lock()
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__errors: int = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """ Gets a cached value, counting the hit or miss.
+
+        Args:
+            - key (str): The key.
+
+        Returns:
+            - Optional[Any]: The value, or `None` if it is not cached or the server failed.
+        """
+        try:
+            data: Optional[bytes] = self.__client.get(self.__prefix + key)
+        except self.__errors_type as ex:
+            self.__error('get', ex)
+            data = None
+        with self.__lock:
+            if data is None:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+        return None if data is None else json.loads(data)
+
+    def set(self, key: str, value: Any) -> None:
+        """ Caches a value, replacing the current one, if any.
+
+        Args:
+            - key (str): The key.
+            - value (Any): The value.
+        """
+        try:
+            self.__client.set(self.__prefix + key, json.dumps(value), px=self.__ttl_ms)
+        except self.__errors_type as ex:
+            self.__error('set', ex)
+
+    def add(self, key: str, value: Any) -> bool:
+        """ Caches a value, unless the key is already cached.
+
+        Args:
+            - key (str): The key.
+            - value (Any): The value.
+
+        Returns:
+            - bool: `True` if the value was cached; `False` if the key was already cached or the
+              server failed.
+        """
+        try:
+            return bool(
+                self.__client.set(self.__prefix + key, json.dumps(value), px=self.__ttl_ms, nx=True)
+            )
+        except self.__errors_type as ex:
+            self.__error('add', ex)
+            return False
+
+    def incr(self, key: str, amount: int = 1) -> int:
+        """ Atomically increases a cached counter, caching it if the key is not cached.
+
+        Args:
+            - key (str): The key.
+            - amount (int): The amount to add.
+
+        Returns:
+            - int: The new value of the counter, or `0` if the server failed.
+        """
+        try:
+            pipeline = self.__client.pipeline(transaction=True)
+            pipeline.set(self.__prefix + key, 0, px=self.__ttl_ms, nx=True)
+            pipeline.incrby(self.__prefix + key, amount)
+            return int(pipeline.execute()[1])
+        except self.__errors_type as ex:
+            self.__error('incr', ex)
+            return 0
+
+    def delete(self, key: str) -> None:
+        """ Forgets a cached value.
+
+        Args:
+            - key (str): The key.
+        """
+        try:
+            self.__client.delete(self.__prefix + key)
+        except self.__errors_type as ex:
+            self.__error('delete', ex)
+
+    def clear(self) -> None:
+        """ Forgets every cached value (every key with the prefix of this cache).
+        """
+        try:
+            keys = list(self.__client.scan_iter(match=self.__prefix + '*', count=1000))
+            if keys:
+                self.__client.delete(*keys)
+        except self.__errors_type as ex:
+            self.__error('clear', ex)
+
+    def get_stats(self) -> Dict:
+        """ Gets the cache usage statistics of this process.
+
+        Returns:
+            - Dict: A dictionary with the hit and miss counters (keys `hits` and `misses`) and the
+              number of failed operations (key `errors`).
+        """
+        with self.__lock:
+            return {'hits': self.__hits, 'misses': self.__misses, 'errors': self.__errors}
+
+    def __error(self, operation: str, ex: Exception) -> None:
+        """ Counts and logs a failed operation.
+
+        Args:
+            - operation (str): The operation name.
+            - ex (Exception): The error raised by the client.
+        """
+        with self.__lock:
+            self.__errors += 1
+        logging.warning('Redis cache %s failed: %s', operation, ex)
@@ -1,6 +1,7 @@
 """ ServiceConfiguration class module.
 """
 
+import re
 from typing import List, Dict
 from .configuration import Configuration
 
@@ -16,6 +17,9 @@ class ServiceConfiguration(Configuration):
         Configuration.__init__(self)
 
         self.set_authorized_api_keys([])
+        self.set_server({})
+        self.set_tracing({})
+        self.set_json({})
 
     def _set_values(self, values: Dict) -> None:
         """Sets/merges a collection of configuration values.
@@ -31,6 +35,12 @@ class ServiceConfiguration(Configuration):
             self.set_debug_flag(values['debug'])
         if 'authorized_api_keys' in values:
             self.set_authorized_api_keys(values['authorized_api_keys'])
+        if 'server' in values:
+            self.set_server(values['server'])
+        if 'tracing' in values:
+            self.set_tracing(values['tracing'])
+        if 'json' in values:
+            self.set_json(values['json'])
 
     def set_service_host(self, service_host: str) -> None:
         """ Sets the service_host configuration value.
@@ -111,3 +121,237 @@ class ServiceConfiguration(Configuration):
         """
 
         return self._values['authorized_api_keys']
+
+    def set_db_engine_options(self, options: Dict) -> None:
+        """ Sets the database engine options configuration value.
+
+        Args:
+            - options: A dictionary with the connection pool size (`pool_size`), the number of
+              connections allowed beyond it (`max_overflow`), the seconds after which a connection
+              is replaced (`pool_recycle`, `-1` for never), whether connections are tested before
+              being used (`pool_pre_ping`) and, for SQLite, whether connections are restricted to
+              the thread that created them (`check_same_thread`). Missing keys take their default
+              values.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = {
+            'pool_size': 5,
+            'max_overflow': 10,
+            'pool_recycle': -1,
+            'pool_pre_ping': False,
+            'check_same_thread': False
+        }
+        unknown = set(options) - set(values)
+        if unknown:
+            raise ValueError(f'Unknown database engine options {", ".join(sorted(unknown))}')
+        values.update(options)
+        for key in ('pool_size', 'max_overflow', 'pool_recycle'):
+            values[key] = int(values[key])
+        for key in ('pool_pre_ping', 'check_same_thread'):
+            values[key] = bool(values[key])
+        self._values['db_engine'] = values
+
+    def get_db_engine_options(self) -> Dict:
+        """ Gets the database engine options configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of db_engine.
+        """
+
+        return self._values['db_engine']
+
+    def set_db_pragmas(self, pragmas: Dict) -> None:
+        """ Sets the SQLite pragmas configuration value.
+
+        Args:
+            - pragmas: A dictionary with the values of the `journal_mode`, `synchronous`,
+              `mmap_size`, `cache_size`, `busy_timeout` and `temp_store` pragmas set on every new
+              SQLite connection. A `None` value leaves that pragma unset. Missing keys take their
+              default values.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'mmap_size': 268435456,
+            'cache_size': -20000,
+            'busy_timeout': 5000,
+            'temp_store': 'MEMORY'
+        }
+        unknown = set(pragmas) - set(values)
+        if unknown:
+            raise ValueError(f'Unknown SQLite pragmas {", ".join(sorted(unknown))}')
+        values.update(pragmas)
+        for key, value in values.items():
+            if value is not None and not re.fullmatch(r'-?[A-Za-z0-9_]+', str(value)):
+                raise ValueError(f'Invalid value {value} for the SQLite pragma {key}')
+        self._values['db_pragmas'] = values
+
+    def get_db_pragmas(self) -> Dict:
+        """ Gets the SQLite pragmas configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of db_pragmas.
+        """
+
+        return self._values['db_pragmas']
+
+    def set_db_profiler(self, profiler: Dict) -> None:
+        """ Sets the SQL query profiler configuration value.
+
+        Args:
+            - profiler: A dictionary with the fraction of the requests whose SQL statements are
+              profiled (`sample_rate`, `0` disabling the profiler), the executions of a statement
+              in a request from which it is reported as an N+1 pattern (`n_plus_one_threshold`),
+              and the number of latest reports kept (`max_reports`). Missing keys take their
+              default values.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = {
+            'sample_rate': 0.0,
+            'n_plus_one_threshold': 5,
+            'max_reports': 100
+        }
+        unknown = set(profiler) - set(values)
+        if unknown:
+            raise ValueError(f'Unknown profiler options {", ".join(sorted(unknown))}')
+        values.update(profiler)
+        values['sample_rate'] = float(values['sample_rate'])
+        if not 0 <= values['sample_rate'] <= 1:
+            raise ValueError(f'Invalid profiler sample_rate value {values["sample_rate"]}')
+        for key in ('n_plus_one_threshold', 'max_reports'):
+            values[key] = int(values[key])
+            if values[key] <= 0:
+                raise ValueError(f'Invalid profiler {key} value {values[key]}')
+        self._values['db_profiler'] = values
+
+    def get_db_profiler(self) -> Dict:
+        """ Gets the SQL query profiler configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of db_profiler.
+        """
+
+        return self._values['db_profiler']
+
+    def set_server(self, server: Dict) -> None:
+        """ Sets the server configuration value, which selects and tunes how the service is served.
+
+        Args:
+            - server: A dictionary with the serving `mode` (`development` for the built-in
+              development server, `wsgi` for the production multi-process server, or `async` for
+              the production server with cooperative, event loop based workers), and, for the
+              latter two, the number of worker processes (`workers`), of threads per `wsgi` worker
+              (`threads`) and of concurrent connections per `async` worker (`worker_connections`),
+              the number of requests after which a worker is recycled
+              (`max_requests`, with a random `max_requests_jitter` added), and the seconds a worker
+              may spend in a request (`timeout`) or finishing its requests on a reload or shutdown
+              (`graceful_timeout`). Missing keys take their default values.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = {
+            'mode': 'development',
+            'workers': 2,
+            'threads': 4,
+            'worker_connections': 1000,
+            'max_requests': 1000,
+            'max_requests_jitter': 100,
+            'timeout': 60,
+            'graceful_timeout': 30
+        }
+        values.update(server)
+        if values['mode'] not in ('development', 'wsgi', 'async'):
+            raise ValueError(f'Unknown server mode {values["mode"]}')
+        for key in ('workers', 'threads', 'worker_connections', 'max_requests',
+                    'max_requests_jitter', 'timeout', 'graceful_timeout'):
+            values[key] = int(values[key])
+            if values[key] < 0 or (
+                    values[key] == 0 and key in ('workers', 'threads', 'worker_connections')):
+                raise ValueError(f'Invalid server {key} value {values[key]}')
+        self._values['server'] = values
+
+    def get_server(self) -> Dict:
+        """ Gets the server configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of server.
+        """
+
+        return self._values['server']
+
+    def set_tracing(self, tracing: Dict) -> None:
+        """ Sets the tracing configuration value, which selects where the request spans are sent.
+
+        Args:
+            - tracing: A dictionary with the span `exporter` (`memory` to keep the spans of the
+              latest `max_traces` traces in the service process, `file` to append them to the
+              JSON lines `file`, or `none` to only propagate the trace context). Missing keys take
+              their default values.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = {
+            'exporter': 'memory',
+            'max_traces': 1000,
+            'file': None
+        }
+        values.update(tracing)
+        if values['exporter'] not in ('none', 'memory', 'file'):
+            raise ValueError(f'Unknown tracing exporter {values["exporter"]}')
+        values['max_traces'] = int(values['max_traces'])
+        if values['max_traces'] <= 0:
+            raise ValueError(f'Invalid tracing max_traces value {values["max_traces"]}')
+        if values['exporter'] == 'file' and not values['file']:
+            raise ValueError('The file tracing exporter needs a file')
+        self._values['tracing'] = values
+
+    def get_tracing(self) -> Dict:
+        """ Gets the tracing configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of tracing.
+        """
+
+        return self._values['tracing']
+
+    def set_json(self, json: Dict) -> None:
+        """ Sets the JSON configuration value, which selects how the responses are serialized.
+
+        Args:
+            - json: A dictionary with the `encoder` (`orjson`, `stdlib`, or `auto` to use orjson if
+              it is installed) and whether the documents are indented (`indent`). Missing keys
+              take their default values.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = {
+            'encoder': 'auto',
+            'indent': False
+        }
+        unknown = set(json) - set(values)
+        if unknown:
+            raise ValueError(f'Unknown JSON options {", ".join(sorted(unknown))}')
+        values.update(json)
+        if values['encoder'] not in ('auto', 'orjson', 'stdlib'):
+            raise ValueError(f'Unknown JSON encoder {values["encoder"]}')
+        values['indent'] = bool(values['indent'])
+        self._values['json'] = values
+
+    def get_json(self) -> Dict:
+        """ Gets the JSON configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of json.
+        """
+
+        return self._values['json']
@@ -0,0 +1,76 @@
+""" DatabaseEngine class module.
+"""
+
+from typing import Any, Dict
+
+
+class DatabaseEngine():
+    """ Monostate class responsible of creating the SQLAlchemy engines of the services databases.
+    """
+
+    @staticmethod
+    def create(db_connection_string: str, options: Dict, pragmas: Dict) -> Any:
+        """ Creates an engine with the configured connection pool and, for SQLite, pragmas.
+
+        Args:
+            - db_connection_string (str): The string used to connect to the database.
+            - options (Dict): The engine options (see
+              `ServiceConfiguration.set_db_engine_options`).
+            - pragmas (Dict): The pragmas set on every new SQLite connection (see
+              `ServiceConfiguration.set_db_pragmas`).
+
+        Returns:
+            - Engine: The SQLAlchemy engine.
+        """
+        from sqlalchemy import create_engine, event  # type: ignore  # pylint: disable=import-outside-toplevel
+        engine = create_engine(
+            db_connection_string, **DatabaseEngine.__engine_options(db_connection_string, options)
+        )
+        if engine.dialect.name == 'sqlite':
+            event.listen(
+                engine, 'connect',
+                lambda dbapi_connection, connection_record: DatabaseEngine.__set_sqlite_pragmas(
+                    dbapi_connection, pragmas
+                )
+            )
+        return engine
+
+    @staticmethod
+    def __engine_options(db_connection_string: str, options: Dict) -> Dict:
+        """ Builds the keyword arguments of the engine from the configuration.
+
+        Args:
+            - db_connection_string (str): The string used to connect to the database.
+            - options (Dict): The engine options.
+
+        Returns:
+            - Dict: A dictionary of `create_engine` keyword arguments.
+        """
+        from sqlalchemy.engine import make_url  # type: ignore  # pylint: disable=import-outside-toplevel
+        engine_options: Dict = {
+            'pool_recycle': options['pool_recycle'],
+            'pool_pre_ping': options['pool_pre_ping']
+        }
+        url = make_url(db_connection_string)
+        if url.get_backend_name() == 'sqlite':
+            engine_options['connect_args'] = {'check_same_thread': options['check_same_thread']}
+            if url.database in (None, '', ':memory:'):
+                # In-memory databases live in a single connection, so they are not pooled
+                return engine_options
+        engine_options['pool_size'] = options['pool_size']
+        engine_options['max_overflow'] = options['max_overflow']
+        return engine_options
+
+    @staticmethod
+    def __set_sqlite_pragmas(dbapi_connection, pragmas: Dict) -> None:
+        """ Sets the configured SQLite pragmas on a new connection.
+
+        Args:
+            - dbapi_connection: The connection to the database API.
+            - pragmas (Dict): The pragma values, by name. `None` values are skipped.
+        """
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            if value is not None:
+                cursor.execute(f'PRAGMA {name} = {value};')
+        cursor.close()
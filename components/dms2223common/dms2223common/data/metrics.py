@@ -0,0 +1,238 @@
+""" Metrics class module.
+"""
+
+import bisect
+import math
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# (label name, label value) pairs, sorted by label name
+LabelSet = Tuple[Tuple[str, str], ...]
+
+
+class Metrics():
+    """ Thread-safe registry of counters, gauges and histograms.
+
+    Metrics are declared once (with `counter`, `gauge` or `histogram`) and then updated with
+    `inc`, `add` or `observe` and any number of labels, every distinct set of label values being a
+    separate series. `render` exposes them in the Prometheus text exposition format.
+
+    The values live in the memory of the process, so a service served by several worker
+    processes keeps separate metrics in each one.
+    """
+
+    DEFAULT_BUCKETS: Tuple[float, ...] = (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+    )
+
+    def __init__(self):
+        """ Constructor method.
+        """
+        self.__lock: Lock = Lock()
+        # Name -> (type, help text, buckets)
+        self.__declarations: Dict[str, Tuple[str, str, Tuple[float, ...]]] = {}
+        # Name -> label set -> value (or, for histograms, bucket counts followed by the sum)
+        self.__series: Dict[str, Dict[LabelSet, List[float]]] = {}
+
+    def counter(self, name: str, description: str) -> None:
+        """ Declares a counter, a value that only increases.
+
+        Args:
+            - name (str): The metric name.
+            - description (str): The help text of the metric.
+        """
+        self.__declare(name, 'counter', description, ())
+
+    def gauge(self, name: str, description: str) -> None:
+        """ Declares a gauge, a value that can go up and down.
+
+        Args:
+            - name (str): The metric name.
+            - description (str): The help text of the metric.
+        """
+        self.__declare(name, 'gauge', description, ())
+
+    def histogram(self, name: str, description: str,
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """ Declares a histogram, which counts the observed values in cumulative buckets.
+
+        Args:
+            - name (str): The metric name.
+            - description (str): The help text of the metric.
+            - buckets (Sequence[float]): The upper bounds of the buckets. A `+Inf` bucket is
+              always added.
+        """
+        self.__declare(name, 'histogram', description, tuple(sorted(float(b) for b in buckets)))
+
+    def __declare(self, name: str, kind: str, description: str,
+                  buckets: Tuple[float, ...]) -> None:
+        """ Declares a metric, unless it is already declared.
+
+        Args:
+            - name (str): The metric name.
+            - kind (str): The metric type.
+            - description (str): The help text of the metric.
+            - buckets (Tuple[float, ...]): The histogram bucket bounds.
+
+        Raises:
+            - ValueError: If the metric was declared with another type.
+        """
+        with self.__lock:
+            declaration = self.__declarations.get(name)
+            if declaration is not None and declaration[0] != kind:
+                raise ValueError(f'Metric {name} is already declared as a {declaration[0]}')
+            if declaration is None:
+                self.__declarations[name] = (kind, description, buckets)
+                self.__series[name] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        """ Increments a counter.
+
+        Args:
+            - name (str): The metric name.
+            - value (float): The increment.
+            - **labels (str): The label values of the series.
+        """
+        self.add(name, value, **labels)
+
+    def add(self, name: str, value: float, **labels: str) -> None:
+        """ Adds a (possibly negative) value to a counter or gauge.
+
+        Args:
+            - name (str): The metric name.
+            - value (float): The value to add.
+            - **labels (str): The label values of the series.
+
+        Raises:
+            - KeyError: If the metric is not declared.
+        """
+        key: LabelSet = Metrics.__label_set(labels)
+        with self.__lock:
+            series: Dict[LabelSet, List[float]] = self.__series[name]
+            values: Optional[List[float]] = series.get(key)
+            if values is None:
+                values = series[key] = [0.0]
+            values[0] += value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """ Counts a value in a histogram.
+
+        Args:
+            - name (str): The metric name.
+            - value (float): The observed value.
+            - **labels (str): The label values of the series.
+
+        Raises:
+            - KeyError: If the metric is not declared.
+        """
+        key: LabelSet = Metrics.__label_set(labels)
+        with self.__lock:
+            buckets: Tuple[float, ...] = self.__declarations[name][2]
+            series: Dict[LabelSet, List[float]] = self.__series[name]
+            values: Optional[List[float]] = series.get(key)
+            if values is None:
+                # One count per bucket, the `+Inf` one, and the sum
+                values = series[key] = [0.0] * (len(buckets) + 2)
+            values[bisect.bisect_left(buckets, value)] += 1
+            values[-1] += value
+
+    def get(self, name: str, **labels: str) -> float:
+        """ Gets the value of a counter or gauge series, or the number of values observed in a
+        histogram series.
+
+        Args:
+            - name (str): The metric name.
+            - **labels (str): The label values of the series.
+
+        Returns:
+            - float: The value; `0` if the series has not been updated yet.
+        """
+        key: LabelSet = Metrics.__label_set(labels)
+        with self.__lock:
+            values: Optional[List[float]] = self.__series.get(name, {}).get(key)
+            if values is None:
+                return 0.0
+            if self.__declarations[name][0] == 'histogram':
+                return sum(values[:-1])
+            return values[0]
+
+    def render(self) -> str:
+        """ Renders every metric in the Prometheus text exposition format (version 0.0.4).
+
+        Returns:
+            - str: The metrics exposition.
+        """
+        lines: List[str] = []
+        with self.__lock:
+            for name, (kind, description, buckets) in self.__declarations.items():
+                escaped: str = description.replace('\\', '\\\\').replace('\n', '\\n')
+                lines.append(f'# HELP {name} {escaped}')
+                lines.append(f'# TYPE {name} {kind}')
+                for labels, values in self.__series[name].items():
+                    if kind != 'histogram':
+                        lines.append(
+                            f'{name}{Metrics.__format_labels(labels)} '
+                            f'{Metrics.__format_value(values[0])}'
+                        )
+                        continue
+                    cumulative: float = 0.0
+                    for bound, count in zip(buckets + (math.inf,), values[:-1]):
+                        cumulative += count
+                        le: Tuple[str, str] = ('le', '+Inf' if math.isinf(bound) else repr(bound))
+                        lines.append(
+                            f'{name}_bucket{Metrics.__format_labels(labels + (le,))} '
+                            f'{Metrics.__format_value(cumulative)}'
+                        )
+                    lines.append(
+                        f'{name}_sum{Metrics.__format_labels(labels)} '
+                        f'{Metrics.__format_value(values[-1])}'
+                    )
+                    lines.append(
+                        f'{name}_count{Metrics.__format_labels(labels)} '
+                        f'{Metrics.__format_value(cumulative)}'
+                    )
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def __label_set(labels: Dict[str, str]) -> LabelSet:
+        """ Builds the key of a series from its label values.
+
+        Args:
+            - labels (Dict[str, str]): The label values, by label name.
+
+        Returns:
+            - LabelSet: The label pairs, sorted by name.
+        """
+        return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+    @staticmethod
+    def __format_labels(labels: LabelSet) -> str:
+        """ Formats the labels of a series sample.
+
+        Args:
+            - labels (LabelSet): The label pairs.
+
+        Returns:
+            - str: The labels between braces, or an empty string if there are none.
+        """
+        if not labels:
+            return ''
+        pairs: List[str] = []
+        for name, value in labels:
+            escaped: str = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            pairs.append(f'{name}="{escaped}"')
+        return '{' + ','.join(pairs) + '}'
+
+    @staticmethod
+    def __format_value(value: float) -> str:
+        """ Formats the value of a series sample.
+
+        Args:
+            - value (float): The value.
+
+        Returns:
+            - str: The value, without decimals if it is integral.
+        """
+        if value.is_integer():
+            return str(int(value))
+        return repr(value)
@@ -0,0 +1,207 @@
+""" QueryProfiler class module.
+"""
+
+import logging
+import os
+import random
+import re
+import sys
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional
+
+# Statement shape -> [executions, total seconds, origin of the first execution]
+_CURRENT_PROFILE: ContextVar[Optional[Dict[str, List]]] = ContextVar(
+    'dms2223_query_profile', default=None
+)
+
+
+class QueryProfiler():
+    """ Records the SQL statements run while handling a sample of the requests.
+
+    Statements are grouped by shape (the statement with its literals and parameter lists
+    collapsed), and a shape run at least `n_plus_one_threshold` times in the same request is
+    reported as an N+1 pattern (e.g., a query per item of a listing), logged with the code line
+    that issued it. The latest reports are kept in memory.
+
+    Unsampled requests only cost a context variable lookup per statement.
+    """
+
+    __LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+    __LISTS = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+    __SPACES = re.compile(r'\s+')
+
+    def __init__(self, sample_rate: float = 1.0, n_plus_one_threshold: int = 5,
+                 max_reports: int = 100):
+        """ Constructor method.
+
+        Args:
+            - sample_rate (float): The fraction of the requests profiled (between 0 and 1).
+            - n_plus_one_threshold (int): Executions of the same statement shape in a request from
+              which it is reported as an N+1 pattern.
+            - max_reports (int): The number of latest reports kept.
+        """
+        self.__sample_rate: float = float(sample_rate)
+        self.__threshold: int = int(n_plus_one_threshold)
+        self.__reports: Deque[Dict[str, Any]] = deque(maxlen=max(1, int(max_reports)))
+        self.__lock: Lock = Lock()
+        self.__shapes: Dict[str, str] = {}
+
+    @staticmethod
+    def from_config(config: Dict) -> Optional['QueryProfiler']:
+        """ Creates a profiler from a configuration dictionary.
+
+        Args:
+            - config (Dict): A dictionary with the `sample_rate`, `n_plus_one_threshold` and
+              `max_reports` constructor arguments.
+
+        Returns:
+            - Optional[QueryProfiler]: The new profiler, or `None` if the sample rate is 0.
+        """
+        if config['sample_rate'] <= 0:
+            return None
+        return QueryProfiler(
+            config['sample_rate'], config['n_plus_one_threshold'], config['max_reports']
+        )
+
+    def instrument_engine(self, engine: Any) -> None:
+        """ Records the statements run by an SQLAlchemy engine.
+
+        Args:
+            - engine (Engine): The SQLAlchemy engine.
+        """
+        from sqlalchemy import event  # type: ignore  # pylint: disable=import-outside-toplevel
+        event.listen(engine, 'before_cursor_execute', QueryProfiler.__before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self.__after_cursor_execute)
+
+    def start(self) -> Optional[Token]:
+        """ Starts profiling the statements run in the current context, if it is sampled.
+
+        Returns:
+            - Optional[Token]: The token to pass to `stop`, or `None` if the request is not
+              sampled.
+        """
+        if self.__sample_rate < 1 and random.random() >= self.__sample_rate:
+            return None
+        return _CURRENT_PROFILE.set({})
+
+    def stop(self, token: Token, request: str) -> Dict[str, Any]:
+        """ Stops profiling, keeps the report and logs any N+1 pattern found.
+
+        Args:
+            - token (Token): The token returned by `start`.
+            - request (str): A description of the profiled request (e.g., its method and path).
+
+        Returns:
+            - Dict[str, Any]: The report, with the request (key `request`), when it finished (key
+              `time`, as a timestamp), the number of statements run (key `queries`), the time spent
+              running them (key `duration`, in seconds), every statement shape with its executions,
+              time and origin (key `statements`, most executed first), and the shapes reported as
+              N+1 patterns (key `n_plus_one`).
+        """
+        profile: Dict[str, List] = _CURRENT_PROFILE.get() or {}
+        _CURRENT_PROFILE.reset(token)
+        statements: List[Dict[str, Any]] = sorted((
+            {'statement': shape, 'count': count, 'duration': duration, 'origin': origin}
+            for shape, (count, duration, origin) in profile.items()
+        ), key=lambda statement: (-statement['count'], -statement['duration']))
+        n_plus_one: List[Dict[str, Any]] = [
+            statement for statement in statements if statement['count'] >= self.__threshold
+        ]
+        report: Dict[str, Any] = {
+            'request': request,
+            'time': time.time(),
+            'queries': sum(statement['count'] for statement in statements),
+            'duration': sum(statement['duration'] for statement in statements),
+            'statements': statements,
+            'n_plus_one': [statement['statement'] for statement in n_plus_one]
+        }
+        for statement in n_plus_one:
+            logging.warning(
+                'N+1 query pattern in %s: %d executions (%.1f ms) of %s, from %s',
+                request, statement['count'], statement['duration'] * 1000,
+                statement['statement'], statement['origin']
+            )
+        with self.__lock:
+            self.__reports.append(report)
+        return report
+
+    def get_reports(self, n_plus_one_only: bool = False) -> List[Dict[str, Any]]:
+        """ Gets the latest reports.
+
+        Args:
+            - n_plus_one_only (bool): Whether to get only the reports with N+1 patterns.
+
+        Returns:
+            - List[Dict[str, Any]]: The reports (see `stop`), most recent first.
+        """
+        with self.__lock:
+            reports: List[Dict[str, Any]] = list(reversed(self.__reports))
+        if n_plus_one_only:
+            return [report for report in reports if report['n_plus_one']]
+        return reports
+
+    def __shape(self, statement: str) -> str:
+        """ Gets the shape of a statement.
+
+        Args:
+            - statement (str): The SQL statement.
+
+        Returns:
+            - str: The statement in a single line, with its literals replaced by `?` and its
+              parameter lists collapsed to `(?)`.
+        """
+        shape: Optional[str] = self.__shapes.get(statement)
+        if shape is None:
+            shape = QueryProfiler.__SPACES.sub(' ', statement).strip()
+            shape = QueryProfiler.__LITERALS.sub('?', shape)
+            shape = QueryProfiler.__LISTS.sub('(?)', shape)
+            if len(self.__shapes) < 10000:
+                self.__shapes[statement] = shape
+        return shape
+
+    @staticmethod
+    def __origin() -> str:
+        """ Finds the lines of the service code that issued the statement being run.
+
+        Returns:
+            - str: The file name, line number and function of the three innermost frames of the
+              service code (innermost first), or `unknown` if there are none.
+        """
+        lines: List[str] = []
+        frame = sys._getframe(2)  # pylint: disable=protected-access
+        while frame is not None and len(lines) < 3:
+            path: str = frame.f_code.co_filename
+            if f'{os.sep}dms2223' in path and f'{os.sep}dms2223common{os.sep}' not in path:
+                lines.append(f'{os.path.basename(path)}:{frame.f_lineno} {frame.f_code.co_name}')
+            frame = frame.f_back
+        return ' < '.join(lines) or 'unknown'
+
+    @staticmethod
+    def __before_cursor_execute(  # pylint: disable=unused-argument,too-many-arguments
+        connection, cursor, statement, parameters, context, executemany
+    ) -> None:
+        """ Starts timing a statement, if the current request is profiled.
+        """
+        if context is not None and _CURRENT_PROFILE.get() is not None:
+            context.profiler_start = time.perf_counter()
+
+    def __after_cursor_execute(  # pylint: disable=unused-argument,too-many-arguments
+        self, connection, cursor, statement, parameters, context, executemany
+    ) -> None:
+        """ Records a statement, if the current request is profiled.
+        """
+        profile: Optional[Dict[str, List]] = _CURRENT_PROFILE.get()
+        start: Optional[float] = getattr(context, 'profiler_start', None)
+        if profile is None or start is None:
+            return
+        elapsed: float = time.perf_counter() - start
+        shape: str = self.__shape(statement)
+        entry: Optional[List] = profile.get(shape)
+        if entry is None:
+            profile[shape] = [1, elapsed, QueryProfiler.__origin()]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
@@ -0,0 +1,227 @@
+""" RestClient class module.
+"""
+
+import re
+import time
+from threading import Lock
+from typing import Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dms2223common.data.metrics import Metrics
+from dms2223common.data.tracing import Span, Tracer
+
+
+class RestClient():
+    """ Pooled HTTP client shared by the REST service clients.
+
+    Requests are sent through a single `requests.Session`, so connections to the service are kept
+    alive and reused from a bounded pool instead of being opened for every call. Idempotent
+    requests (`GET`, `HEAD`, `PUT`, `DELETE`, `OPTIONS`) are retried with exponential backoff
+    on connection errors and on `502`, `503` and `504` responses, and the latency of every
+    endpoint is accounted for.
+    """
+
+    __ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+    __USER_SEGMENT = re.compile(r'(/users?)/[^/]+')
+
+    def __init__(self,
+                 base_url: str,
+                 pool_size: int = 10,
+                 connect_timeout: float = 5,
+                 read_timeout: float = 60,
+                 retries: int = 3,
+                 backoff_factor: float = 0.2
+                 ):
+        """ Constructor method.
+
+        Args:
+            - base_url (str): The URL prepended to every request path.
+            - pool_size (int): The maximum number of connections kept alive to the service.
+            - connect_timeout (float): Seconds to wait for a connection to be established.
+            - read_timeout (float): Seconds to wait for the service to answer.
+            - retries (int): The maximum number of retries of an idempotent request.
+            - backoff_factor (float): Base of the exponential delay between retries, in seconds.
+        """
+        self.__base_url: str = base_url
+        self.__timeout = (float(connect_timeout), float(read_timeout))
+        retry: Retry = Retry(
+            total=int(retries),
+            backoff_factor=float(backoff_factor),
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS']),
+            raise_on_status=False
+        )
+        adapter: HTTPAdapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=int(pool_size), max_retries=retry
+        )
+        self.__session: requests.Session = requests.Session()
+        self.__session.mount('http://', adapter)
+        self.__session.mount('https://', adapter)
+        self.__stats: Dict[str, Dict] = {}
+        self.__stats_lock: Lock = Lock()
+        self.__metrics: Optional[Metrics] = None
+        self.__service: str = ''
+        self.__tracer: Optional[Tracer] = None
+        self.__tracer_service: str = ''
+
+    @staticmethod
+    def from_config(base_url: str, config: Optional[Dict] = None) -> 'RestClient':
+        """ Creates a client from a configuration dictionary.
+
+        Args:
+            - base_url (str): The URL prepended to every request path.
+            - config (Optional[Dict]): A dictionary with any of the constructor keyword
+              arguments (`pool_size`, `connect_timeout`, `read_timeout`, `retries` and
+              `backoff_factor`). Missing keys take their default values.
+
+        Returns:
+            - RestClient: The new client.
+        """
+        options: Dict = {
+            key: value for key, value in (config or {}).items()
+            if key in ('pool_size', 'connect_timeout', 'read_timeout', 'retries', 'backoff_factor')
+        }
+        return RestClient(base_url, **options)
+
+    def set_metrics(self, metrics: Metrics, service: str) -> None:
+        """ Records the latency of every request sent from now on in a metrics registry.
+
+        Requests are observed in the `http_client_request_duration_seconds` histogram and the
+        failed ones counted in `http_client_errors_total`, both labelled with the service name,
+        the method and the path template of the endpoint.
+
+        Args:
+            - metrics (Metrics): The metrics registry.
+            - service (str): The name of the service the client sends the requests to.
+        """
+        metrics.histogram(
+            'http_client_request_duration_seconds',
+            'Latency of the requests sent to other services.'
+        )
+        metrics.counter(
+            'http_client_errors_total',
+            'Requests sent to other services that raised or got a server error.'
+        )
+        self.__service = service
+        self.__metrics = metrics
+
+    def set_tracer(self, tracer: Tracer, service: str) -> None:
+        """ Records every request sent from now on as a client span, and propagates the trace
+        context to the service in the `traceparent` header.
+
+        Args:
+            - tracer (Tracer): The tracer of the calling service.
+            - service (str): The name of the service the client sends the requests to.
+        """
+        self.__tracer_service = service
+        self.__tracer = tracer
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """ Sends a request to the service.
+
+        Args:
+            - method (str): The HTTP method.
+            - path (str): The request path, relative to the base URL.
+            - **kwargs: Any other `requests` keyword arguments (`headers`, `json`, `params`...).
+
+        Returns:
+            - requests.Response: The service response.
+        """
+        kwargs.setdefault('timeout', self.__timeout)
+        template: str = RestClient.__USER_SEGMENT.sub(
+            r'\1/{username}', RestClient.__ID_SEGMENT.sub('/{id}', path.split('?', 1)[0])
+        )
+        tracer: Optional[Tracer] = self.__tracer
+        span: Optional[Span] = None
+        if tracer is not None:
+            span = tracer.start_span(f'{method.upper()} {template}', 'client', {
+                'peer.service': self.__tracer_service, 'http.url': self.__base_url + path
+            })
+            kwargs['headers'] = dict(kwargs.get('headers') or {}, **{
+                Tracer.HEADER: Tracer.traceparent(span)
+            })
+        start: float = time.perf_counter()
+        failed: bool = True
+        try:
+            response: requests.Response = self.__session.request(
+                method, self.__base_url + path, **kwargs
+            )
+            failed = response.status_code >= 500
+            if span is not None:
+                span.attributes['http.status_code'] = response.status_code
+            return response
+        finally:
+            self.__account(method.upper(), template, time.perf_counter() - start, failed)
+            if tracer is not None and span is not None:
+                span.error = failed
+                tracer.end_span(span)
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        """ Sends a GET request to the service. See `request`.
+        """
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        """ Sends a POST request to the service. See `request`.
+        """
+        return self.request('POST', path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> requests.Response:
+        """ Sends a PUT request to the service. See `request`.
+        """
+        return self.request('PUT', path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> requests.Response:
+        """ Sends a DELETE request to the service. See `request`.
+        """
+        return self.request('DELETE', path, **kwargs)
+
+    def __account(self, method: str, template: str, elapsed: float, failed: bool) -> None:
+        """ Accounts a finished request in the endpoint statistics and metrics.
+
+        Args:
+            - method (str): The request method.
+            - template (str): The path template of the request.
+            - elapsed (float): The request latency, in seconds.
+            - failed (bool): Whether the request raised or got a server error.
+        """
+        metrics: Optional[Metrics] = self.__metrics
+        if metrics is not None:
+            labels: Dict[str, str] = {
+                'service': self.__service, 'method': method, 'endpoint': template
+            }
+            metrics.observe('http_client_request_duration_seconds', elapsed, **labels)
+            if failed:
+                metrics.inc('http_client_errors_total', **labels)
+        endpoint: str = f'{method} {template}'
+        with self.__stats_lock:
+            stats: Dict = self.__stats.setdefault(
+                endpoint, {'count': 0, 'errors': 0, 'total_time': 0.0, 'max_time': 0.0}
+            )
+            stats['count'] += 1
+            stats['errors'] += int(failed)
+            stats['total_time'] += elapsed
+            stats['max_time'] = max(stats['max_time'], elapsed)
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """ Gets the latency statistics of every endpoint requested so far.
+
+        Numeric path segments are grouped as `{id}` and user names as `{username}`, so e.g. every
+        `GET /discussions/<n>` is accounted under `GET /discussions/{id}`.
+
+        Returns:
+            - Dict[str, Dict]: The number of requests (key `count`), of failed requests (key
+              `errors`), and the total, mean and maximum latencies in seconds (keys `total_time`,
+              `mean_time` and `max_time`) of each endpoint.
+        """
+        with self.__stats_lock:
+            return {
+                endpoint: dict(stats, mean_time=stats['total_time'] / stats['count'])
+                for endpoint, stats in self.__stats.items()
+            }
+
+    def close(self) -> None:
+        """ Closes the pooled connections.
+        """
+        self.__session.close()
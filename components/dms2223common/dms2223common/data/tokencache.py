@@ -0,0 +1,177 @@
+""" TokenCache class module.
+"""
+
+import base64
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+
+class TokenCache():
+    """ Bounded, thread-safe cache of user token validation results.
+
+    Entries are keyed by the SHA-256 hash of the token (the token itself is not stored) and hold
+    the owner's user name. Each entry is kept until the earliest of the token expiration and the
+    configured TTL, and the least recently used entries are evicted when the cache is full.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60):
+        """ Constructor method.
+
+        Args:
+            - max_size (int): The maximum number of entries. `0` disables the cache.
+            - ttl (float): The maximum number of seconds an entry is kept.
+        """
+        self.__max_size: int = max(0, int(max_size))
+        self.__ttl: float = float(ttl)
+        self.__entries: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self.__lock: Lock = Lock()
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    @staticmethod
+    def __key(token: str) -> str:
+        """ Computes the cache key of a token.
+
+        Args:
+            - token (str): The user token.
+
+        Returns:
+            - str: The hexadecimal SHA-256 digest of the token.
+        """
+        return hashlib.sha256(token.encode('UTF-8')).hexdigest()
+
+    @staticmethod
+    def token_claims(token: str) -> Optional[Dict]:
+        """ Reads the claims of a compact JWS token without verifying it.
+
+        Args:
+            - token (str): The user token.
+
+        Returns:
+            - Optional[Dict]: The claims, or `None` if they cannot be read.
+        """
+        try:
+            payload: str = token.split('.')[1]
+            payload += '=' * (-len(payload) % 4)
+            claims: Dict = json.loads(base64.urlsafe_b64decode(payload))
+            return claims if isinstance(claims, dict) else None
+        except Exception:  # pylint: disable=broad-except
+            return None
+
+    @staticmethod
+    def token_expiration(token: str) -> Optional[float]:
+        """ Reads the `exp` claim of a compact JWS token without verifying it.
+
+        Args:
+            - token (str): The user token.
+
+        Returns:
+            - Optional[float]: The expiration timestamp, or `None` if it cannot be read.
+        """
+        try:
+            return float((TokenCache.token_claims(token) or {})['exp'])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def get(self, token: Optional[str]) -> Optional[str]:
+        """ Looks up a token, counting the hit or miss.
+
+        Args:
+            - token (Optional[str]): The user token.
+
+        Returns:
+            - Optional[str]: The user name of a valid cached token, or `None` on a miss.
+        """
+        if not token:
+            return None
+        key: str = TokenCache.__key(token)
+        with self.__lock:
+            entry: Optional[Tuple[str, float]] = self.__entries.get(key)
+            if entry is not None and entry[1] <= time.time():
+                del self.__entries[key]
+                entry = None
+            if entry is None:
+                self.__misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return entry[0]
+
+    def put(self, token: Optional[str], user: str, exp: Optional[float] = None) -> None:
+        """ Remembers a token as valid.
+
+        Args:
+            - token (Optional[str]): The user token.
+            - user (str): The user name of the token owner.
+            - exp (Optional[float]): The token expiration timestamp. If `None`, it is read from
+              the token.
+        """
+        if not token or self.__max_size == 0:
+            return
+        if exp is None:
+            exp = TokenCache.token_expiration(token)
+        expires_at: float = time.time() + self.__ttl
+        if exp is not None:
+            expires_at = min(expires_at, exp)
+        if expires_at <= time.time():
+            return
+        key: str = TokenCache.__key(token)
+        with self.__lock:
+            self.__entries[key] = (user, expires_at)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, token: Optional[str]) -> bool:
+        """ Forgets a token.
+
+        Args:
+            - token (Optional[str]): The user token.
+
+        Returns:
+            - bool: `True` if the token was cached; `False` otherwise.
+        """
+        if not token:
+            return False
+        with self.__lock:
+            return self.__entries.pop(TokenCache.__key(token), None) is not None
+
+    def invalidate_user(self, user: str) -> int:
+        """ Forgets every token of a user.
+
+        Args:
+            - user (str): The user name.
+
+        Returns:
+            - int: The number of tokens forgotten.
+        """
+        with self.__lock:
+            keys = [key for key, entry in self.__entries.items() if entry[0] == user]
+            for key in keys:
+                del self.__entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """ Forgets every token.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def get_stats(self) -> Dict:
+        """ Gets the cache usage statistics.
+
+        Returns:
+            - Dict: A dictionary with the number of entries (key `size`), the maximum number of
+              entries (key `max_size`), and the hit and miss counters (keys `hits` and `misses`).
+        """
+        with self.__lock:
+            return {
+                'size': len(self.__entries),
+                'max_size': self.__max_size,
+                'hits': self.__hits,
+                'misses': self.__misses
+            }
@@ -0,0 +1,8 @@
+""" Request tracing classes.
+"""
+
+from .span import Span
+from .spanexporter import SpanExporter
+from .filespanexporter import FileSpanExporter
+from .memoryspanexporter import MemorySpanExporter
+from .tracer import Tracer
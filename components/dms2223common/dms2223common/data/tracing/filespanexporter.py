@@ -0,0 +1,38 @@
+""" FileSpanExporter class module.
+"""
+
+import json
+from threading import Lock
+from typing import BinaryIO, Optional
+from dms2223common.data.tracing.span import Span
+from dms2223common.data.tracing.spanexporter import SpanExporter
+
+
+class FileSpanExporter(SpanExporter):
+    """ Appends the finished spans to a file, one JSON object per line.
+
+    Every span is written with a single unbuffered append, so several processes (e.g., the workers
+    of a service, or several services) can share the same file.
+    """
+
+    def __init__(self, path: str):
+        """ Constructor method.
+
+        Args:
+            - path (str): The path of the file.
+        """
+        self.__path: str = path
+        self.__file: Optional[BinaryIO] = None
+        self.__lock: Lock = Lock()
+
+    def export(self, span: Span) -> None:
+        """ Writes a finished span.
+
+        Args:
+            - span (Span): The span.
+        """
+        line: bytes = (json.dumps(span.to_json(), default=str) + '\n').encode('UTF-8')
+        with self.__lock:
+            if self.__file is None:
+                self.__file = open(self.__path, 'ab', buffering=0)  # pylint: disable=consider-using-with
+            self.__file.write(line)
@@ -0,0 +1,61 @@
+""" MemorySpanExporter class module.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, List
+from dms2223common.data.tracing.span import Span
+from dms2223common.data.tracing.spanexporter import SpanExporter
+
+
+class MemorySpanExporter(SpanExporter):
+    """ In-process collector keeping the spans of the most recent traces.
+
+    When the maximum number of traces is reached, the spans of the least recently updated trace
+    are discarded.
+    """
+
+    def __init__(self, max_traces: int = 1000):
+        """ Constructor method.
+
+        Args:
+            - max_traces (int): The maximum number of traces kept.
+        """
+        self.__max_traces: int = max(1, int(max_traces))
+        self.__traces: OrderedDict[str, List[Span]] = OrderedDict()
+        self.__lock: Lock = Lock()
+
+    def export(self, span: Span) -> None:
+        """ Keeps a finished span.
+
+        Args:
+            - span (Span): The span.
+        """
+        with self.__lock:
+            self.__traces.setdefault(span.trace_id, []).append(span)
+            self.__traces.move_to_end(span.trace_id)
+            while len(self.__traces) > self.__max_traces:
+                self.__traces.popitem(last=False)
+
+    def get_trace(self, trace_id: str) -> List[Dict[str, Any]]:
+        """ Gets the spans of a trace kept by the collector.
+
+        Args:
+            - trace_id (str): The trace id.
+
+        Returns:
+            - List[Dict[str, Any]]: The spans (see `Span.to_json`), in order of start time. The list
+              is empty if the trace is unknown or was discarded.
+        """
+        with self.__lock:
+            spans: List[Span] = list(self.__traces.get(trace_id, []))
+        return [span.to_json() for span in sorted(spans, key=lambda span: span.start_time)]
+
+    def get_trace_ids(self) -> List[str]:
+        """ Gets the ids of the traces kept by the collector.
+
+        Returns:
+            - List[str]: The trace ids, most recently updated first.
+        """
+        with self.__lock:
+            return list(reversed(self.__traces.keys()))
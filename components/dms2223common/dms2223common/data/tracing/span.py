@@ -0,0 +1,67 @@
+""" Span class module.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+
+class Span():
+    """ A timed operation (a request handled, a query run, a call sent...) within a trace.
+
+    Spans are identified by the id of their trace (32 hexadecimal digits) and their own id (16
+    hexadecimal digits), and reference their parent span, if any, so the spans of a trace form a
+    tree, even if recorded by different services.
+    """
+
+    def __init__(self, trace_id: str, span_id: str, parent_id: Optional[str], name: str,
+                 kind: str, service: str, attributes: Optional[Dict[str, Any]] = None):
+        """ Constructor method.
+
+        Starts the span.
+
+        Args:
+            - trace_id (str): The trace id.
+            - span_id (str): The span id.
+            - parent_id (Optional[str]): The id of the parent span, or `None` for a root span.
+            - name (str): The name of the operation.
+            - kind (str): The kind of operation (`server`, `client`, `db` or `internal`).
+            - service (str): The name of the service recording the span.
+            - attributes (Optional[Dict[str, Any]]): Details of the operation.
+        """
+        self.trace_id: str = trace_id
+        self.span_id: str = span_id
+        self.parent_id: Optional[str] = parent_id
+        self.name: str = name
+        self.kind: str = kind
+        self.service: str = service
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.error: bool = False
+        self.start_time: float = time.time()
+        self.duration: Optional[float] = None
+        self.__start: float = time.perf_counter()
+
+    def end(self) -> None:
+        """ Ends the span, fixing its duration.
+        """
+        if self.duration is None:
+            self.duration = time.perf_counter() - self.__start
+
+    def to_json(self) -> Dict[str, Any]:
+        """ Gets a dictionary representation of the span.
+
+        Returns:
+            - Dict[str, Any]: The span ids, name, kind, service, start timestamp and duration (in
+              seconds), attributes and error flag.
+        """
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'kind': self.kind,
+            'service': self.service,
+            'start_time': self.start_time,
+            'duration': self.duration,
+            'attributes': self.attributes,
+            'error': self.error
+        }
@@ -0,0 +1,20 @@
+""" SpanExporter class module.
+"""
+
+from dms2223common.data.tracing.span import Span
+
+
+class SpanExporter():
+    """ Base class of the destinations of the finished spans.
+    """
+
+    def export(self, span: Span) -> None:
+        """ Exports a finished span.
+
+        Args:
+            - span (Span): The span.
+
+        Raises:
+            - NotImplementedError: If the subclass does not implement it.
+        """
+        raise NotImplementedError()
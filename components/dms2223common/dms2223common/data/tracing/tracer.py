@@ -0,0 +1,186 @@
+""" Tracer class module.
+"""
+
+import re
+import secrets
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Iterator, Optional, Tuple
+from dms2223common.data.tracing.filespanexporter import FileSpanExporter
+from dms2223common.data.tracing.memoryspanexporter import MemorySpanExporter
+from dms2223common.data.tracing.span import Span
+from dms2223common.data.tracing.spanexporter import SpanExporter
+
+_CURRENT_SPAN: ContextVar[Optional[Span]] = ContextVar('dms2223_current_span', default=None)
+
+
+class Tracer():
+    """ Records the spans of a service and propagates the trace context to other services.
+
+    The trace context travels between services in the W3C `traceparent` header
+    (`00-<trace id>-<parent span id>-<flags>`). Within a service, the active span is kept in a
+    context variable, so it is local to the thread (or greenlet) handling the request; new spans
+    are children of the active one.
+    """
+
+    HEADER: str = 'traceparent'
+    __TRACEPARENT = re.compile(r'^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$')
+
+    def __init__(self, service: str, exporter: Optional[SpanExporter] = None):
+        """ Constructor method.
+
+        Args:
+            - service (str): The name of the service recording the spans.
+            - exporter (Optional[SpanExporter]): The destination of the finished spans. If
+              `None`, spans are still created (so the trace context is propagated) but discarded.
+        """
+        self.__service: str = service
+        self.__exporter: Optional[SpanExporter] = exporter
+
+    @staticmethod
+    def from_config(service: str, config: Dict) -> 'Tracer':
+        """ Creates a tracer from a configuration dictionary.
+
+        Args:
+            - service (str): The name of the service recording the spans.
+            - config (Dict): The tracing configuration (see `ServiceConfiguration.set_tracing`).
+
+        Returns:
+            - Tracer: The new tracer.
+        """
+        exporter: Optional[SpanExporter] = None
+        if config['exporter'] == 'memory':
+            exporter = MemorySpanExporter(config['max_traces'])
+        elif config['exporter'] == 'file':
+            exporter = FileSpanExporter(config['file'])
+        return Tracer(service, exporter)
+
+    def get_exporter(self) -> Optional[SpanExporter]:
+        """ Gets the destination of the finished spans.
+
+        Returns:
+            - Optional[SpanExporter]: The span exporter, if any.
+        """
+        return self.__exporter
+
+    @staticmethod
+    def current_span() -> Optional[Span]:
+        """ Gets the active span.
+
+        Returns:
+            - Optional[Span]: The active span, or `None` if there is none.
+        """
+        return _CURRENT_SPAN.get()
+
+    @staticmethod
+    def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str]]:
+        """ Reads a `traceparent` header.
+
+        Args:
+            - header (Optional[str]): The header value.
+
+        Returns:
+            - Optional[Tuple[str, str]]: The trace id and the parent span id, or `None` if the
+              header is missing or malformed.
+        """
+        match = Tracer.__TRACEPARENT.match((header or '').strip().lower())
+        if match is None or set(match.group(1)) == {'0'} or set(match.group(2)) == {'0'}:
+            return None
+        return match.group(1), match.group(2)
+
+    @staticmethod
+    def traceparent(span: Span) -> str:
+        """ Builds the `traceparent` header propagating a span as the parent of remote spans.
+
+        Args:
+            - span (Span): The parent span.
+
+        Returns:
+            - str: The header value.
+        """
+        return f'00-{span.trace_id}-{span.span_id}-01'
+
+    def start_span(self, name: str, kind: str = 'internal',
+                   attributes: Optional[Dict[str, Any]] = None,
+                   remote_parent: Optional[Tuple[str, str]] = None) -> Span:
+        """ Starts a span, without activating it.
+
+        Args:
+            - name (str): The name of the operation.
+            - kind (str): The kind of operation (`server`, `client`, `db` or `internal`).
+            - attributes (Optional[Dict[str, Any]]): Details of the operation.
+            - remote_parent (Optional[Tuple[str, str]]): The trace id and parent span id received
+              from another service (see `parse_traceparent`). If `None`, the span is a child of
+              the active span, or the root of a new trace if there is none.
+
+        Returns:
+            - Span: The started span.
+        """
+        trace_id: str
+        parent_id: Optional[str]
+        if remote_parent is not None:
+            trace_id, parent_id = remote_parent
+        else:
+            parent: Optional[Span] = _CURRENT_SPAN.get()
+            if parent is not None:
+                trace_id, parent_id = parent.trace_id, parent.span_id
+            else:
+                trace_id, parent_id = secrets.token_hex(16), None
+        return Span(
+            trace_id, secrets.token_hex(8), parent_id, name, kind, self.__service, attributes
+        )
+
+    @staticmethod
+    def activate(span: Span) -> Token:
+        """ Makes a span the active one.
+
+        Args:
+            - span (Span): The span.
+
+        Returns:
+            - Token: The token to restore the previously active span with `deactivate`.
+        """
+        return _CURRENT_SPAN.set(span)
+
+    @staticmethod
+    def deactivate(token: Token) -> None:
+        """ Restores the span that was active before an `activate` call.
+
+        Args:
+            - token (Token): The token returned by `activate`.
+        """
+        _CURRENT_SPAN.reset(token)
+
+    def end_span(self, span: Span) -> None:
+        """ Ends a span and exports it.
+
+        Args:
+            - span (Span): The span.
+        """
+        span.end()
+        if self.__exporter is not None:
+            self.__exporter.export(span)
+
+    @contextmanager
+    def span(self, name: str, kind: str = 'internal',
+             attributes: Optional[Dict[str, Any]] = None) -> Iterator[Span]:
+        """ Records a block of code as an active span, flagged as an error if it raises.
+
+        Args:
+            - name (str): The name of the operation.
+            - kind (str): The kind of operation.
+            - attributes (Optional[Dict[str, Any]]): Details of the operation.
+
+        Yields:
+            - Span: The span.
+        """
+        span: Span = self.start_span(name, kind, attributes)
+        token: Token = Tracer.activate(span)
+        try:
+            yield span
+        except BaseException:
+            span.error = True
+            raise
+        finally:
+            Tracer.deactivate(token)
+            self.end_span(span)
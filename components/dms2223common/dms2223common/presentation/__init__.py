@@ -0,0 +1,6 @@
+""" Common presentation layer modules to be used by the different services.
+"""
+
+from .fastjsonprovider import FastJSONProvider
+from .instrumentation import Instrumentation
+from .wsgiserver import WSGIServer
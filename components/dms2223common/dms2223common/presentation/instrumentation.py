@@ -0,0 +1,332 @@
+""" Instrumentation class module.
+"""
+
+import threading
+import time
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+from flask import Flask, Response, has_request_context, jsonify, request
+from dms2223common.data.metrics import Metrics
+from dms2223common.data.queryprofiler import QueryProfiler
+from dms2223common.data.tracing import MemorySpanExporter, Span, Tracer
+
+
+class Instrumentation():
+    """ Collects the request metrics of a service Flask application and exposes them.
+
+    Once installed in an application, every request is counted (by method, route template and
+    status code), its latency observed and the requests being handled tracked. The database
+    queries run by the engines given to `instrument_engine` are timed too, both on their own and
+    accumulated per request. All the metrics are served in the Prometheus text exposition format
+    by a `/metrics` endpoint.
+
+    With a tracer, every request is also recorded as a server span (continuing the trace of the
+    caller if it sent a `traceparent` header), with a child span per database query, and its trace
+    id is returned in the `X-Trace-Id` response header. If the tracer keeps the spans in memory,
+    those of a trace are served by a `/traces/<trace id>` endpoint.
+
+    With a query profiler, the SQL statements of the sampled requests are profiled; their summary
+    is returned in the `X-Query-Profile` response header, and the latest reports are served by a
+    `/debug/queries` endpoint.
+    """
+
+    QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+    # The accounting state of a request is kept in its WSGI environment, as the handlers may
+    # push their own application contexts (and thus use another `g`)
+    __ENVIRON_KEY: str = 'dms2223common.instrumentation'
+
+    def __init__(self, metrics: Optional[Metrics] = None, tracer: Optional[Tracer] = None,
+                 profiler: Optional[QueryProfiler] = None):
+        """ Constructor method.
+
+        Args:
+            - metrics (Optional[Metrics]): The registry where the metrics are recorded. If `None`,
+              a new one is created.
+            - tracer (Optional[Tracer]): The tracer recording the request spans, if any.
+            - profiler (Optional[QueryProfiler]): The profiler of the SQL statements run by the
+              requests, if any.
+        """
+        self.__metrics: Metrics = metrics if metrics is not None else Metrics()
+        self.__tracer: Optional[Tracer] = tracer
+        self.__profiler: Optional[QueryProfiler] = profiler
+        self.__metrics.counter('http_requests_total', 'Requests handled.')
+        self.__metrics.histogram('http_request_duration_seconds', 'Latency of the requests.')
+        self.__metrics.gauge('http_requests_in_flight', 'Requests being handled.')
+        self.__metrics.histogram(
+            'http_request_db_queries', 'Database queries run per request.',
+            buckets=Instrumentation.QUERY_COUNT_BUCKETS
+        )
+        self.__metrics.histogram(
+            'http_request_db_duration_seconds', 'Time spent in database queries per request.'
+        )
+        self.__metrics.histogram('db_query_duration_seconds', 'Latency of the database queries.')
+
+    def get_metrics(self) -> Metrics:
+        """ Gets the metrics registry.
+
+        Returns:
+            - Metrics: The registry where the metrics are recorded.
+        """
+        return self.__metrics
+
+    def get_tracer(self) -> Optional[Tracer]:
+        """ Gets the tracer.
+
+        Returns:
+            - Optional[Tracer]: The tracer recording the request spans, if any.
+        """
+        return self.__tracer
+
+    def install(self, app: Flask, path: str = '/metrics') -> None:
+        """ Instruments the requests handled by an application and adds the metrics endpoint.
+
+        Args:
+            - app (Flask): The Flask application.
+            - path (str): The path of the metrics endpoint.
+        """
+        app.before_request(self.__before_request)
+        app.after_request(self.__after_request)
+        app.teardown_request(self.__teardown_request)
+        app.add_url_rule(path, 'metrics', self.__get_metrics, methods=['GET'])
+        if self.__tracer is not None and isinstance(
+                self.__tracer.get_exporter(), MemorySpanExporter):
+            app.add_url_rule('/traces/<trace_id>', 'trace', self.__get_trace, methods=['GET'])
+        if self.__profiler is not None:
+            app.add_url_rule('/debug/queries', 'debug_queries', self.__get_queries, methods=['GET'])
+
+    def instrument_engine(self, engine: Any) -> None:
+        """ Times the queries run by an SQLAlchemy engine.
+
+        Args:
+            - engine (Engine): The SQLAlchemy engine.
+        """
+        from sqlalchemy import event  # type: ignore  # pylint: disable=import-outside-toplevel
+        event.listen(engine, 'before_cursor_execute', self.__before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self.__after_cursor_execute)
+        event.listen(engine, 'handle_error', self.__handle_error)
+
+    @staticmethod
+    def __operation(statement: str) -> str:
+        """ Gets the operation of an SQL statement.
+
+        Args:
+            - statement (str): The SQL statement.
+
+        Returns:
+            - str: The first keyword of the statement (e.g., `SELECT`), in upper case.
+        """
+        words: List[str] = statement.split(None, 1)
+        return words[0].upper() if words else ''
+
+    @staticmethod
+    def __route() -> str:
+        """ Gets the route template of the current request.
+
+        Returns:
+            - str: The URL rule matched by the request, or `<unmatched>` if none did.
+        """
+        return request.url_rule.rule if request.url_rule is not None else '<unmatched>'
+
+    def __before_request(self) -> None:
+        """ Starts accounting a request.
+        """
+        route: str = Instrumentation.__route()
+        state: Dict[str, Any] = {
+            'start': time.perf_counter(), 'status': None, 'db_queries': 0, 'db_time': 0.0,
+            'span': None, 'token': None, 'profile': None, 'thread': threading.get_ident()
+        }
+        request.environ[Instrumentation.__ENVIRON_KEY] = state
+        self.__metrics.add('http_requests_in_flight', 1, method=request.method, route=route)
+        if self.__tracer is not None:
+            span: Span = self.__tracer.start_span(
+                f'{request.method} {route}', 'server',
+                {
+                    'http.method': request.method, 'http.route': route,
+                    'http.target': request.full_path
+                },
+                remote_parent=Tracer.parse_traceparent(request.headers.get(Tracer.HEADER))
+            )
+            state['span'] = span
+            state['token'] = Tracer.activate(span)
+        if self.__profiler is not None:
+            state['profile'] = self.__profiler.start()
+
+    @staticmethod
+    def __state() -> Optional[Dict[str, Any]]:
+        """ Gets the accounting state of the current request.
+
+        Returns:
+            - Optional[Dict[str, Any]]: The state, or `None` if the request is not accounted for.
+        """
+        return request.environ.get(Instrumentation.__ENVIRON_KEY)
+
+    def __after_request(self, response: Response) -> Response:
+        """ Remembers the status code of a request response.
+
+        Args:
+            - response (Response): The response to be sent.
+
+        Returns:
+            - Response: The same response.
+        """
+        state: Optional[Dict[str, Any]] = Instrumentation.__state()
+        if state is not None:
+            state['status'] = response.status_code
+            if state['span'] is not None:
+                response.headers['X-Trace-Id'] = state['span'].trace_id
+            report: Optional[Dict[str, Any]] = self.__stop_profile(state)
+            if report is not None:
+                response.headers['X-Query-Profile'] = (
+                    f'queries={report["queries"]}; duration={report["duration"] * 1000:.1f}ms; '
+                    f'n_plus_one={len(report["n_plus_one"])}'
+                )
+        return response
+
+    def __stop_profile(self, state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """ Stops profiling the SQL statements of a request, if it was sampled.
+
+        Args:
+            - state (Dict[str, Any]): The accounting state of the request.
+
+        Returns:
+            - Optional[Dict[str, Any]]: The profiler report, or `None` if the request was not
+              being profiled.
+        """
+        if self.__profiler is None or state['profile'] is None:
+            return None
+        report: Dict[str, Any] = self.__profiler.stop(
+            state['profile'], f'{request.method} {request.full_path}'
+        )
+        state['profile'] = None
+        return report
+
+    def __teardown_request(self, exception: Optional[BaseException]) -> None:
+        """ Finishes accounting a request.
+
+        Args:
+            - exception (Optional[BaseException]): The exception that aborted the request, if any.
+        """
+        state: Optional[Dict[str, Any]] = Instrumentation.__state()
+        if state is None or state['thread'] != threading.get_ident():
+            # The request failed before being accounted for, or this is the teardown of a copy of
+            # its context (e.g., one of the frontend fan-out calls)
+            return
+        del request.environ[Instrumentation.__ENVIRON_KEY]
+        # Requests aborted by an exception skip the `after_request` handlers
+        self.__stop_profile(state)
+        method: str = request.method
+        route: str = Instrumentation.__route()
+        status: int = state['status'] or (500 if exception is not None else 200)
+        self.__metrics.add('http_requests_in_flight', -1, method=method, route=route)
+        self.__metrics.inc('http_requests_total', method=method, route=route, status=str(status))
+        self.__metrics.observe(
+            'http_request_duration_seconds', time.perf_counter() - state['start'],
+            method=method, route=route
+        )
+        self.__metrics.observe(
+            'http_request_db_queries', state['db_queries'], method=method, route=route
+        )
+        self.__metrics.observe(
+            'http_request_db_duration_seconds', state['db_time'], method=method, route=route
+        )
+        span: Optional[Span] = state['span']
+        if self.__tracer is not None and span is not None:
+            Tracer.deactivate(state['token'])
+            span.attributes['http.status_code'] = status
+            span.attributes['db.queries'] = state['db_queries']
+            span.error = status >= 500
+            self.__tracer.end_span(span)
+
+    def __get_metrics(self) -> Response:
+        """ Handles the GET requests to the metrics endpoint.
+
+        Returns:
+            - Response: The metrics, in the Prometheus text exposition format.
+        """
+        return Response(
+            self.__metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8'
+        )
+
+    def __get_trace(self, trace_id: str) -> Tuple[Response, int]:
+        """ Handles the GET requests to the trace endpoint.
+
+        Args:
+            - trace_id (str): The trace id.
+
+        Returns:
+            - Tuple[Response, int]: The spans of the trace recorded by this service, in JSON
+              format, and a 200 status code, or a 404 status code if there are none.
+        """
+        exporter = self.__tracer.get_exporter() if self.__tracer is not None else None
+        spans: List[Dict[str, Any]] = (
+            exporter.get_trace(trace_id) if isinstance(exporter, MemorySpanExporter) else []
+        )
+        if not spans:
+            return (jsonify([]), HTTPStatus.NOT_FOUND.value)
+        return (jsonify(spans), HTTPStatus.OK.value)
+
+    def __get_queries(self) -> Tuple[Response, int]:
+        """ Handles the GET requests to the query profiler endpoint.
+
+        Only the reports with N+1 patterns are listed if the `n_plus_one` query parameter is
+        true.
+
+        Returns:
+            - Tuple[Response, int]: The latest profiler reports, in JSON format, and a 200 status
+              code.
+        """
+        n_plus_one_only: bool = request.args.get('n_plus_one', default='false').lower() in (
+            'true', '1', 'yes'
+        )
+        reports: List[Dict[str, Any]] = (
+            self.__profiler.get_reports(n_plus_one_only) if self.__profiler is not None else []
+        )
+        return (jsonify(reports), HTTPStatus.OK.value)
+
+    def __before_cursor_execute(  # pylint: disable=unused-argument,too-many-arguments
+        self, connection, cursor, statement, parameters, context, executemany
+    ) -> None:
+        """ Starts timing a database query.
+        """
+        if context is None:
+            return
+        context.metrics_start = time.perf_counter()
+        context.metrics_span = None
+        if self.__tracer is not None and Tracer.current_span() is not None:
+            context.metrics_span = self.__tracer.start_span(
+                f'{Instrumentation.__operation(statement)} query', 'db',
+                {'db.system': connection.dialect.name, 'db.statement': statement[:1000]}
+            )
+
+    def __after_cursor_execute(  # pylint: disable=unused-argument,too-many-arguments
+        self, connection, cursor, statement, parameters, context, executemany
+    ) -> None:
+        """ Finishes timing a database query.
+        """
+        start: Optional[float] = getattr(context, 'metrics_start', None)
+        if start is None:
+            return
+        elapsed: float = time.perf_counter() - start
+        self.__metrics.observe(
+            'db_query_duration_seconds', elapsed, operation=Instrumentation.__operation(statement)
+        )
+        span: Optional[Span] = getattr(context, 'metrics_span', None)
+        if self.__tracer is not None and span is not None:
+            self.__tracer.end_span(span)
+        state: Optional[Dict[str, Any]] = (
+            Instrumentation.__state() if has_request_context() else None
+        )
+        if state is not None:
+            state['db_queries'] += 1
+            state['db_time'] += elapsed
+
+    def __handle_error(self, exception_context) -> None:
+        """ Finishes the span of a failed database query.
+
+        Args:
+            - exception_context (ExceptionContext): The details of the failure.
+        """
+        span: Optional[Span] = getattr(exception_context.execution_context, 'metrics_span', None)
+        if self.__tracer is not None and span is not None:
+            span.error = True
+            self.__tracer.end_span(span)
@@ -0,0 +1,94 @@
+""" WSGIServer class module.
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+
+class WSGIServer():
+    """ Production multi-process server for the WSGI applications of the services.
+
+    Runs the application with Gunicorn (an optional dependency, installed with the `wsgi` extra):
+    a master process forks a configurable number of worker processes, each one handling requests
+    with a pool of threads. The application (including the connexion specification) is loaded
+    once in the master before forking, so the workers share it and start quickly.
+
+    In `async` mode the workers are Gevent based instead: sockets and thread-local storage are
+    made cooperative, so each worker can hold a large number of concurrent requests while they
+    wait for the network (e.g., the calls to other services), with the same synchronous code.
+
+    Workers are recycled after a configurable number of requests. Sending `SIGHUP` to the master
+    gracefully replaces every worker, and `SIGTERM` shuts the server down after the in-flight
+    requests finish.
+    """
+
+    def __init__(self, application: Callable, host: str, port: int, server: Dict,
+                 worker_init: Optional[Callable[[], None]] = None):
+        """ Constructor method.
+
+        Args:
+            - application (Callable): The WSGI application.
+            - host (str): The host to bind to.
+            - port (int): The port to bind to.
+            - server (Dict): The server configuration (see `ServiceConfiguration.set_server`).
+            - worker_init (Optional[Callable[[], None]]): A function run in every worker process
+              once it is initialized, before it handles any request (e.g., to discard the
+              database connections inherited from the master). In `async` mode it runs after
+              Gevent patched the standard library, so the thread-local objects it creates are
+              local to each greenlet.
+        """
+        self.__application: Callable = application
+        self.__options: Dict[str, Any] = {
+            'bind': f'{host}:{port}',
+            'workers': server['workers'],
+            'max_requests': server['max_requests'],
+            'max_requests_jitter': server['max_requests_jitter'],
+            'timeout': server['timeout'],
+            'graceful_timeout': server['graceful_timeout'],
+            'preload_app': True
+        }
+        if server['mode'] == 'async':
+            self.__options['worker_class'] = 'gevent'
+            self.__options['worker_connections'] = server['worker_connections']
+        else:
+            self.__options['worker_class'] = 'gthread'
+            self.__options['threads'] = server['threads']
+        if worker_init is not None:
+            # Gevent workers patch the standard library after post_fork, so use post_worker_init
+            self.__options['post_worker_init'] = lambda worker: worker_init()
+
+    def get_options(self) -> Dict[str, Any]:
+        """ Gets the Gunicorn settings the server will run with.
+
+        Returns:
+            - Dict[str, Any]: A dictionary of Gunicorn settings.
+        """
+        return dict(self.__options)
+
+    def run(self) -> None:
+        """ Runs the server until it is shut down.
+
+        Raises:
+            - RuntimeError: If Gunicorn (or Gevent, in `async` mode) is not installed.
+        """
+        try:
+            from gunicorn.app.base import BaseApplication  # type: ignore  # pylint: disable=import-outside-toplevel
+            if self.__options['worker_class'] == 'gevent':
+                import gevent  # type: ignore  # pylint: disable=import-outside-toplevel,unused-import
+        except ImportError as ex:
+            raise RuntimeError(
+                'The wsgi and async server modes require Gunicorn (install the "wsgi" extra), '
+                'and the async one also Gevent (install the "async" extra)'
+            ) from ex
+
+        application: Callable = self.__application
+        options: Dict[str, Any] = self.__options
+
+        class _Application(BaseApplication):  # pylint: disable=abstract-method
+            def load_config(self):
+                for key, value in options.items():
+                    self.cfg.set(key, value)
+
+            def load(self):
+                return application
+
+        _Application().run()
@@ -38,6 +38,12 @@ class FrontendConfiguration(ServiceConfiguration):
             'port': 5000,
             'apikey_secret': 'This is another frontend API key'
         })
+        self.set_token_cache({
+            'size': 1024,
+            'ttl': 60
+        })
+        self.set_session_renewal_window(900)
+        self.set_fan_out_deadline(10)
 
     def _set_values(self, values: Dict) -> None:
         """Sets/merges a collection of configuration values.
@@ -53,6 +59,12 @@ class FrontendConfiguration(ServiceConfiguration):
             self.set_auth_service(values['auth_service'])
         if 'backend_service' in values:
             self.set_backend_service(values['backend_service'])
+        if 'token_cache' in values:
+            self.set_token_cache(values['token_cache'])
+        if 'session_renewal_window' in values:
+            self.set_session_renewal_window(values['session_renewal_window'])
+        if 'fan_out_deadline' in values:
+            self.set_fan_out_deadline(values['fan_out_deadline'])
 
     def set_app_secret_key(self, app_secret_key: str) -> None:
         """ Sets the app_secret_key configuration value.
@@ -113,3 +125,75 @@ class FrontendConfiguration(ServiceConfiguration):
         """
 
         return self._values['backend_service']
+
+    def set_token_cache(self, token_cache: Dict) -> None:
+        """Sets the parameters of the cache of tokens validated against the authentication service.
+
+        Args:
+            token_cache (Dict): The maximum number of cached tokens (key `size`) and the maximum
+              number of seconds a token is cached (key `ttl`).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['token_cache'] = {
+            'size': int(token_cache.get('size', 1024)),
+            'ttl': float(token_cache.get('ttl', 60))
+        }
+
+    def get_token_cache(self) -> Dict:
+        """ Gets the token cache configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of token_cache.
+        """
+
+        return self._values['token_cache']
+
+    def set_session_renewal_window(self, window: int) -> None:
+        """ Sets the number of seconds before their expiration from which session tokens are
+        renewed.
+
+        Args:
+            - window: An integer with the configuration value.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if int(window) < 0:
+            raise ValueError(f'Invalid session renewal window {window}')
+        self._values['session_renewal_window'] = int(window)
+
+    def get_session_renewal_window(self) -> int:
+        """ Gets the number of seconds before their expiration from which session tokens are
+        renewed.
+
+        Returns:
+            - int: An integer with the value of session_renewal_window.
+        """
+
+        return int(self._values['session_renewal_window'])
+
+    def set_fan_out_deadline(self, deadline: float) -> None:
+        """ Sets the maximum number of seconds a page waits for the backend calls it runs
+        concurrently.
+
+        Args:
+            - deadline: A positive number with the configuration value.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if float(deadline) <= 0:
+            raise ValueError(f'Invalid fan-out deadline {deadline}')
+        self._values['fan_out_deadline'] = float(deadline)
+
+    def get_fan_out_deadline(self) -> float:
+        """ Gets the maximum number of seconds a page waits for the backend calls it runs
+        concurrently.
+
+        Returns:
+            - float: A number with the value of fan_out_deadline.
+        """
+
+        return float(self._values['fan_out_deadline'])
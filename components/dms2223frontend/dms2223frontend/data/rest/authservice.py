@@ -1,10 +1,11 @@
 """ AuthService class module.
 """
 
-from typing import List, Optional, Union
+from http import HTTPStatus
+from typing import Dict, List, Optional, Union
 import requests
-from dms2223common.data import Role
-from dms2223common.data.rest import ResponseData
+from dms2223common.data import Role, TokenCache
+from dms2223common.data.rest import ResponseData, RestClient
 
 
 class AuthService():
@@ -15,7 +16,10 @@ class AuthService():
                  host: str, port: int,
                  api_base_path: str = '/api/v1',
                  apikey_header: str = 'X-ApiKey-Auth',
-                 apikey_secret: str = ''
+                 apikey_secret: str = '',
+                 client_options: Optional[Dict] = None,
+                 token_cache: Optional[TokenCache] = None,
+                 renewal_window: float = 900
                  ):
         """ Constructor method.
 
@@ -27,12 +31,20 @@ class AuthService():
             - api_base_path (str): The base path that is prepended to every request's path.
             - apikey_header (str): Name of the header with the API key that identifies this client.
             - apikey_secret (str): The API key that identifies this client.
+            - client_options (Optional[Dict]): The HTTP client pool, timeout and retry options (see
+              `RestClient.from_config`).
+            - token_cache (Optional[TokenCache]): The cache of already validated tokens, if any.
+            - renewal_window (float): The number of seconds before their expiration from which
+              session tokens are renewed instead of just validated.
         """
         self.__host: str = host
         self.__port: int = port
         self.__api_base_path: str = api_base_path
         self.__apikey_header: str = apikey_header
         self.__apikey_secret: str = apikey_secret
+        self.__client: RestClient = RestClient.from_config(self.__base_url(), client_options)
+        self.__token_cache: Optional[TokenCache] = token_cache
+        self.__renewal_window: float = float(renewal_window)
 
     def __base_url(self) -> str:
         """ Constructs the base URL for the requests.
@@ -42,28 +54,60 @@ class AuthService():
         """
         return f'http://{self.__host}:{self.__port}{self.__api_base_path}'
 
-    def login(self, username: str, password: str) -> ResponseData:
+    def get_client(self) -> RestClient:
+        """ Gets the pooled HTTP client used to send the requests.
+
+        Returns:
+            - RestClient: The HTTP client.
+        """
+        return self.__client
+
+    def get_token_cache(self) -> Optional[TokenCache]:
+        """ Gets the cache of tokens already validated against the authentication service.
+
+        Returns:
+            - Optional[TokenCache]: The token cache, or `None` if tokens are not cached.
+        """
+        return self.__token_cache
+
+    def get_renewal_window(self) -> float:
+        """ Gets the number of seconds before their expiration from which session tokens are
+        renewed.
+
+        Returns:
+            - float: The renewal window.
+        """
+        return self.__renewal_window
+
+    def login(self, username: str, password: str, client: Optional[str] = None) -> ResponseData:
         """ Performs a login request to the authentication service.
 
         Args:
             - username (str): The username.
             - password (str): The password.
+            - client (Optional[str]): The address of the client logging in, forwarded so the
+              authentication service throttles the attempts of each client separately.
 
         Returns:
             - ResponseData: If successful, the contents hold a string with the user session token.
         """
-        response: requests.Response = requests.post(
-            self.__base_url() + '/auth',
+        headers: Dict[str, str] = {self.__apikey_header: self.__apikey_secret}
+        if client:
+            headers['X-Forwarded-For'] = client
+        response: requests.Response = self.__client.post(
+            '/auth',
             auth=(username, password),
-            headers={
-                self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+            headers=headers
         )
         response_data: ResponseData = ResponseData()
         response_data.set_successful(response.ok)
         if response_data.is_successful():
             response_data.set_content(response.content.decode('ascii'))
+        elif response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            response_data.add_message(
+                'Too many login attempts. Try again in '
+                f'{response.headers.get("Retry-After", "a few")} seconds'
+            )
         else:
             response_data.add_message('Invalid credentials')
         return response_data
@@ -83,13 +127,12 @@ class AuthService():
             response_data.set_successful(False)
             return response_data
 
-        response: requests.Response = requests.post(
-            self.__base_url() + '/auth',
+        response: requests.Response = self.__client.post(
+            '/auth',
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+            }
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -98,6 +141,34 @@ class AuthService():
             response_data.add_message('Session expired')
         return response_data
 
+    def validate(self, token: Optional[str]) -> ResponseData:
+        """ Performs a validation request to the authentication service, which checks a token
+        without renewing it.
+
+        Args:
+            - token (Optional[str]): The user session token to validate.
+
+        Returns:
+            - ResponseData: Whether the session is valid. Otherwise, the session is rejected (e.g.,
+              timed out, was invalidated, was missing)
+        """
+        response_data: ResponseData = ResponseData()
+        if not token:
+            response_data.set_successful(False)
+            return response_data
+
+        response: requests.Response = self.__client.get(
+            '/auth/validation',
+            headers={
+                'Authorization': f'Bearer {token}',
+                self.__apikey_header: self.__apikey_secret
+            }
+        )
+        response_data.set_successful(response.ok)
+        if not response_data.is_successful():
+            response_data.add_message('Session expired')
+        return response_data
+
     def list_users(self, token: Optional[str]) -> ResponseData:
         """ Requests a list of registered users.
 
@@ -109,13 +180,12 @@ class AuthService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + '/users',
+        response: requests.Response = self.__client.get(
+            '/users',
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+            }
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -137,8 +207,8 @@ class AuthService():
             - ResponseData: If successful, the contents hold the new user's data.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + '/users',
+        response: requests.Response = self.__client.post(
+            '/users',
             json={
                 'username': username,
                 'password': password
@@ -146,8 +216,7 @@ class AuthService():
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+            }
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -168,13 +237,12 @@ class AuthService():
               empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/users/{username}/roles',
+        response: requests.Response = self.__client.get(
+            f'/users/{username}/roles',
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+            }
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
@@ -200,13 +268,12 @@ class AuthService():
         if isinstance(role, Role):
             role = role.name
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + f'/users/{username}/roles/{role}',
+        response: requests.Response = self.__client.post(
+            f'/users/{username}/roles/{role}',
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+            }
         )
         response_data.set_successful(response.ok)
         if not response_data.is_successful():
@@ -229,13 +296,12 @@ class AuthService():
         if isinstance(role, Role):
             role = role.name
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.delete(
-            self.__base_url() + f'/users/{username}/roles/{role}',
+        response: requests.Response = self.__client.delete(
+            f'/users/{username}/roles/{role}',
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
-            },
-            timeout=60
+            }
         )
         response_data.set_successful(response.ok)
         if not response_data.is_successful():
@@ -1,9 +1,9 @@
 """ BackendService class module.
 """
-from typing import Optional
+from typing import Dict, Optional
 import requests
 from dms2223common.data import Role
-from dms2223common.data.rest import ResponseData
+from dms2223common.data.rest import ResponseData, RestClient
 
 
 class BackendService():
@@ -14,7 +14,8 @@ class BackendService():
         host: str, port: int,
         api_base_path: str = '/api/v1',
         apikey_header: str = 'X-ApiKey-Backend',
-        apikey_secret: str = ''
+        apikey_secret: str = '',
+        client_options: Optional[Dict] = None
         ):
         """ 
         Constructor method.
@@ -26,30 +27,49 @@ class BackendService():
             - api_base_path (str): The base path that is prepended to every request's path.
             - apikey_header (str): Name of the header with the API key that identifies this client.
             - apikey_secret (str): The API key that identifies this client.
+            - client_options (Optional[Dict]): The HTTP client pool, timeout and retry options (see
+              `RestClient.from_config`).
         """
         self.__host: str = host
         self.__port: int = port
         self.__api_base_path: str = api_base_path
         self.__apikey_header: str = apikey_header
         self.__apikey_secret: str = apikey_secret
+        self.__client: RestClient = RestClient.from_config(self.__base_url(), client_options)
 
     def __base_url(self) -> str:
         return f'http://{self.__host}:{self.__port}{self.__api_base_path}'
 
+    def get_client(self) -> RestClient:
+        """ Gets the pooled HTTP client used to send the requests.
+
+        Returns:
+            - RestClient: The HTTP client.
+        """
+        return self.__client
+
     
-    def list_discussions(self, token: Optional[str]) -> ResponseData:
+    def list_discussions(self, token: Optional[str],
+                         limit: Optional[int] = None, after: Optional[int] = None) -> ResponseData:
         """ Requests a list of registered questions.
 
         Args:
             token (Optional[str]): The question session token.
+            limit (Optional[int]): Maximum number of discussions in the page (the backend default if `None`).
+            after (Optional[int]): Cursor returned with the previous page (the first page if `None`).
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of user data dictionaries.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold a page with the list of discussions data
+              dictionaries (key `items`) and the cursor of the next page, or `None` if there are
+              no more (key `next_cursor`). Otherwise, the contents will be an empty page.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + '/discussions',
+        response: requests.Response = self.__client.get(
+            '/discussions',
+            params={
+                'limit': limit,
+                'after': after
+            },
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -60,7 +80,43 @@ class BackendService():
             response_data.set_content(response.json())
         else:
             response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
+            response_data.set_content({'items': [], 'next_cursor': None})
+        return response_data
+
+    def search(self, token: Optional[str], q: str,
+               limit: Optional[int] = None, after: Optional[int] = None) -> ResponseData:
+        """ Requests a full-text search over the questions, answers and comments.
+
+        Args:
+            token (Optional[str]): The user session token.
+            q (str): The search terms.
+            limit (Optional[int]): Maximum number of results in the page (the backend default if `None`).
+            after (Optional[int]): Cursor returned with the previous page (the first page if `None`).
+
+        Returns:
+            - ResponseData: If successful, the contents hold a page with the list of results data
+              dictionaries (key `items`) and the cursor of the next page, or `None` if there are
+              no more (key `next_cursor`). Otherwise, the contents will be an empty page.
+        """
+        response_data: ResponseData = ResponseData()
+        response: requests.Response = self.__client.get(
+            '/search',
+            params={
+                'q': q,
+                'limit': limit,
+                'after': after
+            },
+            headers={
+                'Authorization': f'Bearer {token}',
+                self.__apikey_header: self.__apikey_secret
+            }
+        )
+        response_data.set_successful(response.ok)
+        if response_data.is_successful():
+            response_data.set_content(response.json())
+        else:
+            response_data.add_message(response.content.decode('ascii'))
+            response_data.set_content({'items': [], 'next_cursor': None})
         return response_data
 
     def create_report(self, token: Optional[str],id :Optional[str], reason: Optional[str]) -> ResponseData:
@@ -76,8 +132,8 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + f'/discussions/{id}/reports',
+        response: requests.Response = self.__client.post(
+            f'/discussions/{id}/reports',
             json={
                 'reason': reason
             },
@@ -106,8 +162,8 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + f'/comments/{id}/reports',
+        response: requests.Response = self.__client.post(
+            f'/comments/{id}/reports',
             json={
                 'reason': reason
             },
@@ -135,8 +191,8 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + f'/answers/{id}/reports',
+        response: requests.Response = self.__client.post(
+            f'/answers/{id}/reports',
             json={
                 'reason': reason
             },
@@ -164,8 +220,8 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + '/discussions',
+        response: requests.Response = self.__client.post(
+            '/discussions',
             json={
                 'title': title,
                 'content': content
@@ -184,8 +240,8 @@ class BackendService():
 
     def get_discussion(self, token:  Optional[str], id: int) -> ResponseData:
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/discussions/{id}',
+        response: requests.Response = self.__client.get(
+            f'/discussions/{id}',
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -199,23 +255,58 @@ class BackendService():
             response_data.set_content([])
         return response_data
 
+    def get_discussion_thread(self, token: Optional[str], id: int) -> ResponseData:
+        """ Requests a whole discussion thread: the discussion, its answers and their comments.
+
+        Args:
+            token (Optional[str]): The user session token.
+            id (int): The discussion id.
+
+        Returns:
+            - ResponseData: If successful, the contents hold a dictionary with the discussion data
+              (key `discussion`) and the list of answers (key `answers`), each one with its list of
+              comments (key `comments`). Otherwise, the contents will be `None`.
+        """
+        response_data: ResponseData = ResponseData()
+        response: requests.Response = self.__client.get(
+            f'/discussions/{id}/thread',
+            headers={
+                'Authorization': f'Bearer {token}',
+                self.__apikey_header: self.__apikey_secret
+            }
+        )
+        response_data.set_successful(response.ok)
+        if response_data.is_successful():
+            response_data.set_content(response.json())
+        else:
+            response_data.add_message(response.content.decode('ascii'))
+        return response_data
+
 
     
 
-    def list_answers(self, token: Optional[str], id: int) -> ResponseData:
+    def list_answers(self, token: Optional[str], id: int,
+                     limit: Optional[int] = None, after: Optional[int] = None) -> ResponseData:
         """ Requests a list of registered questions.
 
         Args:
             token (Optional[str]): The question session token.
+            limit (Optional[int]): Maximum number of answers in the page (the backend default if `None`).
+            after (Optional[int]): Cursor returned with the previous page (the first page if `None`).
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of user data dictionaries.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold a page with the list of answers data
+              dictionaries (key `items`) and the cursor of the next page, or `None` if there are
+              no more (key `next_cursor`). Otherwise, the contents will be an empty page.
         """
         #post para recibir de la discusion adecuada
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/discussions/{id}/answers',
+        response: requests.Response = self.__client.get(
+            f'/discussions/{id}/answers',
+            params={
+                'limit': limit,
+                'after': after
+            },
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -226,7 +317,7 @@ class BackendService():
             response_data.set_content(response.json())
         else:
             response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
+            response_data.set_content({'items': [], 'next_cursor': None})
         return response_data
 
 
@@ -244,8 +335,8 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + f'/discussions/{discussionid}/answers',
+        response: requests.Response = self.__client.post(
+            f'/discussions/{discussionid}/answers',
             json={
                 'discussionid': discussionid,
                 'content': content
@@ -264,8 +355,8 @@ class BackendService():
 
     def get_answer(self, token:  Optional[str], answerid: int) -> ResponseData:
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/discussions/{answerid}/answers',
+        response: requests.Response = self.__client.get(
+            f'/discussions/{answerid}/answers',
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -279,20 +370,28 @@ class BackendService():
             response_data.set_content([])
         return response_data
 
-    def list_comments(self, token: Optional[str], id: int) -> ResponseData:
+    def list_comments(self, token: Optional[str], id: int,
+                      limit: Optional[int] = None, after: Optional[int] = None) -> ResponseData:
         """ Requests a list of registered questions.
 
         Args:
             token (Optional[str]): The question session token.
+            limit (Optional[int]): Maximum number of comments in the page (the backend default if `None`).
+            after (Optional[int]): Cursor returned with the previous page (the first page if `None`).
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of user data dictionaries.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold a page with the list of comments data
+              dictionaries (key `items`) and the cursor of the next page, or `None` if there are
+              no more (key `next_cursor`). Otherwise, the contents will be an empty page.
         """
 
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/answers/{id}/comments', 
+        response: requests.Response = self.__client.get(
+            f'/answers/{id}/comments',
+            params={
+                'limit': limit,
+                'after': after
+            },
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -303,7 +402,7 @@ class BackendService():
             response_data.set_content(response.json())
         else:
             response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
+            response_data.set_content({'items': [], 'next_cursor': None})
         return response_data
 
 
@@ -321,8 +420,8 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
-            self.__base_url() + f'/answers/{answerid}/comments', 
+        response: requests.Response = self.__client.post(
+            f'/answers/{answerid}/comments', 
             json={
                 'discussionid': discussionid,
                 'answerid': answerid,
@@ -342,8 +441,8 @@ class BackendService():
 
     def get_comment(self, token:  Optional[str], id: int) -> ResponseData:
             response_data: ResponseData = ResponseData()
-            response: requests.Response = requests.get(
-                self.__base_url() + f'/answers/{id}/comments',
+            response: requests.Response = self.__client.get(
+                f'/answers/{id}/comments',
                 headers={
                     'Authorization': f'Bearer {token}',
                     self.__apikey_header: self.__apikey_secret
@@ -359,19 +458,27 @@ class BackendService():
 
 
 
-    def list_reports(self, token: Optional[str]) -> ResponseData:
+    def list_reports(self, token: Optional[str],
+                     limit: Optional[int] = None, after: Optional[int] = None) -> ResponseData:
         """ Requests a list of registered questions.
 
         Args:
             token (Optional[str]): The question session token.
+            limit (Optional[int]): Maximum number of reports in the page (the backend default if `None`).
+            after (Optional[int]): Cursor returned with the previous page (the first page if `None`).
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of user data dictionaries.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold a page with the list of reports data
+              dictionaries (key `items`) and the cursor of the next page, or `None` if there are
+              no more (key `next_cursor`). Otherwise, the contents will be an empty page.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/discussions/reports',
+        response: requests.Response = self.__client.get(
+            f'/discussions/reports',
+            params={
+                'limit': limit,
+                'after': after
+            },
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -382,23 +489,31 @@ class BackendService():
             response_data.set_content(response.json())
         else:
             response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
+            response_data.set_content({'items': [], 'next_cursor': None})
         return response_data
 
  
-    def list_reports_answer(self, token: Optional[str]) -> ResponseData:
+    def list_reports_answer(self, token: Optional[str],
+                            limit: Optional[int] = None, after: Optional[int] = None) -> ResponseData:
         """ Requests a list of registered questions.
 
         Args:
             token (Optional[str]): The question session token.
+            limit (Optional[int]): Maximum number of reports in the page (the backend default if `None`).
+            after (Optional[int]): Cursor returned with the previous page (the first page if `None`).
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of user data dictionaries.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold a page with the list of reports data
+              dictionaries (key `items`) and the cursor of the next page, or `None` if there are
+              no more (key `next_cursor`). Otherwise, the contents will be an empty page.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/answers/reports',
+        response: requests.Response = self.__client.get(
+            f'/answers/reports',
+            params={
+                'limit': limit,
+                'after': after
+            },
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -409,22 +524,30 @@ class BackendService():
             response_data.set_content(response.json())
         else:
             response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
+            response_data.set_content({'items': [], 'next_cursor': None})
         return response_data
 
-    def list_reports_comments(self, token: Optional[str]) -> ResponseData:
+    def list_reports_comments(self, token: Optional[str],
+                              limit: Optional[int] = None, after: Optional[int] = None) -> ResponseData:
         """ Requests a list of registered questions.
 
         Args:
             token (Optional[str]): The question session token.
+            limit (Optional[int]): Maximum number of reports in the page (the backend default if `None`).
+            after (Optional[int]): Cursor returned with the previous page (the first page if `None`).
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of user data dictionaries.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold a page with the list of reports data
+              dictionaries (key `items`) and the cursor of the next page, or `None` if there are
+              no more (key `next_cursor`). Otherwise, the contents will be an empty page.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/comments/reports',
+        response: requests.Response = self.__client.get(
+            f'/comments/reports',
+            params={
+                'limit': limit,
+                'after': after
+            },
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -435,13 +558,13 @@ class BackendService():
             response_data.set_content(response.json())
         else:
             response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
+            response_data.set_content({'items': [], 'next_cursor': None})
         return response_data
 
     def get_report(self, token:  Optional[str], id: int) -> ResponseData:
             response_data: ResponseData = ResponseData()
-            response: requests.Response = requests.get(
-                self.__base_url() + f'/answers/{id}/comments',
+            response: requests.Response = self.__client.get(
+                f'/answers/{id}/comments',
                 headers={
                     'Authorization': f'Bearer {token}',
                     self.__apikey_header: self.__apikey_secret
@@ -457,8 +580,8 @@ class BackendService():
 
     def put_report(self,token:Optional[str], id: int, status: str) -> ResponseData:
             response_data: ResponseData = ResponseData()
-            response: requests.Response = requests.get(
-                self.__base_url() + f'/discussions/reports/{id}',
+            response: requests.Response = self.__client.get(
+                f'/discussions/reports/{id}',
                 json={
                     'status': status
                 },
@@ -488,8 +611,8 @@ class BackendService():
                 
             """
             response_data: ResponseData = ResponseData()
-            response: requests.Response = requests.post(
-                self.__base_url() + f'/answers/{answerid}/votes', 
+            response: requests.Response = self.__client.post(
+                f'/answers/{answerid}/votes', 
                 headers={
                     'Authorization': f'Bearer {token}',
                     self.__apikey_header: self.__apikey_secret
@@ -514,8 +637,8 @@ class BackendService():
                 
             """
             response_data: ResponseData = ResponseData()
-            response: requests.Response = requests.post(
-                self.__base_url() + f'/comments/{commentid}/votes', 
+            response: requests.Response = self.__client.post(
+                f'/comments/{commentid}/votes', 
                 headers={
                     'Authorization': f'Bearer {token}',
                     self.__apikey_header: self.__apikey_secret
@@ -1,7 +1,7 @@
 """ DiscussionEndpoints class module.
 """
 
-from typing import Text, Union
+from typing import Dict, Optional, Text, Union
 from flask import redirect, url_for, session, render_template, request, flash
 from werkzeug.wrappers import Response
 from dms2223common.data import Role
@@ -47,8 +47,36 @@ class DiscussionEndpoints():
         if Role.DISCUSSION.name not in session['roles']:
             return redirect(url_for('get_home'))
         name = session['user']
+        discussions, next_cursor = WebQuestion.list_discussions(
+            backend_service, request.args.get('after', default=None, type=int)
+        )
+        return render_template('discussion/discussions.html', name=name, roles=session['roles'],
+            discussions=discussions, next_cursor=next_cursor)
 
-        return render_template('discussion/discussions.html', name=name, roles=session['roles'], discussions=WebQuestion.list_discussions(backend_service))
+    @staticmethod
+    def get_discussion_search(auth_service: AuthService, backend_service: BackendService) -> Union[Response, Text]:
+        """ Handles the GET requests to the discussion search endpoint.
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+            - backend_service (BackendService): The backend service.
+
+        Returns:
+            - Union[Response,Text]: The generated response to the request.
+        """
+        if not WebAuth.test_token(auth_service):
+            return redirect(url_for('get_login'))
+        if Role.DISCUSSION.name not in session['roles']:
+            return redirect(url_for('get_home'))
+        name = session['user']
+        q: str = request.args.get('q', default='').strip()
+        results, next_cursor = ([], None)
+        if q:
+            results, next_cursor = WebQuestion.search(
+                backend_service, q, request.args.get('after', default=None, type=int)
+            )
+        return render_template('discussion/discussions/search.html', name=name, roles=session['roles'],
+            q=q, results=results, next_cursor=next_cursor)
 
     @staticmethod
     def get_discussion_discussions_new(auth_service: AuthService, backend_service: BackendService) -> Union[Response, Text]:
@@ -115,9 +143,11 @@ class DiscussionEndpoints():
         id: int = int(str(request.args.get('discussionid')))
         #answerid: int = int(str(request.args.get('answerid')))
         
+        thread: Optional[Dict] = WebQuestion.get_thread(backend_service, id)
+        if thread is None:
+            return redirect(url_for('get_discussion_discussions'))
         return render_template('discussion/discussions/view.html', name=name, roles=session['roles'], redirect_to=redirect_to,
-            discussion=WebQuestion.get_discussion(backend_service, id), answers = WebAnswer.list_answers(backend_service,id),
-            comments = WebComment.list_comments(backend_service, id))
+            discussion=thread['discussion'], answers=thread['answers'])
 
     @staticmethod
     def post_discussion_discussions_view(auth_service: AuthService, backend_service: BackendService) -> Union[Response, Text]:
@@ -207,8 +237,11 @@ class DiscussionEndpoints():
         discussionid: int = int(str(request.args.get('discussionid')))
         answerid: int = int(str(request.args.get('answerid')))
         redirect_to = request.args.get('redirect_to', default='/discussion/discussions/view')
+        thread: Optional[Dict] = WebQuestion.get_thread(backend_service, discussionid)
+        if thread is None:
+            return redirect(url_for('get_discussion_discussions'))
         return render_template('discussion/discussions/comment.html', name=name, roles=session['roles'], answerid=answerid, discussionid=discussionid,
-            redirect_to=redirect_to, discussion=WebQuestion.get_discussion(backend_service, discussionid), answers = WebAnswer.list_answers(backend_service, discussionid))
+            redirect_to=redirect_to, discussion=thread['discussion'], answers=thread['answers'])
 
     @staticmethod
     def post_discussion_discussions_comment(auth_service: AuthService, backend_service: BackendService) -> Union[Response, Text]:
@@ -315,8 +348,11 @@ class DiscussionEndpoints():
         answerid: int = int(str(request.args.get('answerid')))
         discussionid: int = int(str(request.args.get('discussionid'))) 
         redirect_to = request.args.get('redirect_to', default='/discussion/discussions/view')
+        thread: Optional[Dict] = WebQuestion.get_thread(backend_service, discussionid)
+        if thread is None:
+            return redirect(url_for('get_discussion_discussions'))
         return render_template('discussion/discussions/reportanswer.html', name=name, roles=session['roles'], redirect_to=redirect_to, discussionid = discussionid,answerid=answerid,
-        answers=WebAnswer.list_answers(backend_service, discussionid))
+        answers=thread['answers'])
 
     @staticmethod
     def get_discussion_discussions_reportcomment(auth_service: AuthService, backend_service: BackendService) -> Union[Response, Text]:
@@ -337,9 +373,12 @@ class DiscussionEndpoints():
         commentid:  int = int(str(request.args.get('commentid')))
         discussionid:  int = int(str(request.args.get('discussionid')))
         redirect_to = request.args.get('redirect_to', default='/discussion/discussions/view')
+        thread: Optional[Dict] = WebQuestion.get_thread(backend_service, discussionid)
+        if thread is None:
+            return redirect(url_for('get_discussion_discussions'))
 
         return render_template('discussion/discussions/reportcomment.html', name=name, roles=session['roles'],answerid = answerid , redirect_to=redirect_to,
-        commentid = commentid ,comments=WebComment.list_comments(backend_service,discussionid))
+        commentid = commentid ,comments=[comment for answer in thread['answers'] for comment in answer['comments']])
 
     @staticmethod
     def post_discussion_discussions_reportcomment(auth_service: AuthService, backend_service: BackendService) -> Union[Response, Text]:
@@ -1,7 +1,7 @@
 """ ModeratorEndpoints class module.
 """
 
-from typing import Text, Union
+from typing import Dict, Optional, Text, Union
 from flask import redirect, url_for, session, render_template, request
 from werkzeug.wrappers import Response
 from dms2223common.data import Role
@@ -9,8 +9,7 @@ from dms2223frontend.data.rest.authservice import AuthService
 from dms2223frontend.data.rest.backendservice import BackendService
 from .webauth import WebAuth
 from .webquestion import WebQuestion
-from .webanswer import WebAnswer
-from .webcomment import WebComment
+from .webutils import WebUtils
 
 
 class ModeratorEndpoints():
@@ -34,11 +33,14 @@ class ModeratorEndpoints():
         return render_template('moderator.html', name=name, roles=session['roles'])
 
     @staticmethod
-    def get_moderator_reports(auth_service: AuthService,backend_service: BackendService) -> Union[Response, Text]:
+    def get_moderator_reports(auth_service: AuthService, backend_service: BackendService,
+                              fan_out_deadline: float) -> Union[Response, Text]:
         """ Handles the GET requests to the reports root endpoint.
 
         Args:
             - auth_service (AuthService): The authentication service.
+            - backend_service (BackendService): The backend service.
+            - fan_out_deadline (float): Maximum number of seconds to wait for the backend calls.
 
         Returns:
             - Union[Response,Text]: The generated response to the request.
@@ -48,11 +50,38 @@ class ModeratorEndpoints():
         if Role.MODERATION.name not in session['roles']:
             return redirect(url_for('get_home'))
         name = session['user']
-
-        return render_template('moderator/reports.html', name=name, roles=session['roles'], reports=WebQuestion.list_reports(backend_service),
-                                                                                            reportsanswer = WebQuestion.list_reports_answer(backend_service,),
-                                                                                            reportscomment = WebQuestion.list_reports_comments(backend_service)
-                                                                                            )
+        # Every listing is paged on its own, so each one has its own cursor
+        cursors: Dict[str, Optional[int]] = {
+            argument: request.args.get(argument, default=None, type=int)
+            for argument in ('after', 'answers_after', 'comments_after')
+        }
+
+        page: Dict = WebUtils.fan_out({
+            'reports': lambda: WebQuestion.list_reports(backend_service, cursors['after']),
+            'answer reports': lambda: WebQuestion.list_reports_answer(
+                backend_service, cursors['answers_after']
+            ),
+            'comment reports': lambda: WebQuestion.list_reports_comments(
+                backend_service, cursors['comments_after']
+            )
+        }, defaults={
+            'reports': ([], None), 'answer reports': ([], None), 'comment reports': ([], None)
+        }, deadline=fan_out_deadline)
+
+        def next_page(argument: str, next_cursor: Optional[int]) -> Optional[str]:
+            if next_cursor is None:
+                return None
+            return url_for('get_moderator_reports', **{
+                **{key: value for key, value in cursors.items() if value is not None},
+                argument: next_cursor
+            })
+
+        return render_template('moderator/reports.html', name=name, roles=session['roles'],
+            reports=page['reports'][0], reportsanswer=page['answer reports'][0],
+            reportscomment=page['comment reports'][0],
+            next_reports=next_page('after', page['reports'][1]),
+            next_reportsanswer=next_page('answers_after', page['answer reports'][1]),
+            next_reportscomment=next_page('comments_after', page['comment reports'][1]))
 
     @staticmethod
     def get_report_view(auth_service: AuthService,backend_service: BackendService) -> Union[Response, Text]:
@@ -109,7 +138,11 @@ class ModeratorEndpoints():
             if Role.MODERATION.name not in session['roles']:
                 return redirect(url_for('get_home'))
             name = session['user']
-            return render_template('moderator/discussions.html', name=name, roles=session['roles'], discussions=WebQuestion.list_discussions(backend_services))
+            discussions, next_cursor = WebQuestion.list_discussions(
+                backend_services, request.args.get('after', default=None, type=int)
+            )
+            return render_template('moderator/discussions.html', name=name, roles=session['roles'],
+                discussions=discussions, next_cursor=next_cursor)
 
     # @staticmethod
     # def get_discussions_view(auth_service: AuthService, backend_service: BackendService) -> Union[Response, Text]:
@@ -139,6 +172,7 @@ class ModeratorEndpoints():
 
         Args:
             - auth_service (AuthService): The authentication service.
+            - backend_service (BackendService): The backend service.
 
         Returns:
             - Union[Response,Text]: The generated response to the request.
@@ -150,10 +184,12 @@ class ModeratorEndpoints():
         name = session['user']
         redirect_to = request.args.get('redirect_to', default='/moderator/discussions')
         id: int = int(str(request.args.get('discussionid')))
-        
+
+        thread: Optional[Dict] = WebQuestion.get_thread(backend_service, id)
+        if thread is None:
+            return redirect(url_for('get_moderator_discussions'))
         return render_template('moderator/discussions/view.html', name=name, roles=session['roles'], redirect_to=redirect_to,
-            discussion=WebQuestion.get_discussion(backend_service, id), answers = WebAnswer.list_answers(backend_service,id),
-            comments = WebComment.list_comments(backend_service, id))
+            discussion=thread['discussion'], answers=thread['answers'])
 
     @staticmethod
     def get_moderator_resolution_report(auth_service: AuthService) -> Union[Response, Text]:
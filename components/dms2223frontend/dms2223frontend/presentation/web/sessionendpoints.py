@@ -1,9 +1,11 @@
 """ SessionEndpoints class module.
 """
 
-from typing import Text, Union
+from http import HTTPStatus
+from typing import List, Optional, Text, Tuple, Union
 from flask import request, redirect, url_for, render_template, session, flash
 from werkzeug.wrappers import Response
+from dms2223common.data import TokenCache
 from dms2223common.data.rest import ResponseData
 from dms2223frontend.data.rest import AuthService
 from .webauth import WebAuth
@@ -39,23 +41,65 @@ class SessionEndpoints():
             - Union[Response,Text]: The generated response to the request.
         """
         response: ResponseData = auth_service.login(
-            request.form['user'], request.form['pass'])
+            request.form['user'], request.form['pass'], request.remote_addr)
         WebUtils.flash_response_messages(response)
         if not response.is_successful():
             return redirect(url_for('get_login'))
 
         session['user'] = request.form['user']
         session['token'] = response.get_content()
-        session['roles'] = WebUser.get_roles(auth_service, session['user'])
+        roles: Optional[List] = WebUser.get_token_roles(session['token'])
+        if roles is None:
+            roles = WebUser.get_roles(auth_service, session['user'])
+        session['roles'] = roles
+        token_cache: Optional[TokenCache] = auth_service.get_token_cache()
+        if token_cache is not None:
+            token_cache.put(session['token'], session['user'])
         return redirect(url_for('get_home'))
 
     @staticmethod
-    def get_logout() -> Union[Response, Text]:
+    def get_logout(auth_service: AuthService) -> Union[Response, Text]:
         """ Handles the GET requests to the logout endpoint.
 
+        Args:
+            - auth_service (AuthService): The authentication service.
+
         Returns:
             - Union[Response,Text]: The generated response to the request.
         """
+        token_cache: Optional[TokenCache] = auth_service.get_token_cache()
+        if token_cache is not None:
+            token_cache.invalidate(session.get('token'))
         session.clear()
         flash('Session closed', 'info')
         return redirect(url_for('get_login'))
+
+    @staticmethod
+    def post_token_invalidations(
+        auth_service: AuthService, authorized_api_keys: List[str]
+    ) -> Tuple[Text, int]:
+        """ Handles the POST requests to the token invalidations endpoint.
+
+        Drops from the token cache either every token of a user (JSON key `user`) or a single
+        token (JSON key `token`). Intended to be called by the authentication service, which must
+        present one of the authorized API keys in the `X-ApiKey-Frontend` header.
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+            - authorized_api_keys (List[str]): The API keys allowed to invalidate tokens.
+
+        Returns:
+            - Tuple[Text, int]: The generated response body and status code.
+        """
+        if request.headers.get('X-ApiKey-Frontend') not in authorized_api_keys:
+            return ('Invalid API key', HTTPStatus.UNAUTHORIZED.value)
+        body = request.get_json(silent=True) or {}
+        if not body.get('user') and not body.get('token'):
+            return ('Either a user or a token must be given', HTTPStatus.BAD_REQUEST.value)
+        token_cache: Optional[TokenCache] = auth_service.get_token_cache()
+        if token_cache is not None:
+            if body.get('user'):
+                token_cache.invalidate_user(body['user'])
+            if body.get('token'):
+                token_cache.invalidate(body['token'])
+        return ('', HTTPStatus.NO_CONTENT.value)
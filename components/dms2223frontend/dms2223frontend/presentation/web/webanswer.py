@@ -1,7 +1,7 @@
 """ WebQuestion class module.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from flask import session
 from dms2223common.data.rest import ResponseData
 from dms2223frontend.data.rest.backendservice import BackendService
@@ -12,20 +12,25 @@ class WebAnswer():
     """ Monostate class responsible of the user operation utilities.
     """
     @staticmethod
-    def list_answers(backend_service:BackendService, id: int) -> Optional[List]:
-        """ Gets the list of discussions from the backend service.
+    def list_answers(backend_service: BackendService, id: int,
+                     after: Optional[int] = None) -> Tuple[List, Optional[int]]:
+        """ Gets a page of the list of answers of a discussion from the backend service.
 
         Args:
             - backend_service (BackendService): The backend service.
+            - id (int): The discussion id.
+            - after (Optional[int]): Cursor of the page to get (the first page if `None`).
 
         Returns:
-            - List: A list of user data dictionaries (the list may be empty)
+            - Tuple[List, Optional[int]]: A list of answer data dictionaries (the list may be
+              empty) and the cursor of the next page, or `None` if there are no more.
         """
-        response: ResponseData = backend_service.list_answers(session.get('token'), id)
+        response: ResponseData = backend_service.list_answers(session.get('token'), id, after=after)
         WebUtils.flash_response_messages(response)
-        if response.get_content() is not None and isinstance(response.get_content(), list):
-            return list(response.get_content())
-        return []
+        content = response.get_content()
+        if content is not None and isinstance(content, dict):
+            return (list(content.get('items', [])), content.get('next_cursor'))
+        return ([], None)
 
     @staticmethod
     def create_answer(backend_service: BackendService, discussionid: int, content: str) -> Optional[Dict]:
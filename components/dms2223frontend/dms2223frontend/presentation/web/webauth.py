@@ -1,9 +1,13 @@
 """ WebAuth class module.
 """
 
+import time
+from typing import List, Optional
 from flask import session
+from dms2223common.data import TokenCache
 from dms2223common.data.rest import ResponseData
 from dms2223frontend.data.rest import AuthService
+from .webuser import WebUser
 from .webutils import WebUtils
 
 class WebAuth():
@@ -13,7 +17,12 @@ class WebAuth():
     def test_token(auth_service: AuthService) -> bool:
         """ Tests whether the session token is valid or not against the authentication service.
 
-        If the token is valid, the session token is updated/refreshed.
+        If the token is valid and close to its expiration (within the renewal window), the session
+        token is refreshed; otherwise, it is only validated, so no new token is signed and the
+        session cookie is not rewritten. A token rejected on validation (e.g., because the roles
+        it carries are outdated) is renewed instead, and the session roles are updated from the
+        new token. Tokens recently validated are accepted from the token cache without contacting
+        the authentication service.
 
         Args:
             - auth_service (AuthService): The authentication service.
@@ -21,10 +30,28 @@ class WebAuth():
         Returns:
             - bool: Whether the token is valid (`True`) or not.
         """
-        response: ResponseData = auth_service.auth(session.get('token'))
+        token: Optional[str] = session.get('token')
+        token_cache: Optional[TokenCache] = auth_service.get_token_cache()
+        if token_cache is not None and token_cache.get(token) is not None:
+            return True
+
+        exp: Optional[float] = TokenCache.token_expiration(token) if token else None
+        renew: bool = exp is None or exp - time.time() <= auth_service.get_renewal_window()
+        response: ResponseData = (
+            auth_service.auth(token) if renew else auth_service.validate(token)
+        )
+        if not renew and not response.is_successful():
+            response = auth_service.auth(token)
+            renew = True
         WebUtils.flash_response_messages(response)
         if not response.is_successful():
             return False
 
-        session['token'] = response.get_content()
+        if renew and response.get_content() != token:
+            session['token'] = response.get_content()
+            roles: Optional[List] = WebUser.get_token_roles(session['token'])
+            if roles is not None:
+                session['roles'] = roles
+        if token_cache is not None:
+            token_cache.put(session['token'], session.get('user', ''))
         return True
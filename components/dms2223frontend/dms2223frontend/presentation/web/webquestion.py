@@ -1,7 +1,7 @@
 """ WebQuestion class module.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from flask import session
 from dms2223common.data.rest import ResponseData
 from dms2223frontend.data.rest.backendservice import BackendService
@@ -12,20 +12,44 @@ class WebQuestion():
     """ Monostate class responsible of the user operation utilities.
     """
     @staticmethod
-    def list_discussions(backend_service:BackendService) -> List:
-        """ Gets the list of discussions from the backend service.
+    def list_discussions(backend_service:BackendService, after: Optional[int] = None) -> Tuple[List, Optional[int]]:
+        """ Gets a page of the list of discussions from the backend service.
 
         Args:
             - backend_service (BackendService): The backend service.
+            - after (Optional[int]): Cursor of the page to get (the first page if `None`).
 
         Returns:
-            - List: A list of user data dictionaries (the list may be empty)
+            - Tuple[List, Optional[int]]: A list of discussion data dictionaries (the list may be
+              empty) and the cursor of the next page, or `None` if there are no more.
         """
-        response: ResponseData = backend_service.list_discussions(session.get('token'))
+        response: ResponseData = backend_service.list_discussions(session.get('token'), after=after)
         WebUtils.flash_response_messages(response)
-        if response.get_content() is not None and isinstance(response.get_content(), list):
-            return list(response.get_content())
-        return []
+        content = response.get_content()
+        if content is not None and isinstance(content, dict):
+            return (list(content.get('items', [])), content.get('next_cursor'))
+        return ([], None)
+
+    @staticmethod
+    def search(backend_service: BackendService, q: str,
+               after: Optional[int] = None) -> Tuple[List, Optional[int]]:
+        """ Gets a page of the posts matching some search terms from the backend service.
+
+        Args:
+            - backend_service (BackendService): The backend service.
+            - q (str): The search terms.
+            - after (Optional[int]): Cursor of the page to get (the first page if `None`).
+
+        Returns:
+            - Tuple[List, Optional[int]]: A list of search result dictionaries (the list may be
+              empty) and the cursor of the next page, or `None` if there are no more.
+        """
+        response: ResponseData = backend_service.search(session.get('token'), q, after=after)
+        WebUtils.flash_response_messages(response)
+        content = response.get_content()
+        if content is not None and isinstance(content, dict):
+            return (list(content.get('items', [])), content.get('next_cursor'))
+        return ([], None)
 
     @staticmethod
     def create_report(backend_service: BackendService,id :Optional[str],reason: Optional[str])-> Optional[Dict]:
@@ -102,20 +126,40 @@ class WebQuestion():
         return response.get_content()
 
     @staticmethod
-    def list_reports(backend_service:BackendService) -> List:
-        """ Gets the list of discussions from the backend service.
+    def get_thread(backend_service: BackendService, discussionid: int) -> Optional[Dict]:
+        """ Gets a whole discussion thread from the backend service in a single request.
+
+        Args:
+            - backend_service (BackendService): The backend service.
+            - discussionid (int): The discussion id.
+
+        Returns:
+            - Dict: A dictionary with the discussion data (key `discussion`) and the list of its
+              answers (key `answers`), each one with the list of its comments (key `comments`).
+            - None: Nothing on error.
+        """
+        response: ResponseData = backend_service.get_discussion_thread(session.get('token'), discussionid)
+        WebUtils.flash_response_messages(response)
+        return response.get_content()
+
+    @staticmethod
+    def list_reports(backend_service: BackendService, after: Optional[int] = None) -> Tuple[List, Optional[int]]:
+        """ Gets a page of the list of discussion reports from the backend service.
 
         Args:
             - backend_service (BackendService): The backend service.
+            - after (Optional[int]): Cursor of the page to get (the first page if `None`).
 
         Returns:
-            - List: A list of user data dictionaries (the list may be empty)
+            - Tuple[List, Optional[int]]: A list of report data dictionaries (the list may be
+              empty) and the cursor of the next page, or `None` if there are no more.
         """
-        response: ResponseData = backend_service.list_reports(session.get('token'))
+        response: ResponseData = backend_service.list_reports(session.get('token'), after=after)
         WebUtils.flash_response_messages(response)
-        if response.get_content() is not None and isinstance(response.get_content(), list):
-            return list(response.get_content())
-        return []
+        content = response.get_content()
+        if content is not None and isinstance(content, dict):
+            return (list(content.get('items', [])), content.get('next_cursor'))
+        return ([], None)
 
     @staticmethod
     def get_report(backend_service: BackendService, id: int) -> Optional[Dict]:
@@ -124,36 +168,42 @@ class WebQuestion():
         return response.get_content()
 
     @staticmethod
-    def list_reports_answer(backend_service:BackendService) -> List:
-        """ Gets the list of discussions from the backend service.
+    def list_reports_answer(backend_service: BackendService, after: Optional[int] = None) -> Tuple[List, Optional[int]]:
+        """ Gets a page of the list of answer reports from the backend service.
 
         Args:
             - backend_service (BackendService): The backend service.
+            - after (Optional[int]): Cursor of the page to get (the first page if `None`).
 
         Returns:
-            - List: A list of user data dictionaries (the list may be empty)
+            - Tuple[List, Optional[int]]: A list of report data dictionaries (the list may be
+              empty) and the cursor of the next page, or `None` if there are no more.
         """
-        response: ResponseData = backend_service.list_reports_answer(session.get('token'))
+        response: ResponseData = backend_service.list_reports_answer(session.get('token'), after=after)
         WebUtils.flash_response_messages(response)
-        if response.get_content() is not None and isinstance(response.get_content(), list):
-            return list(response.get_content())
-        return []
+        content = response.get_content()
+        if content is not None and isinstance(content, dict):
+            return (list(content.get('items', [])), content.get('next_cursor'))
+        return ([], None)
 
     @staticmethod
-    def list_reports_comments(backend_service:BackendService) -> List:
-        """ Gets the list of discussions from the backend service.
+    def list_reports_comments(backend_service: BackendService, after: Optional[int] = None) -> Tuple[List, Optional[int]]:
+        """ Gets a page of the list of comment reports from the backend service.
 
         Args:
             - backend_service (BackendService): The backend service.
+            - after (Optional[int]): Cursor of the page to get (the first page if `None`).
 
         Returns:
-            - List: A list of user data dictionaries (the list may be empty)
+            - Tuple[List, Optional[int]]: A list of report data dictionaries (the list may be
+              empty) and the cursor of the next page, or `None` if there are no more.
         """
-        response: ResponseData = backend_service.list_reports_comments(session.get('token'))
+        response: ResponseData = backend_service.list_reports_comments(session.get('token'), after=after)
         WebUtils.flash_response_messages(response)
-        if response.get_content() is not None and isinstance(response.get_content(), list):
-            return list(response.get_content())
-        return []
+        content = response.get_content()
+        if content is not None and isinstance(content, dict):
+            return (list(content.get('items', [])), content.get('next_cursor'))
+        return ([], None)
 
     @staticmethod
     def put_report(backend_service: BackendService, id: int) -> Optional[Dict]:
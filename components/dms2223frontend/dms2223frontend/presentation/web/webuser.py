@@ -3,6 +3,7 @@
 
 from typing import Dict, List, Optional
 from flask import session
+from dms2223common.data import TokenCache
 from dms2223common.data.rest import ResponseData
 from dms2223frontend.data.rest.authservice import AuthService
 from .webutils import WebUtils
@@ -63,6 +64,22 @@ class WebUser():
             return list(response.get_content())
         return []
 
+    @staticmethod
+    def get_token_roles(token: Optional[str]) -> Optional[List]:
+        """ Gets the list of roles carried by a user token, as signed by the authentication service.
+
+        Args:
+            - token (Optional[str]): The user token.
+
+        Returns:
+            - List: A list of role names.
+            - None: Nothing if the token carries no roles.
+        """
+        claims: Optional[Dict] = TokenCache.token_claims(token) if token else None
+        if claims is not None and isinstance(claims.get('roles'), list):
+            return list(claims['roles'])
+        return None
+
     @staticmethod
     def update_user_roles(auth_service: AuthService, username: str, roles: List) -> bool:
         """ Updates the user roles in the authentication service.
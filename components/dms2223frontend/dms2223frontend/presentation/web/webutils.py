@@ -1,13 +1,24 @@
 """ WebUtils class module.
 """
 
-from flask import flash
+import contextvars
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+from flask import copy_current_request_context, flash, g
+from werkzeug.wrappers import Response
 from dms2223common.data.rest import ResponseData
 
 
 class WebUtils():
     """ Monostate class responsible of various operation utilities.
     """
+    __flash_lock: Lock = Lock()
+    __executor: Optional[ThreadPoolExecutor] = None
+    __executor_lock: Lock = Lock()
+
     @staticmethod
     def flash_response_messages(response: ResponseData):
         """ "Flashes" the messages stored in a response if it was not successful.
@@ -16,5 +27,101 @@ class WebUtils():
             - response (ResponseData): The response data object.
         """
         if not response.is_successful():
-            for message in response.get_messages():
-                flash(message, 'error')
+            with WebUtils.__flash_lock:
+                for message in response.get_messages():
+                    flash(message, 'error')
+
+    @staticmethod
+    def __get_executor() -> ThreadPoolExecutor:
+        """ Gets the thread pool running the fan-out calls.
+
+        The pool is created on first use, so in the production servers each worker process gets
+        its own, built with the (possibly cooperative) threading primitives of that process.
+
+        Returns:
+            - ThreadPoolExecutor: The thread pool.
+        """
+        with WebUtils.__executor_lock:
+            if WebUtils.__executor is None:
+                WebUtils.__executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='fan_out')
+            return WebUtils.__executor
+
+    @staticmethod
+    def fan_out(calls: Dict[str, Callable[[], Any]], defaults: Dict[str, Any],
+                deadline: float) -> Dict[str, Any]:
+        """ Runs several independent backend calls concurrently.
+
+        Each call runs in a worker thread within a copy of the current request context (and of the
+        context variables, such as the active trace span), so it can use the session and flash
+        messages. The page latency is thus that of the slowest call
+        instead of the sum of all of them. Each call is meant to be a single backend request (e.g.,
+        one page of a listing), so the deadline is not exceeded as the data grows.
+
+        Calls failing or not finished by the deadline are flashed as errors and replaced by their
+        default value, so the page can still be partially rendered. The latency of each call (and
+        of the whole fan-out, as `total`) is logged and added to the `Server-Timing` response
+        header (see `add_server_timing`).
+
+        Args:
+            - calls (Dict[str, Callable[[], Any]]): The calls to run, by name.
+            - defaults (Dict[str, Any]): The value of each call when it fails, by name.
+            - deadline (float): Maximum number of seconds to wait for the calls (see the
+              `fan_out_deadline` configuration value).
+
+        Returns:
+            - Dict[str, Any]: The result of each call (or its default value), by name.
+        """
+        timings: Dict[str, float] = {}
+
+        def timed(name: str, call: Callable[[], Any]) -> Callable[[], Any]:
+            @copy_current_request_context
+            def run() -> Any:
+                start: float = time.perf_counter()
+                try:
+                    return call()
+                finally:
+                    timings[name] = time.perf_counter() - start
+            context: contextvars.Context = contextvars.copy_context()
+            return lambda: context.run(run)
+
+        start: float = time.perf_counter()
+        executor: ThreadPoolExecutor = WebUtils.__get_executor()
+        futures: Dict[str, Future] = {
+            name: executor.submit(timed(name, call)) for name, call in calls.items()
+        }
+        wait(futures.values(), timeout=deadline)
+        timings['total'] = time.perf_counter() - start
+
+        results: Dict[str, Any] = {}
+        for name, future in futures.items():
+            results[name] = defaults.get(name)
+            if not future.done():
+                flash(f'Timed out while loading the {name}', 'error')
+            elif future.exception() is not None:
+                logging.warning('Fan-out call %s failed: %s', name, future.exception())
+                flash(f'Could not load the {name}', 'error')
+            else:
+                results[name] = future.result()
+
+        logging.debug('Fan-out timings: %s', ', '.join(
+            f'{name}={elapsed * 1000:.1f}ms' for name, elapsed in timings.items()))
+        g.setdefault('server_timing', {}).update(timings)
+        return results
+
+    @staticmethod
+    def add_server_timing(response: Response) -> Response:
+        """ Adds the timings gathered while handling the request as a `Server-Timing` header.
+
+        Intended to be registered as a Flask `after_request` handler.
+
+        Args:
+            - response (Response): The response to be sent.
+
+        Returns:
+            - Response: The same response, with the header added if there were timings.
+        """
+        timings: Optional[Dict[str, float]] = g.get('server_timing')
+        if timings:
+            response.headers['Server-Timing'] = ', '.join(
+                f'{name};dur={elapsed * 1000:.1f}' for name, elapsed in timings.items())
+        return response